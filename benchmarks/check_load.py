@@ -0,0 +1,97 @@
+"""Run ``check_and_notify`` repeatedly against the local mock provider server.
+
+Usage: ``python benchmarks/check_load.py [--seconds 10] [--latency 0.02]
+[--error-rate 0.05] [--rate-limit-every 50]``. All six providers are enabled
+with dummy credentials and the threshold is set so no notification is sent.
+Prints checks per second and the provider request counts seen by the server.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from mock_provider_server import MockProviderServer, MockScenario  # noqa: E402
+from rates.config import set_config  # noqa: E402
+from rates.http_transport import transfer_stats  # noqa: E402
+
+PROVIDERS = (
+    "openexchangerates,bank_al_maghrib,exchangerate_api,currencyapi,"
+    "apilayer_exchangeratesapi,fawazahmed0_exchange_api"
+)
+
+
+def _configure(server_url: str, args: argparse.Namespace) -> None:
+    os.environ.update(
+        {
+            "PROVIDER_BASE_URL_OVERRIDE": server_url,
+            "RATE_SOURCES": PROVIDERS,
+            "WATCHLIST": args.watchlist,
+            "THRESHOLD_RATE": "1000000",
+            "NOTIFY_ON_AGGREGATION_FAILURE": "false",
+            "OER_APP_ID": "load-test",
+            "BAM_SUBSCRIPTION_KEY": "load-test",
+            "EXCHANGERATE_API_KEY": "load-test",
+            "CURRENCYAPI_API_KEY": "load-test",
+            "APILAYER_EXCHANGERATESAPI_ACCESS_KEY": "load-test",
+            "HTTP_BACKOFF_BASE_SECONDS": "0.01",
+            "HTTP_BACKOFF_MAX_SECONDS": "0.1",
+        }
+    )
+    set_config(None)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--extra-currencies", type=int, default=150)
+    parser.add_argument(
+        "--watchlist", default="EUR/MAD:1000000,USD/MAD:1000000,GBP/MAD:1000000"
+    )
+    args = parser.parse_args()
+
+    scenario = MockScenario(
+        latency_seconds=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_every=args.rate_limit_every,
+        retry_after_seconds=0,
+        extra_currencies=args.extra_currencies,
+    )
+    with MockProviderServer(scenarios={"default": scenario}, seed=1) as server:
+        _configure(server.url, args)
+        import script
+
+        checks = failures = 0
+        started_at = time.perf_counter()
+        deadline = started_at + args.seconds
+        while time.perf_counter() < deadline:
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    script.check_and_notify()
+            except ValueError:
+                failures += 1
+            checks += 1
+
+        elapsed = time.perf_counter() - started_at
+        stats = server.stats()
+
+    requests = sum(counts["requests"] for counts in stats.values())
+    totals = transfer_stats.totals()
+    print(f"{checks} checks in {elapsed:.1f}s ({checks / elapsed:.1f}/s)")
+    print(f"{failures} check(s) failed aggregation")
+    print(f"{requests} provider requests ({requests / elapsed:.1f}/s)")
+    print(f"{totals.bytes_on_wire} bytes on wire, {totals.bytes_decoded} decoded")
+    for provider, counts in sorted(stats.items()):
+        print(f"  {provider}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark JSON decoding backends on provider-shaped payloads.
+
+Usage: ``python benchmarks/decode_json.py`` (optionally with orjson/msgspec installed).
+"""
+
+import json
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rates.json_decoding import decode_json, set_json_backend  # noqa: E402
+from rates.providers.apilayer_exchangeratesapi import (  # noqa: E402
+    ApilayerLatestPayload,
+)
+from rates.providers.fawazahmed0_exchange_api import (  # noqa: E402
+    FawazAhmed0CurrencyPayload,
+)
+from rates.providers.openexchangerates import OpenExchangeRatesPayload  # noqa: E402
+
+
+def _currency_codes(count: int) -> list:
+    rng = random.Random(42)
+    codes = set()
+    while len(codes) < count:
+        codes.add("".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ") for _ in range(3)))
+
+    return sorted(codes)
+
+
+def build_payloads() -> dict:
+    rng = random.Random(7)
+    oer_rates = {code: rng.uniform(0.01, 500) for code in _currency_codes(170)}
+    fawaz_rates = {
+        code.lower(): rng.uniform(0.0001, 50000) for code in _currency_codes(340)
+    }
+
+    return {
+        "openexchangerates": (
+            json.dumps(
+                {
+                    "disclaimer": "Usage subject to terms",
+                    "license": "https://openexchangerates.org/license",
+                    "timestamp": 1710750600,
+                    "base": "USD",
+                    "rates": oer_rates,
+                }
+            ).encode(),
+            OpenExchangeRatesPayload,
+        ),
+        "apilayer_exchangeratesapi": (
+            json.dumps(
+                {
+                    "success": True,
+                    "timestamp": 1719408000,
+                    "base": "EUR",
+                    "date": "2024-06-26",
+                    "rates": {"EUR": 1.0, "MAD": 10.75},
+                }
+            ).encode(),
+            ApilayerLatestPayload,
+        ),
+        "fawazahmed0_exchange_api": (
+            json.dumps({"date": "2026-03-21", "eur": fawaz_rates}).encode(),
+            FawazAhmed0CurrencyPayload,
+        ),
+    }
+
+
+def main() -> None:
+    payloads = build_payloads()
+    backends = []
+    for backend in ("json", "orjson", "msgspec"):
+        try:
+            set_json_backend(backend)
+        except ValueError:
+            print(f"{backend}: not installed, skipped")
+            continue
+
+        backends.append(backend)
+
+    print(f"{'payload':<28} {'bytes':>7} " + " ".join(f"{b:>12}" for b in backends))
+    for name, (content, schema) in payloads.items():
+        timings = []
+        for backend in backends:
+            set_json_backend(backend)
+            runs = 2000
+            seconds = timeit.timeit(lambda: decode_json(content, schema), number=runs)
+            timings.append(f"{seconds / runs * 1e6:>9.1f} us")
+
+        print(f"{name:<28} {len(content):>7} " + " ".join(timings))
+
+
+if __name__ == "__main__":
+    main()
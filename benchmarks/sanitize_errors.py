@@ -0,0 +1,74 @@
+"""Benchmark error message redaction against the previous three-pass version.
+
+Usage: ``python benchmarks/sanitize_errors.py``.
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from rates.http_client import sanitize_error_message  # noqa: E402
+
+
+def sanitize_three_passes(message: str) -> str:
+    """The previous implementation: three ``re.sub`` calls per message."""
+    sanitized = re.sub(
+        r"([?&](?:app_id|access_key|api_key|apikey|subscription_key|token)=)[^&\s]+",
+        r"\1<redacted>",
+        message,
+        flags=re.IGNORECASE,
+    )
+    sanitized = re.sub(
+        r"(/v6/)[^/]+(/pair/)",
+        r"\1<redacted>\2",
+        sanitized,
+        flags=re.IGNORECASE,
+    )
+    return re.sub(
+        r"(Ocp-Apim-Subscription-Key['\"]?\s*[:=]\s*['\"]?)[^'\",\s]+",
+        r"\1<redacted>",
+        sanitized,
+        flags=re.IGNORECASE,
+    )
+
+
+MESSAGES = {
+    "timeout": "timed out",
+    "http status": (
+        "Server error '503 Service Unavailable' for url "
+        "'https://latest.currency-api.pages.dev/v1/currencies/eur.json'\n"
+        "For more information check: "
+        "https://developer.mozilla.org/en-US/docs/Web/HTTP/Status/503"
+    ),
+    "query secrets": (
+        "Client error '401 Unauthorized' for url "
+        "'https://openexchangerates.org/api/latest.json?app_id=0123456789abcdef'"
+    ),
+    "path and header": (
+        "Client error for url 'https://v6.exchangerate-api.com/v6/abc123/pair/EUR/MAD' "
+        "with headers {'Ocp-Apim-Subscription-Key': 'secret'}"
+    ),
+}
+
+
+def main() -> None:
+    runs = 100_000
+    print(f"{'message':<16} {'three passes':>14} {'current':>10} {'speedup':>8}")
+    for name, message in MESSAGES.items():
+        assert sanitize_error_message(message) == sanitize_three_passes(message)
+
+        timings = [
+            timeit.timeit(lambda: sanitize(message), number=runs) / runs
+            for sanitize in (sanitize_three_passes, sanitize_error_message)
+        ]
+        print(
+            f"{name:<16} {timings[0] * 1e9:>11.0f} ns {timings[1] * 1e9:>7.0f} ns "
+            f"{timings[0] / timings[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
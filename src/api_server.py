@@ -0,0 +1,329 @@
+"""Asyncio HTTP API serving aggregated rates from a stale-while-revalidate cache.
+
+Run ``python src/api_server.py`` (or ``make serve``). Endpoints:
+
+- ``GET /rate/{base}/{quote}``: aggregated rate for one pair.
+- ``GET /rates?base=EUR[&quotes=MAD,USD]``: rates for several quotes of one base;
+  without ``quotes``, the ``WATCHLIST`` pairs with that base are used.
+- ``GET /details/{base}/{quote}`` (or ``/details/EUR-MAD``): the rate plus the
+  per-provider details it was aggregated from.
+- ``GET /health``, with the fetch worker pool's queue depth.
+
+Only ``WATCHLIST`` pairs and pairs of ISO 4217 codes are served; other pairs
+get ``404`` without reaching a provider. When ``API_MAX_CONCURRENT_LOADS``
+uncached pairs are already being fetched, further misses get ``503``.
+
+Rates come from ``fetch_and_aggregate_rate`` through ``RateCache``: fresh
+entries are served directly, stale ones are served while a background refresh
+runs, so client traffic does not turn into provider traffic. Frequently
+requested pairs are refreshed by ``HotPairRefresher`` before they go stale.
+Responses carry ``age_seconds`` and ``stale``.
+"""
+
+import asyncio
+import json
+import os
+import re
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from http import HTTPStatus
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from rates.config import get_config, load_config
+from rates.currencies import ISO_4217_CODES
+from rates.http_client import safe_error_message
+from rates.rate_cache import CachedRate, HotPairRefresher, RateCache, RateCacheBusyError
+from rates.service import fetch_and_aggregate_rate
+from rates.worker_pool import shutdown_worker_pool
+
+_CURRENCY_RE = re.compile(r"^[A-Z0-9]{2,10}$")
+_ISO_CODES = frozenset(ISO_4217_CODES)
+_MAX_HEADER_LINES = 100
+
+Response = t.Tuple[int, t.Dict[str, t.Any]]
+
+
+def _read_float_env(env_var: str, default: str) -> float:
+    value = float(os.environ.get(env_var, default).strip())
+    if value < 0:
+        raise ValueError(f"{env_var} cannot be negative")
+
+    return value
+
+
+def _read_int_env(env_var: str, default: str) -> int:
+    value = int(os.environ.get(env_var, default).strip())
+    if value <= 0:
+        raise ValueError(f"{env_var} must be a positive integer")
+
+    return value
+
+
+def _currency(raw_code: str) -> str:
+    code = raw_code.strip().upper()
+    if not _CURRENCY_RE.match(code):
+        raise ValueError(f"Invalid currency code '{raw_code}'")
+
+    return code
+
+
+def _rate_document(cached: CachedRate) -> t.Dict[str, t.Any]:
+    result = cached.result
+    return {
+        "pair": str(result.pair),
+        "base": result.pair.base,
+        "quote": result.pair.quote,
+        "rate": result.aggregated_rate,
+        "aggregation_method": result.aggregation_method,
+        "successful_sources": result.successful_sources,
+        "failed_sources": result.failed_sources,
+        "age_seconds": round(cached.age_seconds, 3),
+        "stale": cached.stale,
+    }
+
+
+def _details_document(cached: CachedRate) -> t.Dict[str, t.Any]:
+    document = _rate_document(cached)
+    document["details"] = [
+        {
+            "source": detail.source,
+            "status": str(detail.status),
+            "rate": detail.rate,
+            "error": detail.error,
+        }
+        for detail in cached.result.details
+    ]
+    return document
+
+
+class UnknownPairError(LookupError):
+    """Raised for a pair that is neither watched nor made of ISO 4217 codes."""
+
+
+class RatesApi:
+    """Route API requests to the rate cache."""
+
+    def __init__(
+        self,
+        cache: RateCache,
+        default_pairs: t.Sequence[t.Tuple[str, str]] = (),
+    ):
+        self.cache = cache
+        self.default_pairs = list(default_pairs)
+        self._watched_pairs = set(self.default_pairs)
+
+    def _check_pair(self, base_currency: str, quote_currency: str) -> None:
+        if (base_currency, quote_currency) in self._watched_pairs:
+            return
+
+        if base_currency in _ISO_CODES and quote_currency in _ISO_CODES:
+            return
+
+        raise UnknownPairError(f"Unknown pair '{base_currency}/{quote_currency}'")
+
+    async def _cached_rate(self, base_currency: str, quote_currency: str) -> CachedRate:
+        self._check_pair(base_currency, quote_currency)
+        return await asyncio.wrap_future(self.cache.get(base_currency, quote_currency))
+
+    async def _rate(self, base: str, quote: str, with_details: bool) -> Response:
+        try:
+            cached = await self._cached_rate(base, quote)
+        except UnknownPairError as error:
+            return HTTPStatus.NOT_FOUND, {"error": str(error)}
+        except RateCacheBusyError as error:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": str(error)}
+        except Exception as error:
+            return HTTPStatus.BAD_GATEWAY, {"error": safe_error_message(error)}
+
+        if with_details:
+            return HTTPStatus.OK, _details_document(cached)
+
+        return HTTPStatus.OK, _rate_document(cached)
+
+    async def _rates(self, query: t.Mapping[str, t.List[str]]) -> Response:
+        base = _currency(query.get("base", [""])[-1])
+        raw_quotes = query.get("quotes", [""])[-1]
+        quotes = (
+            [_currency(code) for code in raw_quotes.split(",") if code.strip()]
+            if raw_quotes
+            else [quote for pair_base, quote in self.default_pairs if pair_base == base]
+        )
+        if not quotes:
+            raise ValueError(f"No quotes requested or watched for base '{base}'")
+        for quote in quotes:
+            self._check_pair(base, quote)
+
+        outcomes = await asyncio.gather(
+            *(self._cached_rate(base, quote) for quote in quotes),
+            return_exceptions=True,
+        )
+        return HTTPStatus.OK, {
+            "base": base,
+            "rates": {
+                quote: (
+                    _rate_document(outcome)
+                    if isinstance(outcome, CachedRate)
+                    else {"error": safe_error_message(t.cast(Exception, outcome))}
+                )
+                for quote, outcome in zip(quotes, outcomes)
+            },
+        }
+
+    async def handle(self, method: str, target: str) -> Response:
+        """Return the status and JSON document for one request."""
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": "Only GET is supported"}
+
+        parts = urlsplit(target)
+        segments = [unquote(segment) for segment in parts.path.split("/") if segment]
+
+        try:
+            if segments == ["health"]:
+                return HTTPStatus.OK, {
+                    "status": "ok",
+                    "fetch_pool": asdict(get_config().workers.pool().stats()),
+                }
+
+            if segments == ["rates"]:
+                return await self._rates(parse_qs(parts.query))
+
+            if len(segments) == 3 and segments[0] in ("rate", "details"):
+                return await self._rate(
+                    _currency(segments[1]),
+                    _currency(segments[2]),
+                    with_details=segments[0] == "details",
+                )
+
+            if len(segments) == 2 and segments[0] == "details":
+                base, _, quote = segments[1].replace("-", "/").partition("/")
+                return await self._rate(
+                    _currency(base), _currency(quote), with_details=True
+                )
+        except ValueError as error:
+            return HTTPStatus.BAD_REQUEST, {"error": str(error)}
+        except UnknownPairError as error:
+            return HTTPStatus.NOT_FOUND, {"error": str(error)}
+
+        return HTTPStatus.NOT_FOUND, {"error": f"Unknown path '{parts.path}'"}
+
+    async def serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve HTTP/1.1 requests on one connection until it closes."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                method, target, version = (
+                    request_line.decode("latin-1").strip().split(" ", 2) + ["", ""]
+                )[:3]
+                headers: t.Dict[str, str] = {}
+                for _ in range(_MAX_HEADER_LINES):
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    status, document = await self.handle(method, target)
+                except Exception as error:
+                    status = HTTPStatus.INTERNAL_SERVER_ERROR
+                    document = {"error": safe_error_message(error)}
+
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                body = json.dumps(document).encode("utf-8")
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+                        "Content-Type: application/json\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                        "\r\n"
+                    ).encode("latin-1")
+                    + body
+                )
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _default_pairs() -> t.List[t.Tuple[str, str]]:
+    from script import prepare_watchlist
+
+    try:
+        return [
+            (rule.base_currency, rule.quote_currency) for rule in prepare_watchlist()
+        ]
+    except (KeyError, ValueError):
+        return []
+
+
+async def serve(
+    host: str,
+    port: int,
+    api: RatesApi,
+    bound_port: t.Optional["asyncio.Future[int]"] = None,
+) -> None:
+    """Serve ``api`` until cancelled, reporting the listening port to ``bound_port``."""
+    server = await asyncio.start_server(api.serve_connection, host, port)
+    async with server:
+        listening_port = server.sockets[0].getsockname()[1]
+        print(f"Rates API listening on http://{host}:{listening_port}")
+        if bound_port is not None:
+            bound_port.set_result(listening_port)
+
+        await server.serve_forever()
+
+
+def main() -> None:
+    load_config()
+    host = os.environ.get("API_HOST", "127.0.0.1").strip()
+    port = _read_int_env("API_PORT", "8000")
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=_read_int_env("API_FETCH_WORKERS", "4"),
+            thread_name_prefix="rates-api-fetch",
+        ) as executor:
+            cache = RateCache(
+                lambda base, quote: fetch_and_aggregate_rate(base, quote),
+                executor,
+                ttl_seconds=_read_float_env("API_CACHE_TTL_SECONDS", "60"),
+                stale_seconds=_read_float_env("API_CACHE_STALE_SECONDS", "300"),
+                max_concurrent_refreshes=_read_int_env(
+                    "API_MAX_CONCURRENT_REFRESHES", "4"
+                ),
+                max_concurrent_loads=_read_int_env("API_MAX_CONCURRENT_LOADS", "32"),
+            )
+            refresher = HotPairRefresher(
+                cache,
+                interval_seconds=_read_float_env(
+                    "API_HOT_REFRESH_INTERVAL_SECONDS", "5"
+                ),
+                min_hits=_read_float_env("API_HOT_PAIR_MIN_REQUESTS", "2"),
+                lead_seconds=_read_float_env("API_HOT_REFRESH_LEAD_SECONDS", "10"),
+            )
+            try:
+                with refresher:
+                    asyncio.run(serve(host, port, RatesApi(cache, _default_pairs())))
+            except KeyboardInterrupt:
+                pass
+    finally:
+        shutdown_worker_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,491 @@
+"""Local HTTP server emulating every rate provider API for load and chaos tests.
+
+Run ``python src/mock_provider_server.py --port 8080`` and point the script at
+it with ``PROVIDER_BASE_URL_OVERRIDE=http://127.0.0.1:8080``: every provider
+request for ``https://<host>/<path>`` is then sent to
+``http://127.0.0.1:8080/<host>/<path>``. Provider credentials can be any
+non-empty value.
+
+Each provider follows a ``MockScenario`` with latency, random errors, periodic
+429 responses with ``Retry-After`` and extra synthetic currencies to grow the
+table payloads. Scenarios come from the command line or a JSON file shaped
+like ``{"default": {...}, "<provider>": {...}}`` and can be replaced while the
+server runs with ``POST /_scenarios`` using the same shape. ``GET /_stats``
+returns the request and response counts per provider.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import typing as t
+from dataclasses import asdict, dataclass, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+USD_RATES: t.Dict[str, float] = {
+    "USD": 1.0,
+    "EUR": 0.92,
+    "GBP": 0.79,
+    "MAD": 9.95,
+    "JPY": 151.4,
+    "CHF": 0.9,
+    "CAD": 1.36,
+    "AUD": 1.52,
+    "CNY": 7.23,
+    "AED": 3.6725,
+    "SAR": 3.75,
+    "TRY": 32.2,
+}
+
+
+@dataclass(slots=True)
+class MockScenario:
+    """Behaviour of one emulated provider."""
+
+    latency_seconds: float = 0.0
+    latency_jitter_seconds: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    rate_limit_every: int = 0
+    retry_after_seconds: float = 1.0
+    extra_currencies: int = 0
+
+    @classmethod
+    def from_dict(cls, values: t.Mapping[str, t.Any]) -> "MockScenario":
+        """Build a scenario from a JSON object, rejecting unknown keys."""
+        known = {scenario_field.name for scenario_field in fields(cls)}
+        unknown = set(values) - known
+        if unknown:
+            raise ValueError(f"Unknown scenario settings: {sorted(unknown)}")
+
+        return cls(**values)
+
+
+@dataclass(slots=True)
+class _Route:
+    provider: str
+    host: re.Pattern
+    path: re.Pattern
+    render: t.Callable[..., t.Any]
+
+
+class MockProviderApis:
+    """Payload builders for each provider, sharing one rate table."""
+
+    def __init__(self, timestamp: t.Optional[int] = None):
+        self.timestamp = int(time.time()) if timestamp is None else timestamp
+        self.date = time.strftime("%Y-%m-%d", time.gmtime(self.timestamp))
+
+    @staticmethod
+    def usd_rates(extra_currencies: int = 0) -> t.Dict[str, float]:
+        """Return the USD-based table padded with synthetic currencies."""
+        rates = dict(USD_RATES)
+        rates.update(
+            (f"Z{index:04d}", 1.0 + index / 1000) for index in range(extra_currencies)
+        )
+        return rates
+
+    def cross_rate(self, base: str, quote: str) -> t.Optional[float]:
+        """Return the base/quote rate, or None for an unknown currency."""
+        if base not in USD_RATES or quote not in USD_RATES:
+            return None
+
+        return USD_RATES[quote] / USD_RATES[base]
+
+    def openexchangerates(
+        self, match: re.Match, query: t.Mapping[str, str], scenario: MockScenario
+    ) -> t.Any:
+        return {
+            "disclaimer": "Mock data",
+            "license": "Mock data",
+            "timestamp": self.timestamp,
+            "base": "USD",
+            "rates": self.usd_rates(scenario.extra_currencies),
+        }
+
+    def bank_al_maghrib(
+        self, match: re.Match, query: t.Mapping[str, str], scenario: MockScenario
+    ) -> t.Any:
+        currency = query.get("libDevise", "")
+        rate = self.cross_rate(currency, "MAD")
+        if rate is None:
+            return []
+
+        return [
+            {
+                "achatClientele": round(rate * 0.99, 4),
+                "venteClientele": round(rate * 1.01, 4),
+                "uniteDevise": 1,
+                "libDevise": currency,
+                "date": f"{self.date}T00:00:00",
+            }
+        ]
+
+    def exchangerate_api(
+        self, match: re.Match, query: t.Mapping[str, str], scenario: MockScenario
+    ) -> t.Any:
+        base, quote = match.group("base"), match.group("quote")
+        rate = self.cross_rate(base, quote)
+        if rate is None:
+            return {"result": "error", "error-type": "unsupported-code"}
+
+        return {
+            "result": "success",
+            "base_code": base,
+            "target_code": quote,
+            "conversion_rate": rate,
+            "time_last_update_unix": self.timestamp,
+            "time_next_update_unix": self.timestamp + 86400,
+        }
+
+    def currencyapi(
+        self, match: re.Match, query: t.Mapping[str, str], scenario: MockScenario
+    ) -> t.Any:
+        base = query.get("base_currency", "USD")
+        rates = self.usd_rates(scenario.extra_currencies)
+        requested = [code for code in query.get("currencies", "").split(",") if code]
+        codes = requested or list(rates)
+        return {
+            "meta": {"last_updated_at": f"{self.date}T00:00:00Z"},
+            "data": {
+                code: {"code": code, "value": rates[code] / rates[base]}
+                for code in codes
+                if code in rates and base in rates
+            },
+        }
+
+    def apilayer_exchangeratesapi(
+        self, match: re.Match, query: t.Mapping[str, str], scenario: MockScenario
+    ) -> t.Any:
+        rates = self.usd_rates(scenario.extra_currencies)
+        symbols = [code for code in query.get("symbols", "").split(",") if code]
+        return {
+            "success": True,
+            "timestamp": self.timestamp,
+            "base": "EUR",
+            "date": self.date,
+            "rates": {
+                code: rates[code] / rates["EUR"]
+                for code in symbols or list(rates)
+                if code in rates
+            },
+        }
+
+    def fawazahmed0_exchange_api(
+        self, match: re.Match, query: t.Mapping[str, str], scenario: MockScenario
+    ) -> t.Any:
+        base = match.group("base").upper()
+        rates = self.usd_rates(scenario.extra_currencies)
+        if base not in rates:
+            return None
+
+        return {
+            "date": self.date,
+            base.lower(): {
+                code.lower(): value / rates[base] for code, value in rates.items()
+            },
+        }
+
+    def routes(self) -> t.List[_Route]:
+        """Return the URL patterns of every emulated endpoint."""
+        return [
+            _Route(
+                "openexchangerates",
+                re.compile(r"openexchangerates\.org$"),
+                re.compile(r"/api/latest\.json$"),
+                self.openexchangerates,
+            ),
+            _Route(
+                "bank_al_maghrib",
+                re.compile(r"api\.centralbankofmorocco\.ma$"),
+                re.compile(r"/cours/Version1/api/[^/]+$"),
+                self.bank_al_maghrib,
+            ),
+            _Route(
+                "exchangerate_api",
+                re.compile(r"v6\.exchangerate-api\.com$"),
+                re.compile(r"/v6/[^/]+/pair/(?P<base>[^/]+)/(?P<quote>[^/]+)$"),
+                self.exchangerate_api,
+            ),
+            _Route(
+                "currencyapi",
+                re.compile(r"api\.currencyapi\.com$"),
+                re.compile(r"/v3/latest$"),
+                self.currencyapi,
+            ),
+            _Route(
+                "apilayer_exchangeratesapi",
+                re.compile(r"api\.exchangeratesapi\.io$"),
+                re.compile(r"/v1/latest$"),
+                self.apilayer_exchangeratesapi,
+            ),
+            _Route(
+                "fawazahmed0_exchange_api",
+                re.compile(r"(cdn\.jsdelivr\.net|[^/]+\.currency-api\.pages\.dev)$"),
+                re.compile(
+                    r"(/npm/@fawazahmed0/currency-api@[^/]+)?"
+                    r"/v1/currencies/(?P<base>[^/]+)\.json$"
+                ),
+                self.fawazahmed0_exchange_api,
+            ),
+        ]
+
+
+class MockProviderServer:
+    """Threaded mock server; use as a context manager or call start/stop."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        scenarios: t.Optional[t.Mapping[str, MockScenario]] = None,
+        seed: t.Optional[int] = None,
+    ):
+        self.apis = MockProviderApis()
+        self.routes = self.apis.routes()
+        self._scenarios: t.Dict[str, MockScenario] = dict(scenarios or {})
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats: t.Dict[str, t.Dict[str, int]] = {}
+        self._thread: t.Optional[threading.Thread] = None
+        self.httpd = ThreadingHTTPServer((host, port), _MockHandler)
+        self.httpd.daemon_threads = True
+        setattr(self.httpd, "mock", self)
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as ``PROVIDER_BASE_URL_OVERRIDE``."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def scenario(self, provider: str) -> MockScenario:
+        """Return the scenario for ``provider``, falling back to ``default``."""
+        with self._lock:
+            return self._scenarios.get(
+                provider, self._scenarios.get("default", MockScenario())
+            )
+
+    def set_scenarios(self, scenarios: t.Mapping[str, MockScenario]) -> None:
+        """Replace every scenario."""
+        with self._lock:
+            self._scenarios = dict(scenarios)
+
+    def stats(self) -> t.Dict[str, t.Dict[str, int]]:
+        """Return request and response status counts per provider."""
+        with self._lock:
+            return {provider: dict(counts) for provider, counts in self._stats.items()}
+
+    def _count(self, provider: str, outcome: str) -> int:
+        with self._lock:
+            counts = self._stats.setdefault(provider, {"requests": 0})
+            if outcome == "requests":
+                counts["requests"] += 1
+            else:
+                counts[outcome] = counts.get(outcome, 0) + 1
+
+            return counts["requests"]
+
+    def _random_uniform(self, low: float, high: float) -> float:
+        with self._lock:
+            return self._random.uniform(low, high)
+
+    def start(self) -> "MockProviderServer":
+        """Serve requests from a background thread."""
+        self._thread = threading.Thread(
+            target=self.httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="mock-provider-server",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "MockProviderServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.stop()
+
+
+def parse_scenarios(document: t.Mapping[str, t.Any]) -> t.Dict[str, MockScenario]:
+    """Parse ``{"default": {...}, "<provider>": {...}}`` into scenarios."""
+    return {
+        provider: MockScenario.from_dict(values)
+        for provider, values in document.items()
+    }
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    server: ThreadingHTTPServer
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls.
+    disable_nagle_algorithm = True
+
+    @property
+    def mock(self) -> MockProviderServer:
+        return t.cast(MockProviderServer, getattr(self.server, "mock"))
+
+    def log_message(self, format: str, *args: t.Any) -> None:
+        pass
+
+    def _send_json(
+        self,
+        status: int,
+        document: t.Any,
+        headers: t.Optional[t.Mapping[str, str]] = None,
+        provider: t.Optional[str] = None,
+    ) -> None:
+        body = json.dumps(document).encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+
+        # Count before responding so a client reading stats afterwards sees it.
+        if provider is not None:
+            self.mock._count(provider, str(status))
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if status in (200, 304):
+            self.send_header("ETag", etag)
+
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        if parts.path == "/_stats":
+            self._send_json(200, self.mock.stats())
+            return
+
+        host, _, path = parts.path.lstrip("/").partition("/")
+        path = f"/{path}"
+        query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+
+        for route in self.mock.routes:
+            match = route.path.match(path)
+            if route.host.match(host) and match is not None:
+                self._serve(route, match, query)
+                return
+
+        self._send_json(404, {"error": f"No mock provider for {host}{path}"})
+
+    def _serve(
+        self, route: _Route, match: re.Match, query: t.Mapping[str, str]
+    ) -> None:
+        mock = self.mock
+        scenario = mock.scenario(route.provider)
+        request_number = mock._count(route.provider, "requests")
+
+        delay = scenario.latency_seconds + mock._random_uniform(
+            0.0, scenario.latency_jitter_seconds
+        )
+        if delay > 0:
+            time.sleep(delay)
+
+        if (
+            scenario.rate_limit_every
+            and request_number % scenario.rate_limit_every == 0
+        ):
+            self._send_json(
+                429,
+                {"error": "Too many requests"},
+                {"Retry-After": f"{scenario.retry_after_seconds:g}"},
+                provider=route.provider,
+            )
+        elif mock._random_uniform(0.0, 1.0) < scenario.error_rate:
+            self._send_json(
+                scenario.error_status,
+                {"error": "Injected failure"},
+                provider=route.provider,
+            )
+        else:
+            document = route.render(match, query, scenario)
+            if document is None:
+                self._send_json(
+                    404, {"error": "Unknown currency"}, provider=route.provider
+                )
+            else:
+                self._send_json(200, document, provider=route.provider)
+
+    def do_POST(self) -> None:
+        if urlsplit(self.path).path != "/_scenarios":
+            self._send_json(404, {"error": "Unknown control endpoint"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            scenarios = parse_scenarios(json.loads(self.rfile.read(length) or b"{}"))
+        except (TypeError, ValueError) as error:
+            self._send_json(400, {"error": str(error)})
+            return
+
+        self.mock.set_scenarios(scenarios)
+        self._send_json(
+            200, {name: asdict(scenario) for name, scenario in scenarios.items()}
+        )
+
+
+def _parse_args(argv: t.Optional[t.Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--scenario-file", help="JSON file with default and per-provider scenarios"
+    )
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--extra-currencies", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> None:
+    args = _parse_args(argv)
+
+    scenarios = {
+        "default": MockScenario(
+            latency_seconds=args.latency,
+            latency_jitter_seconds=args.latency_jitter,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            rate_limit_every=args.rate_limit_every,
+            retry_after_seconds=args.retry_after,
+            extra_currencies=args.extra_currencies,
+        )
+    }
+    if args.scenario_file:
+        with open(args.scenario_file, encoding="utf-8") as scenario_file:
+            scenarios.update(parse_scenarios(json.load(scenario_file)))
+
+    server = MockProviderServer(args.host, args.port, scenarios, seed=args.seed)
+    print(f"Mock provider server listening on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,14 @@
 """Notification package using apprise for flexible multi-medium notifications."""
 
-from .manager import notify
+from .digest import Alert, NotificationDigest
+from .manager import drain_outbox, notify
+from .outbox import DrainResult, NotificationOutbox
 
-__all__ = ["notify"]
+__all__ = [
+    "Alert",
+    "DrainResult",
+    "NotificationDigest",
+    "NotificationOutbox",
+    "drain_outbox",
+    "notify",
+]
@@ -0,0 +1,92 @@
+"""Digest helper that batches alerts into one notification per flush."""
+
+import time
+import typing as t
+from dataclasses import dataclass
+
+NotifyCallable = t.Callable[[str, str], bool]
+
+
+@dataclass(slots=True, frozen=True)
+class Alert:
+    """Single alert produced by rule evaluation."""
+
+    subject: str
+    body: str
+
+
+class NotificationDigest:
+    """Collect alerts over a run or time window and send them as one message.
+
+    Every flush results in a single ``send`` call, so each configured target is
+    contacted once per digest instead of once per alert.
+    """
+
+    def __init__(
+        self,
+        send: NotifyCallable,
+        window_seconds: t.Optional[float] = None,
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        if window_seconds is not None and window_seconds < 0:
+            raise ValueError("Digest window cannot be negative")
+
+        self.send = send
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._alerts: t.List[Alert] = []
+        self._first_alert_at: t.Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    @property
+    def alerts(self) -> t.Tuple[Alert, ...]:
+        """Return the queued alerts in the order they were added."""
+        return tuple(self._alerts)
+
+    def add(self, subject: str, body: str) -> None:
+        """Queue an alert for the next digest."""
+        if not self._alerts:
+            self._first_alert_at = self._clock()
+
+        self._alerts.append(Alert(subject=subject, body=body))
+
+    def is_due(self) -> bool:
+        """Return True when queued alerts should be sent now."""
+        if not self._alerts or self._first_alert_at is None:
+            return False
+
+        if not self.window_seconds:
+            return True
+
+        return self._clock() - self._first_alert_at >= self.window_seconds
+
+    def render(self) -> t.Tuple[str, str]:
+        """Render queued alerts into one subject and body."""
+        if not self._alerts:
+            raise ValueError("Cannot render an empty digest")
+
+        if len(self._alerts) == 1:
+            alert = self._alerts[0]
+            return alert.subject, alert.body
+
+        alert_count = len(self._alerts)
+        subject = f"{alert_count} exchange rate alerts"
+        sections = [
+            f"[{index}/{alert_count}] {alert.subject}\n{alert.body}"
+            for index, alert in enumerate(self._alerts, start=1)
+        ]
+
+        return subject, "\n\n".join(sections)
+
+    def flush(self) -> bool:
+        """Send queued alerts as one notification and clear the digest."""
+        if not self._alerts:
+            return False
+
+        subject, body = self.render()
+        self._alerts = []
+        self._first_alert_at = None
+
+        return self.send(subject, body)
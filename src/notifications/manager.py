@@ -1,9 +1,29 @@
-"""Notification module using apprise for flexible multi-medium notifications."""
+"""Notification module using apprise for flexible multi-medium notifications.
 
+apprise loads many plugin modules on import, so it is only imported when a
+notification is actually sent.
+"""
+
+import importlib
 import os
 import typing as t
 
-import apprise
+from .outbox import DrainResult, NotificationOutbox
+
+if t.TYPE_CHECKING:
+    import apprise
+
+
+def _load_apprise() -> t.Any:
+    return importlib.import_module("apprise")
+
+
+def __getattr__(name: str) -> t.Any:
+    # Keep ``notifications.manager.apprise`` available without importing it eagerly.
+    if name == "apprise":
+        return _load_apprise()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _build_mailgun_url() -> t.Optional[str]:
@@ -47,9 +67,25 @@ def _build_gotify_url() -> t.Optional[str]:
         return f"gotifys://{url}/{token}"
 
 
-def get_notification_manager() -> apprise.Apprise:
+def get_notification_targets() -> t.Dict[str, str]:
+    """Return configured target names mapped to their apprise URLs."""
+    targets: t.Dict[str, str] = {}
+
+    mailgun_url = _build_mailgun_url()
+    if mailgun_url:
+        targets["mailgun"] = mailgun_url
+
+    gotify_url = _build_gotify_url()
+    if gotify_url:
+        targets["gotify"] = gotify_url
+
+    return targets
+
+
+def get_notification_manager() -> "apprise.Apprise":
     """Build and return an Apprise notification manager with all configured targets."""
-    apobj = apprise.Apprise()
+    apprise_module = _load_apprise()
+    apobj = apprise_module.Apprise()
 
     # Mailgun (email)
     mailgun_url = _build_mailgun_url()
@@ -63,7 +99,79 @@ def get_notification_manager() -> apprise.Apprise:
         apobj.add(gotify_url)
         print("[Notifications] Gotify configured")
 
-    return apobj
+    return t.cast("apprise.Apprise", apobj)
+
+
+def get_notification_outbox() -> t.Optional[NotificationOutbox]:
+    """Build the durable outbox when NOTIFICATION_OUTBOX_PATH is configured."""
+    path = os.environ.get("NOTIFICATION_OUTBOX_PATH", "").strip()
+    if not path:
+        return None
+
+    return NotificationOutbox(
+        path,
+        max_attempts=int(os.environ.get("NOTIFICATION_MAX_ATTEMPTS", "10").strip()),
+        backoff_base_seconds=float(
+            os.environ.get("NOTIFICATION_BACKOFF_BASE_SECONDS", "30").strip()
+        ),
+        backoff_max_seconds=float(
+            os.environ.get("NOTIFICATION_BACKOFF_MAX_SECONDS", "3600").strip()
+        ),
+    )
+
+
+def deliver_to_target(target: str, subject: str, body: str) -> bool:
+    """Send one notification to a single named target."""
+    target_url = get_notification_targets().get(target)
+    if target_url is None:
+        print(f"[Notifications] Warning: Target '{target}' is no longer configured")
+        return False
+
+    apprise_module = _load_apprise()
+    apobj = apprise_module.Apprise()
+    apobj.add(target_url)
+
+    return bool(
+        apobj.notify(
+            body=body,
+            title=subject,
+            body_format=apprise_module.NotifyFormat.TEXT,
+        )
+    )
+
+
+def drain_outbox() -> t.Optional[DrainResult]:
+    """Retry pending notifications from the outbox, if one is configured."""
+    outbox = get_notification_outbox()
+    if outbox is None:
+        return None
+
+    result = outbox.drain(deliver_to_target)
+    if result.delivered or result.retried or result.dropped:
+        print(
+            f"[Notifications] Outbox drained: {result.delivered} delivered, "
+            f"{result.retried} rescheduled, {result.dropped} dropped"
+        )
+
+    return result
+
+
+def _notify_via_outbox(outbox: NotificationOutbox, subject: str, body: str) -> bool:
+    targets = get_notification_targets()
+    if not targets:
+        print("[Notifications] Warning: No notification targets configured")
+        return False
+
+    entry_ids = {outbox.enqueue(target, subject, body) for target in targets}
+
+    result = outbox.drain(deliver_to_target)
+    if result.retried:
+        print(
+            f"[Notifications] {result.retried} notification(s) kept in outbox for retry"
+        )
+
+    # Earlier entries delivered by this drain do not count as sending this one.
+    return not entry_ids.isdisjoint(result.delivered_ids)
 
 
 def notify(subject: str, body: str) -> bool:
@@ -74,19 +182,27 @@ def notify(subject: str, body: str) -> bool:
         subject: The notification title/subject
         body: The notification message body
 
+    When NOTIFICATION_OUTBOX_PATH is set, the notification is stored per target
+    in the outbox first, so failed deliveries are retried on later drains.
+
     Returns:
         True if at least one notification was sent successfully
     """
+    outbox = get_notification_outbox()
+    if outbox is not None:
+        return _notify_via_outbox(outbox, subject, body)
+
     apobj = get_notification_manager()
 
     if not apobj:
         print("[Notifications] Warning: No notification targets configured")
         return False
 
+    apprise_module = _load_apprise()
     result = apobj.notify(
         body=body,
         title=subject,
-        body_format=apprise.NotifyFormat.TEXT,
+        body_format=apprise_module.NotifyFormat.TEXT,
     )
 
     success = bool(result)
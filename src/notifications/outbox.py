@@ -0,0 +1,207 @@
+"""Durable SQLite outbox for notifications that still need to be delivered."""
+
+import contextlib
+import sqlite3
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+DeliverCallable = t.Callable[[str, str, str], bool]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    target TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    last_error TEXT
+)
+"""
+
+
+@dataclass(slots=True)
+class OutboxEntry:
+    """Pending notification for a single target."""
+
+    id: int
+    target: str
+    subject: str
+    body: str
+    attempts: int
+
+
+@dataclass(slots=True)
+class DrainResult:
+    """Outcome of one outbox drain."""
+
+    delivered: int = 0
+    retried: int = 0
+    dropped: int = 0
+    delivered_ids: t.List[int] = field(default_factory=list)
+
+
+class NotificationOutbox:
+    """Store pending notifications per target and retry them with backoff.
+
+    Entries are claimed with a short lease before delivery so that concurrent
+    drains (for example a background drain and a new alert) never send the same
+    entry twice.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = 10,
+        backoff_base_seconds: float = 30.0,
+        backoff_max_seconds: float = 3600.0,
+        lease_seconds: float = 300.0,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        if max_attempts <= 0:
+            raise ValueError("Outbox max attempts must be a positive integer")
+
+        if backoff_base_seconds < 0 or backoff_max_seconds < 0:
+            raise ValueError("Outbox backoff delays cannot be negative")
+
+        self.path = path
+        self.max_attempts = max_attempts
+        self.backoff_base_seconds = backoff_base_seconds
+        self.backoff_max_seconds = backoff_max_seconds
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+
+        with self._connect() as connection:
+            connection.execute(_SCHEMA)
+
+    @contextlib.contextmanager
+    def _connect(self) -> t.Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> t.Iterator[sqlite3.Connection]:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+            connection.execute("COMMIT")
+
+    def enqueue(self, target: str, subject: str, body: str) -> int:
+        """Store a notification for immediate delivery to ``target``, returning its id."""
+        now = self._clock()
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "INSERT INTO outbox (target, subject, body, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (target, subject, body, now, now),
+            )
+
+        return t.cast(int, cursor.lastrowid)
+
+    def pending_count(self) -> int:
+        """Return the number of notifications not yet delivered."""
+        with self._connect() as connection:
+            row = connection.execute("SELECT COUNT(*) FROM outbox").fetchone()
+
+        return int(row[0])
+
+    def _claim_due_entries(self) -> t.List[OutboxEntry]:
+        now = self._clock()
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT id, target, subject, body, attempts FROM outbox "
+                "WHERE next_attempt_at <= ? ORDER BY id",
+                (now,),
+            ).fetchall()
+            connection.executemany(
+                "UPDATE outbox SET next_attempt_at = ? WHERE id = ?",
+                [(now + self.lease_seconds, row[0]) for row in rows],
+            )
+
+        return [OutboxEntry(*row) for row in rows]
+
+    def _compute_backoff_delay_seconds(self, attempts: int) -> float:
+        delay = self.backoff_base_seconds * (2 ** (attempts - 1))
+        return float(min(self.backoff_max_seconds, delay))
+
+    @staticmethod
+    def _deliver_in_order(
+        deliver: DeliverCallable, entries: t.Sequence[OutboxEntry]
+    ) -> t.List[t.Tuple[OutboxEntry, t.Optional[str]]]:
+        outcomes: t.List[t.Tuple[OutboxEntry, t.Optional[str]]] = []
+        for entry in entries:
+            try:
+                delivered = deliver(entry.target, entry.subject, entry.body)
+                error = None if delivered else "Delivery failed"
+            except Exception as delivery_error:
+                error = type(delivery_error).__name__
+
+            outcomes.append((entry, error))
+
+        return outcomes
+
+    def drain(self, deliver: DeliverCallable) -> DrainResult:
+        """Deliver all due entries, concurrently across targets.
+
+        Entries for the same target are sent in enqueue order; failed entries are
+        rescheduled with exponential backoff and dropped after ``max_attempts``.
+        """
+        entries = self._claim_due_entries()
+        result = DrainResult()
+        if not entries:
+            return result
+
+        entries_by_target: t.Dict[str, t.List[OutboxEntry]] = {}
+        for entry in entries:
+            entries_by_target.setdefault(entry.target, []).append(entry)
+
+        with ThreadPoolExecutor(max_workers=len(entries_by_target)) as executor:
+            futures = [
+                executor.submit(self._deliver_in_order, deliver, target_entries)
+                for target_entries in entries_by_target.values()
+            ]
+            outcomes = [outcome for future in futures for outcome in future.result()]
+
+        now = self._clock()
+        with self._transaction() as connection:
+            for entry, error in outcomes:
+                if error is None:
+                    connection.execute("DELETE FROM outbox WHERE id = ?", (entry.id,))
+                    result.delivered += 1
+                    result.delivered_ids.append(entry.id)
+                    continue
+
+                attempts = entry.attempts + 1
+                if attempts >= self.max_attempts:
+                    connection.execute("DELETE FROM outbox WHERE id = ?", (entry.id,))
+                    print(
+                        f"[Notifications] Dropping notification for {entry.target} "
+                        f"after {attempts} failed attempt(s)"
+                    )
+                    result.dropped += 1
+                    continue
+
+                connection.execute(
+                    "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ? "
+                    "WHERE id = ?",
+                    (
+                        attempts,
+                        now + self._compute_backoff_delay_seconds(attempts),
+                        error,
+                        entry.id,
+                    ),
+                )
+                result.retried += 1
+
+        return result
@@ -1,24 +1,34 @@
 """Rates package for provider adapters and aggregation orchestration."""
 
-from rates.models import AggregatedRateResult, RateDetail
+from rates.currencies import Pair
+from rates.models import AggregatedRateResult, RateDetail, RateDetailBatch, RateStatus
+from rates.planner import RatePlan
 from rates.service import (
     aggregate_rate_details,
     fetch_and_aggregate_rate,
     fetch_rate_details,
+    fetch_rate_details_for_pairs,
     get_aggregation_method,
     get_enabled_provider_names,
     get_min_successful_sources,
+    plan_rate_requests,
     validate_min_successful_sources,
 )
 
 __all__ = [
     "AggregatedRateResult",
+    "Pair",
+    "RatePlan",
     "RateDetail",
+    "RateDetailBatch",
+    "RateStatus",
     "aggregate_rate_details",
     "fetch_and_aggregate_rate",
     "fetch_rate_details",
+    "fetch_rate_details_for_pairs",
     "get_aggregation_method",
     "get_enabled_provider_names",
     "get_min_successful_sources",
+    "plan_rate_requests",
     "validate_min_successful_sources",
 ]
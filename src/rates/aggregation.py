@@ -3,11 +3,36 @@
 import typing as t
 from statistics import mean, median
 
-SUPPORTED_AGGREGATION_METHODS = {"median", "mean"}
+SUPPORTED_AGGREGATION_METHODS = {"median", "mean", "weighted_median", "weighted_mean"}
+WEIGHTED_AGGREGATION_METHODS = {"weighted_median", "weighted_mean"}
 
 
-def aggregate_rates(rates: t.List[float], method: str) -> float:
-    """Aggregate rates using the selected method."""
+def _weighted_median(rates: t.Sequence[float], weights: t.Sequence[float]) -> float:
+    ordered = sorted(zip(rates, weights))
+    half_weight = sum(weights) / 2
+    cumulative_weight = 0.0
+    for index, (rate, weight) in enumerate(ordered):
+        cumulative_weight += weight
+        if cumulative_weight > half_weight:
+            return rate
+
+        if cumulative_weight == half_weight:
+            return (rate + ordered[index + 1][0]) / 2
+
+    return ordered[-1][0]
+
+
+def aggregate_rates(
+    rates: t.List[float],
+    method: str,
+    weights: t.Optional[t.Sequence[float]] = None,
+) -> float:
+    """Aggregate rates using the selected method.
+
+    ``weights`` (one positive weight per rate, default ``1``) is only used by
+    the ``weighted_*`` methods; with equal weights they match ``median`` and
+    ``mean``.
+    """
     if not rates:
         raise ValueError("At least one successful rate is required for aggregation")
 
@@ -19,6 +44,22 @@ def aggregate_rates(rates: t.List[float], method: str) -> float:
     if normalized_method == "mean":
         return float(mean(rates))
 
+    if normalized_method in WEIGHTED_AGGREGATION_METHODS:
+        rate_weights = list(weights) if weights is not None else [1.0] * len(rates)
+        if len(rate_weights) != len(rates):
+            raise ValueError("Aggregation needs exactly one weight per rate")
+
+        if any(weight <= 0 for weight in rate_weights):
+            raise ValueError("Aggregation weights must be positive")
+
+        if normalized_method == "weighted_median":
+            return float(_weighted_median(rates, rate_weights))
+
+        return float(
+            sum(rate * weight for rate, weight in zip(rates, rate_weights))
+            / sum(rate_weights)
+        )
+
     raise ValueError(
         f"Unsupported aggregation method '{method}'. Supported methods: {sorted(SUPPORTED_AGGREGATION_METHODS)}"
     )
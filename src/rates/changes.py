@@ -0,0 +1,80 @@
+"""Change detection for provider details between poll ticks.
+
+Most providers publish new rates hourly or daily, so in a long-running poll
+loop most ``(provider, pair)`` inputs are identical from one tick to the next.
+``RateChangeTracker`` remembers each provider's last ``(status, rate, error)``
+per pair, and per rule the inputs and settings it was last evaluated with, so
+callers only re-evaluate rules whose inputs or settings changed. Several rules
+on one pair are tracked independently.
+"""
+
+import typing as t
+
+from rates.currencies import Pair
+from rates.models import RateDetail, RateDetailBatch, RateStatus
+
+_SourceInput = t.Tuple[RateStatus, t.Optional[float], t.Optional[str]]
+
+
+def _source_inputs(details: t.Sequence[RateDetail]) -> t.Dict[str, _SourceInput]:
+    if isinstance(details, RateDetailBatch):
+        return {
+            source: (status, rate, error)
+            for source, _, status, rate, error in details.rows()
+        }
+
+    return {
+        detail.source: (detail.status, detail.rate, detail.error) for detail in details
+    }
+
+
+class RateChangeTracker:
+    """Remember per-provider inputs for each pair and evaluations for each rule."""
+
+    def __init__(self) -> None:
+        self._inputs: t.Dict[Pair, t.Dict[str, _SourceInput]] = {}
+        self._evaluations: t.Dict[
+            t.Hashable, t.Tuple[t.Dict[str, _SourceInput], t.Hashable]
+        ] = {}
+
+    def changed_sources(
+        self, pair: t.Union[Pair, str], details: t.Sequence[RateDetail]
+    ) -> t.List[str]:
+        """Record the pair's details and return providers whose input changed.
+
+        Providers that appeared or disappeared since the previous call count as
+        changed. The first call for a pair returns every provider.
+        """
+        pair = Pair.parse(pair)
+        current = _source_inputs(details)
+        previous = self._inputs.get(pair)
+        self._inputs[pair] = current
+
+        if previous is None:
+            return list(current)
+
+        changed = [
+            source
+            for source, source_input in current.items()
+            if previous.get(source) != source_input
+        ]
+        changed.extend(source for source in previous if source not in current)
+        return changed
+
+    def should_evaluate(
+        self,
+        rule: t.Hashable,
+        details: t.Sequence[RateDetail],
+        settings: t.Hashable = None,
+    ) -> bool:
+        """Return whether ``rule`` needs re-evaluating since its last call.
+
+        ``rule`` identifies one evaluation, such as a pair and threshold.
+        ``settings`` covers everything else the result depends on, such as the
+        aggregation method, provider weights and which quotes are too old; a
+        change there also counts.
+        """
+        evaluation = (_source_inputs(details), settings)
+        previous = self._evaluations.get(rule)
+        self._evaluations[rule] = evaluation
+        return previous != evaluation
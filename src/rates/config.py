@@ -0,0 +1,649 @@
+"""Validated, immutable configuration snapshots for the rates package.
+
+Settings are parsed once into a frozen ``RatesConfig`` and passed to
+``rates.service`` and ``rates.http_client`` instead of being re-read from
+``os.environ`` on every request. ``ConfigLoader`` applies ``.env`` and an
+optional ``RATE_CONFIG_FILE`` (same ``KEY=value`` format) to the environment
+before parsing, and can reload the snapshot when those files change. Variables
+set in the process environment always take precedence over files.
+"""
+
+import importlib.util
+import os
+import types
+import typing as t
+from dataclasses import dataclass, field
+
+from dotenv import dotenv_values, find_dotenv
+
+from rates.aggregation import SUPPORTED_AGGREGATION_METHODS
+from rates.planner import SUPPORTED_PLAN_MODES
+from rates.reliability import ReliabilityTracker, get_reliability_tracker
+from rates.retry import SUPPORTED_RETRY_ERROR_CLASSES, RetryPolicy
+from rates.worker_pool import FetchWorkerPool, get_worker_pool
+
+ConfigValues = t.Mapping[str, str]
+
+_TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+_FALSE_VALUES = {"0", "false", "no", "n", "off"}
+
+
+def _read(values: ConfigValues, key: str, default: str) -> str:
+    return values.get(key, default).strip()
+
+
+def parse_provider_names(values: ConfigValues) -> t.List[str]:
+    """Parse ``RATE_SOURCES`` into normalized, de-duplicated provider names."""
+    provider_names = [
+        name.strip().lower()
+        for name in values.get("RATE_SOURCES", "openexchangerates").split(",")
+        if name.strip()
+    ]
+
+    if not provider_names:
+        raise ValueError("RATE_SOURCES must contain at least one provider")
+
+    return list(dict.fromkeys(provider_names))
+
+
+def parse_aggregation_method(values: ConfigValues) -> str:
+    """Parse and validate ``AGGREGATION_METHOD``."""
+    method = _read(values, "AGGREGATION_METHOD", "median").lower()
+
+    if method not in SUPPORTED_AGGREGATION_METHODS:
+        raise ValueError(
+            f"AGGREGATION_METHOD must be one of {sorted(SUPPORTED_AGGREGATION_METHODS)}, got '{method}'"
+        )
+
+    return method
+
+
+def parse_min_successful_sources(values: ConfigValues) -> int:
+    """Parse and validate ``MIN_SUCCESSFUL_SOURCES``."""
+    raw_value = _read(values, "MIN_SUCCESSFUL_SOURCES", "1")
+
+    if not raw_value:
+        raise ValueError("MIN_SUCCESSFUL_SOURCES cannot be empty")
+
+    min_successful_sources = int(raw_value)
+    if min_successful_sources <= 0:
+        raise ValueError("MIN_SUCCESSFUL_SOURCES must be a positive integer")
+
+    return min_successful_sources
+
+
+def parse_plan_mode(values: ConfigValues) -> str:
+    """Parse and validate ``RATE_PLAN_MODE``."""
+    mode = _read(values, "RATE_PLAN_MODE", "all").lower()
+
+    if mode not in SUPPORTED_PLAN_MODES:
+        raise ValueError(
+            f"RATE_PLAN_MODE must be one of {sorted(SUPPORTED_PLAN_MODES)}, got '{mode}'"
+        )
+
+    return mode
+
+
+def parse_provider_mapping(values: ConfigValues, key: str) -> t.Dict[str, float]:
+    """Parse a ``provider=value,...`` setting into non-negative numbers."""
+    mapping: t.Dict[str, float] = {}
+
+    for raw_entry in _read(values, key, "").split(","):
+        if not raw_entry.strip():
+            continue
+
+        provider_name, separator, raw_number = raw_entry.partition("=")
+        if not separator:
+            raise ValueError(
+                f"{key} entries must look like provider=value, got '{raw_entry.strip()}'"
+            )
+
+        number = float(raw_number)
+        if number < 0:
+            raise ValueError(f"{key} values cannot be negative")
+
+        mapping[provider_name.strip().lower()] = number
+
+    return mapping
+
+
+def parse_provider_counts(
+    values: ConfigValues, key: str, minimum: int = 0
+) -> t.Dict[str, int]:
+    """Parse a ``provider=N,...`` setting whose values are whole numbers."""
+    counts = parse_provider_mapping(values, key)
+    for provider_name, count in counts.items():
+        if count < minimum or count != int(count):
+            raise ValueError(
+                f"{key} for '{provider_name}' must be a whole number of at least {minimum}"
+            )
+
+    return {provider_name: int(count) for provider_name, count in counts.items()}
+
+
+def parse_max_quote_age_seconds(values: ConfigValues) -> t.Optional[float]:
+    """Parse ``RATE_MAX_QUOTE_AGE_SECONDS``, returning None when unset."""
+    raw_value = _read(values, "RATE_MAX_QUOTE_AGE_SECONDS", "")
+    if not raw_value:
+        return None
+
+    max_age_seconds = float(raw_value)
+    if max_age_seconds <= 0:
+        raise ValueError("RATE_MAX_QUOTE_AGE_SECONDS must be greater than 0")
+
+    return max_age_seconds
+
+
+def parse_http_timeout_seconds(values: ConfigValues) -> float:
+    """Parse and validate ``HTTP_TIMEOUT_SECONDS``."""
+    timeout_seconds = float(_read(values, "HTTP_TIMEOUT_SECONDS", "12"))
+
+    if timeout_seconds <= 0:
+        raise ValueError("HTTP_TIMEOUT_SECONDS must be greater than 0")
+
+    return timeout_seconds
+
+
+def parse_http_max_retries(values: ConfigValues) -> int:
+    """Parse and validate ``HTTP_MAX_RETRIES``."""
+    max_retries = int(_read(values, "HTTP_MAX_RETRIES", "2"))
+
+    if max_retries < 0:
+        raise ValueError("HTTP_MAX_RETRIES cannot be negative")
+
+    return max_retries
+
+
+def parse_http_backoff_base_seconds(values: ConfigValues) -> float:
+    """Parse and validate ``HTTP_BACKOFF_BASE_SECONDS``."""
+    backoff_base_seconds = float(_read(values, "HTTP_BACKOFF_BASE_SECONDS", "0.5"))
+
+    if backoff_base_seconds < 0:
+        raise ValueError("HTTP_BACKOFF_BASE_SECONDS cannot be negative")
+
+    return backoff_base_seconds
+
+
+def parse_http_backoff_max_seconds(values: ConfigValues) -> float:
+    """Parse and validate ``HTTP_BACKOFF_MAX_SECONDS``."""
+    backoff_max_seconds = float(_read(values, "HTTP_BACKOFF_MAX_SECONDS", "4"))
+
+    if backoff_max_seconds < 0:
+        raise ValueError("HTTP_BACKOFF_MAX_SECONDS cannot be negative")
+
+    return backoff_max_seconds
+
+
+def parse_bool(values: ConfigValues, key: str, default: str) -> bool:
+    """Parse a boolean setting; unset or empty values fall back to ``default``."""
+    raw_value = _read(values, key, "").lower() or default
+
+    if raw_value in _TRUE_VALUES:
+        return True
+
+    if raw_value in _FALSE_VALUES:
+        return False
+
+    raise ValueError(
+        f"{key} must be a boolean value (true/false/1/0/yes/no), got '{raw_value}'"
+    )
+
+
+def parse_streaming_json_extraction(values: ConfigValues) -> bool:
+    """Parse ``STREAMING_JSON_EXTRACTION`` as a boolean."""
+    return parse_bool(values, "STREAMING_JSON_EXTRACTION", "false")
+
+
+def parse_http_conditional_requests(values: ConfigValues) -> bool:
+    """Parse ``HTTP_CONDITIONAL_REQUESTS`` as a boolean."""
+    return parse_bool(values, "HTTP_CONDITIONAL_REQUESTS", "true")
+
+
+def parse_http2_enabled(values: ConfigValues) -> bool:
+    """Parse ``HTTP2_ENABLED``, requiring the optional ``h2`` package when set."""
+    enabled = parse_bool(values, "HTTP2_ENABLED", "false")
+
+    if enabled and importlib.util.find_spec("h2") is None:
+        raise ValueError(
+            "HTTP2_ENABLED requires the 'h2' package (pip install 'httpx[http2]')"
+        )
+
+    return enabled
+
+
+def parse_http_compression(values: ConfigValues) -> bool:
+    """Parse ``HTTP_COMPRESSION`` as a boolean."""
+    return parse_bool(values, "HTTP_COMPRESSION", "true")
+
+
+def parse_http_cache_dir(values: ConfigValues) -> t.Optional[str]:
+    """Parse ``HTTP_CACHE_DIR``, returning None when unset."""
+    return _read(values, "HTTP_CACHE_DIR", "") or None
+
+
+def parse_provider_base_url_override(values: ConfigValues) -> t.Optional[str]:
+    """Parse ``PROVIDER_BASE_URL_OVERRIDE``, returning None when unset."""
+    base_url = _read(values, "PROVIDER_BASE_URL_OVERRIDE", "").rstrip("/")
+
+    if base_url and not base_url.startswith(("http://", "https://")):
+        raise ValueError(
+            f"PROVIDER_BASE_URL_OVERRIDE must start with http:// or https://, got '{base_url}'"
+        )
+
+    return base_url or None
+
+
+def parse_http_retry_on(values: ConfigValues) -> t.FrozenSet[str]:
+    """Parse ``HTTP_RETRY_ON`` into the set of retried error classes."""
+    raw_value = _read(
+        values, "HTTP_RETRY_ON", ",".join(sorted(SUPPORTED_RETRY_ERROR_CLASSES))
+    )
+    error_classes = {
+        name.strip().lower() for name in raw_value.split(",") if name.strip()
+    }
+
+    unsupported = error_classes - SUPPORTED_RETRY_ERROR_CLASSES
+    if unsupported:
+        raise ValueError(
+            f"HTTP_RETRY_ON must only contain {sorted(SUPPORTED_RETRY_ERROR_CLASSES)}, got {sorted(unsupported)}"
+        )
+
+    return frozenset(error_classes)
+
+
+def parse_http_retry_budget_ratio(values: ConfigValues) -> float:
+    """Parse and validate ``HTTP_RETRY_BUDGET_RATIO``."""
+    ratio = float(_read(values, "HTTP_RETRY_BUDGET_RATIO", "0.1"))
+
+    if ratio < 0:
+        raise ValueError("HTTP_RETRY_BUDGET_RATIO cannot be negative")
+
+    return ratio
+
+
+def parse_http_retry_budget_window_seconds(values: ConfigValues) -> float:
+    """Parse and validate ``HTTP_RETRY_BUDGET_WINDOW_SECONDS``."""
+    window_seconds = float(_read(values, "HTTP_RETRY_BUDGET_WINDOW_SECONDS", "60"))
+
+    if window_seconds <= 0:
+        raise ValueError("HTTP_RETRY_BUDGET_WINDOW_SECONDS must be greater than 0")
+
+    return window_seconds
+
+
+def parse_http_retry_budget_min_retries(values: ConfigValues) -> int:
+    """Parse and validate ``HTTP_RETRY_BUDGET_MIN_RETRIES``."""
+    min_retries = int(_read(values, "HTTP_RETRY_BUDGET_MIN_RETRIES", "10"))
+
+    if min_retries < 0:
+        raise ValueError("HTTP_RETRY_BUDGET_MIN_RETRIES cannot be negative")
+
+    return min_retries
+
+
+@dataclass(slots=True, frozen=True)
+class HttpConfig:
+    """HTTP client settings used on every provider request."""
+
+    timeout_seconds: float = 12.0
+    max_retries: int = 2
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 4.0
+    streaming_json_extraction: bool = False
+    conditional_requests: bool = True
+    cache_dir: t.Optional[str] = None
+    http2: bool = False
+    compression: bool = True
+    retry_on: t.FrozenSet[str] = frozenset(SUPPORTED_RETRY_ERROR_CLASSES)
+    retry_budget_ratio: float = 0.1
+    retry_budget_window_seconds: float = 60.0
+    retry_budget_min_retries: int = 10
+    provider_max_retries: t.Mapping[str, int] = field(
+        default_factory=lambda: types.MappingProxyType({})
+    )
+    base_url_override: t.Optional[str] = None
+
+    def retry_policy(self, provider: t.Optional[str] = None) -> RetryPolicy:
+        """Return the retry policy for ``provider`` (default: the global one)."""
+        return RetryPolicy(
+            max_retries=self.provider_max_retries.get(provider or "", self.max_retries),
+            backoff_base_seconds=self.backoff_base_seconds,
+            backoff_max_seconds=self.backoff_max_seconds,
+            retry_on=self.retry_on,
+        )
+
+    @classmethod
+    def from_values(cls, values: ConfigValues) -> "HttpConfig":
+        """Build the HTTP client settings, including per-provider retry overrides."""
+        return cls(
+            timeout_seconds=parse_http_timeout_seconds(values),
+            max_retries=parse_http_max_retries(values),
+            backoff_base_seconds=parse_http_backoff_base_seconds(values),
+            backoff_max_seconds=parse_http_backoff_max_seconds(values),
+            streaming_json_extraction=parse_streaming_json_extraction(values),
+            conditional_requests=parse_http_conditional_requests(values),
+            cache_dir=parse_http_cache_dir(values),
+            http2=parse_http2_enabled(values),
+            compression=parse_http_compression(values),
+            retry_on=parse_http_retry_on(values),
+            retry_budget_ratio=parse_http_retry_budget_ratio(values),
+            retry_budget_window_seconds=parse_http_retry_budget_window_seconds(values),
+            retry_budget_min_retries=parse_http_retry_budget_min_retries(values),
+            provider_max_retries=types.MappingProxyType(
+                parse_provider_counts(values, "HTTP_PROVIDER_MAX_RETRIES")
+            ),
+            base_url_override=parse_provider_base_url_override(values),
+        )
+
+
+def parse_reliability_state_path(values: ConfigValues) -> t.Optional[str]:
+    """Parse ``RELIABILITY_STATE_PATH``, returning None when unset."""
+    return _read(values, "RELIABILITY_STATE_PATH", "") or None
+
+
+def parse_reliability_min_samples(values: ConfigValues) -> int:
+    """Parse and validate ``RELIABILITY_MIN_SAMPLES``."""
+    min_samples = int(_read(values, "RELIABILITY_MIN_SAMPLES", "5"))
+
+    if min_samples < 1:
+        raise ValueError("RELIABILITY_MIN_SAMPLES must be at least 1")
+
+    return min_samples
+
+
+def parse_reliability_min_weight(values: ConfigValues) -> float:
+    """Parse and validate ``RELIABILITY_MIN_WEIGHT``."""
+    min_weight = float(_read(values, "RELIABILITY_MIN_WEIGHT", "0.2"))
+
+    if not 0 <= min_weight <= 1:
+        raise ValueError("RELIABILITY_MIN_WEIGHT must be between 0 and 1")
+
+    return min_weight
+
+
+def parse_reliability_retry_seconds(values: ConfigValues) -> float:
+    """Parse and validate ``RELIABILITY_RETRY_SECONDS``."""
+    retry_seconds = float(_read(values, "RELIABILITY_RETRY_SECONDS", "3600"))
+
+    if retry_seconds < 0:
+        raise ValueError("RELIABILITY_RETRY_SECONDS cannot be negative")
+
+    return retry_seconds
+
+
+@dataclass(slots=True, frozen=True)
+class ReliabilityConfig:
+    """Provider reliability scoring settings."""
+
+    state_path: t.Optional[str] = None
+    min_samples: int = 5
+    min_weight: float = 0.2
+    retry_seconds: float = 3600.0
+
+    def tracker(self) -> ReliabilityTracker:
+        """Return the process-wide reliability tracker for these settings."""
+        return get_reliability_tracker(
+            self.state_path,
+            min_samples=self.min_samples,
+            min_weight=self.min_weight,
+            retry_seconds=self.retry_seconds,
+        )
+
+    @classmethod
+    def from_values(cls, values: ConfigValues) -> "ReliabilityConfig":
+        """Build the scoring settings; scores stay in memory without a state path."""
+        return cls(
+            state_path=parse_reliability_state_path(values),
+            min_samples=parse_reliability_min_samples(values),
+            min_weight=parse_reliability_min_weight(values),
+            retry_seconds=parse_reliability_retry_seconds(values),
+        )
+
+
+def parse_fetch_max_workers(values: ConfigValues) -> int:
+    """Parse and validate ``FETCH_MAX_WORKERS``."""
+    max_workers = int(_read(values, "FETCH_MAX_WORKERS", "8"))
+
+    if max_workers < 1:
+        raise ValueError("FETCH_MAX_WORKERS must be at least 1")
+
+    return max_workers
+
+
+def parse_provider_max_concurrency(values: ConfigValues) -> t.Dict[str, int]:
+    """Parse ``PROVIDER_MAX_CONCURRENCY`` (``provider=N`` pairs)."""
+    return parse_provider_counts(values, "PROVIDER_MAX_CONCURRENCY", minimum=1)
+
+
+@dataclass(slots=True, frozen=True)
+class WorkerPoolConfig:
+    """Settings of the long-lived pool running provider requests."""
+
+    max_workers: int = 8
+    thread_name_prefix: str = "rates-fetch"
+    provider_limits: t.Mapping[str, int] = field(
+        default_factory=lambda: types.MappingProxyType({})
+    )
+
+    def pool(self) -> FetchWorkerPool:
+        """Return the process-wide worker pool for these settings."""
+        return get_worker_pool(
+            self.max_workers,
+            thread_name_prefix=self.thread_name_prefix,
+            provider_limits=self.provider_limits,
+        )
+
+    @classmethod
+    def from_values(cls, values: ConfigValues) -> "WorkerPoolConfig":
+        """Build the fetch pool size and per-provider concurrency limits."""
+        return cls(
+            max_workers=parse_fetch_max_workers(values),
+            thread_name_prefix=_read(values, "FETCH_THREAD_NAME_PREFIX", "rates-fetch"),
+            provider_limits=types.MappingProxyType(
+                parse_provider_max_concurrency(values)
+            ),
+        )
+
+
+def parse_profile_output_dir(values: ConfigValues) -> t.Optional[str]:
+    """Parse ``PROFILE_OUTPUT_DIR``, returning None (profiling off) when unset."""
+    return _read(values, "PROFILE_OUTPUT_DIR", "") or None
+
+
+def parse_profile_sample_rate(values: ConfigValues) -> float:
+    """Parse and validate ``PROFILE_SAMPLE_RATE``."""
+    sample_rate = float(_read(values, "PROFILE_SAMPLE_RATE", "1"))
+
+    if not 0 <= sample_rate <= 1:
+        raise ValueError("PROFILE_SAMPLE_RATE must be between 0 and 1")
+
+    return sample_rate
+
+
+def parse_profile_interval_seconds(values: ConfigValues) -> float:
+    """Parse and validate ``PROFILE_INTERVAL_SECONDS``."""
+    interval_seconds = float(_read(values, "PROFILE_INTERVAL_SECONDS", "0.005"))
+
+    if interval_seconds <= 0:
+        raise ValueError("PROFILE_INTERVAL_SECONDS must be positive")
+
+    return interval_seconds
+
+
+def parse_profile_trace_memory(values: ConfigValues) -> bool:
+    """Parse ``PROFILE_TRACE_MEMORY``."""
+    return parse_bool(values, "PROFILE_TRACE_MEMORY", "true")
+
+
+@dataclass(slots=True, frozen=True)
+class ProfilingConfig:
+    """Opt-in profiling settings, see ``rates.profiling``."""
+
+    output_dir: t.Optional[str] = None
+    sample_rate: float = 1.0
+    interval_seconds: float = 0.005
+    trace_memory: bool = True
+
+    @property
+    def enabled(self) -> bool:
+        """Whether runs should be profiled at all."""
+        return self.output_dir is not None and self.sample_rate > 0
+
+    @classmethod
+    def from_values(cls, values: ConfigValues) -> "ProfilingConfig":
+        """Build the profiling settings; profiling stays off without an output dir."""
+        return cls(
+            output_dir=parse_profile_output_dir(values),
+            sample_rate=parse_profile_sample_rate(values),
+            interval_seconds=parse_profile_interval_seconds(values),
+            trace_memory=parse_profile_trace_memory(values),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class RatesConfig:
+    """Snapshot of every setting read by ``rates.service`` and its providers."""
+
+    provider_names: t.Tuple[str, ...] = ("openexchangerates",)
+    aggregation_method: str = "median"
+    min_successful_sources: int = 1
+    plan_mode: str = "all"
+    provider_request_costs: t.Mapping[str, float] = field(
+        default_factory=lambda: types.MappingProxyType({})
+    )
+    provider_quotas: t.Mapping[str, int] = field(
+        default_factory=lambda: types.MappingProxyType({})
+    )
+    max_quote_age_seconds: t.Optional[float] = None
+    http: HttpConfig = field(default_factory=HttpConfig)
+    reliability: ReliabilityConfig = field(default_factory=ReliabilityConfig)
+    profiling: ProfilingConfig = field(default_factory=ProfilingConfig)
+    workers: WorkerPoolConfig = field(default_factory=WorkerPoolConfig)
+
+    @classmethod
+    def from_values(cls, values: ConfigValues) -> "RatesConfig":
+        """Parse and validate every setting from a mapping such as ``os.environ``."""
+        return cls(
+            provider_names=tuple(parse_provider_names(values)),
+            aggregation_method=parse_aggregation_method(values),
+            min_successful_sources=parse_min_successful_sources(values),
+            plan_mode=parse_plan_mode(values),
+            provider_request_costs=types.MappingProxyType(
+                parse_provider_mapping(values, "PROVIDER_REQUEST_COSTS")
+            ),
+            provider_quotas=types.MappingProxyType(
+                parse_provider_counts(values, "PROVIDER_QUOTAS")
+            ),
+            max_quote_age_seconds=parse_max_quote_age_seconds(values),
+            http=HttpConfig.from_values(values),
+            reliability=ReliabilityConfig.from_values(values),
+            profiling=ProfilingConfig.from_values(values),
+            workers=WorkerPoolConfig.from_values(values),
+        )
+
+
+class ConfigLoader:
+    """Build ``RatesConfig`` snapshots from the environment and config files.
+
+    ``paths`` defaults to the nearest ``.env`` and ``RATE_CONFIG_FILE``; later
+    files override earlier ones. Values from files are written into
+    ``environ`` so provider credentials and script settings see them too.
+    """
+
+    def __init__(
+        self,
+        paths: t.Optional[t.Sequence[str]] = None,
+        environ: t.Optional[t.MutableMapping[str, str]] = None,
+    ):
+        self._explicit_paths = list(paths) if paths is not None else None
+        self._environ = environ if environ is not None else os.environ
+        self._applied: t.Dict[str, str] = {}
+        self._mtimes: t.Dict[str, t.Optional[float]] = {}
+
+    def _paths(self) -> t.List[str]:
+        if self._explicit_paths is not None:
+            return self._explicit_paths
+
+        paths = [find_dotenv(usecwd=True), self._environ.get("RATE_CONFIG_FILE", "")]
+        return [path.strip() for path in paths if path.strip()]
+
+    @staticmethod
+    def _mtime(path: str) -> t.Optional[float]:
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return None
+
+    def _apply_files(self, paths: t.Sequence[str]) -> None:
+        file_values: t.Dict[str, str] = {}
+        for path in paths:
+            if os.path.isfile(path):
+                file_values.update(
+                    (key, value)
+                    for key, value in dotenv_values(path).items()
+                    if value is not None
+                )
+
+        applied: t.Dict[str, str] = {}
+        for key, value in file_values.items():
+            current = self._environ.get(key)
+            if current is not None and current != self._applied.get(key):
+                continue  # set by the process environment
+
+            self._environ[key] = value
+            applied[key] = value
+
+        for key, value in self._applied.items():
+            if key not in applied and self._environ.get(key) == value:
+                del self._environ[key]
+
+        self._applied = applied
+
+    def load(self) -> RatesConfig:
+        """Apply config files to the environment and parse a new snapshot."""
+        paths = self._paths()
+        self._mtimes = {path: self._mtime(path) for path in paths}
+        self._apply_files(paths)
+        return RatesConfig.from_values(self._environ)
+
+    def has_changed(self) -> bool:
+        """Return True when a config file was added, removed or modified."""
+        paths = self._paths()
+        return set(paths) != set(self._mtimes) or any(
+            self._mtime(path) != self._mtimes[path] for path in paths
+        )
+
+    def reload_if_changed(self) -> t.Optional[RatesConfig]:
+        """Reload and install a new snapshot when config files changed."""
+        if not self.has_changed():
+            return None
+
+        config = self.load()
+        set_config(config)
+        return config
+
+
+_current_config: t.Optional[RatesConfig] = None
+
+
+def get_config() -> RatesConfig:
+    """Return the active snapshot, parsing the environment on first use."""
+    global _current_config
+
+    if _current_config is None:
+        _current_config = RatesConfig.from_values(os.environ)
+
+    return _current_config
+
+
+def set_config(config: t.Optional[RatesConfig]) -> None:
+    """Install ``config`` as the active snapshot (``None`` re-reads on next use)."""
+    global _current_config
+    _current_config = config
+
+
+def load_config(paths: t.Optional[t.Sequence[str]] = None) -> RatesConfig:
+    """Load config files and the environment once and install the snapshot."""
+    config = ConfigLoader(paths).load()
+    set_config(config)
+    return config
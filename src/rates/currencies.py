@@ -0,0 +1,138 @@
+"""Interned currency codes and currency pairs.
+
+ISO 4217 codes map to small integers from a fixed table; other codes (for
+example crypto assets served by some providers) get ids after the table on
+first use. ``Pair`` objects are interned so a run creates one object per pair
+and compares pairs by identity.
+
+Interned entries live for the whole process, so at most
+``MAX_EXTRA_CURRENCIES`` non-ISO codes and ``MAX_PAIRS`` pairs are interned;
+past that, new codes and pairs are rejected with ``ValueError``.
+"""
+
+import threading
+import typing as t
+
+ISO_4217_CODES: t.Tuple[str, ...] = (
+    "AED", "AFN", "ALL", "AMD", "ANG", "AOA", "ARS", "AUD", "AWG", "AZN",
+    "BAM", "BBD", "BDT", "BGN", "BHD", "BIF", "BMD", "BND", "BOB", "BRL",
+    "BSD", "BTN", "BWP", "BYN", "BZD", "CAD", "CDF", "CHF", "CLP", "CNY",
+    "COP", "CRC", "CUP", "CVE", "CZK", "DJF", "DKK", "DOP", "DZD", "EGP",
+    "ERN", "ETB", "EUR", "FJD", "FKP", "GBP", "GEL", "GHS", "GIP", "GMD",
+    "GNF", "GTQ", "GYD", "HKD", "HNL", "HTG", "HUF", "IDR", "ILS", "INR",
+    "IQD", "IRR", "ISK", "JMD", "JOD", "JPY", "KES", "KGS", "KHR", "KMF",
+    "KPW", "KRW", "KWD", "KYD", "KZT", "LAK", "LBP", "LKR", "LRD", "LSL",
+    "LYD", "MAD", "MDL", "MGA", "MKD", "MMK", "MNT", "MOP", "MRU", "MUR",
+    "MVR", "MWK", "MXN", "MYR", "MZN", "NAD", "NGN", "NIO", "NOK", "NPR",
+    "NZD", "OMR", "PAB", "PEN", "PGK", "PHP", "PKR", "PLN", "PYG", "QAR",
+    "RON", "RSD", "RUB", "RWF", "SAR", "SBD", "SCR", "SDG", "SEK", "SGD",
+    "SHP", "SLE", "SOS", "SRD", "SSP", "STN", "SVC", "SYP", "SZL", "THB",
+    "TJS", "TMT", "TND", "TOP", "TRY", "TTD", "TWD", "TZS", "UAH", "UGX",
+    "USD", "UYU", "UZS", "VES", "VND", "VUV", "WST", "XAF", "XAG", "XAU",
+    "XCD", "XDR", "XOF", "XPD", "XPF", "XPT", "YER", "ZAR", "ZMW", "ZWG",
+)  # fmt: skip
+
+MAX_EXTRA_CURRENCIES = 1024
+MAX_PAIRS = 65536
+
+_lock = threading.Lock()
+_currency_codes: t.List[str] = list(ISO_4217_CODES)
+_currency_ids: t.Dict[str, int] = {
+    code: currency_id for currency_id, code in enumerate(ISO_4217_CODES)
+}
+_pairs: t.Dict[t.Tuple[str, str], "Pair"] = {}
+_pairs_by_id: t.List["Pair"] = []
+
+
+def currency_id(code: str) -> int:
+    """Return the small integer id of a currency code, assigning one if new."""
+    existing_id = _currency_ids.get(code)
+    if existing_id is not None:
+        return existing_id
+
+    with _lock:
+        existing_id = _currency_ids.get(code)
+        if existing_id is None:
+            if len(_currency_codes) - len(ISO_4217_CODES) >= MAX_EXTRA_CURRENCIES:
+                raise ValueError(
+                    f"Cannot intern currency '{code}': "
+                    f"{MAX_EXTRA_CURRENCIES} non-ISO codes already in use"
+                )
+            existing_id = _currency_ids[code] = _append(_currency_codes, code)
+
+        return existing_id
+
+
+def currency_code(code_id: int) -> str:
+    """Return the currency code for an id returned by ``currency_id``."""
+    return _currency_codes[code_id]
+
+
+def _append(values: t.List[t.Any], value: t.Any) -> int:
+    values.append(value)
+    return len(values) - 1
+
+
+class Pair(str):
+    """Interned ``BASE/QUOTE`` pair name with integer currency and pair ids.
+
+    ``Pair("EUR", "MAD")`` always returns the same object, so it hashes and
+    compares like the plain ``"EUR/MAD"`` string but pair-to-pair lookups
+    resolve on identity.
+    """
+
+    base: str
+    quote: str
+    base_id: int
+    quote_id: int
+    id: int
+
+    def __new__(cls, base_currency: str, quote_currency: str) -> "Pair":
+        key = (base_currency, quote_currency)
+        existing = _pairs.get(key)
+        if existing is not None:
+            return existing
+
+        base_id = currency_id(base_currency)
+        quote_id = currency_id(quote_currency)
+        with _lock:
+            existing = _pairs.get(key)
+            if existing is not None:
+                return existing
+
+            if len(_pairs_by_id) >= MAX_PAIRS:
+                raise ValueError(
+                    f"Cannot intern pair '{base_currency}/{quote_currency}': "
+                    f"{MAX_PAIRS} pairs already in use"
+                )
+
+            pair = super().__new__(cls, f"{base_currency}/{quote_currency}")
+            pair.base = base_currency
+            pair.quote = quote_currency
+            pair.base_id = base_id
+            pair.quote_id = quote_id
+            pair.id = _append(_pairs_by_id, pair)
+            _pairs[key] = pair
+
+        return pair
+
+    @classmethod
+    def parse(cls, name: str) -> "Pair":
+        """Return the interned pair for a ``BASE/QUOTE`` string."""
+        if isinstance(name, Pair):
+            return name
+
+        base_currency, separator, quote_currency = name.partition("/")
+        if not separator or not base_currency or not quote_currency:
+            raise ValueError(f"Invalid currency pair '{name}'. Expected BASE/QUOTE")
+
+        return cls(base_currency, quote_currency)
+
+    @staticmethod
+    def from_id(pair_id: int) -> "Pair":
+        """Return the pair previously interned under ``pair_id``."""
+        return _pairs_by_id[pair_id]
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        # Ids are process-local, so unpickling re-interns by currency codes.
+        return (Pair, (self.base, self.quote))
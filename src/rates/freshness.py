@@ -0,0 +1,163 @@
+"""Provider-reported data timestamps and reuse of quotes until the next update.
+
+Providers report when their data was published: OpenExchangeRates and
+apilayer a unix ``timestamp`` (apilayer also a ``date``), ExchangeRate-API
+``time_last_update_unix`` and ``time_next_update_unix``. ``quote_timestamps``
+reads them from ``RateDetail.metadata``; ``FreshnessTracker`` keeps each
+provider's last successful quote per pair until the provider's next update
+is due, so long-running checks can skip requests that would return the same
+data.
+"""
+
+import time
+import typing as t
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from rates.currencies import Pair
+from rates.models import RateDetail, RateStatus
+
+
+def _unix_seconds(value: t.Any) -> t.Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+
+    return float(value) if value > 0 else None
+
+
+def _date_seconds(value: t.Any) -> t.Optional[float]:
+    if not isinstance(value, str):
+        return None
+
+    try:
+        published = datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+    return published.replace(tzinfo=timezone.utc).timestamp()
+
+
+def quote_timestamps(
+    metadata: t.Mapping[str, t.Any],
+) -> t.Tuple[t.Optional[float], t.Optional[float]]:
+    """Return ``(published_at, next_update_at)`` unix times from provider metadata.
+
+    Either value is None when the provider does not report it.
+    """
+    published_at = (
+        _unix_seconds(metadata.get("time_last_update_unix"))
+        or _unix_seconds(metadata.get("timestamp"))
+        or _date_seconds(metadata.get("date"))
+    )
+    return published_at, _unix_seconds(metadata.get("time_next_update_unix"))
+
+
+def quote_age_seconds(
+    metadata: t.Mapping[str, t.Any], now: t.Optional[float] = None
+) -> t.Optional[float]:
+    """Return how old the provider's data is, or None when it is not reported."""
+    published_at, _ = quote_timestamps(metadata)
+    if published_at is None:
+        return None
+
+    return max(0.0, (time.time() if now is None else now) - published_at)
+
+
+def stale_quote_sources(
+    details: t.Iterable[RateDetail],
+    max_quote_age_seconds: t.Optional[float],
+    now: t.Optional[float] = None,
+) -> t.Tuple[str, ...]:
+    """Return the providers whose quote is older than ``max_quote_age_seconds``."""
+    if max_quote_age_seconds is None:
+        return ()
+
+    checked_at = time.time() if now is None else now
+    stale_sources = []
+    for detail in details:
+        age_seconds = quote_age_seconds(detail.metadata, checked_at)
+        if age_seconds is not None and age_seconds > max_quote_age_seconds:
+            stale_sources.append(detail.source)
+
+    return tuple(stale_sources)
+
+
+@dataclass(slots=True, frozen=True)
+class _FreshQuote:
+    detail: RateDetail
+    next_update_at: float
+
+
+class FreshnessTracker:
+    """Last successful quote per ``(provider, pair)`` until its next update."""
+
+    def __init__(self, clock: t.Callable[[], float] = time.time):
+        self._clock = clock
+        self._quotes: t.Dict[t.Tuple[str, Pair], _FreshQuote] = {}
+
+    def record(
+        self, detail: RateDetail, update_interval_seconds: t.Optional[int] = None
+    ) -> bool:
+        """Remember a quote until its next update, returning whether it was kept.
+
+        The next update is ``time_next_update_unix`` when reported, otherwise
+        the publication time plus ``update_interval_seconds``. Failed quotes and
+        quotes without provider timestamps are not kept.
+        """
+        key = (detail.source, Pair.parse(detail.pair))
+        if detail.status != RateStatus.SUCCESS or detail.rate is None:
+            self._quotes.pop(key, None)
+            return False
+
+        published_at, next_update_at = quote_timestamps(detail.metadata)
+        if (
+            next_update_at is None
+            and published_at is not None
+            and update_interval_seconds
+        ):
+            next_update_at = published_at + update_interval_seconds
+
+        if next_update_at is None or next_update_at <= self._clock():
+            self._quotes.pop(key, None)
+            return False
+
+        self._quotes[key] = _FreshQuote(detail, next_update_at)
+        return True
+
+    def fresh_pairs(self) -> t.Dict[str, t.Set[Pair]]:
+        """Return pairs per provider whose next update is not due yet.
+
+        The result has the shape expected by ``plan_requests(fresh=...)``.
+        """
+        now = self._clock()
+        fresh: t.Dict[str, t.Set[Pair]] = {}
+        for (source, pair), quote in list(self._quotes.items()):
+            if quote.next_update_at <= now:
+                del self._quotes[(source, pair)]
+                continue
+
+            fresh.setdefault(source, set()).add(pair)
+
+        return fresh
+
+    def merge(self, other: "FreshnessTracker", pairs: t.Iterable[Pair]) -> None:
+        """Replace the quotes kept for ``pairs`` with the ones ``other`` keeps.
+
+        Used to take back a copy that checked those pairs in another process.
+        """
+        merged_pairs = set(pairs)
+        for key in [key for key in self._quotes if key[1] in merged_pairs]:
+            del self._quotes[key]
+
+        self._quotes.update(
+            (key, quote)
+            for key, quote in other._quotes.items()
+            if key[1] in merged_pairs
+        )
+
+    def cached_detail(
+        self, source: str, pair: t.Union[Pair, str]
+    ) -> t.Optional[RateDetail]:
+        """Return the kept quote for a provider and pair, if any."""
+        quote = self._quotes.get((source, Pair.parse(pair)))
+        return None if quote is None else quote.detail
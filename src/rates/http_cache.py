@@ -0,0 +1,186 @@
+"""Validator cache for conditional HTTP requests.
+
+Responses that carry an ``ETag`` or ``Last-Modified`` header are kept with
+their parsed payload. The next request for the same URL sends
+``If-None-Match``/``If-Modified-Since`` and a ``304 Not Modified`` answer
+reuses the cached payload without downloading or decoding the body again.
+
+Entries live in memory for the lifetime of the process. When a cache
+directory is configured, validators and raw bodies are also written to disk
+so one-shot runs (for example from cron) can revalidate across runs.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import typing as t
+from dataclasses import dataclass
+
+from rates.json_decoding import decode_json
+
+CacheKey = t.Tuple[
+    str, t.Tuple[t.Tuple[str, str], ...], t.Tuple[t.Tuple[str, str], ...]
+]
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Validators and payload of a response that can be revalidated."""
+
+    etag: t.Optional[str]
+    last_modified: t.Optional[str]
+    content: bytes
+    payload: t.Any = None
+    decoded: bool = False
+
+    def conditional_headers(self) -> t.Dict[str, str]:
+        """Return the headers asking the server to answer 304 when unchanged."""
+        headers: t.Dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+    def get_payload(self, schema: t.Optional[t.Any] = None) -> t.Any:
+        """Return the parsed payload, decoding the stored body on first use."""
+        if not self.decoded:
+            self.payload = decode_json(self.content, schema)
+            self.decoded = True
+
+        return self.payload
+
+
+def cache_key(
+    url: str,
+    params: t.Optional[t.Mapping[str, t.Any]] = None,
+    headers: t.Optional[t.Mapping[str, str]] = None,
+) -> CacheKey:
+    """Build a hashable key identifying one request."""
+    return (
+        url,
+        tuple(sorted((str(key), str(value)) for key, value in (params or {}).items())),
+        tuple(
+            sorted((key.lower(), str(value)) for key, value in (headers or {}).items())
+        ),
+    )
+
+
+class ConditionalCache:
+    """Thread-safe store of revalidatable responses, optionally on disk."""
+
+    def __init__(self, directory: t.Optional[str] = None):
+        self.directory = directory
+        self._entries: t.Dict[CacheKey, CachedResponse] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: CacheKey) -> str:
+        # Keys contain credentials, so only a digest reaches the file system.
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(t.cast(str, self.directory), digest)
+
+    def _load(self, key: CacheKey) -> t.Optional[CachedResponse]:
+        path = self._path(key)
+        try:
+            with open(f"{path}.json", encoding="utf-8") as meta_file:
+                meta = json.load(meta_file)
+            with open(f"{path}.body", "rb") as body_file:
+                content = body_file.read()
+        except (OSError, ValueError):
+            return None
+
+        return CachedResponse(
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+            content=content,
+        )
+
+    def _save(self, key: CacheKey, entry: CachedResponse) -> None:
+        path = self._path(key)
+        try:
+            os.makedirs(t.cast(str, self.directory), exist_ok=True)
+            for suffix, data in (
+                (".body", entry.content),
+                (
+                    ".json",
+                    json.dumps(
+                        {"etag": entry.etag, "last_modified": entry.last_modified}
+                    ).encode("utf-8"),
+                ),
+            ):
+                temporary_path = f"{path}{suffix}.{os.getpid()}.tmp"
+                with open(temporary_path, "wb") as cache_file:
+                    cache_file.write(data)
+                os.replace(temporary_path, f"{path}{suffix}")
+        except OSError as error:
+            print(f"[HTTP cache] Could not write cache entry: {error}")
+
+    def get(self, key: CacheKey) -> t.Optional[CachedResponse]:
+        """Return the cached response for ``key``, reading the disk cache if needed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self.directory:
+                entry = self._load(key)
+                if entry is not None:
+                    self._entries[key] = entry
+
+            return entry
+
+    def store(
+        self,
+        key: CacheKey,
+        etag: t.Optional[str],
+        last_modified: t.Optional[str],
+        content: bytes,
+        payload: t.Any,
+    ) -> None:
+        """Keep a response that carries at least one validator."""
+        if etag is None and last_modified is None:
+            self.discard(key)
+            return
+
+        # The raw body is only needed to rebuild the payload from disk.
+        entry = CachedResponse(
+            etag=etag,
+            last_modified=last_modified,
+            content=content if self.directory else b"",
+            payload=payload,
+            decoded=True,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            if self.directory:
+                self._save(key, entry)
+
+    def discard(self, key: CacheKey) -> None:
+        """Forget any cached response for ``key``."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every in-memory entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+_caches: t.Dict[t.Optional[str], ConditionalCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_conditional_cache(directory: t.Optional[str] = None) -> ConditionalCache:
+    """Return the process-wide cache for ``directory`` (``None``: memory only)."""
+    with _caches_lock:
+        cache = _caches.get(directory)
+        if cache is None:
+            cache = _caches[directory] = ConditionalCache(directory)
+
+        return cache
+
+
+def clear_conditional_caches() -> None:
+    """Drop every process-wide cache."""
+    with _caches_lock:
+        _caches.clear()
@@ -1,86 +1,87 @@
 """Shared HTTP helpers for provider calls with retry support."""
 
+import codecs
 import os
-import random
 import re
 import time
 import typing as t
+from urllib.parse import urlsplit
 
 import httpx
 
-TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+from rates.config import (
+    HttpConfig,
+    get_config,
+    parse_http_backoff_base_seconds,
+    parse_http_backoff_max_seconds,
+    parse_http_max_retries,
+    parse_http_timeout_seconds,
+)
+from rates.http_cache import cache_key, get_conditional_cache
+from rates.http_transport import accept_encoding, get_shared_client, transfer_stats
+from rates.json_decoding import decode_json
+from rates.json_streaming import JsonPath, extract_json_members
+from rates.retry import RetryBudgetExhaustedError, classify_error, get_retry_budget
 
 
 def get_http_timeout_seconds() -> float:
     """Read and validate HTTP timeout in seconds."""
-    raw_value = os.environ.get("HTTP_TIMEOUT_SECONDS", "12").strip()
-    timeout_seconds = float(raw_value)
-
-    if timeout_seconds <= 0:
-        raise ValueError("HTTP_TIMEOUT_SECONDS must be greater than 0")
-
-    return timeout_seconds
+    return parse_http_timeout_seconds(os.environ)
 
 
 def get_http_max_retries() -> int:
     """Read and validate max retry attempts for transient failures."""
-    raw_value = os.environ.get("HTTP_MAX_RETRIES", "2").strip()
-    max_retries = int(raw_value)
-
-    if max_retries < 0:
-        raise ValueError("HTTP_MAX_RETRIES cannot be negative")
-
-    return max_retries
+    return parse_http_max_retries(os.environ)
 
 
 def get_http_backoff_base_seconds() -> float:
     """Read and validate exponential backoff base delay."""
-    raw_value = os.environ.get("HTTP_BACKOFF_BASE_SECONDS", "0.5").strip()
-    backoff_base_seconds = float(raw_value)
-
-    if backoff_base_seconds < 0:
-        raise ValueError("HTTP_BACKOFF_BASE_SECONDS cannot be negative")
-
-    return backoff_base_seconds
+    return parse_http_backoff_base_seconds(os.environ)
 
 
 def get_http_backoff_max_seconds() -> float:
     """Read and validate maximum backoff delay."""
-    raw_value = os.environ.get("HTTP_BACKOFF_MAX_SECONDS", "4").strip()
-    backoff_max_seconds = float(raw_value)
-
-    if backoff_max_seconds < 0:
-        raise ValueError("HTTP_BACKOFF_MAX_SECONDS cannot be negative")
-
-    return backoff_max_seconds
+    return parse_http_backoff_max_seconds(os.environ)
+
+
+def get_streaming_json_extraction() -> bool:
+    """Read whether large JSON tables should be parsed incrementally."""
+    return get_config().http.streaming_json_extraction
+
+
+# Every redaction in one pass: only the alternative that matched sets its group,
+# so the replacement keeps that prefix and redacts the secret after it.
+_SECRET_PATTERN = re.compile(
+    r"(?P<query>[?&](?:app_id|access_key|api_key|apikey|subscription_key|token)=)"
+    r"[^&\s]+"
+    r"|(?P<path>/v6/)[^/]+(?=/pair/)"
+    r"|(?P<header>Ocp-Apim-Subscription-Key['\"]?\s*[:=]\s*['\"]?)[^'\",\s]+",
+    re.IGNORECASE,
+)
+_SECRET_REPLACEMENT = r"\g<query>\g<path>\g<header><redacted>"
+_HEADER_HINT = re.compile("-key", re.IGNORECASE)
+
+
+def _may_contain_secret(message: str) -> bool:
+    # Necessary conditions for a _SECRET_PATTERN match, cheap enough to skip the
+    # full pattern for the usual error message.
+    return (
+        "=" in message
+        or "/v6/" in message
+        or "/V6/" in message
+        or _HEADER_HINT.search(message) is not None
+    )
 
 
 def sanitize_error_message(message: str) -> str:
-    """Redact sensitive tokens and keys from raw error messages."""
-    sanitized = message
-
-    sanitized = re.sub(
-        r"([?&](?:app_id|access_key|api_key|apikey|subscription_key|token)=)[^&\s]+",
-        r"\1<redacted>",
-        sanitized,
-        flags=re.IGNORECASE,
-    )
-
-    sanitized = re.sub(
-        r"(/v6/)[^/]+(/pair/)",
-        r"\1<redacted>\2",
-        sanitized,
-        flags=re.IGNORECASE,
-    )
+    """Redact sensitive tokens and keys from raw error messages.
 
-    sanitized = re.sub(
-        r"(Ocp-Apim-Subscription-Key['\"]?\s*[:=]\s*['\"]?)[^'\",\s]+",
-        r"\1<redacted>",
-        sanitized,
-        flags=re.IGNORECASE,
-    )
+    Messages without secrets are returned as is, without a copy.
+    """
+    if not _may_contain_secret(message):
+        return message
 
-    return sanitized
+    return _SECRET_PATTERN.sub(_SECRET_REPLACEMENT, message)
 
 
 def safe_error_message(error: Exception) -> str:
@@ -88,16 +89,6 @@ def safe_error_message(error: Exception) -> str:
     return sanitize_error_message(str(error))
 
 
-def _is_transient_error(error: Exception) -> bool:
-    if isinstance(error, httpx.HTTPStatusError):
-        return error.response.status_code in TRANSIENT_STATUS_CODES
-
-    if isinstance(error, httpx.RequestError):
-        return True
-
-    return False
-
-
 def _get_retry_after_seconds(error: Exception) -> t.Optional[float]:
     if not isinstance(error, httpx.HTTPStatusError):
         return None
@@ -114,17 +105,124 @@ def _get_retry_after_seconds(error: Exception) -> t.Optional[float]:
     return max(0.0, retry_after_seconds)
 
 
-def _compute_backoff_delay_seconds(attempt_index: int) -> float:
-    base_delay_seconds = get_http_backoff_base_seconds()
-    max_delay_seconds = get_http_backoff_max_seconds()
+def _request_with_retries(
+    url: str,
+    operation: t.Callable[[], t.Any],
+    config: HttpConfig,
+    provider: t.Optional[str] = None,
+) -> t.Any:
+    """Run ``operation`` and retry it on retryable errors within the retry budget."""
+    policy = config.retry_policy(provider)
+    budget = get_retry_budget(
+        config.retry_budget_ratio,
+        config.retry_budget_window_seconds,
+        config.retry_budget_min_retries,
+    )
+    budget.record_request()
+    delay_seconds = policy.backoff_base_seconds
+
+    for attempt in range(policy.max_retries + 1):
+        try:
+            return operation()
+        except Exception as error:
+            if not policy.should_retry(attempt, classify_error(error)):
+                raise
+
+            # Waiting longer than the backoff cap would hold a pool worker and
+            # the provider's slot; give up instead.
+            retry_after_seconds = _get_retry_after_seconds(error)
+            if (
+                retry_after_seconds is not None
+                and retry_after_seconds > policy.backoff_max_seconds
+            ):
+                raise
+
+            if not budget.try_acquire_retry():
+                raise RetryBudgetExhaustedError(
+                    "Retry budget exhausted, not retrying "
+                    f"{provider or sanitize_error_message(url)}: {error}"
+                ) from error
+
+            if retry_after_seconds is not None:
+                wait_seconds = retry_after_seconds
+            else:
+                delay_seconds = policy.next_delay_seconds(delay_seconds)
+                wait_seconds = delay_seconds
+
+            if wait_seconds > 0:
+                time.sleep(wait_seconds)
+
+    raise RuntimeError(f"Unexpected retry flow ended for URL: {url}")
 
-    if max_delay_seconds == 0 or base_delay_seconds == 0:
-        return 0.0
 
-    exponential_delay = base_delay_seconds * (2**attempt_index)
-    jitter = random.uniform(0.0, base_delay_seconds)
+def _resolve_url(url: str, config: HttpConfig) -> str:
+    """Send ``https://host/path`` to ``<override>/host/path`` when overridden."""
+    if config.base_url_override is None:
+        return url
 
-    return float(min(max_delay_seconds, exponential_delay + jitter))
+    parts = urlsplit(url)
+    resolved = f"{config.base_url_override}/{parts.netloc}{parts.path}"
+    return f"{resolved}?{parts.query}" if parts.query else resolved
+
+
+def _request_headers(
+    headers: t.Optional[t.Mapping[str, str]], config: HttpConfig
+) -> t.Dict[str, str]:
+    request_headers = dict(headers or {})
+    request_headers.setdefault("Accept-Encoding", accept_encoding(config.compression))
+    return request_headers
+
+
+def _get(
+    url: str,
+    params: t.Optional[t.Mapping[str, t.Any]],
+    headers: t.Dict[str, str],
+    timeout: float,
+    config: HttpConfig,
+) -> httpx.Response:
+    if config.http2:
+        return get_shared_client().get(
+            url, params=params, headers=headers, timeout=timeout
+        )
+
+    return httpx.get(url, params=params, headers=headers, timeout=timeout)
+
+
+def _stream(
+    url: str,
+    params: t.Optional[t.Mapping[str, t.Any]],
+    headers: t.Dict[str, str],
+    timeout: float,
+    config: HttpConfig,
+) -> t.ContextManager[httpx.Response]:
+    if config.http2:
+        return get_shared_client().stream(
+            "GET", url, params=params, headers=headers, timeout=timeout
+        )
+
+    return httpx.stream("GET", url, params=params, headers=headers, timeout=timeout)
+
+
+class _CountingTextStream:
+    """Decode a streamed body to text while counting its decompressed size."""
+
+    def __init__(self, response: httpx.Response):
+        self._response = response
+        self.bytes_decoded = 0
+
+    def __iter__(self) -> t.Iterator[str]:
+        decoder = codecs.getincrementaldecoder(self._response.encoding or "utf-8")(
+            errors="replace"
+        )
+        for chunk in self._response.iter_bytes():
+            self.bytes_decoded += len(chunk)
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
 
 
 def request_json(
@@ -132,36 +230,95 @@ def request_json(
     params: t.Optional[t.Mapping[str, t.Any]] = None,
     headers: t.Optional[t.Mapping[str, str]] = None,
     timeout_seconds: t.Optional[float] = None,
+    schema: t.Optional[t.Any] = None,
+    config: t.Optional[HttpConfig] = None,
+    provider: t.Optional[str] = None,
 ) -> t.Any:
-    """Perform an HTTP GET request and parse JSON with retry on transient errors."""
+    """Perform an HTTP GET request and parse JSON with retry on transient errors.
+
+    ``schema`` describes the expected payload so typed decoders can skip fields
+    the provider does not read. ``config`` defaults to the active snapshot, and
+    ``provider`` selects per-provider retry settings.
+
+    Responses with an ``ETag`` or ``Last-Modified`` header are cached, and
+    later requests are sent conditionally: a ``304 Not Modified`` answer
+    returns the cached payload without decoding the body again. Compression
+    and HTTP/2 follow the ``HttpConfig`` settings; the size of every response
+    is added to ``rates.http_transport.transfer_stats``.
+    """
+    http_config = config if config is not None else get_config().http
+    url = _resolve_url(url, http_config)
     timeout = (
-        timeout_seconds if timeout_seconds is not None else get_http_timeout_seconds()
+        timeout_seconds if timeout_seconds is not None else http_config.timeout_seconds
     )
-    max_retries = get_http_max_retries()
-
-    for attempt in range(max_retries + 1):
-        try:
-            response = httpx.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=timeout,
+    cache = (
+        get_conditional_cache(http_config.cache_dir)
+        if http_config.conditional_requests
+        else None
+    )
+    key = cache_key(url, params, headers)
+
+    def attempt_request() -> t.Any:
+        cached = cache.get(key) if cache is not None else None
+        request_headers = _request_headers(headers, http_config)
+        if cached is not None:
+            for name, value in cached.conditional_headers().items():
+                request_headers.setdefault(name, value)
+
+        response = _get(url, params, request_headers, timeout, http_config)
+        transfer_stats.record(response, bytes_decoded=len(response.content))
+        if cached is not None and response.status_code == 304:
+            return cached.get_payload(schema)
+
+        response.raise_for_status()
+        payload = decode_json(response.content, schema)
+        if cache is not None:
+            cache.store(
+                key,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                content=response.content,
+                payload=payload,
             )
-            response.raise_for_status()
-            return response.json()
-        except Exception as error:
-            should_retry = attempt < max_retries and _is_transient_error(error)
-            if not should_retry:
-                raise
 
-            retry_after_seconds = _get_retry_after_seconds(error)
-            delay_seconds = (
-                retry_after_seconds
-                if retry_after_seconds is not None
-                else _compute_backoff_delay_seconds(attempt)
-            )
+        return payload
 
-            if delay_seconds > 0:
-                time.sleep(delay_seconds)
+    return _request_with_retries(url, attempt_request, http_config, provider)
 
-    raise RuntimeError(f"Unexpected retry flow ended for URL: {url}")
+
+def stream_json_members(
+    url: str,
+    paths: t.Iterable[JsonPath],
+    params: t.Optional[t.Mapping[str, t.Any]] = None,
+    headers: t.Optional[t.Mapping[str, str]] = None,
+    timeout_seconds: t.Optional[float] = None,
+    config: t.Optional[HttpConfig] = None,
+    provider: t.Optional[str] = None,
+) -> t.Dict[str, t.Any]:
+    """Stream a JSON response and return only the members at ``paths``.
+
+    The body is parsed as it arrives and the connection is closed as soon as
+    every path is resolved, so the rest of a large table is never read. Only
+    the bytes actually read are added to ``transfer_stats``.
+    """
+    http_config = config if config is not None else get_config().http
+    url = _resolve_url(url, http_config)
+    timeout = (
+        timeout_seconds if timeout_seconds is not None else http_config.timeout_seconds
+    )
+    requested_paths = list(paths)
+
+    def attempt_request() -> t.Dict[str, t.Any]:
+        request_headers = _request_headers(headers, http_config)
+        with _stream(url, params, request_headers, timeout, http_config) as response:
+            text_stream = _CountingTextStream(response)
+            try:
+                response.raise_for_status()
+                return extract_json_members(text_stream, requested_paths)
+            finally:
+                transfer_stats.record(response, bytes_decoded=text_stream.bytes_decoded)
+
+    return t.cast(
+        t.Dict[str, t.Any],
+        _request_with_retries(url, attempt_request, http_config, provider),
+    )
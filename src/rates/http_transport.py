@@ -0,0 +1,149 @@
+"""Connection handling, compression negotiation and transfer accounting.
+
+Requests go through ``httpx.get``/``httpx.stream`` by default. With
+``HTTP2_ENABLED`` they share one ``httpx.Client`` per process instead, so
+concurrent requests to the same host (for example several fawazahmed0 base
+currencies) are multiplexed over a single HTTP/2 connection. The optional
+``h2`` package is required for that (``pip install httpx[http2]``).
+
+``Accept-Encoding`` lists only the codings the installed decoders support:
+``br`` needs ``brotli`` (or ``brotlicffi``) and ``zstd`` needs ``zstandard``;
+``gzip`` and ``deflate`` are always available.
+"""
+
+import collections
+import functools
+import importlib.util
+import os
+import threading
+import typing as t
+from dataclasses import dataclass
+
+import httpx
+
+_OPTIONAL_ENCODINGS: t.Tuple[t.Tuple[str, t.Tuple[str, ...]], ...] = (
+    ("br", ("brotli", "brotlicffi")),
+    ("zstd", ("zstandard",)),
+)
+
+_client_lock = threading.Lock()
+_client: t.Optional[httpx.Client] = None
+_client_pid: t.Optional[int] = None
+
+
+def _module_available(module_name: str) -> bool:
+    return importlib.util.find_spec(module_name) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def accept_encoding(compression: bool = True) -> str:
+    """Return the ``Accept-Encoding`` value for the installed decoders.
+
+    Decoders are probed once per process; ``accept_encoding.cache_clear()``
+    probes again.
+    """
+    if not compression:
+        return "identity"
+
+    encodings = [
+        encoding
+        for encoding, module_names in _OPTIONAL_ENCODINGS
+        if any(_module_available(module_name) for module_name in module_names)
+    ]
+    return ", ".join(encodings + ["gzip", "deflate"])
+
+
+def get_shared_client() -> httpx.Client:
+    """Return this process's HTTP/2 client, creating it on first use.
+
+    A forked child never reuses the parent's connections.
+    """
+    global _client, _client_pid
+
+    with _client_lock:
+        if _client is None or _client_pid != os.getpid():
+            _client = httpx.Client(http2=True)
+            _client_pid = os.getpid()
+
+        return _client
+
+
+def close_shared_client() -> None:
+    """Close the shared client and its connections, if one was created."""
+    global _client, _client_pid
+
+    with _client_lock:
+        if _client is not None and _client_pid == os.getpid():
+            _client.close()
+
+        _client = None
+        _client_pid = None
+
+
+@dataclass(slots=True, frozen=True)
+class TransferRecord:
+    """Size and protocol details of one provider response."""
+
+    host: str
+    http_version: str
+    content_encoding: str
+    bytes_on_wire: int
+    bytes_decoded: int
+
+
+@dataclass(slots=True)
+class TransferTotals:
+    """Totals across every recorded response."""
+
+    requests: int = 0
+    bytes_on_wire: int = 0
+    bytes_decoded: int = 0
+
+
+class TransferStats:
+    """Thread-safe totals plus the most recent per-request records."""
+
+    def __init__(self, max_records: int = 256):
+        self._lock = threading.Lock()
+        self._records: t.Deque[TransferRecord] = collections.deque(maxlen=max_records)
+        self._totals = TransferTotals()
+
+    def record(self, response: httpx.Response, bytes_decoded: int) -> TransferRecord:
+        """Record a fully read response (``bytes_decoded``: body after decompression)."""
+        transfer = TransferRecord(
+            host=response.request.url.host,
+            http_version=response.http_version,
+            content_encoding=response.headers.get("Content-Encoding", "identity"),
+            bytes_on_wire=response.num_bytes_downloaded,
+            bytes_decoded=bytes_decoded,
+        )
+        with self._lock:
+            self._records.append(transfer)
+            self._totals.requests += 1
+            self._totals.bytes_on_wire += transfer.bytes_on_wire
+            self._totals.bytes_decoded += transfer.bytes_decoded
+
+        return transfer
+
+    def records(self) -> t.List[TransferRecord]:
+        """Return the recent records, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    def totals(self) -> TransferTotals:
+        """Return a copy of the running totals."""
+        with self._lock:
+            return TransferTotals(
+                requests=self._totals.requests,
+                bytes_on_wire=self._totals.bytes_on_wire,
+                bytes_decoded=self._totals.bytes_decoded,
+            )
+
+    def reset(self) -> None:
+        """Forget every record and zero the totals."""
+        with self._lock:
+            self._records.clear()
+            self._totals = TransferTotals()
+
+
+transfer_stats = TransferStats()
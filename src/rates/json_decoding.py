@@ -0,0 +1,92 @@
+"""Pluggable JSON decoding for provider payloads.
+
+Backends, in order of preference when ``JSON_DECODER=auto`` (the default):
+
+- ``msgspec``: decodes straight into the provider schema, skipping unknown fields.
+- ``orjson``: fast generic decoding into dicts.
+- ``json``: standard library fallback, always available.
+
+Neither optional backend is a required dependency; install one to enable it.
+"""
+
+import importlib
+import json
+import os
+import types
+import typing as t
+
+SUPPORTED_JSON_DECODERS = {"auto", "msgspec", "orjson", "json"}
+
+_backend_name: t.Optional[str] = None
+_backend_module: t.Optional[types.ModuleType] = None
+
+
+def _import_optional(module_name: str) -> t.Optional[types.ModuleType]:
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        return None
+
+
+def _resolve_backend(requested: str) -> t.Tuple[str, t.Optional[types.ModuleType]]:
+    if requested not in SUPPORTED_JSON_DECODERS:
+        raise ValueError(
+            f"JSON_DECODER must be one of {sorted(SUPPORTED_JSON_DECODERS)}, got '{requested}'"
+        )
+
+    candidates = ["msgspec", "orjson"] if requested == "auto" else [requested]
+    for candidate in candidates:
+        if candidate == "json":
+            break
+
+        module = _import_optional(candidate)
+        if module is not None:
+            return candidate, module
+
+        if requested != "auto":
+            raise ValueError(f"JSON_DECODER '{requested}' is not installed")
+
+    return "json", None
+
+
+def set_json_backend(name: t.Optional[str] = None) -> str:
+    """Select the decoding backend (defaults to ``JSON_DECODER``) and return it."""
+    global _backend_name, _backend_module
+
+    requested = (
+        (name if name is not None else os.environ.get("JSON_DECODER", "auto"))
+        .strip()
+        .lower()
+    )
+    _backend_name, _backend_module = _resolve_backend(requested)
+    return _backend_name
+
+
+def get_json_backend() -> str:
+    """Return the name of the active decoding backend."""
+    if _backend_name is None:
+        return set_json_backend()
+
+    return _backend_name
+
+
+def decode_json(content: bytes, schema: t.Optional[t.Any] = None) -> t.Any:
+    """Decode a JSON payload, using ``schema`` for typed decoding when supported.
+
+    ``schema`` is a type such as a ``TypedDict``; backends without typed decoding
+    ignore it and return plain JSON values.
+    """
+    backend = get_json_backend()
+
+    if backend == "msgspec":
+        assert _backend_module is not None
+        if schema is None:
+            return _backend_module.json.decode(content)
+
+        return _backend_module.json.decode(content, type=schema)
+
+    if backend == "orjson":
+        assert _backend_module is not None
+        return _backend_module.loads(content)
+
+    return json.loads(content)
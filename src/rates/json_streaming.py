@@ -0,0 +1,232 @@
+"""Incremental extraction of selected members from a streamed JSON document.
+
+Currency tables list every currency while a check usually needs one or two.
+``JsonMemberExtractor`` scans the document chunk by chunk, keeps only the
+values found at the requested key paths and reports when every path is
+resolved, so the caller can stop reading the response early.
+"""
+
+import json
+import re
+import typing as t
+from dataclasses import dataclass
+
+JsonPath = t.Tuple[str, ...]
+
+_SEPARATORS_RE = re.compile(r"[\s,:]*")
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+_SCALAR_RE = re.compile(r"[^\s,:\]}]+")
+# A complete ``"key": scalar`` object member followed by its terminator.
+_MEMBER_RE = re.compile(
+    r'[\s,]*"((?:[^"\\]|\\.)*)"\s*:\s*' r'("(?:[^"\\]|\\.)*"|[^\s,\]}{\["]+)\s*(?=[,}])'
+)
+
+
+@dataclass(slots=True)
+class _Frame:
+    path: JsonPath
+    is_object: bool
+    key: t.Optional[str] = None
+    index: int = 0
+
+
+class JsonMemberExtractor:
+    """Collect scalar values at the given key paths from JSON text chunks.
+
+    Paths are tuples of object keys (array items are addressed by their index
+    as a string). A path is resolved once its value is read, or once its
+    enclosing container closes without it.
+    """
+
+    def __init__(self, paths: t.Iterable[JsonPath]):
+        self._pending: t.Set[JsonPath] = set(paths)
+        if not self._pending or () in self._pending:
+            raise ValueError("At least one non-empty JSON path is required")
+
+        self._prefixes = {
+            path[:depth] for path in self._pending for depth in range(1, len(path))
+        }
+        self._opened: t.List[JsonPath] = []
+        self._found: t.Dict[JsonPath, t.Any] = {}
+        self._stack: t.List[_Frame] = []
+        self._buffer = ""
+        self._position = 0
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """Return True when no further input can change the result."""
+        return self._done
+
+    def feed(self, chunk: str) -> bool:
+        """Scan another chunk of the document and return ``done``."""
+        if self._done:
+            return True
+
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        self._scan(final=False)
+        return self._done
+
+    def finish(self) -> None:
+        """Signal the end of input, raising ValueError for truncated documents."""
+        if self._done:
+            return
+
+        self._scan(final=True)
+        if not self._done:
+            raise ValueError("JSON document ended before it was complete")
+
+    def members(self) -> t.Dict[str, t.Any]:
+        """Return the found values as nested dicts mirroring the document.
+
+        Objects leading to a requested path are included even when empty, so
+        a missing key can be told apart from a missing parent.
+        """
+        result: t.Dict[str, t.Any] = {}
+        for path in self._opened:
+            node = result
+            for key in path:
+                node = node.setdefault(key, {})
+
+        for path, value in self._found.items():
+            node = result
+            for key in path[:-1]:
+                node = node.setdefault(key, {})
+
+            node[path[-1]] = value
+
+        return result
+
+    def _value_path(self) -> JsonPath:
+        if not self._stack:
+            return ()
+
+        frame = self._stack[-1]
+        if frame.is_object:
+            return frame.path + (t.cast(str, frame.key),)
+
+        return frame.path + (str(frame.index),)
+
+    def _end_value(self) -> None:
+        if not self._stack:
+            self._done = True
+            return
+
+        frame = self._stack[-1]
+        if frame.is_object:
+            frame.key = None
+        else:
+            frame.index += 1
+
+    def _store(self, value: t.Any) -> None:
+        path = self._value_path()
+        if path in self._pending:
+            self._pending.discard(path)
+            self._found[path] = value
+            if not self._pending:
+                self._done = True
+
+        self._end_value()
+
+    def _close(self, frame: _Frame) -> None:
+        depth = len(frame.path)
+        missing = {path for path in self._pending if path[:depth] == frame.path}
+        self._pending -= missing
+        if not self._pending:
+            self._done = True
+
+    def _scan(self, final: bool) -> None:
+        buffer = self._buffer
+        length = len(buffer)
+        position = self._position
+
+        while not self._done:
+            frame = self._stack[-1] if self._stack else None
+            if frame is not None and frame.is_object and frame.key is None:
+                # Fast path: consume whole scalar members with one match each.
+                member_match = _MEMBER_RE.match(buffer, position)
+                while member_match is not None:
+                    key, token = member_match.groups()
+                    position = member_match.end()
+                    if "\\" in key:
+                        key = json.loads(f'"{key}"')
+
+                    if frame.path + (key,) in self._pending:
+                        frame.key = key
+                        self._store(json.loads(token))
+                        if self._done:
+                            break
+
+                    member_match = _MEMBER_RE.match(buffer, position)
+
+                if self._done:
+                    break
+
+            position = t.cast(re.Match, _SEPARATORS_RE.match(buffer, position)).end()
+            if position >= length:
+                break
+
+            char = buffer[position]
+            if char == "{" or char == "[":
+                path = self._value_path()
+                if path in self._prefixes:
+                    self._opened.append(path)
+
+                self._stack.append(_Frame(path=path, is_object=char == "{"))
+                position += 1
+                continue
+
+            if char == "}" or char == "]":
+                if not self._stack:
+                    raise ValueError(f"Unexpected '{char}' in JSON document")
+
+                self._close(self._stack.pop())
+                self._end_value()
+                position += 1
+                continue
+
+            if char == '"':
+                match = _STRING_RE.match(buffer, position)
+                if match is None:
+                    break
+
+                token = match.group()
+                position = match.end()
+                text = json.loads(token) if "\\" in token else token[1:-1]
+
+                frame = self._stack[-1] if self._stack else None
+                if frame is not None and frame.is_object and frame.key is None:
+                    frame.key = text
+                else:
+                    self._store(text)
+                continue
+
+            scalar_match = _SCALAR_RE.match(buffer, position)
+            if scalar_match is None:
+                raise ValueError(f"Unexpected '{char}' in JSON document")
+
+            if scalar_match.end() == length and not final:
+                break
+
+            position = scalar_match.end()
+            self._store(json.loads(scalar_match.group()))
+
+        self._position = position
+
+
+def extract_json_members(
+    chunks: t.Iterable[str], paths: t.Iterable[JsonPath]
+) -> t.Dict[str, t.Any]:
+    """Read ``chunks`` until every path is resolved and return the found members.
+
+    Chunks after the last needed value are never consumed.
+    """
+    extractor = JsonMemberExtractor(paths)
+    for chunk in chunks:
+        if extractor.feed(chunk):
+            break
+    else:
+        extractor.finish()
+
+    return extractor.members()
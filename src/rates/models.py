@@ -1,28 +1,235 @@
 """Models for exchange rate provider details and aggregation results."""
 
+import enum
+import math
 import typing as t
+from array import array
 from dataclasses import dataclass, field
 
+from rates.currencies import Pair
+
+
+class RateStatus(enum.StrEnum):
+    """Outcome of fetching a rate from one source."""
+
+    SUCCESS = "success"
+    ERROR = "error"
+    UNAVAILABLE = "unavailable"
+
+
+_STATUSES: t.Tuple[RateStatus, ...] = tuple(RateStatus)
+_STATUS_CODES: t.Dict[str, int] = {
+    status: code for code, status in enumerate(_STATUSES)
+}
+
 
 @dataclass(slots=True)
 class RateDetail:
     """Normalized details from a single exchange rate source."""
 
     source: str
-    pair: str
-    status: str
+    pair: Pair
+    status: RateStatus
     rate: t.Optional[float] = None
     error: t.Optional[str] = None
     metadata: t.Dict[str, t.Any] = field(default_factory=dict)
 
 
+RateDetailRow = t.Tuple[str, Pair, RateStatus, t.Optional[float], t.Optional[str]]
+
+
+@dataclass(slots=True)
+class _StringTable:
+    """Append-only table assigning a small integer id to each distinct string."""
+
+    values: t.List[str] = field(default_factory=list)
+    ids: t.Dict[str, int] = field(default_factory=dict)
+
+    def intern(self, value: str) -> int:
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = len(self.values)
+            self.ids[value] = value_id
+            self.values.append(value)
+
+        return value_id
+
+
+class RateDetailBatch(t.Sequence[RateDetail]):
+    """Column-oriented collection of rate details for multi-pair runs.
+
+    Each row stores the interned ``Pair`` id, the ``RateStatus`` code and ids
+    of the source name and error message in per-batch string tables, plus the
+    rate as a float64 (NaN when absent). Metadata is
+    kept for rows that have any. ``RateDetail`` objects are built on demand
+    when the batch is indexed or iterated.
+    """
+
+    __slots__ = (
+        "_sources",
+        "_errors",
+        "source_ids",
+        "pair_ids",
+        "status_ids",
+        "rates",
+        "error_ids",
+        "_metadata",
+    )
+
+    def __init__(
+        self,
+        details: t.Iterable[RateDetail] = (),
+        _tables: t.Optional[t.Tuple[_StringTable, ...]] = None,
+    ):
+        self._sources, self._errors = _tables or (_StringTable(), _StringTable())
+        self.source_ids = array("H")
+        self.pair_ids = array("I")
+        self.status_ids = array("B")
+        self.rates = array("d")
+        self.error_ids = array("i")
+        self._metadata: t.Dict[int, t.Dict[str, t.Any]] = {}
+
+        for detail in details:
+            self.append(detail)
+
+    def append_row(
+        self,
+        source: str,
+        pair: t.Union[Pair, str],
+        status: t.Union[RateStatus, str],
+        rate: t.Optional[float] = None,
+        error: t.Optional[str] = None,
+        metadata: t.Optional[t.Dict[str, t.Any]] = None,
+    ) -> None:
+        """Add one row without building a ``RateDetail``."""
+        status_code = _STATUS_CODES.get(status)
+        if status_code is None:
+            raise ValueError(
+                f"Unsupported rate status '{status}'. Supported statuses: {[status.value for status in _STATUSES]}"
+            )
+
+        if metadata:
+            self._metadata[len(self.source_ids)] = metadata
+
+        self.source_ids.append(self._sources.intern(source))
+        self.pair_ids.append(Pair.parse(pair).id)
+        self.status_ids.append(status_code)
+        self.rates.append(math.nan if rate is None else float(rate))
+        self.error_ids.append(-1 if error is None else self._errors.intern(error))
+
+    def append(self, detail: RateDetail) -> None:
+        """Add a detail, keeping only its column values."""
+        self.append_row(
+            detail.source,
+            detail.pair,
+            detail.status,
+            detail.rate,
+            detail.error,
+            detail.metadata,
+        )
+
+    def extend(self, details: t.Iterable[RateDetail]) -> None:
+        """Add every detail in order."""
+        for detail in details:
+            self.append(detail)
+
+    def _row(self, index: int) -> RateDetailRow:
+        rate = self.rates[index]
+        error_id = self.error_ids[index]
+        return (
+            self._sources.values[self.source_ids[index]],
+            Pair.from_id(self.pair_ids[index]),
+            _STATUSES[self.status_ids[index]],
+            None if math.isnan(rate) else rate,
+            None if error_id < 0 else self._errors.values[error_id],
+        )
+
+    def rows(self) -> t.Iterator[RateDetailRow]:
+        """Yield ``(source, pair, status, rate, error)`` tuples for every row."""
+        for index in range(len(self.source_ids)):
+            yield self._row(index)
+
+    def successful_rates(self) -> t.List[float]:
+        """Return the rates of rows with ``success`` status, in row order."""
+        success_id = _STATUS_CODES[RateStatus.SUCCESS]
+        return [
+            rate
+            for status_id, rate in zip(self.status_ids, self.rates)
+            if status_id == success_id and not math.isnan(rate)
+        ]
+
+    def select(self, indexes: t.Iterable[int]) -> "RateDetailBatch":
+        """Return a batch with the given rows, sharing this batch's string tables."""
+        selected = RateDetailBatch(_tables=(self._sources, self._errors))
+        for index in indexes:
+            metadata = self._metadata.get(index)
+            if metadata:
+                selected._metadata[len(selected.source_ids)] = metadata
+
+            selected.source_ids.append(self.source_ids[index])
+            selected.pair_ids.append(self.pair_ids[index])
+            selected.status_ids.append(self.status_ids[index])
+            selected.rates.append(self.rates[index])
+            selected.error_ids.append(self.error_ids[index])
+
+        return selected
+
+    def __len__(self) -> int:
+        return len(self.source_ids)
+
+    @t.overload
+    def __getitem__(self, index: int) -> RateDetail: ...
+
+    @t.overload
+    def __getitem__(self, index: slice) -> "RateDetailBatch": ...
+
+    def __getitem__(
+        self, index: t.Union[int, slice]
+    ) -> t.Union[RateDetail, "RateDetailBatch"]:
+        if isinstance(index, slice):
+            return self.select(range(*index.indices(len(self))))
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("RateDetailBatch index out of range")
+
+        source, pair, status, rate, error = self._row(index)
+        return RateDetail(
+            source=source,
+            pair=pair,
+            status=status,
+            rate=rate,
+            error=error,
+            metadata=dict(self._metadata.get(index, {})),
+        )
+
+    def __iter__(self) -> t.Iterator[RateDetail]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, t.Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            left == right for left, right in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return f"RateDetailBatch({list(self)!r})"
+
+
 @dataclass(slots=True)
 class AggregatedRateResult:
     """Final aggregated exchange rate result across all sources."""
 
-    pair: str
+    pair: Pair
     aggregation_method: str
     aggregated_rate: float
-    details: t.List[RateDetail]
+    details: t.Sequence[RateDetail]
     successful_sources: int
     failed_sources: int
+    # Providers whose quote was too old to use; counted in ``failed_sources``.
+    stale_sources: t.List[str] = field(default_factory=list)
@@ -0,0 +1,234 @@
+"""Cost-aware planning of provider requests for a set of currency pairs."""
+
+import typing as t
+from dataclasses import dataclass, field
+
+from rates.currencies import Pair
+from rates.providers.base import ProviderCapabilities
+
+PLAN_MODE_ALL = "all"
+PLAN_MODE_MINIMAL = "minimal"
+SUPPORTED_PLAN_MODES = {PLAN_MODE_ALL, PLAN_MODE_MINIMAL}
+
+
+@dataclass(slots=True)
+class PlannedRequest:
+    """One HTTP request (or request group) a provider must make."""
+
+    provider: str
+    key: str
+    cost: float
+    pairs: t.List[Pair] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class RatePlan:
+    """Providers assigned to each pair and the requests they require."""
+
+    mode: str
+    min_successful_sources: int
+    assignments: t.Dict[Pair, t.List[str]]
+    requests: t.List[PlannedRequest]
+    cached: t.Dict[Pair, t.List[str]]
+    skipped: t.Dict[Pair, t.Dict[str, str]]
+
+    @property
+    def total_cost(self) -> float:
+        """Sum of the cost of every planned request."""
+        return sum(request.cost for request in self.requests)
+
+    @property
+    def unsatisfied_pairs(self) -> t.List[Pair]:
+        """Pairs that cannot reach ``min_successful_sources`` under this plan."""
+        return [
+            pair
+            for pair, providers in self.assignments.items()
+            if len(providers) + len(self.cached.get(pair, []))
+            < self.min_successful_sources
+        ]
+
+    def pairs_for_provider(self, provider: str) -> t.List[Pair]:
+        """Return the pairs a provider should fetch, in plan order."""
+        return [
+            pair
+            for pair, providers in self.assignments.items()
+            if provider in providers
+        ]
+
+    def explain(self) -> str:
+        """Render a human-readable description of the plan."""
+        lines = [
+            f"Plan mode: {self.mode} (min successful sources: {self.min_successful_sources})",
+            f"HTTP requests: {len(self.requests)} (total cost {self.total_cost:g})",
+        ]
+
+        for request in self.requests:
+            lines.append(
+                f"- {request.provider} [{request.key}] cost={request.cost:g} "
+                f"serves {', '.join(request.pairs)}"
+            )
+
+        lines.append("Pairs:")
+        for pair, providers in self.assignments.items():
+            sources = providers + [
+                f"{provider} (cached)" for provider in self.cached.get(pair, [])
+            ]
+            lines.append(f"- {pair}: {', '.join(sources) or 'no sources'}")
+
+            for provider, reason in self.skipped.get(pair, {}).items():
+                lines.append(f"    skipped {provider}: {reason}")
+
+        for pair in self.unsatisfied_pairs:
+            lines.append(
+                f"Warning: {pair} cannot reach {self.min_successful_sources} successful source(s)"
+            )
+
+        return "\n".join(lines)
+
+
+def plan_requests(
+    pairs: t.Sequence[t.Tuple[str, str]],
+    providers: t.Mapping[str, ProviderCapabilities],
+    min_successful_sources: int,
+    mode: str = PLAN_MODE_ALL,
+    costs: t.Optional[t.Mapping[str, float]] = None,
+    quotas: t.Optional[t.Mapping[str, int]] = None,
+    fresh: t.Optional[t.Mapping[str, t.Collection[str]]] = None,
+) -> RatePlan:
+    """Choose providers per pair while minimizing the number and cost of requests.
+
+    ``providers`` is ordered by preference and breaks ties between equal costs.
+    ``costs`` is the cost of a single request per provider (default ``1``),
+    ``quotas`` caps the requests a provider may make, and ``fresh`` lists pairs
+    per provider that can be served from cache without a request.
+
+    In ``all`` mode every eligible provider is used for every pair; in
+    ``minimal`` mode only the ``min_successful_sources`` cheapest are used,
+    taking into account requests already planned for other pairs.
+
+    Picking the cheapest provider pair by pair is greedy: an early pair can
+    settle on a cheap per-pair request when one full-table request would have
+    served every pair. Minimal mode therefore also plans with each provider
+    put first for every pair it can serve, and keeps the cheapest plan (the
+    greedy one on ties).
+    """
+    if mode not in SUPPORTED_PLAN_MODES:
+        raise ValueError(
+            f"Unsupported plan mode '{mode}'. Supported modes: {sorted(SUPPORTED_PLAN_MODES)}"
+        )
+
+    plan = _plan(pairs, providers, min_successful_sources, mode, costs, quotas, fresh)
+    if mode != PLAN_MODE_MINIMAL:
+        return plan
+
+    for provider in providers:
+        candidate = _plan(
+            pairs,
+            providers,
+            min_successful_sources,
+            mode,
+            costs,
+            quotas,
+            fresh,
+            first=provider,
+        )
+        if candidate.total_cost < plan.total_cost:
+            plan = candidate
+
+    return plan
+
+
+def _plan(
+    pairs: t.Sequence[t.Tuple[str, str]],
+    providers: t.Mapping[str, ProviderCapabilities],
+    min_successful_sources: int,
+    mode: str,
+    costs: t.Optional[t.Mapping[str, float]],
+    quotas: t.Optional[t.Mapping[str, int]],
+    fresh: t.Optional[t.Mapping[str, t.Collection[str]]],
+    first: t.Optional[str] = None,
+) -> RatePlan:
+    """Assign providers pair by pair, trying ``first`` before any other."""
+    request_costs = costs or {}
+    request_quotas = quotas or {}
+    fresh_pairs = fresh or {}
+
+    planned: t.Dict[t.Tuple[str, str], PlannedRequest] = {}
+    requests_per_provider: t.Dict[str, int] = {}
+    assignments: t.Dict[Pair, t.List[str]] = {}
+    cached: t.Dict[Pair, t.List[str]] = {}
+    skipped: t.Dict[Pair, t.Dict[str, str]] = {}
+
+    for base_currency, quote_currency in pairs:
+        pair = Pair(base_currency, quote_currency)
+        if pair in assignments:
+            continue
+
+        assignments[pair] = []
+        pair_skipped: t.Dict[str, str] = {}
+        candidates: t.List[t.Tuple[float, int, str, t.List[str]]] = []
+
+        for preference, (provider, capabilities) in enumerate(providers.items()):
+            if pair in fresh_pairs.get(provider, ()):
+                cached.setdefault(pair, []).append(provider)
+                continue
+
+            if not capabilities.supports_base_currency(base_currency):
+                pair_skipped[provider] = f"base currency {base_currency} not supported"
+                continue
+
+            new_keys = [
+                key
+                for key in capabilities.request_keys(base_currency, quote_currency)
+                if (provider, key) not in planned
+            ]
+            quota = request_quotas.get(provider)
+            used = requests_per_provider.get(provider, 0)
+            if quota is not None and used + len(new_keys) > quota:
+                pair_skipped[provider] = f"quota of {quota} request(s) reached"
+                continue
+
+            marginal_cost = len(new_keys) * request_costs.get(provider, 1.0)
+            candidates.append((marginal_cost, preference, provider, new_keys))
+
+        needed = max(0, min_successful_sources - len(cached.get(pair, [])))
+        if mode == PLAN_MODE_MINIMAL:
+            candidates.sort(
+                key=lambda candidate: (
+                    candidate[2] != first,
+                    candidate[0],
+                    candidate[1],
+                )
+            )
+            for _, _, provider, _ in candidates[needed:]:
+                pair_skipped[provider] = "not needed to reach min successful sources"
+
+            candidates = candidates[:needed]
+
+        for _, _, provider, new_keys in candidates:
+            assignments[pair].append(provider)
+            for key in new_keys:
+                planned[(provider, key)] = PlannedRequest(
+                    provider=provider,
+                    key=key,
+                    cost=request_costs.get(provider, 1.0),
+                )
+                requests_per_provider[provider] = (
+                    requests_per_provider.get(provider, 0) + 1
+                )
+
+            capabilities = providers[provider]
+            for key in capabilities.request_keys(base_currency, quote_currency):
+                planned[(provider, key)].pairs.append(pair)
+
+        if pair_skipped:
+            skipped[pair] = pair_skipped
+
+    return RatePlan(
+        mode=mode,
+        min_successful_sources=min_successful_sources,
+        assignments=assignments,
+        requests=list(planned.values()),
+        cached=cached,
+        skipped=skipped,
+    )
@@ -0,0 +1,226 @@
+"""Opt-in profiling of provider fetches and aggregation.
+
+``rates.service`` wraps every provider ``fetch_rate`` / ``fetch_rates`` call
+and every ``aggregate_rates`` call in ``profile_stage``. Outside
+``profile_run`` this is a shared no-op context manager. Inside, a
+``Profiler`` records for each stage:
+
+- calls, wall time and CPU time of the calling thread,
+- net bytes allocated and the peak traced memory above what was allocated
+  when the stage started, through ``tracemalloc`` (these are process-wide, so
+  concurrent stages in other threads are included; the traced peak is reset
+  when a stage starts while no other stage is running),
+- stack samples taken every ``interval_seconds`` from the threads that are
+  inside a stage, written in the collapsed format read by ``flamegraph.pl``
+  and speedscope (``stage;module.function;... count``).
+"""
+
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import typing as t
+from dataclasses import asdict, dataclass
+from types import FrameType
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Accumulated measurements for one stage name."""
+
+    calls: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    allocated_bytes: int = 0
+    peak_bytes: int = 0
+
+
+def _frame_name(frame: FrameType) -> str:
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{frame.f_code.co_qualname}"
+
+
+class Profiler:
+    """Stage timings, allocations and sampled stacks for one profiled run."""
+
+    def __init__(self, interval_seconds: float = 0.005, trace_memory: bool = True):
+        self.interval_seconds = interval_seconds
+        self.trace_memory = trace_memory
+        self.stats: t.Dict[str, StageStats] = {}
+        self.stacks: t.Dict[str, int] = {}
+        self._active: t.Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._sampler: t.Optional[threading.Thread] = None
+        self._started_tracing = False
+        # Set by ``profile_run`` once the results are written.
+        self.output_paths: t.Optional[t.Tuple[str, str]] = None
+
+    def start(self) -> None:
+        """Start tracing allocations and sampling stacks."""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+        self._stopped.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="rates-profiler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self) -> None:
+        """Stop sampling, and tracing allocations if ``start`` enabled it."""
+        self._stopped.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> "Profiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.stop()
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> t.Iterator[None]:
+        """Measure the enclosed block as one call of stage ``name``."""
+        thread_id = threading.get_ident()
+        tracing = tracemalloc.is_tracing()
+        with self._lock:
+            outer = self._active.get(thread_id)
+            if tracing and not self._active:
+                tracemalloc.reset_peak()
+            self._active[thread_id] = name
+
+        if tracing:
+            allocated_before, _ = tracemalloc.get_traced_memory()
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        try:
+            yield
+        finally:
+            cpu_seconds = time.thread_time() - cpu_started
+            wall_seconds = time.perf_counter() - wall_started
+            allocated_bytes = peak_bytes = 0
+            if tracing:
+                allocated_after, peak_after = tracemalloc.get_traced_memory()
+                allocated_bytes = allocated_after - allocated_before
+                peak_bytes = max(0, peak_after - allocated_before)
+
+            with self._lock:
+                if outer is None:
+                    del self._active[thread_id]
+                else:
+                    self._active[thread_id] = outer
+
+                stats = self.stats.setdefault(name, StageStats())
+                stats.calls += 1
+                stats.wall_seconds += wall_seconds
+                stats.cpu_seconds += cpu_seconds
+                stats.allocated_bytes += allocated_bytes
+                stats.peak_bytes = max(stats.peak_bytes, peak_bytes)
+
+    def _sample_loop(self) -> None:
+        while not self._stopped.wait(self.interval_seconds):
+            self.sample()
+
+    def sample(self) -> None:
+        """Record the current stack of every thread inside a stage."""
+        with self._lock:
+            active = dict(self._active)
+        if not active:
+            return
+
+        frames = sys._current_frames()
+        for thread_id, name in active.items():
+            frame = frames.get(thread_id)
+            names: t.List[str] = []
+            while frame is not None:
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+
+            stack = ";".join([name, *reversed(names)])
+            with self._lock:
+                self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+    def write(self, output_dir: str, label: str) -> t.Tuple[str, str]:
+        """Write ``<label>.collapsed`` and ``<label>.stages.json``, returning both paths."""
+        os.makedirs(output_dir, exist_ok=True)
+        stacks_path = os.path.join(output_dir, f"{label}.collapsed")
+        stages_path = os.path.join(output_dir, f"{label}.stages.json")
+
+        with self._lock:
+            stacks = sorted(self.stacks.items())
+            stages = {name: asdict(stats) for name, stats in self.stats.items()}
+
+        with open(stacks_path, "w", encoding="utf-8") as stacks_file:
+            for stack, count in stacks:
+                stacks_file.write(f"{stack} {count}\n")
+
+        with open(stages_path, "w", encoding="utf-8") as stages_file:
+            json.dump(stages, stages_file, indent=2, sort_keys=True)
+
+        return stacks_path, stages_path
+
+    def summary(self) -> str:
+        """Return one line per stage, slowest first."""
+        with self._lock:
+            stages = sorted(
+                self.stats.items(), key=lambda item: item[1].wall_seconds, reverse=True
+            )
+
+        return "\n".join(
+            f"{name}: {stats.calls} call(s), wall {stats.wall_seconds:.4f}s, "
+            f"cpu {stats.cpu_seconds:.4f}s, allocated {stats.allocated_bytes} B"
+            for name, stats in stages
+        )
+
+
+_profiler: t.Optional[Profiler] = None
+_NO_STAGE: t.ContextManager[None] = contextlib.nullcontext()
+
+
+def profile_stage(name: str) -> t.ContextManager[None]:
+    """Measure the enclosed block when a run is being profiled."""
+    profiler = _profiler
+    return _NO_STAGE if profiler is None else profiler.stage(name)
+
+
+@contextlib.contextmanager
+def profile_run(
+    output_dir: str,
+    label: t.Optional[str] = None,
+    interval_seconds: float = 0.005,
+    trace_memory: bool = True,
+) -> t.Iterator[Profiler]:
+    """Profile every stage run in the block and write the results to ``output_dir``.
+
+    ``label`` (default: a timestamp) names the output files, whose paths are
+    left in ``Profiler.output_paths``.
+    """
+    global _profiler
+
+    if _profiler is not None:
+        raise ValueError("A profiled run is already in progress")
+
+    profiler = Profiler(interval_seconds=interval_seconds, trace_memory=trace_memory)
+    _profiler = profiler
+    try:
+        with profiler:
+            yield profiler
+    finally:
+        _profiler = None
+        now = time.time()
+        run_label = label or (
+            f"rates-{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}"
+            f"-{int(now * 1000) % 1000:03d}"
+        )
+        profiler.output_paths = profiler.write(output_dir, run_label)
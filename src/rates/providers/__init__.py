@@ -1,11 +1,41 @@
-"""Exchange rate source adapters."""
+"""Exchange rate source adapters.
+
+Adapters are imported on first attribute access so that only enabled
+providers pay their import cost.
+"""
+
+import importlib
+import typing as t
+
+from .base import ExchangeRateProvider, ProviderCapabilities
+from .registry import ProviderRegistry, build_default_registry
+
+if t.TYPE_CHECKING:
+    from .apilayer_exchangeratesapi import ApilayerExchangeRatesApiProvider
+    from .bank_al_maghrib import BankAlMaghribProvider
+    from .currencyapi import CurrencyApiProvider
+    from .exchangerate_api import ExchangeRateApiProvider
+    from .fawazahmed0_exchange_api import FawazAhmed0ExchangeApiProvider
+    from .openexchangerates import OpenExchangeRatesProvider
+
+_PROVIDER_MODULES = {
+    "ApilayerExchangeRatesApiProvider": "apilayer_exchangeratesapi",
+    "BankAlMaghribProvider": "bank_al_maghrib",
+    "CurrencyApiProvider": "currencyapi",
+    "ExchangeRateApiProvider": "exchangerate_api",
+    "FawazAhmed0ExchangeApiProvider": "fawazahmed0_exchange_api",
+    "OpenExchangeRatesProvider": "openexchangerates",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    module_name = _PROVIDER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    return getattr(module, name)
 
-from .apilayer_exchangeratesapi import ApilayerExchangeRatesApiProvider
-from .bank_al_maghrib import BankAlMaghribProvider
-from .currencyapi import CurrencyApiProvider
-from .exchangerate_api import ExchangeRateApiProvider
-from .fawazahmed0_exchange_api import FawazAhmed0ExchangeApiProvider
-from .openexchangerates import OpenExchangeRatesProvider
 
 __all__ = [
     "ApilayerExchangeRatesApiProvider",
@@ -14,4 +44,8 @@ __all__ = [
     "ExchangeRateApiProvider",
     "FawazAhmed0ExchangeApiProvider",
     "OpenExchangeRatesProvider",
+    "ExchangeRateProvider",
+    "ProviderCapabilities",
+    "ProviderRegistry",
+    "build_default_registry",
 ]
@@ -3,14 +3,32 @@
 import os
 import typing as t
 
+from rates.currencies import Pair
 from rates.http_client import request_json, safe_error_message
-from rates.models import RateDetail
+from rates.models import RateDetail, RateStatus
+from rates.providers.base import REQUEST_SCOPE_GLOBAL, ProviderCapabilities
+
+
+class ApilayerLatestPayload(t.TypedDict, total=False):
+    """Fields read from the latest endpoint response."""
+
+    success: bool
+    base: str
+    date: t.Optional[str]
+    timestamp: t.Optional[int]
+    rates: t.Dict[str, float]
+    error: t.Dict[str, t.Any]
 
 
 class ApilayerExchangeRatesApiProvider:
     """Fetch cross rates from apilayer exchangeratesapi latest endpoint."""
 
     source_name = "apilayer_exchangeratesapi"
+    capabilities = ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_GLOBAL,
+        supports_batch=True,
+        update_interval_seconds=3600,
+    )
     _api_url = "https://api.exchangeratesapi.io/v1/latest"
 
     def __init__(
@@ -25,11 +43,13 @@ class ApilayerExchangeRatesApiProvider:
         self.timeout_seconds = timeout_seconds
 
     @staticmethod
-    def _pair(base_currency: str, quote_currency: str) -> str:
-        return f"{base_currency}/{quote_currency}"
+    def _pair(base_currency: str, quote_currency: str) -> Pair:
+        return Pair(base_currency, quote_currency)
 
     @staticmethod
-    def _base_to_currency(rates: t.Dict[str, t.Any], base: str, currency: str) -> float:
+    def _base_to_currency(
+        rates: t.Mapping[str, t.Any], base: str, currency: str
+    ) -> float:
         if currency == base:
             return 1.0
 
@@ -42,7 +62,7 @@ class ApilayerExchangeRatesApiProvider:
         return float(value)
 
     @staticmethod
-    def _raise_api_error(payload: t.Dict[str, t.Any]) -> None:
+    def _raise_api_error(payload: ApilayerLatestPayload) -> None:
         error = payload.get("error")
         if not isinstance(error, dict):
             raise ValueError("apilayer exchangeratesapi returned an unknown API error")
@@ -55,9 +75,60 @@ class ApilayerExchangeRatesApiProvider:
             f"apilayer exchangeratesapi error ({code}/{error_type}): {info}"
         )
 
+    def _build_detail(
+        self,
+        payload: ApilayerLatestPayload,
+        base_currency: str,
+        quote_currency: str,
+    ) -> RateDetail:
+        rates = payload.get("rates", {})
+        provider_base_currency = str(payload.get("base") or "")
+        if not provider_base_currency:
+            raise ValueError("Missing 'base' in apilayer exchangeratesapi response")
+
+        provider_base_to_base = self._base_to_currency(
+            rates,
+            provider_base_currency,
+            base_currency,
+        )
+        provider_base_to_quote = self._base_to_currency(
+            rates,
+            provider_base_currency,
+            quote_currency,
+        )
+        cross_rate = provider_base_to_quote / provider_base_to_base
+
+        return RateDetail(
+            source=self.source_name,
+            pair=self._pair(base_currency, quote_currency),
+            status=RateStatus.SUCCESS,
+            rate=cross_rate,
+            metadata={
+                "provider_base": provider_base_currency,
+                "date": payload.get("date"),
+                "timestamp": payload.get("timestamp"),
+            },
+        )
+
+    def _error_detail(
+        self, base_currency: str, quote_currency: str, error: Exception
+    ) -> RateDetail:
+        return RateDetail(
+            source=self.source_name,
+            pair=self._pair(base_currency, quote_currency),
+            status=RateStatus.ERROR,
+            error=safe_error_message(error),
+        )
+
     def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
         """Fetch base/quote cross rate via latest endpoint."""
-        pair = self._pair(base_currency, quote_currency)
+        return self.fetch_rates([(base_currency, quote_currency)])[0]
+
+    def fetch_rates(self, pairs: t.Sequence[t.Tuple[str, str]]) -> t.List[RateDetail]:
+        """Fetch cross rates for every pair with one request for all symbols."""
+        symbols = dict.fromkeys(
+            currency for base, quote in pairs for currency in (base, quote)
+        )
 
         try:
             if not self.access_key:
@@ -66,52 +137,31 @@ class ApilayerExchangeRatesApiProvider:
                 )
 
             payload = t.cast(
-                t.Dict[str, t.Any],
+                ApilayerLatestPayload,
                 request_json(
                     self._api_url,
                     params={
                         "access_key": self.access_key,
-                        "symbols": f"{base_currency},{quote_currency}",
+                        "symbols": ",".join(symbols),
                     },
                     timeout_seconds=self.timeout_seconds,
+                    provider=self.source_name,
+                    schema=ApilayerLatestPayload,
                 ),
             )
 
             if payload.get("success") is False:
                 self._raise_api_error(payload)
+        except Exception as error:  # pragma: no cover - exercised by tests via behavior
+            return [self._error_detail(base, quote, error) for base, quote in pairs]
 
-            rates = t.cast(t.Dict[str, t.Any], payload.get("rates", {}))
-            provider_base_currency = str(payload.get("base") or "")
-            if not provider_base_currency:
-                raise ValueError("Missing 'base' in apilayer exchangeratesapi response")
+        details: t.List[RateDetail] = []
+        for base_currency, quote_currency in pairs:
+            try:
+                details.append(
+                    self._build_detail(payload, base_currency, quote_currency)
+                )
+            except Exception as error:
+                details.append(self._error_detail(base_currency, quote_currency, error))
 
-            provider_base_to_base = self._base_to_currency(
-                rates,
-                provider_base_currency,
-                base_currency,
-            )
-            provider_base_to_quote = self._base_to_currency(
-                rates,
-                provider_base_currency,
-                quote_currency,
-            )
-            cross_rate = provider_base_to_quote / provider_base_to_base
-
-            return RateDetail(
-                source=self.source_name,
-                pair=pair,
-                status="success",
-                rate=cross_rate,
-                metadata={
-                    "provider_base": provider_base_currency,
-                    "date": payload.get("date"),
-                    "timestamp": payload.get("timestamp"),
-                },
-            )
-        except Exception as error:  # pragma: no cover - exercised by tests via behavior
-            return RateDetail(
-                source=self.source_name,
-                pair=pair,
-                status="error",
-                error=safe_error_message(error),
-            )
+        return details
@@ -3,8 +3,23 @@
 import os
 import typing as t
 
+from rates.currencies import Pair
 from rates.http_client import request_json, safe_error_message
-from rates.models import RateDetail
+from rates.models import RateDetail, RateStatus
+from rates.providers.base import REQUEST_SCOPE_CURRENCY, ProviderCapabilities
+
+
+class BamQuote(t.TypedDict, total=False):
+    """Fields read from a CoursBBE/CoursVirement quote."""
+
+    achatClientele: float
+    venteClientele: t.Optional[float]
+    uniteDevise: t.Optional[float]
+    libDevise: str
+    date: t.Optional[str]
+
+
+MadQuote = t.Tuple[float, t.Optional[BamQuote]]
 
 
 class QuoteUnavailableError(Exception):
@@ -15,6 +30,12 @@ class BankAlMaghribProvider:
     """Fetch cross rates from Bank Al-Maghrib using achatClientele quotes."""
 
     source_name = "bank_al_maghrib"
+    capabilities = ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_CURRENCY,
+        supports_batch=True,
+        update_interval_seconds=86400,
+        anchor_currency="MAD",
+    )
     _base_api_url = "https://api.centralbankofmorocco.ma/cours/Version1/api"
 
     def __init__(
@@ -30,17 +51,17 @@ class BankAlMaghribProvider:
         self.timeout_seconds = timeout_seconds
 
     @staticmethod
-    def _pair(base_currency: str, quote_currency: str) -> str:
-        return f"{base_currency}/{quote_currency}"
+    def _pair(base_currency: str, quote_currency: str) -> Pair:
+        return Pair(base_currency, quote_currency)
 
-    def _fetch_quote(self, currency: str) -> t.Dict[str, t.Any]:
+    def _fetch_quote(self, currency: str) -> BamQuote:
         if not self.subscription_key:
             raise ValueError(
                 "BAM_SUBSCRIPTION_KEY is required for bank_al_maghrib provider"
             )
 
         payload = t.cast(
-            t.List[t.Dict[str, t.Any]],
+            t.List[BamQuote],
             request_json(
                 f"{self._base_api_url}/{self.endpoint}",
                 params={"libDevise": currency},
@@ -49,6 +70,8 @@ class BankAlMaghribProvider:
                     "Ocp-Apim-Subscription-Key": self.subscription_key,
                 },
                 timeout_seconds=self.timeout_seconds,
+                provider=self.source_name,
+                schema=t.List[BamQuote],
             ),
         )
         if not payload:
@@ -58,9 +81,7 @@ class BankAlMaghribProvider:
 
         return payload[0]
 
-    def _mad_per_currency(
-        self, currency: str
-    ) -> t.Tuple[float, t.Optional[t.Dict[str, t.Any]]]:
+    def _mad_per_currency(self, currency: str) -> MadQuote:
         if currency == "MAD":
             return 1.0, None
 
@@ -77,23 +98,65 @@ class BankAlMaghribProvider:
         mad_per_currency = achat_clientele / unite_devise
         return mad_per_currency, quote
 
+    def _metadata(self) -> t.Dict[str, t.Any]:
+        return {
+            "endpoint": self.endpoint,
+            "quote_field": "achatClientele",
+        }
+
     def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
         """Fetch base/quote cross rate using MAD-based achatClientele quotes."""
+        return self.fetch_rates([(base_currency, quote_currency)])[0]
+
+    def fetch_rates(self, pairs: t.Sequence[t.Tuple[str, str]]) -> t.List[RateDetail]:
+        """Fetch cross rates for every pair, requesting each currency only once."""
+        currencies = dict.fromkeys(
+            currency for base, quote in pairs for currency in (base, quote)
+        )
+
+        mad_quotes: t.Dict[str, t.Union[MadQuote, Exception]] = {}
+        for currency in currencies:
+            try:
+                mad_quotes[currency] = self._mad_per_currency(currency)
+            except Exception as error:
+                mad_quotes[currency] = error
+
+        return [
+            self._build_detail(mad_quotes, base_currency, quote_currency)
+            for base_currency, quote_currency in pairs
+        ]
+
+    @staticmethod
+    def _resolve_quote(quote: t.Union[MadQuote, Exception]) -> MadQuote:
+        if isinstance(quote, Exception):
+            raise quote
+
+        return quote
+
+    def _build_detail(
+        self,
+        mad_quotes: t.Mapping[str, t.Union[MadQuote, Exception]],
+        base_currency: str,
+        quote_currency: str,
+    ) -> RateDetail:
         pair = self._pair(base_currency, quote_currency)
 
         try:
-            mad_per_base, base_currency_quote = self._mad_per_currency(base_currency)
-            mad_per_quote, quote_currency_quote = self._mad_per_currency(quote_currency)
+            mad_per_base, base_currency_quote = self._resolve_quote(
+                mad_quotes[base_currency]
+            )
+            mad_per_quote, quote_currency_quote = self._resolve_quote(
+                mad_quotes[quote_currency]
+            )
             cross_rate = mad_per_base / mad_per_quote
 
             return RateDetail(
                 source=self.source_name,
                 pair=pair,
-                status="success",
+                status=RateStatus.SUCCESS,
                 rate=cross_rate,
                 metadata={
-                    "endpoint": self.endpoint,
-                    "quote_field": "achatClientele",
+                    **self._metadata(),
                     "base_currency_quote": base_currency_quote,
                     "quote_currency_quote": quote_currency_quote,
                 },
@@ -102,21 +165,15 @@ class BankAlMaghribProvider:
             return RateDetail(
                 source=self.source_name,
                 pair=pair,
-                status="unavailable",
+                status=RateStatus.UNAVAILABLE,
                 error=safe_error_message(error),
-                metadata={
-                    "endpoint": self.endpoint,
-                    "quote_field": "achatClientele",
-                },
+                metadata=self._metadata(),
             )
         except Exception as error:  # pragma: no cover - exercised by tests via behavior
             return RateDetail(
                 source=self.source_name,
                 pair=pair,
-                status="error",
+                status=RateStatus.ERROR,
                 error=safe_error_message(error),
-                metadata={
-                    "endpoint": self.endpoint,
-                    "quote_field": "achatClientele",
-                },
+                metadata=self._metadata(),
             )
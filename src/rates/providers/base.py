@@ -1,15 +1,86 @@
 """Provider protocol for normalized exchange rate adapters."""
 
 import typing as t
+from dataclasses import dataclass
 
+from rates.currencies import Pair
 from rates.models import RateDetail
 
+# How many HTTP requests a provider needs to serve pairs.
+REQUEST_SCOPE_GLOBAL = "global"  # one request returns every currency
+REQUEST_SCOPE_BASE = "base"  # one request per base currency
+REQUEST_SCOPE_PAIR = "pair"  # one request per base/quote pair
+REQUEST_SCOPE_CURRENCY = "currency"  # one request per currency in the pair
+
+REQUEST_SCOPES = {
+    REQUEST_SCOPE_GLOBAL,
+    REQUEST_SCOPE_BASE,
+    REQUEST_SCOPE_PAIR,
+    REQUEST_SCOPE_CURRENCY,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class ProviderCapabilities:
+    """Static description of what a provider can serve and how cheaply."""
+
+    request_scope: str
+    supports_batch: bool = False
+    supported_base_currencies: t.Optional[t.FrozenSet[str]] = None
+    update_interval_seconds: t.Optional[int] = None
+    # Currency every quote is expressed in; it never needs its own request.
+    anchor_currency: t.Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.request_scope not in REQUEST_SCOPES:
+            raise ValueError(
+                f"Unsupported request scope '{self.request_scope}'. Supported scopes: {sorted(REQUEST_SCOPES)}"
+            )
+
+    @property
+    def full_table(self) -> bool:
+        """Return True when one response contains rates for many currencies."""
+        return self.request_scope in {REQUEST_SCOPE_GLOBAL, REQUEST_SCOPE_BASE}
+
+    def request_keys(self, base_currency: str, quote_currency: str) -> t.List[str]:
+        """Return the distinct requests needed to serve a base/quote pair.
+
+        Pairs sharing a key can be served by the same HTTP request.
+        """
+        if self.request_scope == REQUEST_SCOPE_GLOBAL:
+            return ["*"]
+
+        if self.request_scope == REQUEST_SCOPE_BASE:
+            return [base_currency]
+
+        if self.request_scope == REQUEST_SCOPE_PAIR:
+            return [Pair(base_currency, quote_currency)]
+
+        currencies = dict.fromkeys([base_currency, quote_currency])
+        return [currency for currency in currencies if currency != self.anchor_currency]
+
+    def supports_base_currency(self, base_currency: str) -> bool:
+        """Return True when ``base_currency`` can be used as the pair base."""
+        return (
+            self.supported_base_currencies is None
+            or base_currency.upper() in self.supported_base_currencies
+        )
+
 
 class ExchangeRateProvider(t.Protocol):
     """Protocol implemented by all exchange rate providers."""
 
     source_name: str
+    capabilities: ProviderCapabilities
 
     def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
         """Fetch base/quote rate and return normalized source details."""
         ...
+
+
+class BatchExchangeRateProvider(ExchangeRateProvider, t.Protocol):
+    """Provider able to serve several pairs with shared requests."""
+
+    def fetch_rates(self, pairs: t.Sequence[t.Tuple[str, str]]) -> t.List[RateDetail]:
+        """Fetch details for every base/quote pair, in the same order."""
+        ...
@@ -3,14 +3,34 @@
 import os
 import typing as t
 
+from rates.currencies import Pair
 from rates.http_client import request_json, safe_error_message
-from rates.models import RateDetail
+from rates.models import RateDetail, RateStatus
+from rates.providers.base import REQUEST_SCOPE_BASE, ProviderCapabilities
+
+
+class CurrencyApiQuote(t.TypedDict, total=False):
+    """Single currency entry of the latest endpoint response."""
+
+    code: str
+    value: t.Optional[float]
+
+
+class CurrencyApiLatestPayload(t.TypedDict, total=False):
+    """Fields read from the latest endpoint response."""
+
+    data: t.Dict[str, CurrencyApiQuote]
 
 
 class CurrencyApiProvider:
     """Fetch base/quote rates from currencyapi latest endpoint."""
 
     source_name = "currencyapi"
+    capabilities = ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_BASE,
+        supports_batch=True,
+        update_interval_seconds=86400,
+    )
     _api_url = "https://api.currencyapi.com/v3/latest"
 
     def __init__(
@@ -22,63 +42,100 @@ class CurrencyApiProvider:
         self.timeout_seconds = timeout_seconds
 
     @staticmethod
-    def _pair(base_currency: str, quote_currency: str) -> str:
-        return f"{base_currency}/{quote_currency}"
+    def _pair(base_currency: str, quote_currency: str) -> Pair:
+        return Pair(base_currency, quote_currency)
 
-    def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
-        """Fetch base/quote rate using currencyapi latest endpoint."""
-        pair = self._pair(base_currency, quote_currency)
+    def _fetch_data(
+        self, base_currency: str, quote_currencies: t.Sequence[str]
+    ) -> t.Dict[str, CurrencyApiQuote]:
+        if not self.api_key:
+            raise ValueError("CURRENCYAPI_API_KEY is required for currencyapi provider")
 
-        try:
-            if not self.api_key:
-                raise ValueError(
-                    "CURRENCYAPI_API_KEY is required for currencyapi provider"
-                )
+        payload = t.cast(
+            CurrencyApiLatestPayload,
+            request_json(
+                self._api_url,
+                params={
+                    "base_currency": base_currency,
+                    "currencies": ",".join(quote_currencies),
+                },
+                headers={
+                    "apikey": self.api_key,
+                },
+                timeout_seconds=self.timeout_seconds,
+                provider=self.source_name,
+                schema=CurrencyApiLatestPayload,
+            ),
+        )
+        return payload.get("data", {})
 
-            payload = t.cast(
-                t.Dict[str, t.Any],
-                request_json(
-                    self._api_url,
-                    params={
-                        "base_currency": base_currency,
-                        "currencies": quote_currency,
-                    },
-                    headers={
-                        "apikey": self.api_key,
-                    },
-                    timeout_seconds=self.timeout_seconds,
-                ),
+    def _build_detail(
+        self,
+        data: t.Dict[str, CurrencyApiQuote],
+        base_currency: str,
+        quote_currency: str,
+    ) -> RateDetail:
+        quote_data = data.get(quote_currency)
+
+        if quote_data is None:
+            raise ValueError(
+                f"Currency '{quote_currency}' not present in currencyapi response"
             )
-            data = t.cast(t.Dict[str, t.Any], payload.get("data", {}))
-            quote_data = t.cast(
-                t.Optional[t.Dict[str, t.Any]], data.get(quote_currency)
+
+        raw_value = quote_data.get("value")
+        if raw_value is None:
+            raise ValueError(
+                f"Missing value for currency '{quote_currency}' in currencyapi response"
             )
 
-            if quote_data is None:
-                raise ValueError(
-                    f"Currency '{quote_currency}' not present in currencyapi response"
+        return RateDetail(
+            source=self.source_name,
+            pair=self._pair(base_currency, quote_currency),
+            status=RateStatus.SUCCESS,
+            rate=float(raw_value),
+            metadata={
+                "base_currency": base_currency,
+                "quote_currency": quote_currency,
+            },
+        )
+
+    def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
+        """Fetch base/quote rate using currencyapi latest endpoint."""
+        return self.fetch_rates([(base_currency, quote_currency)])[0]
+
+    def fetch_rates(self, pairs: t.Sequence[t.Tuple[str, str]]) -> t.List[RateDetail]:
+        """Fetch rates for every pair with one request per base currency."""
+        quotes_by_base: t.Dict[str, t.Dict[str, None]] = {}
+        for base_currency, quote_currency in pairs:
+            quotes_by_base.setdefault(base_currency, {})[quote_currency] = None
+
+        data_by_base: t.Dict[str, t.Union[t.Dict[str, CurrencyApiQuote], Exception]] = (
+            {}
+        )
+        for base_currency, quote_currencies in quotes_by_base.items():
+            try:
+                data_by_base[base_currency] = self._fetch_data(
+                    base_currency, list(quote_currencies)
                 )
+            except Exception as error:
+                data_by_base[base_currency] = error
+
+        details: t.List[RateDetail] = []
+        for base_currency, quote_currency in pairs:
+            try:
+                data = data_by_base[base_currency]
+                if isinstance(data, Exception):
+                    raise data
 
-            raw_value = quote_data.get("value")
-            if raw_value is None:
-                raise ValueError(
-                    f"Missing value for currency '{quote_currency}' in currencyapi response"
+                details.append(self._build_detail(data, base_currency, quote_currency))
+            except Exception as error:
+                details.append(
+                    RateDetail(
+                        source=self.source_name,
+                        pair=self._pair(base_currency, quote_currency),
+                        status=RateStatus.ERROR,
+                        error=safe_error_message(error),
+                    )
                 )
 
-            return RateDetail(
-                source=self.source_name,
-                pair=pair,
-                status="success",
-                rate=float(raw_value),
-                metadata={
-                    "base_currency": base_currency,
-                    "quote_currency": quote_currency,
-                },
-            )
-        except Exception as error:  # pragma: no cover - exercised by tests via behavior
-            return RateDetail(
-                source=self.source_name,
-                pair=pair,
-                status="error",
-                error=safe_error_message(error),
-            )
+        return details
@@ -3,14 +3,35 @@
 import os
 import typing as t
 
+from rates.currencies import Pair
 from rates.http_client import request_json, safe_error_message
-from rates.models import RateDetail
+from rates.models import RateDetail, RateStatus
+from rates.providers.base import REQUEST_SCOPE_PAIR, ProviderCapabilities
+
+ExchangeRateApiPairPayload = t.TypedDict(
+    "ExchangeRateApiPairPayload",
+    {
+        "result": str,
+        "error-type": str,
+        "base_code": str,
+        "target_code": str,
+        "conversion_rate": float,
+        "time_last_update_unix": t.Optional[int],
+        "time_next_update_unix": t.Optional[int],
+    },
+    total=False,
+)
 
 
 class ExchangeRateApiProvider:
     """Fetch pair conversion rates from ExchangeRate-API."""
 
     source_name = "exchangerate_api"
+    capabilities = ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_PAIR,
+        supports_batch=False,
+        update_interval_seconds=86400,
+    )
     _base_api_url = "https://v6.exchangerate-api.com/v6"
 
     def __init__(
@@ -22,8 +43,8 @@ class ExchangeRateApiProvider:
         self.timeout_seconds = timeout_seconds
 
     @staticmethod
-    def _pair(base_currency: str, quote_currency: str) -> str:
-        return f"{base_currency}/{quote_currency}"
+    def _pair(base_currency: str, quote_currency: str) -> Pair:
+        return Pair(base_currency, quote_currency)
 
     def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
         """Fetch base/quote rate using ExchangeRate-API pair endpoint."""
@@ -36,10 +57,12 @@ class ExchangeRateApiProvider:
                 )
 
             payload = t.cast(
-                t.Dict[str, t.Any],
+                ExchangeRateApiPairPayload,
                 request_json(
                     f"{self._base_api_url}/{self.api_key}/pair/{base_currency}/{quote_currency}",
                     timeout_seconds=self.timeout_seconds,
+                    provider=self.source_name,
+                    schema=ExchangeRateApiPairPayload,
                 ),
             )
 
@@ -56,7 +79,7 @@ class ExchangeRateApiProvider:
             return RateDetail(
                 source=self.source_name,
                 pair=pair,
-                status="success",
+                status=RateStatus.SUCCESS,
                 rate=float(conversion_rate),
                 metadata={
                     "base_code": payload.get("base_code"),
@@ -69,6 +92,6 @@ class ExchangeRateApiProvider:
             return RateDetail(
                 source=self.source_name,
                 pair=pair,
-                status="error",
+                status=RateStatus.ERROR,
                 error=safe_error_message(error),
             )
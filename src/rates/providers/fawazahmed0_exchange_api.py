@@ -3,14 +3,29 @@
 import os
 import typing as t
 
-from rates.http_client import request_json, safe_error_message
-from rates.models import RateDetail
+from rates.currencies import Pair
+from rates.http_client import (
+    get_streaming_json_extraction,
+    request_json,
+    safe_error_message,
+    stream_json_members,
+)
+from rates.models import RateDetail, RateStatus
+from rates.providers.base import REQUEST_SCOPE_BASE, ProviderCapabilities
+
+# The currency table is keyed by the lowercase base currency code.
+FawazAhmed0CurrencyPayload = t.Dict[str, t.Union[str, t.Dict[str, float]]]
 
 
 class FawazAhmed0ExchangeApiProvider:
     """Fetch base/quote rates from fawazahmed0 exchange-api."""
 
     source_name = "fawazahmed0_exchange_api"
+    capabilities = ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_BASE,
+        supports_batch=True,
+        update_interval_seconds=86400,
+    )
     _primary_url_template = (
         "https://cdn.jsdelivr.net/npm/@fawazahmed0/currency-api@"
         "{date}/v1/currencies/{base}.json"
@@ -23,7 +38,13 @@ class FawazAhmed0ExchangeApiProvider:
         self,
         date_tag: t.Optional[str] = None,
         timeout_seconds: t.Optional[float] = None,
+        streaming: t.Optional[bool] = None,
     ):
+        """Create the provider.
+
+        With ``streaming`` (default ``STREAMING_JSON_EXTRACTION``) the currency
+        table is read only until the requested quote currencies are found.
+        """
         raw_date_tag = (
             date_tag
             if date_tag is not None
@@ -32,10 +53,13 @@ class FawazAhmed0ExchangeApiProvider:
 
         self.date_tag = raw_date_tag.strip()
         self.timeout_seconds = timeout_seconds
+        self.streaming = (
+            streaming if streaming is not None else get_streaming_json_extraction()
+        )
 
     @staticmethod
-    def _pair(base_currency: str, quote_currency: str) -> str:
-        return f"{base_currency}/{quote_currency}"
+    def _pair(base_currency: str, quote_currency: str) -> Pair:
+        return Pair(base_currency, quote_currency)
 
     def _build_urls(self, base_currency: str) -> t.List[str]:
         base = base_currency.lower()
@@ -50,15 +74,37 @@ class FawazAhmed0ExchangeApiProvider:
             ),
         ]
 
-    def _fetch_payload(self, base_currency: str) -> t.Tuple[t.Dict[str, t.Any], str]:
+    def _request_payload(
+        self, url: str, base_currency: str, quote_currencies: t.Collection[str]
+    ) -> t.Dict[str, t.Any]:
+        if not self.streaming:
+            return t.cast(
+                t.Dict[str, t.Any],
+                request_json(
+                    url,
+                    timeout_seconds=self.timeout_seconds,
+                    provider=self.source_name,
+                    schema=FawazAhmed0CurrencyPayload,
+                ),
+            )
+
+        base = base_currency.lower()
+        paths = [(base, quote.lower()) for quote in sorted(quote_currencies)]
+        return stream_json_members(
+            url,
+            paths,
+            timeout_seconds=self.timeout_seconds,
+            provider=self.source_name,
+        )
+
+    def _fetch_payload(
+        self, base_currency: str, quote_currencies: t.Collection[str]
+    ) -> t.Tuple[t.Dict[str, t.Any], str]:
         errors: t.List[str] = []
 
         for url in self._build_urls(base_currency):
             try:
-                payload = t.cast(
-                    t.Dict[str, t.Any],
-                    request_json(url, timeout_seconds=self.timeout_seconds),
-                )
+                payload = self._request_payload(url, base_currency, quote_currencies)
                 return payload, url
             except Exception as error:
                 errors.append(f"{url}: {safe_error_message(error)}")
@@ -77,8 +123,8 @@ class FawazAhmed0ExchangeApiProvider:
         base = base_currency.lower()
         quote = quote_currency.lower()
 
-        rates = t.cast(t.Dict[str, t.Any], payload.get(base, {}))
-        if not rates:
+        rates = t.cast(t.Optional[t.Dict[str, t.Any]], payload.get(base))
+        if rates is None:
             raise ValueError(
                 f"Currency '{base_currency}' block is missing in fawazahmed0 exchange-api response"
             )
@@ -91,33 +137,86 @@ class FawazAhmed0ExchangeApiProvider:
 
         return float(rate_value)
 
-    def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
-        """Fetch base/quote rate from fawazahmed0 exchange-api."""
-        pair = self._pair(base_currency, quote_currency)
-
+    def _fetch_base_payload(
+        self, base_quotes: t.Tuple[str, t.Collection[str]]
+    ) -> t.Union[t.Tuple[t.Dict[str, t.Any], str], Exception]:
+        base_currency, quote_currencies = base_quotes
         try:
             if not self.date_tag:
                 raise ValueError(
                     "FAWAZAHMED0_CURRENCY_API_DATE cannot be empty when fawazahmed0_exchange_api is enabled"
                 )
 
-            payload, resolved_url = self._fetch_payload(base_currency)
-            rate = self._extract_rate(payload, base_currency, quote_currency)
-
-            return RateDetail(
-                source=self.source_name,
-                pair=pair,
-                status="success",
-                rate=rate,
-                metadata={
-                    "resolved_url": resolved_url,
-                    "date_tag": self.date_tag,
-                },
-            )
-        except Exception as error:  # pragma: no cover - exercised by tests via behavior
-            return RateDetail(
-                source=self.source_name,
-                pair=pair,
-                status="error",
-                error=safe_error_message(error),
-            )
+            return self._fetch_payload(base_currency, quote_currencies)
+        except Exception as error:
+            return error
+
+    def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
+        """Fetch base/quote rate from fawazahmed0 exchange-api."""
+        return self.fetch_rates([(base_currency, quote_currency)])[0]
+
+    def fetch_rates(self, pairs: t.Sequence[t.Tuple[str, str]]) -> t.List[RateDetail]:
+        """Fetch rates for every pair with one currency table per base currency."""
+        quotes_by_base: t.Dict[str, t.Set[str]] = {}
+        for base_currency, quote_currency in pairs:
+            quotes_by_base.setdefault(base_currency, set()).add(quote_currency)
+
+        # Tables are fetched one after another; the fetch pipeline runs one
+        # task per base currency on the shared worker pool.
+        payloads = {
+            base_quotes[0]: self._fetch_base_payload(base_quotes)
+            for base_quotes in quotes_by_base.items()
+        }
+
+        # Sanitized once per failed table rather than once per pair using it.
+        fetch_errors = {
+            base_currency: safe_error_message(fetched)
+            for base_currency, fetched in payloads.items()
+            if isinstance(fetched, Exception)
+        }
+
+        details: t.List[RateDetail] = []
+        for base_currency, quote_currency in pairs:
+            pair = self._pair(base_currency, quote_currency)
+
+            fetch_error = fetch_errors.get(base_currency)
+            if fetch_error is not None:
+                details.append(
+                    RateDetail(
+                        source=self.source_name,
+                        pair=pair,
+                        status=RateStatus.ERROR,
+                        error=fetch_error,
+                    )
+                )
+                continue
+
+            try:
+                payload, resolved_url = t.cast(
+                    t.Tuple[t.Dict[str, t.Any], str], payloads[base_currency]
+                )
+                rate = self._extract_rate(payload, base_currency, quote_currency)
+
+                details.append(
+                    RateDetail(
+                        source=self.source_name,
+                        pair=pair,
+                        status=RateStatus.SUCCESS,
+                        rate=rate,
+                        metadata={
+                            "resolved_url": resolved_url,
+                            "date_tag": self.date_tag,
+                        },
+                    )
+                )
+            except Exception as error:
+                details.append(
+                    RateDetail(
+                        source=self.source_name,
+                        pair=pair,
+                        status=RateStatus.ERROR,
+                        error=safe_error_message(error),
+                    )
+                )
+
+        return details
@@ -3,30 +3,59 @@
 import os
 import typing as t
 
-from rates.http_client import request_json, safe_error_message
-from rates.models import RateDetail
+from rates.currencies import Pair
+from rates.http_client import (
+    get_streaming_json_extraction,
+    request_json,
+    safe_error_message,
+    stream_json_members,
+)
+from rates.models import RateDetail, RateStatus
+from rates.providers.base import REQUEST_SCOPE_GLOBAL, ProviderCapabilities
+
+
+class OpenExchangeRatesPayload(t.TypedDict, total=False):
+    """Fields read from the latest.json response."""
+
+    base: str
+    timestamp: t.Optional[int]
+    rates: t.Dict[str, float]
 
 
 class OpenExchangeRatesProvider:
     """Fetch cross rates from OpenExchangeRates latest endpoint."""
 
     source_name = "openexchangerates"
+    capabilities = ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_GLOBAL,
+        supports_batch=True,
+        update_interval_seconds=3600,
+    )
     _api_url = "https://openexchangerates.org/api/latest.json"
 
     def __init__(
         self,
         app_id: t.Optional[str] = None,
         timeout_seconds: t.Optional[float] = None,
+        streaming: t.Optional[bool] = None,
     ):
+        """Create the provider.
+
+        With ``streaming`` (default ``STREAMING_JSON_EXTRACTION``) only the
+        rates for the requested currencies are read from the response.
+        """
         self.app_id = app_id or os.environ.get("OER_APP_ID", "").strip()
         self.timeout_seconds = timeout_seconds
+        self.streaming = (
+            streaming if streaming is not None else get_streaming_json_extraction()
+        )
 
     @staticmethod
-    def _pair(base_currency: str, quote_currency: str) -> str:
-        return f"{base_currency}/{quote_currency}"
+    def _pair(base_currency: str, quote_currency: str) -> Pair:
+        return Pair(base_currency, quote_currency)
 
     @staticmethod
-    def _usd_to_currency(rates: t.Dict[str, t.Any], currency: str) -> float:
+    def _usd_to_currency(rates: t.Mapping[str, t.Any], currency: str) -> float:
         if currency == "USD":
             return 1.0
 
@@ -38,44 +67,96 @@ class OpenExchangeRatesProvider:
 
         return float(value)
 
+    def _build_detail(
+        self,
+        payload: OpenExchangeRatesPayload,
+        base_currency: str,
+        quote_currency: str,
+    ) -> RateDetail:
+        rates = payload.get("rates", {})
+
+        usd_to_base = self._usd_to_currency(rates, base_currency)
+        usd_to_quote = self._usd_to_currency(rates, quote_currency)
+        cross_rate = usd_to_quote / usd_to_base
+
+        return RateDetail(
+            source=self.source_name,
+            pair=self._pair(base_currency, quote_currency),
+            status=RateStatus.SUCCESS,
+            rate=cross_rate,
+            metadata={
+                "base": payload.get("base"),
+                "timestamp": payload.get("timestamp"),
+            },
+        )
+
+    def _fetch_payload(
+        self, pairs: t.Sequence[t.Tuple[str, str]]
+    ) -> OpenExchangeRatesPayload:
+        params = {"app_id": self.app_id}
+
+        if not self.streaming:
+            return t.cast(
+                OpenExchangeRatesPayload,
+                request_json(
+                    self._api_url,
+                    params=params,
+                    timeout_seconds=self.timeout_seconds,
+                    provider=self.source_name,
+                    schema=OpenExchangeRatesPayload,
+                ),
+            )
+
+        currencies = {
+            currency for pair in pairs for currency in pair if currency != "USD"
+        }
+        paths = [("base",), ("timestamp",)] + [
+            ("rates", currency) for currency in sorted(currencies)
+        ]
+        return t.cast(
+            OpenExchangeRatesPayload,
+            stream_json_members(
+                self._api_url,
+                paths,
+                params=params,
+                timeout_seconds=self.timeout_seconds,
+                provider=self.source_name,
+            ),
+        )
+
+    def _error_detail(
+        self, base_currency: str, quote_currency: str, error: Exception
+    ) -> RateDetail:
+        return RateDetail(
+            source=self.source_name,
+            pair=self._pair(base_currency, quote_currency),
+            status=RateStatus.ERROR,
+            error=safe_error_message(error),
+        )
+
     def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
         """Fetch base/quote cross rate using USD base rates."""
-        pair = self._pair(base_currency, quote_currency)
+        return self.fetch_rates([(base_currency, quote_currency)])[0]
 
+    def fetch_rates(self, pairs: t.Sequence[t.Tuple[str, str]]) -> t.List[RateDetail]:
+        """Fetch cross rates for every pair from a single latest.json request."""
         try:
             if not self.app_id:
                 raise ValueError(
                     "OER_APP_ID is required for openexchangerates provider"
                 )
 
-            payload = t.cast(
-                t.Dict[str, t.Any],
-                request_json(
-                    self._api_url,
-                    params={"app_id": self.app_id},
-                    timeout_seconds=self.timeout_seconds,
-                ),
-            )
-            rates = t.cast(t.Dict[str, t.Any], payload.get("rates", {}))
-
-            usd_to_base = self._usd_to_currency(rates, base_currency)
-            usd_to_quote = self._usd_to_currency(rates, quote_currency)
-            cross_rate = usd_to_quote / usd_to_base
-
-            return RateDetail(
-                source=self.source_name,
-                pair=pair,
-                status="success",
-                rate=cross_rate,
-                metadata={
-                    "base": payload.get("base"),
-                    "timestamp": payload.get("timestamp"),
-                },
-            )
+            payload = self._fetch_payload(pairs)
         except Exception as error:  # pragma: no cover - exercised by tests via behavior
-            return RateDetail(
-                source=self.source_name,
-                pair=pair,
-                status="error",
-                error=safe_error_message(error),
-            )
+            return [self._error_detail(base, quote, error) for base, quote in pairs]
+
+        details: t.List[RateDetail] = []
+        for base_currency, quote_currency in pairs:
+            try:
+                details.append(
+                    self._build_detail(payload, base_currency, quote_currency)
+                )
+            except Exception as error:
+                details.append(self._error_detail(base_currency, quote_currency, error))
+
+        return details
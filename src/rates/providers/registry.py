@@ -0,0 +1,204 @@
+"""Registry of exchange rate providers with lazy, pluggable discovery.
+
+Providers come from three places, in order of precedence:
+
+1. Built-in adapters shipped in ``rates.providers``.
+2. Installed packages exposing an entry point in the
+   ``exchange_rate_notifier.providers`` group (``name = "module:Class"``).
+3. ``*.py`` files in ``RATE_PROVIDER_PLUGIN_DIR`` defining a module-level
+   ``PROVIDER`` class; the file name is the provider name.
+
+Provider modules are only imported when a provider is requested by name.
+"""
+
+import functools
+import importlib
+import importlib.metadata
+import importlib.util
+import os
+import threading
+import typing as t
+from pathlib import Path
+
+from rates.providers.base import ExchangeRateProvider, ProviderCapabilities
+
+ENTRY_POINT_GROUP = "exchange_rate_notifier.providers"
+
+ProviderFactory = t.Callable[[], ExchangeRateProvider]
+ProviderLoader = t.Callable[[], t.Any]
+
+BUILTIN_PROVIDERS: t.Dict[str, str] = {
+    "openexchangerates": "rates.providers.openexchangerates:OpenExchangeRatesProvider",
+    "bank_al_maghrib": "rates.providers.bank_al_maghrib:BankAlMaghribProvider",
+    "exchangerate_api": "rates.providers.exchangerate_api:ExchangeRateApiProvider",
+    "currencyapi": "rates.providers.currencyapi:CurrencyApiProvider",
+    "apilayer_exchangeratesapi": (
+        "rates.providers.apilayer_exchangeratesapi:ApilayerExchangeRatesApiProvider"
+    ),
+    "fawazahmed0_exchange_api": (
+        "rates.providers.fawazahmed0_exchange_api:FawazAhmed0ExchangeApiProvider"
+    ),
+}
+
+
+def _import_target(target: str) -> t.Any:
+    module_name, _, attribute = target.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, attribute)
+
+
+def _load_plugin_file(path: Path) -> t.Any:
+    spec = importlib.util.spec_from_file_location(
+        f"rate_provider_plugins.{path.stem}", path
+    )
+    if spec is None or spec.loader is None:
+        raise ValueError(f"Cannot load provider plugin from '{path}'")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    provider_class = getattr(module, "PROVIDER", None)
+    if provider_class is None:
+        raise ValueError(f"Provider plugin '{path}' must define PROVIDER")
+
+    return provider_class
+
+
+class ProviderRegistry(t.Mapping[str, ProviderFactory]):
+    """Mapping of provider names to provider classes, loaded on first lookup."""
+
+    def __init__(self, plugin_dir: t.Optional[str] = None, discover: bool = True):
+        """Create an empty registry.
+
+        ``plugin_dir`` defaults to ``RATE_PROVIDER_PLUGIN_DIR``, read when
+        discovery first runs so values loaded from ``.env`` are honoured.
+        """
+        self._loaders: t.Dict[str, ProviderLoader] = {}
+        self._origins: t.Dict[str, str] = {}
+        self._loaded: t.Dict[str, ProviderFactory] = {}
+        self._plugin_dir = plugin_dir
+        self._lock = threading.RLock()
+        self._discovered = not discover
+
+    def register(
+        self, name: str, loader: ProviderLoader, origin: str = "manual"
+    ) -> None:
+        """Register a provider loader under ``name``; the first registration wins."""
+        normalized_name = name.strip().lower()
+        with self._lock:
+            if normalized_name in self._loaders:
+                print(
+                    f"[Providers] Warning: Ignoring {origin} provider '{normalized_name}', "
+                    f"already registered by {self._origins[normalized_name]}"
+                )
+                return
+
+            self._loaders[normalized_name] = loader
+            self._origins[normalized_name] = origin
+
+    def register_target(self, name: str, target: str, origin: str = "manual") -> None:
+        """Register a provider by ``module:Class`` import path."""
+        self.register(name, functools.partial(_import_target, target), origin)
+
+    def discover_entry_points(self, group: str = ENTRY_POINT_GROUP) -> None:
+        """Register providers advertised by installed packages."""
+        for entry_point in importlib.metadata.entry_points(group=group):
+            self.register(entry_point.name, entry_point.load, "entry point")
+
+    def discover_plugin_dir(self, plugin_dir: str) -> None:
+        """Register every ``*.py`` provider plugin in ``plugin_dir``."""
+        directory = Path(plugin_dir)
+        if not directory.is_dir():
+            raise ValueError(
+                f"RATE_PROVIDER_PLUGIN_DIR '{plugin_dir}' is not a directory"
+            )
+
+        for path in sorted(directory.glob("*.py")):
+            if path.name.startswith("_"):
+                continue
+
+            self.register(
+                path.stem,
+                functools.partial(_load_plugin_file, path),
+                "plugin directory",
+            )
+
+    def _ensure_discovered(self) -> None:
+        if self._discovered:
+            return
+
+        # Other threads wait for discovery to finish rather than reading a
+        # half-filled registry; ``_discovered`` is only set once it is complete.
+        with self._lock:
+            if self._discovered:
+                return
+
+            self.discover_entry_points()
+
+            plugin_dir = (
+                self._plugin_dir
+                if self._plugin_dir is not None
+                else os.environ.get("RATE_PROVIDER_PLUGIN_DIR", "").strip()
+            )
+            if plugin_dir:
+                self.discover_plugin_dir(plugin_dir)
+
+            self._discovered = True
+
+    def __getitem__(self, name: str) -> ProviderFactory:
+        loaded = self._loaded.get(name)
+        if loaded is not None:
+            return loaded
+
+        self._ensure_discovered()
+        loader = self._loaders[name]
+        provider_class = loader()
+
+        source_name = getattr(provider_class, "source_name", None)
+        if source_name != name:
+            raise ValueError(
+                f"Provider '{name}' declares source_name '{source_name}'; they must match"
+            )
+
+        if not isinstance(
+            getattr(provider_class, "capabilities", None), ProviderCapabilities
+        ):
+            raise ValueError(f"Provider '{name}' must declare ProviderCapabilities")
+
+        factory = t.cast(ProviderFactory, provider_class)
+        self._loaded[name] = factory
+        return factory
+
+    def __contains__(self, name: object) -> bool:
+        self._ensure_discovered()
+        return name in self._loaders
+
+    def __iter__(self) -> t.Iterator[str]:
+        self._ensure_discovered()
+        return iter(list(self._loaders))
+
+    def __len__(self) -> int:
+        self._ensure_discovered()
+        return len(self._loaders)
+
+    def origin(self, name: str) -> str:
+        """Return where the provider was registered from."""
+        self._ensure_discovered()
+        return self._origins[name]
+
+    def create(self, name: str) -> ExchangeRateProvider:
+        """Build a provider instance by name."""
+        return self[name]()
+
+    def get_capabilities(self, name: str) -> ProviderCapabilities:
+        """Return the capabilities declared by a provider class."""
+        return t.cast(ProviderCapabilities, getattr(self[name], "capabilities"))
+
+
+def build_default_registry(plugin_dir: t.Optional[str] = None) -> ProviderRegistry:
+    """Build a registry with built-in providers plus discovered plugins."""
+    registry = ProviderRegistry(plugin_dir=plugin_dir)
+    for name, target in BUILTIN_PROVIDERS.items():
+        registry.register_target(name, target, "built-in")
+
+    return registry
@@ -1,19 +1,28 @@
 """Template provider for quickly adding a new exchange-rate source.
 
-Copy this file, rename the class, and adapt the request + parsing logic.
+Copy this file, rename the class, and adapt the request + parsing logic. The
+provider can then be registered in ``BUILTIN_PROVIDERS``, exposed from another
+package through the ``exchange_rate_notifier.providers`` entry point group, or
+dropped into ``RATE_PROVIDER_PLUGIN_DIR`` with ``PROVIDER = TemplateProvider``.
 """
 
 import os
 import typing as t
 
+from rates.currencies import Pair
 from rates.http_client import request_json, safe_error_message
-from rates.models import RateDetail
+from rates.models import RateDetail, RateStatus
+from rates.providers.base import REQUEST_SCOPE_PAIR, ProviderCapabilities
 
 
 class TemplateProvider:
     """Reference implementation skeleton for a new provider adapter."""
 
     source_name = "template_provider"
+    capabilities = ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_PAIR,
+        supports_batch=False,
+    )
     _api_url = "https://example.com/latest"
 
     def __init__(
@@ -25,8 +34,8 @@ class TemplateProvider:
         self.timeout_seconds = timeout_seconds
 
     @staticmethod
-    def _pair(base_currency: str, quote_currency: str) -> str:
-        return f"{base_currency}/{quote_currency}"
+    def _pair(base_currency: str, quote_currency: str) -> Pair:
+        return Pair(base_currency, quote_currency)
 
     def fetch_rate(self, base_currency: str, quote_currency: str) -> RateDetail:
         """Return a normalized result for base/quote using this source."""
@@ -46,6 +55,7 @@ class TemplateProvider:
                         "Authorization": f"Bearer {self.api_key}",
                     },
                     timeout_seconds=self.timeout_seconds,
+                    provider=self.source_name,
                 ),
             )
 
@@ -61,7 +71,7 @@ class TemplateProvider:
             return RateDetail(
                 source=self.source_name,
                 pair=pair,
-                status="success",
+                status=RateStatus.SUCCESS,
                 rate=rate,
                 metadata={"raw": payload},
             )
@@ -69,6 +79,6 @@ class TemplateProvider:
             return RateDetail(
                 source=self.source_name,
                 pair=pair,
-                status="error",
+                status=RateStatus.ERROR,
                 error=safe_error_message(error),
             )
@@ -0,0 +1,275 @@
+"""In-memory stale-while-revalidate cache of aggregated rates.
+
+An entry is fresh for ``ttl_seconds`` after it was fetched and is then served
+as stale for up to ``stale_seconds`` more while one background refresh
+replaces it. Older entries, and pairs never fetched, are loaded before
+returning; concurrent callers share the same in-flight load. A failed
+refresh keeps the previous entry until it expires.
+
+Lookups are counted per pair. ``refresh_hot`` (run periodically by
+``HotPairRefresher``) reloads frequently requested pairs shortly before
+their TTL runs out, so callers of hot pairs do not even see stale entries.
+Background refreshes, stale-triggered or hot, are capped at
+``max_concurrent_refreshes``. Loads in flight are capped at
+``max_concurrent_loads``: a lookup that would start one more raises
+``RateCacheBusyError``. ``evict_expired`` drops entries past the stale window
+so pairs that stop being requested do not stay in memory.
+"""
+
+import threading
+import time
+import typing as t
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+
+from rates.currencies import Pair
+from rates.http_client import safe_error_message
+from rates.models import AggregatedRateResult
+
+RateLoader = t.Callable[[str, str], AggregatedRateResult]
+
+
+class RateCacheBusyError(Exception):
+    """Raised when a lookup would start a load past ``max_concurrent_loads``."""
+
+
+@dataclass(slots=True, frozen=True)
+class CachedRate:
+    """Aggregated rate served from the cache, with its age at lookup time."""
+
+    result: AggregatedRateResult
+    age_seconds: float
+    stale: bool
+
+
+@dataclass(slots=True)
+class _Entry:
+    result: AggregatedRateResult
+    fetched_at: float
+
+
+class RateCache:
+    """Thread-safe stale-while-revalidate cache keyed by ``Pair``."""
+
+    def __init__(
+        self,
+        loader: RateLoader,
+        executor: Executor,
+        ttl_seconds: float = 60.0,
+        stale_seconds: float = 300.0,
+        clock: t.Callable[[], float] = time.monotonic,
+        max_concurrent_refreshes: int = 4,
+        max_concurrent_loads: int = 32,
+    ):
+        if ttl_seconds < 0 or stale_seconds < 0:
+            raise ValueError("Cache TTL and stale window cannot be negative")
+        if max_concurrent_refreshes <= 0:
+            raise ValueError("max_concurrent_refreshes must be a positive integer")
+        if max_concurrent_loads <= 0:
+            raise ValueError("max_concurrent_loads must be a positive integer")
+
+        self._loader = loader
+        self._executor = executor
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._clock = clock
+        self.max_concurrent_refreshes = max_concurrent_refreshes
+        self.max_concurrent_loads = max_concurrent_loads
+        self._entries: t.Dict[Pair, _Entry] = {}
+        self._loading: t.Dict[Pair, Future[CachedRate]] = {}
+        self._hits: t.Dict[Pair, float] = {}
+        # Reentrant so executors that run tasks inline cannot deadlock.
+        self._lock = threading.RLock()
+
+    def _served(self, entry: _Entry, now: float) -> CachedRate:
+        age_seconds = max(0.0, now - entry.fetched_at)
+        return CachedRate(
+            result=entry.result,
+            age_seconds=age_seconds,
+            stale=age_seconds > self.ttl_seconds,
+        )
+
+    def _load(self, pair: Pair) -> CachedRate:
+        try:
+            result = self._loader(pair.base, pair.quote)
+        except Exception as error:
+            with self._lock:
+                self._loading.pop(pair, None)
+            print(f"[Rate cache] Refresh of {pair} failed: {safe_error_message(error)}")
+            raise
+
+        with self._lock:
+            self._entries[pair] = _Entry(result, self._clock())
+            self._loading.pop(pair, None)
+
+        return CachedRate(result=result, age_seconds=0.0, stale=False)
+
+    def _expired(self, entry: _Entry, now: float) -> bool:
+        return now - entry.fetched_at > self.ttl_seconds + self.stale_seconds
+
+    def _start_load(self, pair: Pair) -> Future[CachedRate]:
+        loading = self._loading.get(pair)
+        if loading is None:
+            if len(self._loading) >= self.max_concurrent_loads:
+                raise RateCacheBusyError(
+                    f"{len(self._loading)} rate loads already in progress"
+                )
+
+            loading = self._executor.submit(self._load, pair)
+            if not loading.done():
+                self._loading[pair] = loading
+
+        return loading
+
+    def _start_refresh(self, pair: Pair) -> bool:
+        if pair in self._loading:
+            return False
+        if len(self._loading) >= min(
+            self.max_concurrent_refreshes, self.max_concurrent_loads
+        ):
+            return False
+
+        self._start_load(pair)
+        return True
+
+    def get(self, base_currency: str, quote_currency: str) -> Future[CachedRate]:
+        """Return a future for the pair's rate, already done when it is cached.
+
+        Stale entries are returned immediately and refreshed in the background.
+        Raises ``RateCacheBusyError`` when the pair has to be loaded and
+        ``max_concurrent_loads`` loads are already in flight.
+        """
+        pair = Pair(base_currency, quote_currency)
+        with self._lock:
+            self._hits[pair] = self._hits.get(pair, 0.0) + 1.0
+            now = self._clock()
+            entry = self._entries.get(pair)
+            if entry is not None:
+                if self._expired(entry, now):
+                    del self._entries[pair]
+                else:
+                    cached = self._served(entry, now)
+                    if cached.stale:
+                        self._start_refresh(pair)
+
+                    done: Future[CachedRate] = Future()
+                    done.set_result(cached)
+                    return done
+
+            return self._start_load(pair)
+
+    def evict_expired(self) -> t.List[Pair]:
+        """Drop entries older than the TTL plus the stale window and return their pairs."""
+        with self._lock:
+            now = self._clock()
+            expired = [
+                pair
+                for pair, entry in self._entries.items()
+                if self._expired(entry, now)
+            ]
+            for pair in expired:
+                del self._entries[pair]
+
+        return expired
+
+    def refresh_hot(
+        self, min_hits: float = 2.0, lead_seconds: float = 10.0, decay: float = 0.5
+    ) -> t.List[Pair]:
+        """Refresh hot pairs whose TTL runs out within ``lead_seconds``.
+
+        A pair is hot when its decayed lookup count is at least ``min_hits``;
+        counts are multiplied by ``decay`` on every call, so a pair cools down
+        once it stops being requested. Returns the pairs a refresh was started
+        for.
+        """
+        refreshed: t.List[Pair] = []
+        with self._lock:
+            now = self._clock()
+            hot_pairs = sorted(
+                (pair for pair, hits in self._hits.items() if hits >= min_hits),
+                key=self._hits.__getitem__,
+                reverse=True,
+            )
+            for pair in hot_pairs:
+                entry = self._entries.get(pair)
+                if entry is None:
+                    continue
+
+                if now - entry.fetched_at < self.ttl_seconds - lead_seconds:
+                    continue
+
+                if self._start_refresh(pair):
+                    refreshed.append(pair)
+
+            for pair, hits in list(self._hits.items()):
+                if hits * decay < 0.01:
+                    del self._hits[pair]
+                else:
+                    self._hits[pair] = hits * decay
+
+        return refreshed
+
+    def peek(self, base_currency: str, quote_currency: str) -> t.Optional[CachedRate]:
+        """Return the cached rate without loading or refreshing it."""
+        with self._lock:
+            entry = self._entries.get(Pair(base_currency, quote_currency))
+            return None if entry is None else self._served(entry, self._clock())
+
+    def pairs(self) -> t.List[Pair]:
+        """Return every pair with a cached rate."""
+        with self._lock:
+            return list(self._entries)
+
+
+class HotPairRefresher:
+    """Background thread refreshing hot pairs and evicting expired ones every interval."""
+
+    def __init__(
+        self,
+        cache: RateCache,
+        interval_seconds: float = 5.0,
+        min_hits: float = 2.0,
+        lead_seconds: float = 10.0,
+    ):
+        if interval_seconds <= 0:
+            raise ValueError("Refresh interval must be positive")
+
+        self.cache = cache
+        self.interval_seconds = interval_seconds
+        self.min_hits = min_hits
+        self.lead_seconds = lead_seconds
+        self._stopped = threading.Event()
+        self._thread: t.Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval_seconds):
+            try:
+                self.cache.refresh_hot(self.min_hits, self.lead_seconds)
+                self.cache.evict_expired()
+            except Exception as error:
+                print(
+                    f"[Rate cache] Hot pair refresh failed: {safe_error_message(error)}"
+                )
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="rates-hot-refresh", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "HotPairRefresher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
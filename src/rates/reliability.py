@@ -0,0 +1,257 @@
+"""Rolling per-provider reliability scores.
+
+Every fetch updates exponentially weighted averages per provider of:
+
+- its relative deviation from the per-pair consensus (median of every
+  successful provider, only when at least two providers answered),
+- its error rate (failed details over all details it returned),
+- its request latency (mean time of one request task in a fetch).
+
+``weight`` turns them into a factor in ``(0, 1]`` used by the
+``weighted_median`` and ``weighted_mean`` aggregation methods. Providers with
+fewer than ``min_samples`` observations get weight ``1``. Providers whose
+weight stays below ``min_weight`` are skipped for ``retry_seconds`` after
+their last observation and then tried again, so they can recover. Scores are
+written to ``state_path`` (JSON) when one is configured.
+"""
+
+import json
+import os
+import threading
+import time
+import typing as t
+from dataclasses import asdict, dataclass
+from statistics import median
+
+from rates.currencies import Pair
+from rates.models import RateDetail, RateStatus
+
+# Relative deviation and latency at which the matching factor halves the weight.
+DEVIATION_TOLERANCE = 0.005
+LATENCY_TOLERANCE_SECONDS = 10.0
+MIN_WEIGHT_FACTOR = 0.01
+
+
+@dataclass(slots=True)
+class ProviderReliability:
+    """Rolling averages for one provider."""
+
+    samples: int = 0
+    deviation: float = 0.0
+    error_rate: float = 0.0
+    latency_seconds: float = 0.0
+    observed_at: float = 0.0
+
+    def weight(self, min_samples: int) -> float:
+        """Return the aggregation weight, ``1`` until enough samples exist."""
+        if self.samples < min_samples:
+            return 1.0
+
+        factor = (
+            (1.0 / (1.0 + self.deviation / DEVIATION_TOLERANCE))
+            * (1.0 - self.error_rate)
+            * (1.0 / (1.0 + self.latency_seconds / LATENCY_TOLERANCE_SECONDS))
+        )
+        return max(MIN_WEIGHT_FACTOR, min(1.0, factor))
+
+
+def _ewma(previous: float, value: float, alpha: float, first: bool) -> float:
+    return value if first else previous + alpha * (value - previous)
+
+
+class ReliabilityTracker:
+    """Thread-safe reliability scores for every provider seen."""
+
+    def __init__(
+        self,
+        state_path: t.Optional[str] = None,
+        min_samples: int = 5,
+        min_weight: float = 0.2,
+        retry_seconds: float = 3600.0,
+        alpha: float = 0.2,
+        clock: t.Callable[[], float] = time.time,
+    ):
+        self.state_path = state_path
+        self.min_samples = min_samples
+        self.min_weight = min_weight
+        self.retry_seconds = retry_seconds
+        self.alpha = alpha
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._scores: t.Dict[str, ProviderReliability] = {}
+        # Why the state file could not be read by the last ``load``, if it failed.
+        self.load_error: t.Optional[str] = None
+        if state_path:
+            self.load()
+
+    def score(self, provider: str) -> ProviderReliability:
+        """Return a copy of the provider's current averages."""
+        with self._lock:
+            score = self._scores.get(provider)
+            return (
+                ProviderReliability(**asdict(score)) if score else ProviderReliability()
+            )
+
+    def weight(self, provider: str) -> float:
+        """Return the provider's aggregation weight (``1`` for unknown providers)."""
+        with self._lock:
+            score = self._scores.get(provider)
+            return 1.0 if score is None else score.weight(self.min_samples)
+
+    def observe(
+        self,
+        details_by_pair: t.Mapping[Pair, t.Sequence[RateDetail]],
+        latency_by_provider: t.Optional[t.Mapping[str, float]] = None,
+    ) -> None:
+        """Update every provider that returned details in one fetch.
+
+        ``latency_by_provider`` holds each provider's mean time per request
+        task in that fetch, not its total.
+        """
+        deviations: t.Dict[str, t.List[float]] = {}
+        outcomes: t.Dict[str, t.List[bool]] = {}
+
+        for details in details_by_pair.values():
+            rates_by_source: t.Dict[str, float] = {}
+            for detail in details:
+                succeeded = detail.status == RateStatus.SUCCESS and bool(detail.rate)
+                outcomes.setdefault(detail.source, []).append(succeeded)
+                if succeeded:
+                    rates_by_source[detail.source] = float(t.cast(float, detail.rate))
+
+            if len(rates_by_source) < 2:
+                continue
+
+            consensus = median(rates_by_source.values())
+            for source, rate in rates_by_source.items():
+                deviations.setdefault(source, []).append(
+                    abs(rate - consensus) / consensus
+                )
+
+        latencies = latency_by_provider or {}
+        now = self._clock()
+        with self._lock:
+            for source, source_outcomes in outcomes.items():
+                score = self._scores.setdefault(source, ProviderReliability())
+                first = score.samples == 0
+                error_rate = source_outcomes.count(False) / len(source_outcomes)
+                score.error_rate = _ewma(
+                    score.error_rate, error_rate, self.alpha, first
+                )
+
+                source_deviations = deviations.get(source)
+                if source_deviations:
+                    score.deviation = _ewma(
+                        score.deviation,
+                        sum(source_deviations) / len(source_deviations),
+                        self.alpha,
+                        first,
+                    )
+
+                latency = latencies.get(source)
+                if latency is not None:
+                    score.latency_seconds = _ewma(
+                        score.latency_seconds, latency, self.alpha, first
+                    )
+
+                score.samples += 1
+                score.observed_at = now
+
+    def select_providers(
+        self, provider_names: t.Sequence[str], min_successful_sources: int
+    ) -> t.List[str]:
+        """Drop consistently poor providers, keeping ``min_successful_sources``.
+
+        The lowest weights are dropped first. A provider is only skipped until
+        ``retry_seconds`` after its last observation.
+        """
+        now = self._clock()
+        with self._lock:
+            poor = sorted(
+                (
+                    (score.weight(self.min_samples), name)
+                    for name in provider_names
+                    if (score := self._scores.get(name)) is not None
+                    and score.weight(self.min_samples) < self.min_weight
+                    and now - score.observed_at < self.retry_seconds
+                ),
+            )
+
+        skipped: t.Set[str] = set()
+        for _, name in poor:
+            if len(provider_names) - len(skipped) <= min_successful_sources:
+                break
+
+            skipped.add(name)
+
+        return [name for name in provider_names if name not in skipped]
+
+    def load(self) -> None:
+        """Replace the scores with the ones saved at ``state_path``, if any."""
+        if not self.state_path:
+            return
+
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as state_file:
+                raw_scores = json.load(state_file)
+            scores = {
+                name: ProviderReliability(**values)
+                for name, values in raw_scores.items()
+            }
+        except FileNotFoundError:
+            self.load_error = None
+            return
+        except (OSError, ValueError, TypeError) as error:
+            self.load_error = str(error)
+            return
+
+        with self._lock:
+            self._scores = scores
+        self.load_error = None
+
+    def save(self) -> None:
+        """Write the scores to ``state_path`` atomically."""
+        if not self.state_path:
+            return
+
+        with self._lock:
+            raw_scores = {name: asdict(score) for name, score in self._scores.items()}
+
+        directory = os.path.dirname(os.path.abspath(self.state_path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as state_file:
+            json.dump(raw_scores, state_file, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+
+_trackers: t.Dict[t.Tuple[t.Any, ...], ReliabilityTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_reliability_tracker(
+    state_path: t.Optional[str] = None,
+    min_samples: int = 5,
+    min_weight: float = 0.2,
+    retry_seconds: float = 3600.0,
+) -> ReliabilityTracker:
+    """Return the process-wide tracker for these settings."""
+    key = (state_path, min_samples, min_weight, retry_seconds)
+    with _trackers_lock:
+        tracker = _trackers.get(key)
+        if tracker is None:
+            tracker = ReliabilityTracker(
+                state_path,
+                min_samples=min_samples,
+                min_weight=min_weight,
+                retry_seconds=retry_seconds,
+            )
+            _trackers[key] = tracker
+
+        return tracker
+
+
+def clear_reliability_trackers() -> None:
+    """Drop every process-wide tracker."""
+    with _trackers_lock:
+        _trackers.clear()
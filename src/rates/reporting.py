@@ -0,0 +1,202 @@
+"""Streaming reports of rate details and check results.
+
+``detail_rows`` and ``format_detail_lines`` walk details lazily, so a caller
+printing or writing them never builds the whole block in memory.
+``RateReporter`` writes one record per line as ``text``, ``ndjson`` or
+``csv`` to any text stream, flushing after every record so downstream tools
+can follow the output while a check is still running.
+
+Every record has a ``type``:
+
+- ``detail``: one provider's answer for a pair (``source``, ``status``,
+  ``rate``, ``error``),
+- ``result``: an evaluated rule (``method``, ``rate``, ``threshold``,
+  ``triggered``, ``successful_sources``, ``failed_sources``),
+- ``error``: a pair that could not be evaluated (``error``).
+"""
+
+import csv
+import json
+import threading
+import typing as t
+
+from rates.models import (
+    AggregatedRateResult,
+    RateDetail,
+    RateDetailBatch,
+    RateDetailRow,
+    RateStatus,
+)
+
+SUPPORTED_REPORT_FORMATS = {"text", "ndjson", "csv"}
+REPORT_FIELDS = (
+    "type",
+    "pair",
+    "source",
+    "status",
+    "rate",
+    "error",
+    "method",
+    "threshold",
+    "triggered",
+    "successful_sources",
+    "failed_sources",
+)
+
+
+def detail_rows(details: t.Iterable[RateDetail]) -> t.Iterator[RateDetailRow]:
+    """Yield ``(source, pair, status, rate, error)`` for every detail."""
+    if isinstance(details, RateDetailBatch):
+        yield from details.rows()
+        return
+
+    for detail in details:
+        yield detail.source, detail.pair, detail.status, detail.rate, detail.error
+
+
+def format_rate_row(row: RateDetailRow) -> str:
+    """Return the human-readable form of one detail row."""
+    source, pair, status, rate, error = row
+    if status == RateStatus.SUCCESS and rate is not None:
+        return f"[{source}] {pair}={rate:.4f}"
+
+    error_message = error or "Unknown error"
+    return f"[{source}] {status}: {error_message}"
+
+
+def format_detail_lines(details: t.Iterable[RateDetail]) -> t.Iterator[str]:
+    """Yield one ``- [source] ...`` line per detail."""
+    for row in detail_rows(details):
+        yield f"- {format_rate_row(row)}"
+
+
+def _format_text_record(record: t.Mapping[str, t.Any]) -> str:
+    record_type = record["type"]
+    if record_type == "detail":
+        row: RateDetailRow = (
+            record["source"],
+            record["pair"],
+            record["status"],
+            record["rate"],
+            record["error"],
+        )
+        return f"- {format_rate_row(row)}"
+
+    if record_type == "result":
+        comparison = "at or above" if record["triggered"] else "below"
+        return (
+            f"{record['pair']} {record['method']} rate {record['rate']:.4f} is "
+            f"{comparison} threshold {record['threshold']:.4f} "
+            f"({record['successful_sources']} successful, "
+            f"{record['failed_sources']} failed source(s))"
+        )
+
+    return f"{record['pair']} failed: {record['error']}"
+
+
+class RateReporter:
+    """Writes report records to a text stream, one line per record.
+
+    Safe to share between threads; each record is written and flushed whole,
+    and the records of one rule (its details, then its result or error) are
+    written together.
+    The CSV header is written before the first record unless the stream
+    already holds data (for example a report file opened for appending).
+    """
+
+    def __init__(self, stream: t.TextIO, output_format: str = "ndjson"):
+        normalized_format = output_format.strip().lower()
+        if normalized_format not in SUPPORTED_REPORT_FORMATS:
+            raise ValueError(
+                f"Unsupported report format '{output_format}'. "
+                f"Supported formats: {sorted(SUPPORTED_REPORT_FORMATS)}"
+            )
+
+        self.stream = stream
+        self.output_format = normalized_format
+        self._lock = threading.RLock()
+        self._csv_writer: t.Optional["csv.DictWriter[str]"] = None
+        self._header_pending = False
+        if normalized_format == "csv":
+            self._csv_writer = csv.DictWriter(
+                stream,
+                fieldnames=REPORT_FIELDS,
+                extrasaction="ignore",
+                lineterminator="\n",
+            )
+            self._header_pending = not _has_data(stream)
+
+    def write(self, record: t.Mapping[str, t.Any]) -> None:
+        """Write one record."""
+        with self._lock:
+            if self._csv_writer is not None:
+                if self._header_pending:
+                    self._csv_writer.writeheader()
+                    self._header_pending = False
+                self._csv_writer.writerow(
+                    {key: _csv_value(value) for key, value in record.items()}
+                )
+            elif self.output_format == "ndjson":
+                self.stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+            else:
+                self.stream.write(_format_text_record(record) + "\n")
+
+            self.stream.flush()
+
+    def write_details(self, details: t.Iterable[RateDetail]) -> None:
+        """Write a ``detail`` record per detail as the iterable yields them."""
+        for source, pair, status, rate, error in detail_rows(details):
+            self.write(
+                {
+                    "type": "detail",
+                    "pair": pair,
+                    "source": source,
+                    "status": status,
+                    "rate": rate,
+                    "error": error,
+                }
+            )
+
+    def write_result(
+        self, result: AggregatedRateResult, threshold_rate: float, triggered: bool
+    ) -> None:
+        """Write its details followed by the ``result`` record of one rule."""
+        with self._lock:
+            self.write_details(result.details)
+            self.write(
+                {
+                    "type": "result",
+                    "pair": result.pair,
+                    "method": result.aggregation_method,
+                    "rate": result.aggregated_rate,
+                    "threshold": threshold_rate,
+                    "triggered": triggered,
+                    "successful_sources": result.successful_sources,
+                    "failed_sources": result.failed_sources,
+                }
+            )
+
+    def write_error(
+        self, pair: str, error: BaseException, details: t.Iterable[RateDetail] = ()
+    ) -> None:
+        """Write the pair's details followed by an ``error`` record."""
+        with self._lock:
+            self.write_details(details)
+            self.write({"type": "error", "pair": pair, "error": str(error)})
+
+
+def _has_data(stream: t.TextIO) -> bool:
+    try:
+        return stream.seekable() and stream.tell() > 0
+    except (OSError, ValueError):
+        return False
+
+
+def _csv_value(value: t.Any) -> t.Any:
+    if value is None:
+        return ""
+
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    return value
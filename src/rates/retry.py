@@ -0,0 +1,160 @@
+"""Retry policies and a shared retry budget for provider requests.
+
+Failures are grouped into error classes so each class can be retried or not:
+
+- ``rate_limited``: HTTP 429.
+- ``server``: HTTP 500, 502, 503 and 504.
+- ``timeout``: connect, read, write and pool timeouts.
+- ``network``: other transport errors such as refused connections.
+
+Delays use decorrelated jitter: each wait is drawn between the base delay and
+three times the previous wait, capped at the maximum. A process-wide
+``RetryBudget`` also caps retries at a fraction of recent requests, so an
+outage at one provider cannot multiply load or stretch a run.
+"""
+
+import collections
+import random
+import threading
+import time
+import typing as t
+from dataclasses import dataclass
+
+import httpx
+
+ERROR_CLASS_RATE_LIMITED = "rate_limited"
+ERROR_CLASS_SERVER = "server"
+ERROR_CLASS_TIMEOUT = "timeout"
+ERROR_CLASS_NETWORK = "network"
+SUPPORTED_RETRY_ERROR_CLASSES = {
+    ERROR_CLASS_RATE_LIMITED,
+    ERROR_CLASS_SERVER,
+    ERROR_CLASS_TIMEOUT,
+    ERROR_CLASS_NETWORK,
+}
+
+_SERVER_STATUS_CODES = {500, 502, 503, 504}
+
+
+class RetryBudgetExhaustedError(Exception):
+    """Raised instead of retrying a failed request when the retry budget is spent.
+
+    The failed attempt's error is kept as ``__cause__``.
+    """
+
+
+def classify_error(error: Exception) -> t.Optional[str]:
+    """Return the retry error class of ``error``, or None if it is permanent."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        if status_code == 429:
+            return ERROR_CLASS_RATE_LIMITED
+
+        if status_code in _SERVER_STATUS_CODES:
+            return ERROR_CLASS_SERVER
+
+        return None
+
+    if isinstance(error, httpx.TimeoutException):
+        return ERROR_CLASS_TIMEOUT
+
+    if isinstance(error, httpx.RequestError):
+        return ERROR_CLASS_NETWORK
+
+    return None
+
+
+@dataclass(slots=True, frozen=True)
+class RetryPolicy:
+    """How many times, after which errors and how long to wait between retries."""
+
+    max_retries: int = 2
+    backoff_base_seconds: float = 0.5
+    backoff_max_seconds: float = 4.0
+    retry_on: t.FrozenSet[str] = frozenset(SUPPORTED_RETRY_ERROR_CLASSES)
+
+    def should_retry(self, attempt_index: int, error_class: t.Optional[str]) -> bool:
+        """Return True when the failed attempt may be retried."""
+        return attempt_index < self.max_retries and error_class in self.retry_on
+
+    def next_delay_seconds(self, previous_delay_seconds: float) -> float:
+        """Return the next decorrelated-jitter delay after ``previous_delay_seconds``."""
+        if self.backoff_base_seconds == 0 or self.backoff_max_seconds == 0:
+            return 0.0
+
+        upper_bound = max(self.backoff_base_seconds, previous_delay_seconds * 3)
+        return min(
+            self.backoff_max_seconds,
+            random.uniform(self.backoff_base_seconds, upper_bound),
+        )
+
+
+class RetryBudget:
+    """Allow retries up to ``ratio`` of the requests seen in a sliding window.
+
+    ``min_retries`` retries per window are always allowed, so a quiet process
+    can still recover from an occasional failure.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        window_seconds: float = 60.0,
+        min_retries: int = 10,
+        clock: t.Callable[[], float] = time.monotonic,
+    ):
+        self.ratio = ratio
+        self.window_seconds = window_seconds
+        self.min_retries = min_retries
+        self._clock = clock
+        self._requests: t.Deque[float] = collections.deque()
+        self._retries: t.Deque[float] = collections.deque()
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] <= cutoff:
+                timestamps.popleft()
+
+    def record_request(self) -> None:
+        """Count a first attempt towards the window."""
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_acquire_retry(self) -> bool:
+        """Reserve one retry, returning False when the budget is spent."""
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            allowed = max(self.min_retries, int(len(self._requests) * self.ratio))
+            if len(self._retries) >= allowed:
+                return False
+
+            self._retries.append(now)
+            return True
+
+
+_budgets: t.Dict[t.Tuple[float, float, int], RetryBudget] = {}
+_budgets_lock = threading.Lock()
+
+
+def get_retry_budget(
+    ratio: float, window_seconds: float, min_retries: int
+) -> RetryBudget:
+    """Return the process-wide budget for these settings."""
+    key = (ratio, window_seconds, min_retries)
+    with _budgets_lock:
+        budget = _budgets.get(key)
+        if budget is None:
+            budget = _budgets[key] = RetryBudget(ratio, window_seconds, min_retries)
+
+        return budget
+
+
+def clear_retry_budgets() -> None:
+    """Drop every process-wide budget."""
+    with _budgets_lock:
+        _budgets.clear()
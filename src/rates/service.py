@@ -1,32 +1,37 @@
 """Orchestration layer for multi-provider exchange rates."""
 
+import functools
 import os
+import queue
+import threading
+import time
 import typing as t
-from concurrent.futures import Future, ThreadPoolExecutor
-
-from rates.aggregation import SUPPORTED_AGGREGATION_METHODS, aggregate_rates
+from concurrent.futures import Future, wait
+
+from rates.aggregation import WEIGHTED_AGGREGATION_METHODS, aggregate_rates
+from rates.config import (
+    RatesConfig,
+    get_config,
+    parse_aggregation_method,
+    parse_min_successful_sources,
+    parse_plan_mode,
+    parse_provider_mapping,
+    parse_provider_names,
+)
+from rates.currencies import Pair
+from rates.freshness import FreshnessTracker, quote_age_seconds
 from rates.http_client import safe_error_message
-from rates.models import AggregatedRateResult, RateDetail
-from rates.providers import (
-    ApilayerExchangeRatesApiProvider,
-    BankAlMaghribProvider,
-    CurrencyApiProvider,
-    ExchangeRateApiProvider,
-    FawazAhmed0ExchangeApiProvider,
-    OpenExchangeRatesProvider,
+from rates.models import AggregatedRateResult, RateDetail, RateDetailBatch, RateStatus
+from rates.planner import RatePlan, plan_requests
+from rates.profiling import profile_stage
+from rates.providers.base import (
+    REQUEST_SCOPE_BASE,
+    BatchExchangeRateProvider,
+    ExchangeRateProvider,
 )
-from rates.providers.base import ExchangeRateProvider
-
-ProviderFactory = t.Callable[[], ExchangeRateProvider]
+from rates.providers.registry import ProviderRegistry, build_default_registry
 
-AVAILABLE_PROVIDERS: t.Dict[str, ProviderFactory] = {
-    "openexchangerates": OpenExchangeRatesProvider,
-    "bank_al_maghrib": BankAlMaghribProvider,
-    "exchangerate_api": ExchangeRateApiProvider,
-    "currencyapi": CurrencyApiProvider,
-    "apilayer_exchangeratesapi": ApilayerExchangeRatesApiProvider,
-    "fawazahmed0_exchange_api": FawazAhmed0ExchangeApiProvider,
-}
+AVAILABLE_PROVIDERS: ProviderRegistry = build_default_registry()
 
 
 def validate_min_successful_sources(
@@ -42,101 +47,492 @@ def validate_min_successful_sources(
         )
 
 
-def get_enabled_provider_names() -> t.List[str]:
-    """Read and validate enabled provider names from env."""
-    configured = os.environ.get("RATE_SOURCES", "openexchangerates")
-    provider_names = [
-        name.strip().lower() for name in configured.split(",") if name.strip()
-    ]
-
-    if not provider_names:
-        raise ValueError("RATE_SOURCES must contain at least one provider")
-
-    deduplicated_provider_names: t.List[str] = []
-    seen_provider_names: t.Set[str] = set()
-    for provider_name in provider_names:
-        if provider_name in seen_provider_names:
-            continue
-
-        seen_provider_names.add(provider_name)
-        deduplicated_provider_names.append(provider_name)
-
-    unknown_names = [
-        name for name in deduplicated_provider_names if name not in AVAILABLE_PROVIDERS
-    ]
+def _validate_provider_names(provider_names: t.Sequence[str]) -> t.List[str]:
+    unknown_names = [name for name in provider_names if name not in AVAILABLE_PROVIDERS]
     if unknown_names:
         raise ValueError(
             f"Unknown provider(s): {unknown_names}. Available providers: {sorted(AVAILABLE_PROVIDERS.keys())}"
         )
 
-    return deduplicated_provider_names
+    return list(provider_names)
+
+
+def get_enabled_provider_names() -> t.List[str]:
+    """Read and validate enabled provider names from env."""
+    return _validate_provider_names(parse_provider_names(os.environ))
 
 
 def get_aggregation_method() -> str:
     """Read and validate aggregation method from env."""
-    method = os.environ.get("AGGREGATION_METHOD", "median").strip().lower()
+    return parse_aggregation_method(os.environ)
 
-    if method not in SUPPORTED_AGGREGATION_METHODS:
-        raise ValueError(
-            f"AGGREGATION_METHOD must be one of {sorted(SUPPORTED_AGGREGATION_METHODS)}, got '{method}'"
+
+def get_min_successful_sources() -> int:
+    """Read and validate minimum successful source count from env."""
+    return parse_min_successful_sources(os.environ)
+
+
+def get_plan_mode() -> str:
+    """Read and validate the request plan mode from env."""
+    return parse_plan_mode(os.environ)
+
+
+def get_provider_request_costs() -> t.Dict[str, float]:
+    """Read per-request provider costs from env (default cost is 1)."""
+    return parse_provider_mapping(os.environ, "PROVIDER_REQUEST_COSTS")
+
+
+def get_provider_quotas() -> t.Dict[str, int]:
+    """Read the maximum number of requests per run for each provider from env."""
+    return {
+        provider_name: int(quota)
+        for provider_name, quota in parse_provider_mapping(
+            os.environ, "PROVIDER_QUOTAS"
+        ).items()
+    }
+
+
+_provider_instances: t.Dict[str, ExchangeRateProvider] = {}
+_provider_instances_config: t.Optional[RatesConfig] = None
+
+
+def _get_provider(provider_name: str, config: RatesConfig) -> ExchangeRateProvider:
+    """Return a provider instance, created once per configuration snapshot."""
+    global _provider_instances_config
+
+    if _provider_instances_config is not config:
+        _provider_instances.clear()
+        _provider_instances_config = config
+
+    provider = _provider_instances.get(provider_name)
+    if provider is None:
+        provider = AVAILABLE_PROVIDERS.create(provider_name)
+        _provider_instances[provider_name] = provider
+
+    return provider
+
+
+def plan_rate_requests(
+    pairs: t.Sequence[t.Tuple[str, str]],
+    provider_names: t.Optional[t.Sequence[str]] = None,
+    min_successful_sources: t.Optional[int] = None,
+    mode: t.Optional[str] = None,
+    fresh: t.Optional[t.Mapping[str, t.Collection[str]]] = None,
+    config: t.Optional[RatesConfig] = None,
+) -> RatePlan:
+    """Plan the provider requests needed to serve every pair.
+
+    Settings not passed explicitly come from ``config`` (default: the active
+    snapshot from ``get_config``).
+    """
+    rates_config = config if config is not None else get_config()
+    selected_provider_names = (
+        list(provider_names)
+        if provider_names
+        else _validate_provider_names(rates_config.provider_names)
+    )
+
+    return plan_requests(
+        pairs,
+        providers={
+            provider_name: AVAILABLE_PROVIDERS.get_capabilities(provider_name)
+            for provider_name in selected_provider_names
+        },
+        min_successful_sources=(
+            min_successful_sources
+            if min_successful_sources is not None
+            else rates_config.min_successful_sources
+        ),
+        mode=mode if mode is not None else rates_config.plan_mode,
+        costs=rates_config.provider_request_costs,
+        quotas=rates_config.provider_quotas,
+        fresh=fresh,
+    )
+
+
+def select_reliable_providers(
+    provider_names: t.Sequence[str],
+    min_successful_sources: int,
+    config: t.Optional[RatesConfig] = None,
+) -> t.List[str]:
+    """Drop providers with consistently poor reliability scores.
+
+    At least ``min_successful_sources`` providers are always kept.
+    """
+    rates_config = config if config is not None else get_config()
+    return rates_config.reliability.tracker().select_providers(
+        provider_names, min_successful_sources
+    )
+
+
+def get_reliability_weights(
+    provider_names: t.Sequence[str], config: t.Optional[RatesConfig] = None
+) -> t.Dict[str, float]:
+    """Return the current aggregation weight of each provider."""
+    rates_config = config if config is not None else get_config()
+    tracker = rates_config.reliability.tracker()
+    return {name: tracker.weight(name) for name in provider_names}
+
+
+class _PipelineClosed(Exception):
+    """Raised in fetch workers once the consumer stopped reading details."""
+
+
+_POLL_SECONDS = 0.1
+
+# Receives the details fetched in one run and each provider's mean task time.
+FetchObserver = t.Callable[
+    [t.Mapping[Pair, t.Sequence[RateDetail]], t.Mapping[str, float]], None
+]
+
+# (provider, pair, detail, latency); pair and detail are None on the last item
+# a provider task sends, which carries how long the task took (None when the
+# task never ran).
+_DetailMessage = t.Tuple[
+    str, t.Optional[Pair], t.Optional[RateDetail], t.Optional[float]
+]
+
+
+def _failed_detail(provider_name: str, pair: Pair, error: str) -> _DetailMessage:
+    detail = RateDetail(
+        source=provider_name, pair=pair, status=RateStatus.ERROR, error=error
+    )
+    return provider_name, pair, detail, None
+
+
+def _stream_provider_pairs(
+    provider_name: str,
+    provider: ExchangeRateProvider,
+    pairs: t.Sequence[t.Tuple[str, str]],
+    put: t.Callable[[_DetailMessage], None],
+) -> None:
+    """Fetch pairs from one provider, sending each detail as soon as it exists.
+
+    Every pair gets a detail: pairs a batch provider left out, or that were
+    not reached because the provider raised, are sent as errors.
+    """
+    started_at = time.perf_counter()
+    sent = 0
+    failure = "Provider returned no rate for this pair"
+    try:
+        try:
+            if provider.capabilities.supports_batch:
+                batch_provider = t.cast(BatchExchangeRateProvider, provider)
+                with profile_stage(f"fetch_rates:{provider_name}"):
+                    details = batch_provider.fetch_rates(pairs)
+                for (base_currency, quote_currency), detail in zip(pairs, details):
+                    pair = Pair(base_currency, quote_currency)
+                    put((provider_name, pair, detail, None))
+                    sent += 1
+            else:
+                for base_currency, quote_currency in pairs:
+                    with profile_stage(f"fetch_rate:{provider_name}"):
+                        detail = provider.fetch_rate(base_currency, quote_currency)
+                    pair = Pair(base_currency, quote_currency)
+                    put((provider_name, pair, detail, None))
+                    sent += 1
+        except _PipelineClosed:
+            raise
+        except Exception as error:
+            failure = f"Unhandled provider failure: {safe_error_message(error)}"
+
+        for base_currency, quote_currency in pairs[sent:]:
+            pair = Pair(base_currency, quote_currency)
+            put(_failed_detail(provider_name, pair, failure))
+
+        put((provider_name, None, None, time.perf_counter() - started_at))
+    except _PipelineClosed:
+        return
+
+
+def stream_rate_details_for_pairs(
+    pairs: t.Sequence[t.Tuple[str, str]],
+    provider_names: t.Optional[t.Sequence[str]] = None,
+    plan: t.Optional[RatePlan] = None,
+    config: t.Optional[RatesConfig] = None,
+    freshness: t.Optional[FreshnessTracker] = None,
+    queue_size: int = 64,
+    observer: t.Optional[FetchObserver] = None,
+) -> t.Iterator[t.Tuple[Pair, RateDetailBatch]]:
+    """Yield ``(pair, details)`` as soon as every provider planned for a pair answered.
+
+    Requests run on the shared worker pool (``RatesConfig.workers``) and
+    hand details to the caller through a queue holding at most
+    ``queue_size`` details, so a slow consumer holds fetching back
+    instead of buffering every response. Pairs come out in completion
+    order with details ordered like ``provider_names``. ``plan`` may cover
+    more pairs than ``pairs``; only the requested pairs are fetched.
+    Provider instances are reused for as long as ``config`` (default: the
+    active snapshot) stays the same.
+
+    With ``freshness``, pairs the plan marks as cached for a provider are
+    served from the tracker, and fetched quotes are recorded in it. Fetched
+    details and request latencies update the provider reliability scores, or
+    are handed to ``observer`` instead when one is given.
+    """
+    rates_config = config if config is not None else get_config()
+    selected_provider_names = (
+        list(provider_names)
+        if provider_names
+        else _validate_provider_names(rates_config.provider_names)
+    )
+    rate_plan = (
+        plan
+        if plan is not None
+        else plan_rate_requests(pairs, selected_provider_names, config=rates_config)
+    )
+    pairs_by_name = {Pair(base, quote): (base, quote) for base, quote in pairs}
+    provider_order = {name: index for index, name in enumerate(selected_provider_names)}
+
+    provider_pairs = [
+        (
+            provider_name,
+            [
+                pairs_by_name[pair]
+                for pair in rate_plan.pairs_for_provider(provider_name)
+                if pair in pairs_by_name
+            ],
+        )
+        for provider_name in selected_provider_names
+    ]
+    provider_pairs = [(name, pairs) for name, pairs in provider_pairs if pairs]
+
+    received: t.Dict[Pair, t.Dict[str, RateDetail]] = {
+        pair: {} for pair in pairs_by_name
+    }
+    outstanding: t.Dict[Pair, int] = {pair: 0 for pair in pairs_by_name}
+    for _, assigned_pairs in provider_pairs:
+        for base_currency, quote_currency in assigned_pairs:
+            outstanding[Pair(base_currency, quote_currency)] += 1
+
+    if freshness is not None:
+        for pair in pairs_by_name:
+            for provider_name in rate_plan.cached.get(pair, ()):
+                cached_detail = freshness.cached_detail(provider_name, pair)
+                if provider_name in provider_order and cached_detail is not None:
+                    received[pair][provider_name] = cached_detail
+
+    def complete(pair: Pair) -> RateDetailBatch:
+        # Each pair gets its own batch, so nothing is kept once it is handed on.
+        return RateDetailBatch(
+            detail
+            for _, detail in sorted(
+                received.pop(pair).items(), key=lambda item: provider_order[item[0]]
+            )
         )
 
-    return method
+    for pair, count in outstanding.items():
+        if count == 0:
+            yield pair, complete(pair)
 
+    if not provider_pairs:
+        return
 
-def get_min_successful_sources() -> int:
-    """Read and validate minimum successful source count from env."""
-    raw_value = os.environ.get("MIN_SUCCESSFUL_SOURCES", "1").strip()
+    details_queue: "queue.Queue[_DetailMessage]" = queue.Queue(maxsize=queue_size)
+    closed = threading.Event()
 
-    if not raw_value:
-        raise ValueError("MIN_SUCCESSFUL_SOURCES cannot be empty")
+    def put(message: _DetailMessage) -> None:
+        while not closed.is_set():
+            try:
+                details_queue.put(message, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+        raise _PipelineClosed()
+
+    update_intervals = {
+        provider_name: AVAILABLE_PROVIDERS.get_capabilities(
+            provider_name
+        ).update_interval_seconds
+        for provider_name, _ in provider_pairs
+    }
+    fetched_by_pair: t.Dict[Pair, t.List[RateDetail]] = {}
+    task_latencies: t.Dict[str, t.List[float]] = {}
+    # Tasks that will never send their last message (cancelled, rejected by a
+    # pool that was shut down, or failed outside the provider call).
+    abandoned: "queue.SimpleQueue[t.Tuple[int, str]]" = queue.SimpleQueue()
+
+    def on_done(index: int, future: "Future[None]") -> None:
+        if future.cancelled():
+            abandoned.put((index, "Provider request was cancelled"))
+            return
+
+        error = future.exception()
+        if error is not None:
+            message = safe_error_message(t.cast(Exception, error))
+            abandoned.put((index, f"Provider request failed: {message}"))
+
+    def abandoned_messages() -> t.List[_DetailMessage]:
+        lost: t.List[t.Tuple[int, str]] = []
+        while not abandoned.empty():
+            lost.append(abandoned.get_nowait())
+        if not lost:
+            return []
+
+        # Everything an abandoned task sent was queued before its callback ran.
+        messages: t.List[_DetailMessage] = []
+        while not details_queue.empty():
+            messages.append(details_queue.get_nowait())
+
+        for index, error in lost:
+            provider_name, _, task_pairs = tasks[index]
+            sent = {pair for name, pair, _, _ in messages if name == provider_name}
+            for base_currency, quote_currency in task_pairs:
+                pair = Pair(base_currency, quote_currency)
+                pending = received.get(pair)
+                if pair in sent or pending is None or provider_name in pending:
+                    continue
+
+                messages.append(_failed_detail(provider_name, pair, error))
+            messages.append((provider_name, None, None, None))
+
+        return messages
+
+    # Per-pair providers get one task per pair, and batch providers that make
+    # one request per base currency one task per base, so their requests can
+    # run side by side up to the provider's concurrency limit.
+    tasks: t.List[t.Tuple[str, ExchangeRateProvider, t.List[t.Tuple[str, str]]]] = []
+    for provider_name, assigned_pairs in provider_pairs:
+        provider = _get_provider(provider_name, rates_config)
+        if not provider.capabilities.supports_batch:
+            tasks.extend(
+                (provider_name, provider, [assigned]) for assigned in assigned_pairs
+            )
+        elif provider.capabilities.request_scope == REQUEST_SCOPE_BASE:
+            pairs_by_base: t.Dict[str, t.List[t.Tuple[str, str]]] = {}
+            for base_currency, quote_currency in assigned_pairs:
+                pairs_by_base.setdefault(base_currency, []).append(
+                    (base_currency, quote_currency)
+                )
+            tasks.extend(
+                (provider_name, provider, base_pairs)
+                for base_pairs in pairs_by_base.values()
+            )
+        else:
+            tasks.append((provider_name, provider, assigned_pairs))
+
+    pool = rates_config.workers.pool()
+    futures: t.List[Future[None]] = []
+    try:
+        for index, (provider_name, provider, task_pairs) in enumerate(tasks):
+            try:
+                future = pool.submit(
+                    provider_name,
+                    _stream_provider_pairs,
+                    provider_name,
+                    provider,
+                    task_pairs,
+                    put,
+                )
+            except RuntimeError as error:
+                future = Future()
+                future.set_exception(error)
 
-    min_successful_sources = int(raw_value)
-    if min_successful_sources <= 0:
-        raise ValueError("MIN_SUCCESSFUL_SOURCES must be a positive integer")
+            future.add_done_callback(functools.partial(on_done, index))
+            futures.append(future)
 
-    return min_successful_sources
+        running = len(futures)
+        while running:
+            try:
+                messages = [details_queue.get(timeout=_POLL_SECONDS)]
+            except queue.Empty:
+                messages = abandoned_messages()
+
+            for provider_name, detail_pair, detail, latency in messages:
+                if detail_pair is None or detail is None:
+                    if latency is not None:
+                        task_latencies.setdefault(provider_name, []).append(latency)
+                    running -= 1
+                    continue
+
+                if freshness is not None:
+                    freshness.record(detail, update_intervals[provider_name])
+
+                fetched_by_pair.setdefault(detail_pair, []).append(detail)
+                received[detail_pair][provider_name] = detail
+                outstanding[detail_pair] -= 1
+                if outstanding[detail_pair] == 0:
+                    yield detail_pair, complete(detail_pair)
+
+        # Per-pair providers run one task per pair, so the mean task time is
+        # the time of one request and does not grow with the watchlist.
+        latency_by_provider = {
+            provider_name: sum(latencies) / len(latencies)
+            for provider_name, latencies in task_latencies.items()
+        }
+        if observer is not None:
+            observer(fetched_by_pair, latency_by_provider)
+        else:
+            tracker = rates_config.reliability.tracker()
+            tracker.observe(fetched_by_pair, latency_by_provider)
+    finally:
+        closed.set()
+        for future in futures:
+            future.cancel()
+        # Cancelled tasks never run; wait only for the ones already started.
+        wait([future for future in futures if not future.cancelled()])
+
+
+def fetch_rate_details_for_pairs(
+    pairs: t.Sequence[t.Tuple[str, str]],
+    provider_names: t.Optional[t.Sequence[str]] = None,
+    plan: t.Optional[RatePlan] = None,
+    config: t.Optional[RatesConfig] = None,
+    freshness: t.Optional[FreshnessTracker] = None,
+    observer: t.Optional[FetchObserver] = None,
+) -> t.Dict[Pair, RateDetailBatch]:
+    """Fetch details for many pairs, sharing requests between pairs where possible.
+
+    Returns a columnar batch of details per ``BASE/QUOTE`` pair, in ``pairs``
+    order; see ``stream_rate_details_for_pairs`` for the other arguments.
+    """
+    details_by_pair = dict(
+        stream_rate_details_for_pairs(
+            pairs,
+            provider_names,
+            plan=plan,
+            config=config,
+            freshness=freshness,
+            observer=observer,
+        )
+    )
+    return {
+        pair: details_by_pair[pair]
+        for pair in dict.fromkeys(Pair(base, quote) for base, quote in pairs)
+    }
 
 
 def fetch_rate_details(
     base_currency: str,
     quote_currency: str,
     provider_names: t.Optional[t.Sequence[str]] = None,
+    config: t.Optional[RatesConfig] = None,
 ) -> t.List[RateDetail]:
     """Fetch normalized rate details from all selected providers."""
+    rates_config = config if config is not None else get_config()
     selected_provider_names = (
-        list(provider_names) if provider_names else get_enabled_provider_names()
+        list(provider_names)
+        if provider_names
+        else _validate_provider_names(rates_config.provider_names)
     )
 
     if not selected_provider_names:
         return []
 
-    details: t.List[RateDetail] = []
-    futures: t.List[Future[RateDetail]] = []
-
-    max_workers = min(len(selected_provider_names), 8)
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for provider_name in selected_provider_names:
-            provider_factory = AVAILABLE_PROVIDERS[provider_name]
-            provider = provider_factory()
-            futures.append(
-                executor.submit(provider.fetch_rate, base_currency, quote_currency)
-            )
-
-        for provider_name, future in zip(selected_provider_names, futures):
-            try:
-                details.append(future.result())
-            except Exception as error:  # pragma: no cover - defensive fallback
-                details.append(
-                    RateDetail(
-                        source=provider_name,
-                        pair=f"{base_currency}/{quote_currency}",
-                        status="error",
-                        error=f"Unhandled provider failure: {safe_error_message(error)}",
-                    )
-                )
+    pairs = [(base_currency, quote_currency)]
+    plan = plan_rate_requests(
+        pairs,
+        selected_provider_names,
+        min_successful_sources=1,
+        mode="all",
+        config=rates_config,
+    )
+    details_by_pair = fetch_rate_details_for_pairs(
+        pairs, selected_provider_names, plan=plan, config=rates_config
+    )
 
-    return details
+    return list(details_by_pair[Pair(base_currency, quote_currency)])
 
 
 def aggregate_rate_details(
@@ -145,14 +541,48 @@ def aggregate_rate_details(
     details: t.Sequence[RateDetail],
     aggregation_method: str,
     min_successful_sources: int,
+    max_quote_age_seconds: t.Optional[float] = None,
+    weights: t.Optional[t.Mapping[str, float]] = None,
 ) -> AggregatedRateResult:
-    """Aggregate normalized provider details into one final rate."""
-    successful_rates = [
-        detail.rate
-        for detail in details
-        if detail.status == "success" and detail.rate is not None
-    ]
-    successful_rates_as_float = [float(rate) for rate in successful_rates]
+    """Aggregate normalized provider details into one final rate.
+
+    A ``RateDetailBatch`` is read column-wise and kept as the result details
+    without building per-row objects. With ``max_quote_age_seconds``, quotes
+    whose provider timestamp is older than that are left out and counted as
+    failed sources and listed in ``stale_sources``; quotes without a timestamp
+    are always used. ``weights`` maps provider names to their weight in the
+    ``weighted_*`` methods (default ``1``).
+    """
+    rate_weights: t.Optional[t.List[float]] = None
+    stale_sources: t.List[str] = []
+    weighted = aggregation_method.strip().lower() in WEIGHTED_AGGREGATION_METHODS
+    if max_quote_age_seconds is not None or weighted:
+        now = time.time()
+        successful_rates_as_float = []
+        rate_weights = []
+        for detail in details:
+            if detail.status != RateStatus.SUCCESS or detail.rate is None:
+                continue
+
+            age_seconds = quote_age_seconds(detail.metadata, now)
+            if (
+                max_quote_age_seconds is not None
+                and age_seconds is not None
+                and age_seconds > max_quote_age_seconds
+            ):
+                stale_sources.append(detail.source)
+                continue
+
+            successful_rates_as_float.append(float(detail.rate))
+            rate_weights.append((weights or {}).get(detail.source, 1.0))
+    elif isinstance(details, RateDetailBatch):
+        successful_rates_as_float = details.successful_rates()
+    else:
+        successful_rates_as_float = [
+            float(detail.rate)
+            for detail in details
+            if detail.status == RateStatus.SUCCESS and detail.rate is not None
+        ]
 
     if len(successful_rates_as_float) < min_successful_sources:
         raise ValueError(
@@ -160,16 +590,20 @@ def aggregate_rate_details(
             f"(required: {min_successful_sources}, available: {len(successful_rates_as_float)})"
         )
 
-    final_rate = aggregate_rates(successful_rates_as_float, aggregation_method)
-    pair = f"{base_currency}/{quote_currency}"
+    with profile_stage("aggregate_rates"):
+        final_rate = aggregate_rates(
+            successful_rates_as_float, aggregation_method, rate_weights
+        )
+    pair = Pair(base_currency, quote_currency)
 
     return AggregatedRateResult(
         pair=pair,
         aggregation_method=aggregation_method,
         aggregated_rate=final_rate,
-        details=list(details),
+        details=details if isinstance(details, RateDetailBatch) else list(details),
         successful_sources=len(successful_rates_as_float),
         failed_sources=len(details) - len(successful_rates_as_float),
+        stale_sources=stale_sources,
     )
 
 
@@ -179,30 +613,41 @@ def fetch_and_aggregate_rate(
     aggregation_method: t.Optional[str] = None,
     provider_names: t.Optional[t.Sequence[str]] = None,
     min_successful_sources: t.Optional[int] = None,
+    config: t.Optional[RatesConfig] = None,
 ) -> AggregatedRateResult:
-    """Convenience helper to fetch provider details and aggregate them."""
+    """Convenience helper to fetch provider details and aggregate them.
+
+    Unless ``provider_names`` is given, consistently poor providers are
+    skipped (see ``select_reliable_providers``).
+    """
+    rates_config = config if config is not None else get_config()
     method = (
         aggregation_method
         if aggregation_method is not None
-        else get_aggregation_method()
+        else rates_config.aggregation_method
     )
     min_successful = (
         min_successful_sources
         if min_successful_sources is not None
-        else get_min_successful_sources()
+        else rates_config.min_successful_sources
     )
     selected_provider_names = (
         list(provider_names)
         if provider_names is not None
-        else get_enabled_provider_names()
+        else _validate_provider_names(rates_config.provider_names)
     )
 
     validate_min_successful_sources(min_successful, selected_provider_names)
+    if provider_names is None:
+        selected_provider_names = select_reliable_providers(
+            selected_provider_names, min_successful, config=rates_config
+        )
 
     details = fetch_rate_details(
         base_currency=base_currency,
         quote_currency=quote_currency,
         provider_names=selected_provider_names,
+        config=rates_config,
     )
 
     return aggregate_rate_details(
@@ -211,4 +656,6 @@ def fetch_and_aggregate_rate(
         details=details,
         aggregation_method=method,
         min_successful_sources=min_successful,
+        max_quote_age_seconds=rates_config.max_quote_age_seconds,
+        weights=get_reliability_weights(selected_provider_names, config=rates_config),
     )
@@ -0,0 +1,210 @@
+"""Long-lived worker pool for provider requests.
+
+``FetchWorkerPool`` keeps one ``ThreadPoolExecutor`` for the life of the
+process instead of one per fetch, and caps how many requests run at once
+per provider. Tasks over a provider's limit wait in a per-provider queue and
+are run by the worker that finishes one of that provider's tasks, so a
+throttled provider never ties up threads other providers could use.
+``stats`` reports queue depth for monitoring.
+"""
+
+import os
+import threading
+import typing as t
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+_T = t.TypeVar("_T")
+
+
+@dataclass(slots=True, frozen=True)
+class WorkerPoolStats:
+    """Task counts of a worker pool at one point in time."""
+
+    max_workers: int
+    queued: int
+    running: int
+    completed: int
+
+
+@dataclass(slots=True)
+class _Task:
+    future: "Future[t.Any]"
+    fn: t.Callable[[], t.Any]
+
+
+def _cancel(future: "Future[t.Any]") -> None:
+    # Notifying lets ``concurrent.futures.wait`` count the future as done.
+    if future.cancel():
+        future.set_running_or_notify_cancel()
+
+
+class FetchWorkerPool:
+    """Thread pool shared by every fetch, with per-provider concurrency limits.
+
+    ``provider_limits`` maps provider names to the most tasks that may run
+    at once for them; providers without a limit may use every worker.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        thread_name_prefix: str = "rates-fetch",
+        provider_limits: t.Optional[t.Mapping[str, int]] = None,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.max_workers = max_workers
+        self.provider_limits = dict(provider_limits or {})
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+        self._waiting: t.Dict[str, t.Deque[_Task]] = {}
+        self._active: t.Dict[str, int] = {}
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._shutdown = False
+
+    def submit(
+        self, provider_name: str, fn: t.Callable[..., _T], *args: t.Any
+    ) -> "Future[_T]":
+        """Run ``fn(*args)`` on the pool once ``provider_name`` has a free slot.
+
+        Cancelling the returned future before it starts drops the task.
+        """
+        task = _Task(Future(), lambda: fn(*args))
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to a worker pool after shutdown")
+
+            self._queued += 1
+            limit = self.provider_limits.get(provider_name)
+            if limit is not None and self._active.get(provider_name, 0) >= limit:
+                self._waiting.setdefault(provider_name, deque()).append(task)
+                return task.future
+
+            self._active[provider_name] = self._active.get(provider_name, 0) + 1
+
+        started = self._executor.submit(self._run, provider_name, task)
+        started.add_done_callback(
+            lambda started: self._dropped(started, provider_name, task)
+        )
+        return task.future
+
+    def _dropped(
+        self, started: "Future[None]", provider_name: str, task: _Task
+    ) -> None:
+        # The executor cancels tasks it never started on shutdown(cancel_futures=True).
+        if not started.cancelled():
+            return
+
+        _cancel(task.future)
+        with self._lock:
+            self._queued -= 1
+            self._active[provider_name] -= 1
+
+    def _run(self, provider_name: str, task: t.Optional[_Task]) -> None:
+        # The thread holding a provider slot keeps draining that provider's queue.
+        while task is not None:
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+
+            try:
+                if task.future.set_running_or_notify_cancel():
+                    try:
+                        task.future.set_result(task.fn())
+                    except BaseException as error:
+                        task.future.set_exception(error)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    waiting = self._waiting.get(provider_name)
+                    task = waiting.popleft() if waiting else None
+                    if task is None:
+                        self._active[provider_name] -= 1
+
+    def stats(self) -> WorkerPoolStats:
+        """Return how many tasks are queued, running and completed."""
+        with self._lock:
+            return WorkerPoolStats(
+                max_workers=self.max_workers,
+                queued=self._queued,
+                running=self._running,
+                completed=self._completed,
+            )
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Stop accepting tasks; with ``wait``, return once every started task finished.
+
+        ``cancel_futures`` cancels tasks that have not started yet.
+        """
+        waiting_tasks: t.List[_Task] = []
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                for waiting in self._waiting.values():
+                    waiting_tasks.extend(waiting)
+                    waiting.clear()
+                self._queued -= len(waiting_tasks)
+
+        for task in waiting_tasks:
+            _cancel(task.future)
+
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+_pool: t.Optional[FetchWorkerPool] = None
+_pool_key: t.Optional[t.Tuple[t.Any, ...]] = None
+_pool_pid: t.Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_worker_pool(
+    max_workers: int = 8,
+    thread_name_prefix: str = "rates-fetch",
+    provider_limits: t.Optional[t.Mapping[str, int]] = None,
+) -> FetchWorkerPool:
+    """Return this process's worker pool, replacing it when the settings change.
+
+    A replaced pool finishes its running tasks in the background. A forked
+    child never reuses the parent's pool.
+    """
+    global _pool, _pool_key, _pool_pid
+
+    key = (
+        max_workers,
+        thread_name_prefix,
+        tuple(sorted((provider_limits or {}).items())),
+    )
+    with _pool_lock:
+        if _pool is None or _pool_key != key or _pool_pid != os.getpid():
+            previous = _pool if _pool_pid == os.getpid() else None
+            _pool = FetchWorkerPool(
+                max_workers,
+                thread_name_prefix=thread_name_prefix,
+                provider_limits=provider_limits,
+            )
+            _pool_key = key
+            _pool_pid = os.getpid()
+            if previous is not None:
+                previous.shutdown(wait=False)
+
+        return _pool
+
+
+def shutdown_worker_pool(wait: bool = True) -> None:
+    """Shut the process's worker pool down, if one was created."""
+    global _pool, _pool_key, _pool_pid
+
+    with _pool_lock:
+        pool = _pool if _pool_pid == os.getpid() else None
+        _pool = _pool_key = _pool_pid = None
+
+    if pool is not None:
+        pool.shutdown(wait=wait)
@@ -1,20 +1,65 @@
+import contextlib
+import io
+import json
+import multiprocessing
 import os
+import queue
+import random
+import sys
+import threading
+import time
 import typing as t
-
-from dotenv import load_dotenv
-
-from notifications import notify
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from notifications import Alert, NotificationDigest, drain_outbox, notify
+from rates.aggregation import WEIGHTED_AGGREGATION_METHODS
+from rates.changes import RateChangeTracker
+from rates.config import ConfigLoader, get_config, parse_bool, set_config
+from rates.currencies import Pair
+from rates.freshness import FreshnessTracker, stale_quote_sources
+from rates.http_transport import close_shared_client
 from rates.models import RateDetail
+from rates.planner import RatePlan
+from rates.profiling import Profiler, profile_run
+from rates.reporting import RateReporter, format_detail_lines
 from rates.service import (
     aggregate_rate_details,
-    fetch_rate_details,
-    get_aggregation_method,
-    get_enabled_provider_names,
-    get_min_successful_sources,
+    fetch_rate_details_for_pairs,
+    get_reliability_weights,
+    plan_rate_requests,
+    select_reliable_providers,
+    stream_rate_details_for_pairs,
     validate_min_successful_sources,
 )
+from rates.worker_pool import shutdown_worker_pool
+
+
+@dataclass(slots=True, frozen=True)
+class WatchRule:
+    """Threshold rule for one base/quote pair."""
+
+    base_currency: str
+    quote_currency: str
+    threshold_rate: float
+
 
-load_dotenv()
+@dataclass(slots=True)
+class ShardOutcome:
+    """What one shard of rules printed, alerted, failed, reported and observed.
+
+    ``observations`` are the reliability inputs of the shard's fetch and
+    ``freshness`` its copy of the freshness tracker, both merged by the parent.
+    """
+
+    output: str
+    alerts: t.List[Alert]
+    failures: t.List[str]
+    records: str = ""
+    observations: t.List[
+        t.Tuple[t.Dict[Pair, t.List[RateDetail]], t.Dict[str, float]]
+    ] = field(default_factory=list)
+    freshness: t.Optional[FreshnessTracker] = None
 
 
 def prepare_inputs() -> t.Tuple[float, str, str]:
@@ -28,6 +73,47 @@ def prepare_inputs() -> t.Tuple[float, str, str]:
     return float(threshold_rate), base_currency.upper(), quote_currency.upper()
 
 
+def prepare_watchlist() -> t.List[WatchRule]:
+    """Read watched pairs from WATCHLIST, falling back to the single-pair settings."""
+    raw_watchlist = os.environ.get("WATCHLIST", "").strip()
+    if not raw_watchlist:
+        threshold_rate, base_currency, quote_currency = prepare_inputs()
+        return [WatchRule(base_currency, quote_currency, threshold_rate)]
+
+    rules: t.List[WatchRule] = []
+    for raw_rule in raw_watchlist.split(","):
+        if not raw_rule.strip():
+            continue
+
+        rules.append(_parse_watch_rule(raw_rule))
+
+    if not rules:
+        raise ValueError("WATCHLIST must contain at least one rule")
+
+    return rules
+
+
+def _parse_watch_rule(raw_rule: str) -> WatchRule:
+    pair, separator, raw_threshold = raw_rule.strip().partition(":")
+    base_currency, pair_separator, quote_currency = pair.strip().partition("/")
+
+    if not separator or not pair_separator:
+        raise ValueError(
+            f"WATCHLIST entries must look like BASE/QUOTE:THRESHOLD, got '{raw_rule.strip()}'"
+        )
+
+    base_currency = base_currency.strip().upper()
+    quote_currency = quote_currency.strip().upper()
+    if not base_currency or not quote_currency:
+        raise ValueError(f"WATCHLIST entry '{raw_rule.strip()}' is missing a currency")
+
+    threshold_rate = float(raw_threshold)
+    if threshold_rate < 0:
+        raise ValueError("Threshold should be a positive number")
+
+    return WatchRule(base_currency, quote_currency, threshold_rate)
+
+
 def _read_required_env(env_var: str) -> str:
     value = os.environ.get(env_var, "").strip()
     if value:
@@ -36,51 +122,58 @@ def _read_required_env(env_var: str) -> str:
     raise ValueError(f"{env_var} is required")
 
 
-def _read_bool_env(env_var: str, default: bool = False) -> bool:
-    raw_value = os.environ.get(env_var)
-    if raw_value is None:
-        return default
+def _read_optional_float_env(env_var: str) -> t.Optional[float]:
+    raw_value = os.environ.get(env_var, "").strip()
+    if not raw_value:
+        return None
 
-    normalized = raw_value.strip().lower()
-    if normalized in {"1", "true", "yes", "y", "on"}:
-        return True
+    value = float(raw_value)
+    if value < 0:
+        raise ValueError(f"{env_var} cannot be negative")
 
-    if normalized in {"0", "false", "no", "n", "off"}:
-        return False
+    return value
 
-    raise ValueError(
-        f"{env_var} must be a boolean value (true/false/1/0/yes/no), got '{raw_value}'"
-    )
 
+class _AlertSink(t.Protocol):
+    def add(self, subject: str, body: str) -> None: ...
 
-def _format_rate_detail(detail: RateDetail) -> str:
-    if detail.status == "success" and detail.rate is not None:
-        return f"[{detail.source}] {detail.pair}={detail.rate:.4f}"
 
-    error_message = detail.error or "Unknown error"
-    return f"[{detail.source}] {detail.status}: {error_message}"
+class _QueuedAlerts:
+    """Hands alerts to the notify stage through a bounded queue."""
 
+    def __init__(self, alerts: "queue.Queue[t.Optional[Alert]]"):
+        self._alerts = alerts
 
-def _format_details_block(details: t.Sequence[RateDetail]) -> str:
-    return "\n".join(f"- {_format_rate_detail(detail)}" for detail in details)
+    def add(self, subject: str, body: str) -> None:
+        self._alerts.put(Alert(subject, body))
 
 
-def check_and_notify() -> None:
-    threshold_rate, base_currency, quote_currency = prepare_inputs()
-    aggregation_method = get_aggregation_method()
-    provider_names = get_enabled_provider_names()
-    min_successful_sources = get_min_successful_sources()
-    notify_on_aggregation_failure = _read_bool_env(
-        "NOTIFY_ON_AGGREGATION_FAILURE", default=True
-    )
+def _print_stale_quotes(
+    pair: Pair,
+    sources: t.Sequence[str],
+    max_quote_age_seconds: t.Optional[float],
+) -> None:
+    for source in sources:
+        print(
+            f"[Freshness] Ignored {source} {pair} quote older than "
+            f"{max_quote_age_seconds:.0f}s"
+        )
 
-    validate_min_successful_sources(min_successful_sources, provider_names)
 
-    details = fetch_rate_details(
-        base_currency=base_currency,
-        quote_currency=quote_currency,
-        provider_names=provider_names,
-    )
+def _check_rule(
+    rule: WatchRule,
+    details: t.Sequence[RateDetail],
+    aggregation_method: str,
+    min_successful_sources: int,
+    notify_on_aggregation_failure: bool,
+    digest: _AlertSink,
+    max_quote_age_seconds: t.Optional[float] = None,
+    weights: t.Optional[t.Mapping[str, float]] = None,
+    reporter: t.Optional[RateReporter] = None,
+) -> None:
+    base_currency = rule.base_currency
+    quote_currency = rule.quote_currency
+    threshold_rate = rule.threshold_rate
 
     try:
         result = aggregate_rate_details(
@@ -89,19 +182,30 @@ def check_and_notify() -> None:
             details=details,
             aggregation_method=aggregation_method,
             min_successful_sources=min_successful_sources,
+            max_quote_age_seconds=max_quote_age_seconds,
+            weights=weights,
         )
     except ValueError as error:
+        _print_stale_quotes(
+            Pair(base_currency, quote_currency),
+            stale_quote_sources(details, max_quote_age_seconds),
+            max_quote_age_seconds,
+        )
         print("Details:")
-        print(_format_details_block(details))
+        for line in format_detail_lines(details):
+            print(line)
+
+        if reporter is not None:
+            reporter.write_error(Pair(base_currency, quote_currency), error, details)
 
         if notify_on_aggregation_failure:
             subject = f"{base_currency}/{quote_currency} - Aggregation failed"
             message = (
                 f"Failed to aggregate exchange rate for {base_currency}/{quote_currency}.\n"
                 f"Reason: {error}\n"
-                f"Source details:\n{_format_details_block(details)}"
+                f"Source details:\n" + "\n".join(format_detail_lines(details))
             )
-            notify(subject, message)
+            digest.add(subject, message)
 
         raise
 
@@ -110,13 +214,18 @@ def check_and_notify() -> None:
         f"using {result.aggregation_method} from "
         f"{result.successful_sources}/{len(result.details)} source(s)."
     )
+    _print_stale_quotes(result.pair, result.stale_sources, max_quote_age_seconds)
 
     print("Details:")
-    print(_format_details_block(result.details))
+    for line in format_detail_lines(result.details):
+        print(line)
 
-    details_block = _format_details_block(result.details)
+    triggered = result.aggregated_rate >= threshold_rate
+    if reporter is not None:
+        reporter.write_result(result, threshold_rate, triggered)
 
-    if result.aggregated_rate >= threshold_rate:
+    if triggered:
+        details_block = "\n".join(format_detail_lines(result.details))
         message = (
             f"The current {result.pair} exchange rate is {result.aggregated_rate:.4f}, "
             f"which is equal to or higher than the threshold rate {threshold_rate:.4f}. "
@@ -129,7 +238,7 @@ def check_and_notify() -> None:
         )
 
         print(message)
-        notify(subject, message)
+        digest.add(subject, message)
     else:
         print(
             f"The current {result.pair} exchange rate is {result.aggregated_rate:.4f}, "
@@ -137,5 +246,528 @@ def check_and_notify() -> None:
         )
 
 
+def _read_shard_workers() -> int:
+    raw_value = os.environ.get("SHARD_WORKERS", "1").strip()
+    workers = int(raw_value)
+
+    if workers < 1:
+        raise ValueError("SHARD_WORKERS must be at least 1")
+
+    return workers
+
+
+def _partition_rules_by_base(
+    rules: t.Sequence[WatchRule], shard_count: int
+) -> t.List[t.List[WatchRule]]:
+    """Split rules into at most ``shard_count`` shards by base currency.
+
+    All rules for a base currency land in the same shard, so providers that
+    return one table per base still make a single request for it. Groups are
+    placed largest first onto the least loaded shard.
+    """
+    rules_by_base: t.Dict[str, t.List[WatchRule]] = {}
+    for rule in rules:
+        rules_by_base.setdefault(rule.base_currency, []).append(rule)
+
+    shards: t.List[t.List[WatchRule]] = [
+        [] for _ in range(min(shard_count, len(rules_by_base)))
+    ]
+    for group in sorted(rules_by_base.values(), key=len, reverse=True):
+        min(shards, key=len).extend(group)
+
+    return shards
+
+
+@contextlib.contextmanager
+def _open_reporter() -> t.Iterator[t.Optional[RateReporter]]:
+    """Open the ``OUTPUT_FORMAT`` reporter, or yield None for text on stdout.
+
+    Records are appended to ``OUTPUT_PATH`` when set, in any format. Otherwise
+    machine-readable records own stdout and the human-readable output moves to
+    stderr.
+    """
+    output_format = os.environ.get("OUTPUT_FORMAT", "").strip().lower() or "text"
+    output_path = os.environ.get("OUTPUT_PATH", "").strip()
+    if output_format == "text" and not output_path:
+        yield None
+        return
+
+    if output_path:
+        with open(output_path, "a", encoding="utf-8", newline="") as stream:
+            yield RateReporter(stream, output_format)
+        return
+
+    reporter = RateReporter(sys.stdout, output_format)
+    with contextlib.redirect_stdout(sys.stderr):
+        yield reporter
+
+
+def _read_pipeline_settings() -> t.Tuple[int, int]:
+    """Return ``(queue_size, evaluate_workers)`` for the check pipeline."""
+    queue_size = int(os.environ.get("PIPELINE_QUEUE_SIZE", "64").strip())
+    evaluate_workers = int(os.environ.get("PIPELINE_EVALUATE_WORKERS", "1").strip())
+
+    if queue_size < 1:
+        raise ValueError("PIPELINE_QUEUE_SIZE must be at least 1")
+
+    if evaluate_workers < 1:
+        raise ValueError("PIPELINE_EVALUATE_WORKERS must be at least 1")
+
+    return queue_size, evaluate_workers
+
+
+def _check_rules(
+    rules: t.Sequence[WatchRule],
+    details_stream: t.Iterable[t.Tuple[Pair, t.Sequence[RateDetail]]],
+    aggregation_method: str,
+    min_successful_sources: int,
+    notify_on_aggregation_failure: bool,
+    digest: NotificationDigest,
+    change_tracker: t.Optional[RateChangeTracker] = None,
+    queue_size: int = 64,
+    evaluate_workers: int = 1,
+    reporter: t.Optional[RateReporter] = None,
+) -> t.List[ValueError]:
+    """Check rules as their pair's details arrive, skipping unchanged inputs.
+
+    ``details_stream`` yields ``(pair, details)`` in any order. Rules are
+    evaluated by ``evaluate_workers`` threads while later pairs are still being
+    fetched, with at most ``queue_size`` pairs waiting; triggered alerts reach
+    ``digest`` through a notify thread, and evaluated rules are written to
+    ``reporter``. ``change_tracker`` is only used from the calling thread.
+    """
+    failures: t.List[ValueError] = []
+    evaluated = 0
+    config = get_config()
+    max_quote_age_seconds = config.max_quote_age_seconds
+    weights = get_reliability_weights(config.provider_names, config=config)
+    evaluation_weights = (
+        tuple(sorted(weights.items()))
+        if aggregation_method.strip().lower() in WEIGHTED_AGGREGATION_METHODS
+        else None
+    )
+
+    rules_by_pair: t.Dict[Pair, t.List[WatchRule]] = {}
+    for rule in rules:
+        rules_by_pair.setdefault(
+            Pair(rule.base_currency, rule.quote_currency), []
+        ).append(rule)
+
+    alerts: "queue.Queue[t.Optional[Alert]]" = queue.Queue(maxsize=queue_size)
+
+    def deliver_alerts() -> None:
+        while (alert := alerts.get()) is not None:
+            digest.add(alert.subject, alert.body)
+
+    def evaluate(
+        rule: WatchRule, details: t.Sequence[RateDetail]
+    ) -> t.Optional[ValueError]:
+        try:
+            _check_rule(
+                rule,
+                details=details,
+                aggregation_method=aggregation_method,
+                min_successful_sources=min_successful_sources,
+                notify_on_aggregation_failure=notify_on_aggregation_failure,
+                digest=_QueuedAlerts(alerts),
+                max_quote_age_seconds=max_quote_age_seconds,
+                weights=weights,
+                reporter=reporter,
+            )
+        except ValueError as error:
+            return error
+
+        return None
+
+    notifier = threading.Thread(target=deliver_alerts, name="rates-notify")
+    notifier.start()
+    slots = threading.BoundedSemaphore(queue_size)
+    futures: t.List[Future[t.Optional[ValueError]]] = []
+    try:
+        with ThreadPoolExecutor(
+            max_workers=evaluate_workers, thread_name_prefix="rates-evaluate"
+        ) as executor:
+            for pair, details in details_stream:
+                settings = (
+                    aggregation_method,
+                    min_successful_sources,
+                    max_quote_age_seconds,
+                    evaluation_weights,
+                    stale_quote_sources(details, max_quote_age_seconds),
+                )
+                for index, rule in enumerate(rules_by_pair.get(pair, ())):
+                    # Rules are tracked one by one; the index keeps repeated
+                    # identical rules apart.
+                    if (
+                        change_tracker is not None
+                        and not change_tracker.should_evaluate(
+                            (pair, rule.threshold_rate, index), details, settings
+                        )
+                    ):
+                        continue
+
+                    evaluated += 1
+                    slots.acquire()
+                    future = executor.submit(evaluate, rule, details)
+                    future.add_done_callback(lambda _: slots.release())
+                    futures.append(future)
+    finally:
+        alerts.put(None)
+        notifier.join()
+
+    for future in futures:
+        failure = future.result()
+        if failure is not None:
+            failures.append(failure)
+
+    if change_tracker is not None:
+        print(
+            f"[Check] Re-evaluated {evaluated}/{len(rules)} rule(s) with changed rates"
+        )
+
+    return failures
+
+
+def _check_shard(
+    rules: t.Sequence[WatchRule],
+    provider_names: t.Sequence[str],
+    plan: RatePlan,
+    aggregation_method: str,
+    min_successful_sources: int,
+    notify_on_aggregation_failure: bool,
+    report: bool = False,
+    freshness: t.Optional[FreshnessTracker] = None,
+) -> ShardOutcome:
+    """Fetch and check one shard in a worker process, capturing what it prints.
+
+    With ``report``, report records are captured as NDJSON for the parent to
+    write in its own output format. Reliability observations and the updated
+    ``freshness`` copy are returned rather than kept in the worker.
+    """
+    # Alerts are only queued here; the parent sends every shard's alerts together.
+    digest = NotificationDigest(send=notify)
+    output = io.StringIO()
+    records = io.StringIO()
+    reporter = RateReporter(records) if report else None
+    observations: t.List[
+        t.Tuple[t.Dict[Pair, t.List[RateDetail]], t.Dict[str, float]]
+    ] = []
+
+    def observe(
+        fetched: t.Mapping[Pair, t.Sequence[RateDetail]],
+        latencies: t.Mapping[str, float],
+    ) -> None:
+        observations.append(
+            (
+                {pair: list(details) for pair, details in fetched.items()},
+                dict(latencies),
+            )
+        )
+
+    with contextlib.redirect_stdout(output):
+        details_by_pair = fetch_rate_details_for_pairs(
+            [(rule.base_currency, rule.quote_currency) for rule in rules],
+            provider_names=provider_names,
+            plan=plan,
+            freshness=freshness,
+            observer=observe,
+        )
+        failures = _check_rules(
+            rules,
+            details_by_pair.items(),
+            aggregation_method=aggregation_method,
+            min_successful_sources=min_successful_sources,
+            notify_on_aggregation_failure=notify_on_aggregation_failure,
+            digest=digest,
+            reporter=reporter,
+        )
+
+    return ShardOutcome(
+        output=output.getvalue(),
+        alerts=list(digest.alerts),
+        failures=[str(failure) for failure in failures],
+        records=records.getvalue(),
+        observations=observations,
+        freshness=freshness,
+    )
+
+
+def _check_shards(
+    shards: t.Sequence[t.Sequence[WatchRule]],
+    provider_names: t.Sequence[str],
+    plan: RatePlan,
+    aggregation_method: str,
+    min_successful_sources: int,
+    notify_on_aggregation_failure: bool,
+    digest: NotificationDigest,
+    reporter: t.Optional[RateReporter] = None,
+    freshness: t.Optional[FreshnessTracker] = None,
+) -> t.List[ValueError]:
+    """Check shards in a process pool and merge what each of them returned.
+
+    Output, alerts and failures are merged in shard order; reliability
+    observations go to this process's tracker and each shard's freshness
+    copy replaces ``freshness`` for that shard's pairs. Workers are spawned,
+    not forked, as this process may already run background threads.
+    """
+    failures: t.List[ValueError] = []
+    tracker = get_config().reliability.tracker()
+
+    with ProcessPoolExecutor(
+        max_workers=len(shards), mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        futures = [
+            executor.submit(
+                _check_shard,
+                shard,
+                provider_names,
+                plan,
+                aggregation_method,
+                min_successful_sources,
+                notify_on_aggregation_failure,
+                reporter is not None,
+                freshness,
+            )
+            for shard in shards
+        ]
+
+        for shard, future in zip(shards, futures):
+            outcome = future.result()
+            print(outcome.output, end="")
+
+            if reporter is not None:
+                for line in outcome.records.splitlines():
+                    reporter.write(json.loads(line))
+
+            for alert in outcome.alerts:
+                digest.add(alert.subject, alert.body)
+
+            failures.extend(ValueError(message) for message in outcome.failures)
+
+            for fetched, latencies in outcome.observations:
+                tracker.observe(fetched, latencies)
+
+            if freshness is not None and outcome.freshness is not None:
+                freshness.merge(
+                    outcome.freshness,
+                    (Pair(rule.base_currency, rule.quote_currency) for rule in shard),
+                )
+
+    return failures
+
+
+def check_and_notify(
+    digest: t.Optional[NotificationDigest] = None,
+    change_tracker: t.Optional[RateChangeTracker] = None,
+    freshness: t.Optional[FreshnessTracker] = None,
+) -> None:
+    """Evaluate every watched pair and send triggered alerts as one digest.
+
+    When ``digest`` is given, alerts are only queued on it and the caller decides
+    when to flush; otherwise a run-scoped digest is flushed before returning.
+    With ``SHARD_WORKERS`` above 1, rules are split by base currency and checked
+    in a process pool. Otherwise, when ``change_tracker`` is given, only rules
+    whose provider details or settings changed since the previous call are
+    aggregated and compared with their threshold. With ``freshness``, providers
+    are not asked again for quotes whose next update is not due.
+    Unsharded checks evaluate each pair as soon as its details arrive, see
+    ``PIPELINE_QUEUE_SIZE`` and ``PIPELINE_EVALUATE_WORKERS``.
+    """
+    rules = prepare_watchlist()
+    config = get_config()
+    aggregation_method = config.aggregation_method
+    provider_names = list(config.provider_names)
+    min_successful_sources = config.min_successful_sources
+    notify_on_aggregation_failure = parse_bool(
+        os.environ, "NOTIFY_ON_AGGREGATION_FAILURE", "true"
+    )
+    shard_workers = _read_shard_workers()
+    queue_size, evaluate_workers = _read_pipeline_settings()
+
+    validate_min_successful_sources(min_successful_sources, provider_names)
+    reliable_names = select_reliable_providers(
+        provider_names, min_successful_sources, config=config
+    )
+    skipped_names = [name for name in provider_names if name not in reliable_names]
+    for name, weight in get_reliability_weights(skipped_names, config=config).items():
+        print(f"[Reliability] Skipping {name} (weight {weight:.2f})")
+    provider_names = reliable_names
+
+    pairs = [(rule.base_currency, rule.quote_currency) for rule in rules]
+    shards = _partition_rules_by_base(rules, shard_workers)
+
+    plan = plan_rate_requests(
+        pairs,
+        provider_names=provider_names,
+        min_successful_sources=min_successful_sources,
+        fresh=freshness.fresh_pairs() if freshness is not None else None,
+        config=config,
+    )
+
+    if parse_bool(os.environ, "RATE_PLAN_DRY_RUN", "false"):
+        print(plan.explain())
+        return
+
+    run_digest = digest if digest is not None else NotificationDigest(send=notify)
+
+    with _open_reporter() as reporter:
+        if len(shards) > 1:
+            failures = _check_shards(
+                shards,
+                provider_names=provider_names,
+                plan=plan,
+                aggregation_method=aggregation_method,
+                min_successful_sources=min_successful_sources,
+                notify_on_aggregation_failure=notify_on_aggregation_failure,
+                digest=run_digest,
+                reporter=reporter,
+                freshness=freshness,
+            )
+        else:
+            failures = _check_rules(
+                rules,
+                stream_rate_details_for_pairs(
+                    pairs,
+                    provider_names=provider_names,
+                    plan=plan,
+                    config=config,
+                    freshness=freshness,
+                    queue_size=queue_size,
+                ),
+                aggregation_method=aggregation_method,
+                min_successful_sources=min_successful_sources,
+                notify_on_aggregation_failure=notify_on_aggregation_failure,
+                digest=run_digest,
+                change_tracker=change_tracker,
+                queue_size=queue_size,
+                evaluate_workers=evaluate_workers,
+                reporter=reporter,
+            )
+
+    config.reliability.tracker().save()
+
+    if digest is None:
+        run_digest.flush()
+
+    if failures:
+        raise failures[0]
+
+
+def _start_outbox_drain() -> threading.Thread:
+    """Retry pending notifications in the background so rate checks are not delayed."""
+    drain_thread = threading.Thread(
+        target=drain_outbox, name="notification-outbox-drain", daemon=True
+    )
+    drain_thread.start()
+    return drain_thread
+
+
+@contextlib.contextmanager
+def _profiled(sampled: bool = False) -> t.Iterator[None]:
+    """Profile a check when ``PROFILE_OUTPUT_DIR`` is set.
+
+    With ``sampled`` (daemon ticks), only a ``PROFILE_SAMPLE_RATE`` fraction of
+    checks is profiled.
+    """
+    profiling = get_config().profiling
+    if not profiling.enabled or (sampled and random.random() >= profiling.sample_rate):
+        yield
+        return
+
+    profiler: t.Optional[Profiler] = None
+    try:
+        with profile_run(
+            t.cast(str, profiling.output_dir),
+            interval_seconds=profiling.interval_seconds,
+            trace_memory=profiling.trace_memory,
+        ) as profiler:
+            yield
+    finally:
+        if profiler is not None and profiler.output_paths is not None:
+            stacks_path, stages_path = profiler.output_paths
+            print(f"[Profile] Wrote {stacks_path} and {stages_path}")
+            summary = profiler.summary()
+            if summary:
+                print(summary)
+
+
+def _reload_config(config_loader: ConfigLoader) -> None:
+    try:
+        if config_loader.reload_if_changed() is not None:
+            print("[Config] Reloaded configuration")
+    except ValueError as error:
+        print(f"[Config] Keeping previous configuration: {error}")
+
+
+def run_daemon(
+    interval_seconds: float, config_loader: t.Optional[ConfigLoader] = None
+) -> None:
+    """Run checks forever, flushing the digest once its window has elapsed.
+
+    When ``config_loader`` is given, changed config files are reloaded before
+    each check. Pairs whose rates did not change since the previous check are
+    not re-evaluated, unless ``INCREMENTAL_CHECKS`` is disabled, and quotes are
+    reused until the provider's next update, unless
+    ``SKIP_FETCH_UNTIL_NEXT_UPDATE`` is disabled.
+    """
+    digest = NotificationDigest(
+        send=notify,
+        window_seconds=_read_optional_float_env("NOTIFICATION_DIGEST_WINDOW_SECONDS"),
+    )
+    change_tracker = (
+        RateChangeTracker()
+        if parse_bool(os.environ, "INCREMENTAL_CHECKS", "true")
+        else None
+    )
+    freshness = (
+        FreshnessTracker()
+        if parse_bool(os.environ, "SKIP_FETCH_UNTIL_NEXT_UPDATE", "true")
+        else None
+    )
+
+    while True:
+        if config_loader is not None:
+            _reload_config(config_loader)
+
+        drain_thread = _start_outbox_drain()
+        try:
+            with _profiled(sampled=True):
+                check_and_notify(
+                    digest=digest, change_tracker=change_tracker, freshness=freshness
+                )
+        except ValueError as error:
+            print(f"[Daemon] Check failed: {error}")
+
+        if digest.is_due():
+            digest.flush()
+
+        drain_thread.join()
+        time.sleep(interval_seconds)
+
+
+def main() -> None:
+    config_loader = ConfigLoader()
+    set_config(config_loader.load())
+    load_error = get_config().reliability.tracker().load_error
+    if load_error is not None:
+        print(f"[Reliability] Ignoring unreadable state file: {load_error}")
+
+    interval_seconds = _read_optional_float_env("POLL_INTERVAL_SECONDS")
+    try:
+        if interval_seconds:
+            run_daemon(interval_seconds, config_loader=config_loader)
+            return
+
+        drain_thread = _start_outbox_drain()
+        try:
+            with _profiled():
+                check_and_notify()
+        finally:
+            drain_thread.join()
+    finally:
+        shutdown_worker_pool()
+        close_shared_client()
+
+
 if __name__ == "__main__":
-    check_and_notify()
+    main()
@@ -0,0 +1,120 @@
+"""Report how long each module takes to import when the script starts.
+
+Run ``python src/startup_timing.py`` to import ``script`` under the timer and
+print the slowest imports, similar to ``python -X importtime`` but aggregated
+and sorted. The rate check itself is not executed.
+"""
+
+import builtins
+import importlib
+import importlib.util
+import sys
+import time
+import typing as t
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ImportTiming:
+    """Measured import time for one module."""
+
+    module: str
+    cumulative_seconds: float
+    self_seconds: float
+
+
+class ImportTimer:
+    """Context manager that records the time spent importing new modules."""
+
+    def __init__(self) -> None:
+        self.timings: t.List[ImportTiming] = []
+        self.total_seconds = 0.0
+        self._original_import: t.Optional[t.Callable[..., t.Any]] = None
+        self._child_seconds: t.List[float] = []
+        self._started_at = 0.0
+
+    def __enter__(self) -> "ImportTimer":
+        self._original_import = builtins.__import__
+        setattr(builtins, "__import__", self._timed_import)
+        self._started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.total_seconds = time.perf_counter() - self._started_at
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+
+    @staticmethod
+    def _resolve_name(
+        name: str, globals_: t.Optional[t.Mapping[str, t.Any]], level: int
+    ) -> str:
+        if level == 0 or not globals_:
+            return name
+
+        package = globals_.get("__package__") or ""
+        try:
+            return importlib.util.resolve_name("." * level + name, package)
+        except (ImportError, ValueError):
+            return name
+
+    def _timed_import(
+        self,
+        name: str,
+        globals_: t.Optional[t.Mapping[str, t.Any]] = None,
+        locals_: t.Optional[t.Mapping[str, t.Any]] = None,
+        fromlist: t.Sequence[str] = (),
+        level: int = 0,
+    ) -> t.Any:
+        assert self._original_import is not None
+
+        module_name = self._resolve_name(name, globals_, level)
+        if module_name in sys.modules:
+            return self._original_import(name, globals_, locals_, fromlist, level)
+
+        self._child_seconds.append(0.0)
+        started_at = time.perf_counter()
+        try:
+            return self._original_import(name, globals_, locals_, fromlist, level)
+        finally:
+            cumulative_seconds = time.perf_counter() - started_at
+            child_seconds = self._child_seconds.pop()
+            if self._child_seconds:
+                self._child_seconds[-1] += cumulative_seconds
+
+            self.timings.append(
+                ImportTiming(
+                    module=module_name,
+                    cumulative_seconds=cumulative_seconds,
+                    self_seconds=cumulative_seconds - child_seconds,
+                )
+            )
+
+    def format_report(self, limit: int = 25) -> str:
+        """Return the slowest imports sorted by cumulative time."""
+        slowest = sorted(
+            self.timings, key=lambda timing: timing.cumulative_seconds, reverse=True
+        )[:limit]
+
+        lines = [
+            f"Startup imports took {self.total_seconds * 1000:.1f} ms "
+            f"({len(self.timings)} module(s) imported).",
+            f"{'cumulative ms':>14} {'self ms':>9}  module",
+        ]
+        lines.extend(
+            f"{timing.cumulative_seconds * 1000:>14.1f} "
+            f"{timing.self_seconds * 1000:>9.1f}  {timing.module}"
+            for timing in slowest
+        )
+
+        return "\n".join(lines)
+
+
+def main() -> None:
+    with ImportTimer() as timer:
+        importlib.import_module("script")
+
+    print(timer.format_report())
+
+
+if __name__ == "__main__":
+    main()
@@ -54,3 +54,24 @@ def mock_exchange_rate_response():
             "GBP": 0.79,
         },
     }
+
+
+@pytest.fixture(autouse=True)
+def reset_rates_config():
+    """Re-read the rates configuration and drop caches, budgets, scores and pools per test."""
+    from rates.config import set_config
+    from rates.http_cache import clear_conditional_caches
+    from rates.reliability import clear_reliability_trackers
+    from rates.retry import clear_retry_budgets
+    from rates.worker_pool import shutdown_worker_pool
+
+    set_config(None)
+    clear_conditional_caches()
+    clear_retry_budgets()
+    clear_reliability_trackers()
+    yield
+    set_config(None)
+    clear_conditional_caches()
+    clear_retry_budgets()
+    clear_reliability_trackers()
+    shutdown_worker_pool()
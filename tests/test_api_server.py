@@ -0,0 +1,172 @@
+"""Tests for the asyncio rates API."""
+
+import asyncio
+import json
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+import pytest
+
+from api_server import RatesApi, serve
+from rates.currencies import Pair
+from rates.models import AggregatedRateResult, RateDetail
+from rates.rate_cache import RateCache
+
+
+def _result(base_currency, quote_currency):
+    pair = Pair(base_currency, quote_currency)
+    return AggregatedRateResult(
+        pair=pair,
+        aggregation_method="median",
+        aggregated_rate=10.8,
+        details=[
+            RateDetail(
+                source="openexchangerates", pair=pair, status="success", rate=10.8
+            ),
+            RateDetail(source="currencyapi", pair=pair, status="error", error="boom"),
+        ],
+        successful_sources=1,
+        failed_sources=1,
+    )
+
+
+@pytest.fixture
+def loader(mocker):
+    def load(base_currency, quote_currency):
+        if quote_currency == "JPY":
+            raise ValueError("No successful rates")
+        return _result(base_currency, quote_currency)
+
+    return mocker.Mock(side_effect=load)
+
+
+@pytest.fixture
+def api(loader):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield RatesApi(RateCache(loader, executor), default_pairs=[("EUR", "MAD")])
+
+
+def _handle(api, target, method="GET"):
+    return asyncio.run(api.handle(method, target))
+
+
+class ManualExecutor(Executor):
+    """Executor that never runs its tasks."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        return Future()
+
+
+class TestRatesApi:
+    """Tests for RatesApi routing."""
+
+    def test_rate_is_served_from_cache(self, api, loader):
+        """Repeated rate requests should hit the provider loader once."""
+        status, document = _handle(api, "/rate/eur/mad")
+        _handle(api, "/rate/EUR/MAD")
+
+        assert status == 200
+        assert document["pair"] == "EUR/MAD"
+        assert document["rate"] == 10.8
+        assert document["stale"] is False
+        assert "details" not in document
+        loader.assert_called_once_with("EUR", "MAD")
+
+    def test_details_include_provider_rows(self, api):
+        """The details route should accept both pair spellings."""
+        status, document = _handle(api, "/details/EUR-MAD")
+        _, same_document = _handle(api, "/details/EUR/MAD")
+
+        assert status == 200
+        assert [detail["source"] for detail in document["details"]] == [
+            "openexchangerates",
+            "currencyapi",
+        ]
+        assert same_document["details"] == document["details"]
+
+    def test_rates_for_base_uses_watchlist_by_default(self, api):
+        """Without quotes, /rates should serve the watched pairs for the base."""
+        _, watched = _handle(api, "/rates?base=EUR")
+        _, requested = _handle(api, "/rates?base=USD&quotes=MAD,JPY")
+
+        assert list(watched["rates"]) == ["MAD"]
+        assert requested["rates"]["MAD"]["pair"] == "USD/MAD"
+        assert requested["rates"]["JPY"] == {"error": "No successful rates"}
+
+    def test_unknown_pairs_are_not_loaded(self, api, loader):
+        """Pairs outside the watchlist and ISO 4217 should get 404 without a fetch."""
+        single, _ = _handle(api, "/rate/EUR/ABC12")
+        several, _ = _handle(api, "/rates?base=EUR&quotes=MAD,ZZZ")
+
+        assert single == several == 404
+        loader.assert_not_called()
+
+    def test_misses_past_the_load_cap_are_rejected(self, loader):
+        """A miss while the load cap is reached should get 503."""
+        cache = RateCache(loader, ManualExecutor(), max_concurrent_loads=1)
+        cache.get("EUR", "MAD")
+
+        status, document = _handle(RatesApi(cache), "/rate/EUR/USD")
+
+        assert status == 503
+        assert "in progress" in document["error"]
+
+    def test_health_reports_fetch_pool(self, api):
+        """Health checks should expose the fetch worker pool's queue depth."""
+        status, document = _handle(api, "/health")
+
+        assert status == 200
+        assert document["fetch_pool"]["queued"] == 0
+
+    @pytest.mark.parametrize(
+        ("method", "target", "expected_status"),
+        [
+            ("GET", "/rate/EUR/JPY", 502),
+            ("GET", "/rate/EUR/M$D", 400),
+            ("GET", "/rates?base=GBP", 400),
+            ("GET", "/unknown", 404),
+            ("POST", "/rate/EUR/MAD", 405),
+        ],
+    )
+    def test_error_statuses(self, api, method, target, expected_status):
+        """Bad input, failed loads and unknown routes should map to statuses."""
+        status, document = _handle(api, target, method=method)
+
+        assert status == expected_status
+        assert "error" in document
+
+
+class TestServe:
+    """Tests for the HTTP server loop."""
+
+    def test_keep_alive_connection(self, api):
+        """Several requests should be answered on one connection."""
+
+        async def exchange():
+            bound_port = asyncio.get_running_loop().create_future()
+            server = asyncio.create_task(serve("127.0.0.1", 0, api, bound_port))
+            port = await bound_port
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = []
+            for connection in ("keep-alive", "close"):
+                writer.write(
+                    f"GET /rate/EUR/MAD HTTP/1.1\r\nConnection: {connection}\r\n\r\n".encode()
+                )
+                status_line = await reader.readline()
+                headers = {}
+                while (line := await reader.readline()) != b"\r\n":
+                    name, _, value = line.decode().partition(":")
+                    headers[name.lower()] = value.strip()
+                body = await reader.readexactly(int(headers["content-length"]))
+                responses.append((status_line, headers, json.loads(body)))
+
+            assert await reader.read() == b""
+            writer.close()
+            server.cancel()
+            return responses
+
+        responses = asyncio.run(exchange())
+
+        assert [response[0] for response in responses] == [b"HTTP/1.1 200 OK\r\n"] * 2
+        assert responses[0][1]["connection"] == "keep-alive"
+        assert responses[1][1]["connection"] == "close"
+        assert responses[1][2]["rate"] == 10.8
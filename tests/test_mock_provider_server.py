@@ -0,0 +1,116 @@
+"""Tests for the local mock provider server."""
+
+import httpx
+import pytest
+
+from mock_provider_server import MockProviderServer, MockScenario
+from rates.config import get_config
+from rates.http_client import request_json
+from rates.service import fetch_rate_details_for_pairs
+from script import check_and_notify
+
+ALL_PROVIDERS = [
+    "openexchangerates",
+    "bank_al_maghrib",
+    "exchangerate_api",
+    "currencyapi",
+    "apilayer_exchangeratesapi",
+    "fawazahmed0_exchange_api",
+]
+
+
+@pytest.fixture
+def mock_server(monkeypatch, mock_env_vars):
+    """Run the mock server and send every provider request to it."""
+    with MockProviderServer(seed=1) as server:
+        monkeypatch.setenv("PROVIDER_BASE_URL_OVERRIDE", server.url)
+        monkeypatch.setenv("HTTP_BACKOFF_BASE_SECONDS", "0")
+        yield server
+
+
+class TestMockProviderServer:
+    """Tests for MockProviderServer."""
+
+    def test_serves_every_provider(self, mock_server):
+        """Every provider should fetch a rate through the override."""
+        details_by_pair = fetch_rate_details_for_pairs(
+            [("EUR", "MAD"), ("GBP", "MAD")], provider_names=ALL_PROVIDERS
+        )
+
+        for details in details_by_pair.values():
+            assert [detail.status for detail in details] == ["success"] * 6
+            assert all(detail.rate and detail.rate > 10 for detail in details)
+
+        stats = mock_server.stats()
+        assert set(stats) == set(ALL_PROVIDERS)
+
+    def test_rate_limit_sends_retry_after(self, mock_server, mocker):
+        """Every Nth request should get a 429 that request_json waits out."""
+        mock_server.set_scenarios(
+            {"default": MockScenario(rate_limit_every=1, retry_after_seconds=2)}
+        )
+        sleep = mocker.patch("rates.http_client.time.sleep")
+
+        with pytest.raises(httpx.HTTPStatusError) as error_info:
+            request_json("https://openexchangerates.org/api/latest.json")
+
+        assert error_info.value.response.status_code == 429
+        assert error_info.value.response.headers["Retry-After"] == "2"
+        sleep.assert_called_with(2.0)
+        assert mock_server.stats()["openexchangerates"]["429"] == 3
+
+    def test_injected_errors_and_payload_size(self, mock_server):
+        """Scenarios should control error injection and table size per provider."""
+        mock_server.set_scenarios(
+            {
+                "openexchangerates": MockScenario(extra_currencies=500),
+                "fawazahmed0_exchange_api": MockScenario(error_rate=1.0),
+            }
+        )
+
+        payload = request_json("https://openexchangerates.org/api/latest.json")
+        with pytest.raises(httpx.HTTPStatusError):
+            request_json("https://cdn.jsdelivr.net/npm/x@latest/v1/currencies/eur.json")
+
+        assert len(payload["rates"]) > 500
+
+    def test_scenarios_can_be_replaced_over_http(self, mock_server):
+        """POST /_scenarios should replace the running scenarios."""
+        response = httpx.post(
+            f"{mock_server.url}/_scenarios",
+            json={"default": {"error_rate": 1.0, "error_status": 500}},
+        )
+
+        assert response.status_code == 200
+        assert mock_server.scenario("currencyapi").error_status == 500
+
+        response = httpx.post(f"{mock_server.url}/_scenarios", json={"x": {"y": 1}})
+        assert response.status_code == 400
+
+    def test_not_modified_for_matching_etag(self, mock_server):
+        """Repeated requests should be revalidated with a 304."""
+        first = request_json("https://openexchangerates.org/api/latest.json")
+        second = request_json("https://openexchangerates.org/api/latest.json")
+
+        assert second is first
+        assert mock_server.stats()["openexchangerates"] == {
+            "requests": 2,
+            "200": 1,
+            "304": 1,
+        }
+
+    def test_sharded_check_merges_worker_observations(
+        self, mock_server, mocker, monkeypatch
+    ):
+        """Spawned shard workers should report what they observed to the parent."""
+        monkeypatch.setenv("WATCHLIST", "EUR/MAD:100,USD/MAD:100")
+        monkeypatch.setenv("SHARD_WORKERS", "2")
+        monkeypatch.setenv("RATE_SOURCES", "openexchangerates")
+        monkeypatch.setenv("MIN_SUCCESSFUL_SOURCES", "1")
+        mocker.patch("script.notify")
+
+        check_and_notify()
+
+        tracker = get_config().reliability.tracker()
+        assert mock_server.stats()["openexchangerates"]["requests"] == 2
+        assert tracker.score("openexchangerates").samples == 2
@@ -0,0 +1,65 @@
+"""Tests for the notification digest module."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from notifications.digest import NotificationDigest
+
+
+class TestNotificationDigest:
+    """Tests for NotificationDigest."""
+
+    def test_single_alert_is_sent_unchanged(self):
+        """A digest with one alert should forward it as-is."""
+        send = MagicMock(return_value=True)
+        digest = NotificationDigest(send=send)
+
+        digest.add("EUR/MAD - above threshold", "Body")
+        result = digest.flush()
+
+        assert result is True
+        send.assert_called_once_with("EUR/MAD - above threshold", "Body")
+
+    def test_multiple_alerts_are_sent_in_one_call(self):
+        """Several alerts should be rendered into one consolidated message."""
+        send = MagicMock(return_value=True)
+        digest = NotificationDigest(send=send)
+
+        digest.add("EUR/MAD - above threshold", "EUR body")
+        digest.add("USD/MAD - above threshold", "USD body")
+        digest.flush()
+
+        send.assert_called_once()
+        subject, body = send.call_args[0]
+        assert subject == "2 exchange rate alerts"
+        assert "[1/2] EUR/MAD - above threshold\nEUR body" in body
+        assert "[2/2] USD/MAD - above threshold\nUSD body" in body
+        assert len(digest) == 0
+
+    def test_flush_is_noop_when_empty(self):
+        """Flushing an empty digest should not send anything."""
+        send = MagicMock()
+        digest = NotificationDigest(send=send)
+
+        assert digest.flush() is False
+        send.assert_not_called()
+
+    def test_is_due_respects_window(self):
+        """Alerts should only be due once the window has elapsed."""
+        now = [100.0]
+        digest = NotificationDigest(
+            send=MagicMock(), window_seconds=60, clock=lambda: now[0]
+        )
+
+        digest.add("subject", "body")
+        now[0] = 130.0
+        assert digest.is_due() is False
+
+        now[0] = 160.0
+        assert digest.is_due() is True
+
+    def test_rejects_negative_window(self):
+        """Negative windows should fail validation."""
+        with pytest.raises(ValueError, match="cannot be negative"):
+            NotificationDigest(send=MagicMock(), window_seconds=-1)
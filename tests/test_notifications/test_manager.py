@@ -6,6 +6,8 @@ from notifications.manager import (
     _build_gotify_url,
     _build_mailgun_url,
     get_notification_manager,
+    get_notification_outbox,
+    get_notification_targets,
     notify,
 )
 
@@ -259,3 +261,49 @@ class TestNotify:
 
         # Assert
         assert result is False
+
+    def test_keeps_failed_notification_in_outbox(self, mocker, monkeypatch, tmp_path):
+        """Failed deliveries should be stored for retry when an outbox is configured."""
+        # Arrange
+        outbox_path = tmp_path / "outbox.db"
+        monkeypatch.setenv("NOTIFICATION_OUTBOX_PATH", str(outbox_path))
+        monkeypatch.setenv("GOTIFY_URL", "https://gotify.example.com")
+        monkeypatch.setenv("GOTIFY_TOKEN", "abc123")
+        monkeypatch.delenv("MAILGUN_DOMAIN", raising=False)
+
+        mock_apprise = mocker.patch("notifications.manager.apprise.Apprise")
+        mock_instance = MagicMock()
+        mock_instance.notify.return_value = False
+        mock_apprise.return_value = mock_instance
+
+        # Act
+        result = notify("Test Subject", "Test Body")
+
+        # Assert
+        assert result is False
+        assert get_notification_outbox().pending_count() == 1
+
+    def test_outbox_result_ignores_earlier_entries(self, mocker, monkeypatch, tmp_path):
+        """Delivering an older pending entry should not report this one as sent."""
+        # Arrange
+        monkeypatch.setenv("NOTIFICATION_OUTBOX_PATH", str(tmp_path / "outbox.db"))
+        monkeypatch.setenv("GOTIFY_URL", "https://gotify.example.com")
+        monkeypatch.setenv("GOTIFY_TOKEN", "abc123")
+        monkeypatch.delenv("MAILGUN_DOMAIN", raising=False)
+
+        mock_apprise = mocker.patch("notifications.manager.apprise.Apprise")
+        mock_instance = MagicMock()
+        mock_instance.notify.side_effect = lambda body, title, body_format: (
+            title == "Old Subject"
+        )
+        mock_apprise.return_value = mock_instance
+        outbox = get_notification_outbox()
+        [target] = get_notification_targets()
+        outbox.enqueue(target, "Old Subject", "Old")
+
+        # Act
+        result = notify("Test Subject", "Test Body")
+
+        # Assert
+        assert result is False
+        assert outbox.pending_count() == 1
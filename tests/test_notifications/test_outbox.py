@@ -0,0 +1,69 @@
+"""Tests for the notification outbox module."""
+
+from unittest.mock import MagicMock
+
+from notifications.outbox import NotificationOutbox
+
+
+class TestNotificationOutbox:
+    """Tests for NotificationOutbox."""
+
+    def test_delivered_entries_are_removed(self, tmp_path):
+        """Successful deliveries should empty the outbox."""
+        outbox = NotificationOutbox(str(tmp_path / "outbox.db"))
+        outbox.enqueue("mailgun", "Subject", "Body")
+        outbox.enqueue("gotify", "Subject", "Body")
+        deliver = MagicMock(return_value=True)
+
+        result = outbox.drain(deliver)
+
+        assert result.delivered == 2
+        assert outbox.pending_count() == 0
+        deliver.assert_any_call("mailgun", "Subject", "Body")
+        deliver.assert_any_call("gotify", "Subject", "Body")
+
+    def test_failed_entries_are_retried_after_backoff(self, tmp_path):
+        """Failed deliveries should be kept and only retried once backoff expires."""
+        now = [1000.0]
+        outbox = NotificationOutbox(
+            str(tmp_path / "outbox.db"),
+            backoff_base_seconds=30,
+            clock=lambda: now[0],
+        )
+        outbox.enqueue("gotify", "Subject", "Body")
+
+        first = outbox.drain(MagicMock(return_value=False))
+        assert first.retried == 1
+        assert outbox.pending_count() == 1
+
+        deliver = MagicMock(return_value=True)
+        now[0] = 1010.0
+        assert outbox.drain(deliver).delivered == 0
+        deliver.assert_not_called()
+
+        now[0] = 1031.0
+        assert outbox.drain(deliver).delivered == 1
+        assert outbox.pending_count() == 0
+
+    def test_delivery_exceptions_count_as_failures(self, tmp_path):
+        """Exceptions raised by targets should not escape the drain."""
+        outbox = NotificationOutbox(str(tmp_path / "outbox.db"))
+        outbox.enqueue("gotify", "Subject", "Body")
+
+        result = outbox.drain(MagicMock(side_effect=RuntimeError("down")))
+
+        assert result.retried == 1
+        assert outbox.pending_count() == 1
+
+    def test_entries_are_dropped_after_max_attempts(self, tmp_path):
+        """Entries should be dropped once the attempt limit is reached."""
+        outbox = NotificationOutbox(
+            str(tmp_path / "outbox.db"),
+            max_attempts=1,
+        )
+        outbox.enqueue("gotify", "Subject", "Body")
+
+        result = outbox.drain(MagicMock(return_value=False))
+
+        assert result.dropped == 1
+        assert outbox.pending_count() == 0
@@ -2,7 +2,10 @@
 
 from unittest.mock import patch
 
-from rates.providers.apilayer_exchangeratesapi import ApilayerExchangeRatesApiProvider
+from rates.providers.apilayer_exchangeratesapi import (
+    ApilayerExchangeRatesApiProvider,
+    ApilayerLatestPayload,
+)
 
 
 class TestApilayerExchangeRatesApiProvider:
@@ -37,6 +40,8 @@ class TestApilayerExchangeRatesApiProvider:
                 "symbols": "EUR,MAD",
             },
             timeout_seconds=None,
+            provider="apilayer_exchangeratesapi",
+            schema=ApilayerLatestPayload,
         )
 
     def test_returns_error_when_missing_key(self, monkeypatch):
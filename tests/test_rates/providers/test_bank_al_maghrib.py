@@ -52,3 +52,20 @@ class TestBankAlMaghribProvider:
 
         assert detail.status == "unavailable"
         assert "No quote returned" in (detail.error or "")
+
+    @patch("rates.providers.bank_al_maghrib.request_json")
+    def test_fetch_rates_requests_each_currency_once(self, mock_request_json):
+        """Batch fetches should request every currency a single time."""
+        quotes = {
+            "EUR": {"achatClientele": 10.8, "uniteDevise": 1},
+            "USD": {"achatClientele": 9.9, "uniteDevise": 1},
+        }
+        mock_request_json.side_effect = lambda url, params, **kwargs: [
+            quotes[params["libDevise"]]
+        ]
+
+        provider = BankAlMaghribProvider(subscription_key="test_key")
+        details = provider.fetch_rates([("EUR", "MAD"), ("USD", "MAD"), ("EUR", "USD")])
+
+        assert [detail.rate for detail in details] == [10.8, 9.9, 10.8 / 9.9]
+        assert mock_request_json.call_count == 2
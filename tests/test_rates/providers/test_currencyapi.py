@@ -2,7 +2,7 @@
 
 from unittest.mock import patch
 
-from rates.providers.currencyapi import CurrencyApiProvider
+from rates.providers.currencyapi import CurrencyApiLatestPayload, CurrencyApiProvider
 
 
 class TestCurrencyApiProvider:
@@ -37,6 +37,8 @@ class TestCurrencyApiProvider:
             params={"base_currency": "EUR", "currencies": "MAD"},
             headers={"apikey": "test_currencyapi_key"},
             timeout_seconds=None,
+            provider="currencyapi",
+            schema=CurrencyApiLatestPayload,
         )
 
     def test_returns_error_when_missing_key(self, monkeypatch):
@@ -2,7 +2,10 @@
 
 from unittest.mock import patch
 
-from rates.providers.exchangerate_api import ExchangeRateApiProvider
+from rates.providers.exchangerate_api import (
+    ExchangeRateApiPairPayload,
+    ExchangeRateApiProvider,
+)
 
 
 class TestExchangeRateApiProvider:
@@ -35,6 +38,8 @@ class TestExchangeRateApiProvider:
         mock_request_json.assert_called_once_with(
             "https://v6.exchangerate-api.com/v6/test_key/pair/EUR/MAD",
             timeout_seconds=None,
+            provider="exchangerate_api",
+            schema=ExchangeRateApiPairPayload,
         )
 
     @patch("rates.providers.exchangerate_api.request_json")
@@ -52,6 +57,8 @@ class TestExchangeRateApiProvider:
         mock_request_json.assert_called_once_with(
             "https://v6.exchangerate-api.com/v6/test_key/pair/EUR/MAD",
             timeout_seconds=7.5,
+            provider="exchangerate_api",
+            schema=ExchangeRateApiPairPayload,
         )
 
     def test_returns_error_when_missing_key(self, monkeypatch):
@@ -70,6 +70,34 @@ class TestFawazAhmed0ExchangeApiProvider:
         assert detail.status == "error"
         assert "Currency 'MAD'" in (detail.error or "")
 
+    @patch("rates.providers.fawazahmed0_exchange_api.stream_json_members")
+    def test_streaming_requests_only_needed_quotes(self, mock_stream_json_members):
+        """Streaming mode should fetch one table per base with only its quotes."""
+        mock_stream_json_members.return_value = {"eur": {"mad": 10.75, "usd": 1.08}}
+
+        provider = FawazAhmed0ExchangeApiProvider(date_tag="latest", streaming=True)
+        details = provider.fetch_rates([("EUR", "MAD"), ("EUR", "USD")])
+
+        assert [detail.rate for detail in details] == [10.75, 1.08]
+        mock_stream_json_members.assert_called_once_with(
+            "https://cdn.jsdelivr.net/npm/@fawazahmed0/currency-api@latest/"
+            "v1/currencies/eur.json",
+            [("eur", "mad"), ("eur", "usd")],
+            timeout_seconds=None,
+            provider="fawazahmed0_exchange_api",
+        )
+
+    @patch("rates.providers.fawazahmed0_exchange_api.stream_json_members")
+    def test_streaming_reports_missing_quote(self, mock_stream_json_members):
+        """A quote absent from the streamed table should produce an error detail."""
+        mock_stream_json_members.return_value = {"eur": {}}
+
+        provider = FawazAhmed0ExchangeApiProvider(date_tag="latest", streaming=True)
+        detail = provider.fetch_rate("EUR", "MAD")
+
+        assert detail.status == "error"
+        assert "Currency 'MAD'" in (detail.error or "")
+
     def test_returns_error_when_date_tag_is_empty(self):
         """Provider should return error detail when date tag is empty."""
         provider = FawazAhmed0ExchangeApiProvider(date_tag="")
@@ -32,6 +32,27 @@ class TestOpenExchangeRatesProvider:
 
         mock_request_json.assert_called_once()
 
+    @patch("rates.providers.openexchangerates.stream_json_members")
+    def test_streaming_reads_only_requested_rates(self, mock_stream_json_members):
+        """Streaming mode should request only the currencies in the pairs."""
+        mock_stream_json_members.return_value = {
+            "base": "USD",
+            "timestamp": 1710750600,
+            "rates": {"EUR": 0.92, "MAD": 10.8},
+        }
+
+        provider = OpenExchangeRatesProvider(app_id="test_app_id", streaming=True)
+        details = provider.fetch_rates([("EUR", "MAD"), ("USD", "MAD")])
+
+        assert [detail.rate for detail in details] == [10.8 / 0.92, 10.8]
+        mock_stream_json_members.assert_called_once_with(
+            "https://openexchangerates.org/api/latest.json",
+            [("base",), ("timestamp",), ("rates", "EUR"), ("rates", "MAD")],
+            params={"app_id": "test_app_id"},
+            timeout_seconds=None,
+            provider="openexchangerates",
+        )
+
     def test_returns_error_when_missing_app_id(self, monkeypatch):
         """Provider should return error detail when APP ID is missing."""
         monkeypatch.delenv("OER_APP_ID", raising=False)
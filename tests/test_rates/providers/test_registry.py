@@ -0,0 +1,152 @@
+"""Tests for the provider registry."""
+
+import sys
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from rates.providers.base import (
+    REQUEST_SCOPE_CURRENCY,
+    REQUEST_SCOPE_GLOBAL,
+    REQUEST_SCOPE_PAIR,
+    ProviderCapabilities,
+)
+from rates.providers.registry import ProviderRegistry, build_default_registry
+
+PLUGIN_SOURCE = """
+from rates.models import RateDetail
+from rates.providers.base import REQUEST_SCOPE_PAIR, ProviderCapabilities
+
+
+class StaticProvider:
+    source_name = "{name}"
+    capabilities = ProviderCapabilities(request_scope=REQUEST_SCOPE_PAIR)
+
+    def fetch_rate(self, base_currency, quote_currency):
+        return RateDetail(
+            source=self.source_name,
+            pair=f"{{base_currency}}/{{quote_currency}}",
+            status="success",
+            rate=1.5,
+        )
+
+
+PROVIDER = StaticProvider
+"""
+
+
+class TestProviderRegistry:
+    """Tests for ProviderRegistry."""
+
+    def test_builtin_providers_declare_capabilities(self, mocker):
+        """Built-in providers should load lazily and expose capabilities."""
+        mocker.patch(
+            "rates.providers.registry.importlib.metadata.entry_points",
+            return_value=[],
+        )
+        registry = build_default_registry(plugin_dir="")
+
+        assert registry.get_capabilities("openexchangerates").request_scope == (
+            REQUEST_SCOPE_GLOBAL
+        )
+        assert registry.get_capabilities("bank_al_maghrib").request_scope == (
+            REQUEST_SCOPE_CURRENCY
+        )
+        assert registry.get_capabilities("openexchangerates").full_table is True
+        assert registry.origin("currencyapi") == "built-in"
+
+    def test_discovers_plugin_directory(self, tmp_path, mocker):
+        """Plugin files should be registered by file name and loaded on demand."""
+        mocker.patch(
+            "rates.providers.registry.importlib.metadata.entry_points",
+            return_value=[],
+        )
+        (tmp_path / "static_rates.py").write_text(
+            PLUGIN_SOURCE.format(name="static_rates")
+        )
+        registry = build_default_registry(plugin_dir=str(tmp_path))
+
+        assert "static_rates" in registry
+        assert "rate_provider_plugins.static_rates" not in sys.modules
+
+        detail = registry.create("static_rates").fetch_rate("EUR", "MAD")
+
+        assert detail.rate == 1.5
+        assert registry.origin("static_rates") == "plugin directory"
+
+    def test_discovers_entry_points(self, mocker):
+        """Entry point providers should be registered by entry point name."""
+        provider_class = MagicMock()
+        provider_class.source_name = "external"
+        provider_class.capabilities = ProviderCapabilities(
+            request_scope=REQUEST_SCOPE_PAIR
+        )
+        entry_point = MagicMock()
+        entry_point.name = "external"
+        entry_point.load.return_value = provider_class
+        mocker.patch(
+            "rates.providers.registry.importlib.metadata.entry_points",
+            return_value=[entry_point],
+        )
+
+        registry = build_default_registry(plugin_dir="")
+
+        assert registry["external"] is provider_class
+        assert registry.origin("external") == "entry point"
+
+    def test_concurrent_lookups_wait_for_discovery(self, mocker):
+        """A lookup during discovery should wait for it instead of missing plugins."""
+        entry_point = MagicMock()
+        entry_point.name = "external"
+        started = threading.Event()
+        release = threading.Event()
+
+        def entry_points(group):
+            started.set()
+            release.wait()
+            return [entry_point]
+
+        mock_entry_points = mocker.patch(
+            "rates.providers.registry.importlib.metadata.entry_points",
+            side_effect=entry_points,
+        )
+        registry = ProviderRegistry(plugin_dir="")
+        found = []
+
+        def lookup():
+            found.append("external" in registry)
+
+        first = threading.Thread(target=lookup)
+        first.start()
+        started.wait()
+        second = threading.Thread(target=lookup)
+        second.start()
+        second.join(timeout=0.1)
+        release.set()
+        first.join()
+        second.join()
+
+        assert found == [True, True]
+        mock_entry_points.assert_called_once()
+
+    def test_rejects_mismatched_source_name(self, tmp_path, mocker):
+        """A provider whose source_name differs from its name should be rejected."""
+        mocker.patch(
+            "rates.providers.registry.importlib.metadata.entry_points",
+            return_value=[],
+        )
+        (tmp_path / "renamed.py").write_text(PLUGIN_SOURCE.format(name="other"))
+        registry = ProviderRegistry(plugin_dir=str(tmp_path))
+
+        with pytest.raises(ValueError, match="must match"):
+            registry["renamed"]
+
+    def test_first_registration_wins(self):
+        """Later registrations should not shadow earlier ones."""
+        registry = ProviderRegistry(discover=False)
+        first_loader = MagicMock()
+        registry.register("dup", first_loader, "built-in")
+        registry.register("dup", MagicMock(), "plugin directory")
+
+        assert registry.origin("dup") == "built-in"
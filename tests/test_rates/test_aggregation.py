@@ -20,6 +20,35 @@ class TestAggregateRates:
 
         assert result == 2.0
 
+    def test_weighted_median_follows_heavier_rates(self):
+        """Weighted median should pick the rate holding half of the weight."""
+        result = aggregate_rates([10.0, 10.1, 12.0], "weighted_median", [0.2, 0.2, 1.0])
+
+        assert result == 12.0
+
+    def test_weighted_methods_match_unweighted_for_equal_weights(self):
+        """Equal or missing weights should reproduce median and mean."""
+        rates = [10.0, 10.1, 10.2, 99.9]
+
+        assert aggregate_rates(rates, "weighted_median") == aggregate_rates(
+            rates, "median"
+        )
+        assert aggregate_rates(rates, "weighted_mean", [2, 2, 2, 2]) == pytest.approx(
+            aggregate_rates(rates, "mean")
+        )
+
+    def test_weighted_mean(self):
+        """Weighted mean should scale each rate by its weight."""
+        assert aggregate_rates([1.0, 4.0], "weighted_mean", [3.0, 1.0]) == 1.75
+
+    def test_rejects_mismatched_or_invalid_weights(self):
+        """Weights must be positive and match the rates one to one."""
+        with pytest.raises(ValueError, match="one weight per rate"):
+            aggregate_rates([1.0, 2.0], "weighted_mean", [1.0])
+
+        with pytest.raises(ValueError, match="must be positive"):
+            aggregate_rates([1.0, 2.0], "weighted_mean", [1.0, 0.0])
+
     def test_none_aggregation_is_rejected(self):
         """None mode is no longer a supported aggregation method."""
         with pytest.raises(ValueError, match="Unsupported aggregation method"):
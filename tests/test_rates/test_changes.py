@@ -0,0 +1,73 @@
+"""Tests for per-provider change detection."""
+
+from rates.changes import RateChangeTracker
+from rates.models import RateDetail, RateDetailBatch
+
+
+def _details(oer_rate, bam_status="success"):
+    return [
+        RateDetail(
+            source="openexchangerates", pair="EUR/MAD", status="success", rate=oer_rate
+        ),
+        RateDetail(
+            source="bank_al_maghrib",
+            pair="EUR/MAD",
+            status=bam_status,
+            rate=10.8 if bam_status == "success" else None,
+        ),
+    ]
+
+
+class TestRateChangeTracker:
+    """Tests for RateChangeTracker."""
+
+    def test_reports_changed_providers(self):
+        """Only providers whose status or rate changed should be reported."""
+        tracker = RateChangeTracker()
+
+        first = tracker.changed_sources("EUR/MAD", _details(10.9))
+        unchanged = tracker.changed_sources("EUR/MAD", _details(10.9))
+        changed = tracker.changed_sources("EUR/MAD", _details(11.0, "error"))
+
+        assert first == ["openexchangerates", "bank_al_maghrib"]
+        assert unchanged == []
+        assert changed == ["openexchangerates", "bank_al_maghrib"]
+
+    def test_added_and_removed_providers_count_as_changed(self):
+        """A provider appearing or disappearing should be reported."""
+        tracker = RateChangeTracker()
+        tracker.changed_sources("EUR/MAD", _details(10.9)[:1])
+
+        assert tracker.changed_sources("EUR/MAD", _details(10.9)) == ["bank_al_maghrib"]
+        assert tracker.changed_sources("EUR/MAD", _details(10.9)[:1]) == [
+            "bank_al_maghrib"
+        ]
+
+    def test_batches_and_lists_compare_equal(self):
+        """Column batches should be compared by their row values."""
+        tracker = RateChangeTracker()
+        tracker.changed_sources("EUR/MAD", _details(10.9))
+
+        assert tracker.changed_sources("EUR/MAD", RateDetailBatch(_details(10.9))) == []
+
+    def test_should_evaluate_tracks_settings(self):
+        """Unchanged inputs with unchanged settings should be skipped."""
+        tracker = RateChangeTracker()
+
+        assert tracker.should_evaluate("EUR/MAD", [], (10.3, "median"))
+        assert not tracker.should_evaluate("EUR/MAD", [], (10.3, "median"))
+        assert tracker.should_evaluate("EUR/MAD", [], (10.5, "median"))
+        assert tracker.should_evaluate("EUR/MAD", _details(10.9), (10.5, "median"))
+
+    def test_rules_on_one_pair_are_tracked_separately(self):
+        """Two rules on the same pair should not reset each other."""
+        tracker = RateChangeTracker()
+        rules = [("EUR/MAD", 10.3), ("EUR/MAD", 11.0)]
+
+        first = [tracker.should_evaluate(rule, _details(10.9)) for rule in rules]
+        second = [tracker.should_evaluate(rule, _details(10.9)) for rule in rules]
+        changed = [tracker.should_evaluate(rule, _details(11.2)) for rule in rules]
+
+        assert first == [True, True]
+        assert second == [False, False]
+        assert changed == [True, True]
@@ -0,0 +1,165 @@
+"""Tests for configuration snapshots and the config file loader."""
+
+import os
+
+import pytest
+
+from rates.config import (
+    ConfigLoader,
+    HttpConfig,
+    ProfilingConfig,
+    RatesConfig,
+    get_config,
+    parse_bool,
+    set_config,
+)
+
+
+class TestRatesConfig:
+    """Tests for parsing settings into a RatesConfig snapshot."""
+
+    def test_defaults_for_empty_environment(self):
+        """Missing settings should fall back to the documented defaults."""
+        assert RatesConfig.from_values({}) == RatesConfig()
+
+    def test_parses_every_setting(self):
+        """Each setting should be normalized and validated once."""
+        config = RatesConfig.from_values(
+            {
+                "RATE_SOURCES": " OpenExchangeRates, fawazahmed0,openexchangerates ",
+                "AGGREGATION_METHOD": "MEAN",
+                "MIN_SUCCESSFUL_SOURCES": "2",
+                "RATE_PLAN_MODE": "minimal",
+                "PROVIDER_REQUEST_COSTS": "openexchangerates=2.5",
+                "PROVIDER_QUOTAS": "openexchangerates=100",
+                "RATE_MAX_QUOTE_AGE_SECONDS": "7200",
+                "HTTP_TIMEOUT_SECONDS": "3",
+                "HTTP_MAX_RETRIES": "0",
+                "STREAMING_JSON_EXTRACTION": "yes",
+                "PROFILE_OUTPUT_DIR": "profiles",
+                "PROFILE_SAMPLE_RATE": "0.1",
+                "FETCH_MAX_WORKERS": "16",
+                "PROVIDER_MAX_CONCURRENCY": "exchangerate_api=2",
+            }
+        )
+
+        assert config.provider_names == ("openexchangerates", "fawazahmed0")
+        assert config.aggregation_method == "mean"
+        assert config.min_successful_sources == 2
+        assert config.plan_mode == "minimal"
+        assert config.provider_request_costs == {"openexchangerates": 2.5}
+        assert config.provider_quotas == {"openexchangerates": 100}
+        assert config.max_quote_age_seconds == 7200.0
+        assert config.http == HttpConfig(
+            timeout_seconds=3.0, max_retries=0, streaming_json_extraction=True
+        )
+        assert config.profiling == ProfilingConfig(
+            output_dir="profiles", sample_rate=0.1
+        )
+        assert config.workers.max_workers == 16
+        assert config.workers.provider_limits == {"exchangerate_api": 2}
+
+    def test_invalid_setting_raises(self):
+        """Invalid values should fail when the snapshot is built."""
+        with pytest.raises(ValueError, match="HTTP_TIMEOUT_SECONDS"):
+            RatesConfig.from_values({"HTTP_TIMEOUT_SECONDS": "0"})
+
+        with pytest.raises(ValueError, match="PROVIDER_MAX_CONCURRENCY"):
+            RatesConfig.from_values({"PROVIDER_MAX_CONCURRENCY": "currencyapi=0.5"})
+
+        with pytest.raises(ValueError, match="PROVIDER_QUOTAS.*whole number"):
+            RatesConfig.from_values({"PROVIDER_QUOTAS": "currencyapi=2.5"})
+
+        with pytest.raises(ValueError, match="HTTP_PROVIDER_MAX_RETRIES"):
+            RatesConfig.from_values({"HTTP_PROVIDER_MAX_RETRIES": "currencyapi=1.5"})
+
+    def test_empty_boolean_uses_default(self):
+        """An empty boolean setting should behave like an unset one."""
+        config = RatesConfig.from_values(
+            {"HTTP_COMPRESSION": "", "STREAMING_JSON_EXTRACTION": " "}
+        )
+
+        assert config.http.compression is True
+        assert config.http.streaming_json_extraction is False
+        assert parse_bool({"INCREMENTAL_CHECKS": ""}, "INCREMENTAL_CHECKS", "true")
+        with pytest.raises(ValueError, match="must be a boolean"):
+            parse_bool({"INCREMENTAL_CHECKS": "maybe"}, "INCREMENTAL_CHECKS", "true")
+
+    def test_snapshot_is_immutable(self):
+        """Snapshots should not be modified in place."""
+        config = RatesConfig()
+
+        with pytest.raises(AttributeError):
+            config.plan_mode = "minimal"  # type: ignore[misc]
+
+        with pytest.raises(TypeError):
+            config.provider_quotas["openexchangerates"] = 1  # type: ignore[index]
+
+
+class TestGetConfig:
+    """Tests for the active snapshot."""
+
+    def test_environment_is_read_once(self, monkeypatch):
+        """Later environment changes should not affect the cached snapshot."""
+        monkeypatch.setenv("AGGREGATION_METHOD", "mean")
+        config = get_config()
+        monkeypatch.setenv("AGGREGATION_METHOD", "median")
+
+        assert get_config() is config
+        assert config.aggregation_method == "mean"
+
+    def test_set_config_none_rereads_environment(self, monkeypatch):
+        """Clearing the snapshot should parse the environment again."""
+        get_config()
+        monkeypatch.setenv("AGGREGATION_METHOD", "mean")
+        set_config(None)
+
+        assert get_config().aggregation_method == "mean"
+
+
+class TestConfigLoader:
+    """Tests for loading and reloading config files."""
+
+    def test_process_environment_wins_over_files(self, tmp_path):
+        """Files should only fill in settings the process did not set."""
+        config_file = tmp_path / "rates.env"
+        config_file.write_text("AGGREGATION_METHOD=mean\nRATE_PLAN_MODE=minimal\n")
+        environ = {"AGGREGATION_METHOD": "median"}
+
+        config = ConfigLoader([str(config_file)], environ=environ).load()
+
+        assert config.aggregation_method == "median"
+        assert config.plan_mode == "minimal"
+        assert environ["RATE_PLAN_MODE"] == "minimal"
+
+    def test_later_files_override_earlier_ones(self, tmp_path):
+        """The last file listing a setting should win."""
+        first = tmp_path / "first.env"
+        second = tmp_path / "second.env"
+        first.write_text("RATE_PLAN_MODE=minimal\n")
+        second.write_text("RATE_PLAN_MODE=all\n")
+
+        config = ConfigLoader([str(first), str(second)], environ={}).load()
+
+        assert config.plan_mode == "all"
+
+    def test_reload_if_changed_installs_new_snapshot(self, tmp_path):
+        """Edited files should be reloaded, and removed settings dropped."""
+        config_file = tmp_path / "rates.env"
+        config_file.write_text("AGGREGATION_METHOD=mean\nRATE_PLAN_MODE=minimal\n")
+        environ: dict = {}
+        loader = ConfigLoader([str(config_file)], environ=environ)
+        loader.load()
+
+        assert loader.reload_if_changed() is None
+
+        config_file.write_text("AGGREGATION_METHOD=median\n")
+        mtime = os.stat(config_file).st_mtime + 1
+        os.utime(config_file, (mtime, mtime))
+        config = loader.reload_if_changed()
+
+        assert config is not None
+        assert get_config() is config
+        assert config.aggregation_method == "median"
+        assert config.plan_mode == "all"
+        assert "RATE_PLAN_MODE" not in environ
@@ -0,0 +1,81 @@
+"""Tests for interned currency codes and pairs."""
+
+import pickle
+
+import pytest
+
+from rates import currencies
+from rates.currencies import ISO_4217_CODES, Pair, currency_code, currency_id
+
+
+class TestCurrencyId:
+    """Tests for the currency code table."""
+
+    def test_iso_codes_use_table_positions(self):
+        """ISO 4217 codes should map to their position in the table."""
+        assert currency_id("MAD") == ISO_4217_CODES.index("MAD")
+        assert currency_code(currency_id("EUR")) == "EUR"
+
+    def test_unknown_codes_get_stable_ids_after_the_table(self):
+        """Non-ISO codes should be assigned once, after the ISO table."""
+        code_id = currency_id("XBT-TEST")
+
+        assert code_id >= len(ISO_4217_CODES)
+        assert currency_id("XBT-TEST") == code_id
+        assert currency_code(code_id) == "XBT-TEST"
+
+    def test_unknown_codes_are_bounded(self, monkeypatch):
+        """New non-ISO codes should be rejected once the limit is reached."""
+        currency_id("XBT-KNOWN")
+        monkeypatch.setattr(
+            currencies,
+            "MAX_EXTRA_CURRENCIES",
+            len(currencies._currency_codes) - len(ISO_4217_CODES),
+        )
+
+        assert currency_code(currency_id("XBT-KNOWN")) == "XBT-KNOWN"
+        assert currency_id("USD") == ISO_4217_CODES.index("USD")
+        with pytest.raises(ValueError, match="non-ISO codes already in use"):
+            currency_id("XBT-NEW")
+
+
+class TestPair:
+    """Tests for interned pairs."""
+
+    def test_pairs_are_interned(self):
+        """Equal pairs should be the same object with the same id."""
+        pair = Pair("EUR", "MAD")
+
+        assert Pair("EUR", "MAD") is pair
+        assert Pair.parse("EUR/MAD") is pair
+        assert Pair.from_id(pair.id) is pair
+
+    def test_behaves_like_pair_string(self):
+        """Pairs should compare and hash like their BASE/QUOTE string."""
+        pair = Pair("EUR", "MAD")
+
+        assert pair == "EUR/MAD"
+        assert {"EUR/MAD": 1}[pair] == 1
+        assert (pair.base, pair.quote) == ("EUR", "MAD")
+        assert pair.base_id == currency_id("EUR")
+        assert pair.quote_id == currency_id("MAD")
+
+    def test_pickling_reinterns_pair(self):
+        """Unpickled pairs should resolve to the interned instance."""
+        pair = Pair("USD", "MAD")
+
+        assert pickle.loads(pickle.dumps(pair)) is pair
+
+    def test_pairs_are_bounded(self, monkeypatch):
+        """New pairs should be rejected once the limit is reached."""
+        pair = Pair("EUR", "GBP")
+        monkeypatch.setattr(currencies, "MAX_PAIRS", len(currencies._pairs_by_id))
+
+        assert Pair("EUR", "GBP") is pair
+        with pytest.raises(ValueError, match="pairs already in use"):
+            Pair("XPT", "ZWG")
+
+    def test_parse_rejects_invalid_names(self):
+        """Names without a BASE/QUOTE separator should fail validation."""
+        with pytest.raises(ValueError, match="Expected BASE/QUOTE"):
+            Pair.parse("EURMAD")
@@ -0,0 +1,205 @@
+"""Tests for provider timestamps and quote reuse until the next update."""
+
+import pytest
+
+from rates.currencies import Pair
+from rates.freshness import (
+    FreshnessTracker,
+    quote_age_seconds,
+    quote_timestamps,
+    stale_quote_sources,
+)
+from rates.models import RateDetail
+from rates.service import (
+    aggregate_rate_details,
+    fetch_rate_details_for_pairs,
+    plan_rate_requests,
+)
+
+PUBLISHED_AT = 1_700_000_000
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def _detail(metadata, status="success"):
+    return RateDetail(
+        source="openexchangerates",
+        pair="EUR/USD",
+        status=status,
+        rate=1.08 if status == "success" else None,
+        metadata=metadata,
+    )
+
+
+class TestQuoteTimestamps:
+    """Tests for reading provider timestamps from metadata."""
+
+    @pytest.mark.parametrize(
+        ("metadata", "expected"),
+        [
+            ({"timestamp": PUBLISHED_AT}, (PUBLISHED_AT, None)),
+            (
+                {
+                    "time_last_update_unix": PUBLISHED_AT,
+                    "time_next_update_unix": PUBLISHED_AT + 86400,
+                },
+                (PUBLISHED_AT, PUBLISHED_AT + 86400),
+            ),
+            ({"date": "2023-11-14"}, (1699920000, None)),
+            ({"date": "latest", "timestamp": None}, (None, None)),
+            ({}, (None, None)),
+        ],
+    )
+    def test_reads_provider_fields(self, metadata, expected):
+        """Each provider's timestamp fields should map to unix times."""
+        assert quote_timestamps(metadata) == expected
+
+    def test_quote_age(self):
+        """Age should be measured from the publication time."""
+        assert quote_age_seconds({"timestamp": PUBLISHED_AT}, PUBLISHED_AT + 90) == 90
+        assert quote_age_seconds({}, PUBLISHED_AT) is None
+
+    def test_stale_quote_sources(self):
+        """Only quotes older than the limit should be reported."""
+        details = [
+            RateDetail(
+                source=source,
+                pair="EUR/USD",
+                status="success",
+                rate=1.1,
+                metadata=metadata,
+            )
+            for source, metadata in (
+                ("openexchangerates", {"timestamp": PUBLISHED_AT}),
+                ("currencyapi", {}),
+            )
+        ]
+
+        assert stale_quote_sources(details, 60, PUBLISHED_AT + 30) == ()
+        assert stale_quote_sources(details, 60, PUBLISHED_AT + 90) == (
+            "openexchangerates",
+        )
+        assert stale_quote_sources(details, None, PUBLISHED_AT + 90) == ()
+
+
+class TestFreshnessTracker:
+    """Tests for FreshnessTracker."""
+
+    def test_keeps_quote_until_next_update(self):
+        """A quote should be fresh until publication time plus the interval."""
+        clock = FakeClock(PUBLISHED_AT + 600)
+        tracker = FreshnessTracker(clock=clock)
+
+        assert tracker.record(_detail({"timestamp": PUBLISHED_AT}), 3600)
+        assert tracker.fresh_pairs() == {"openexchangerates": {"EUR/USD"}}
+        assert tracker.cached_detail("openexchangerates", "EUR/USD").rate == 1.08
+
+        clock.now = PUBLISHED_AT + 3600
+        assert tracker.fresh_pairs() == {}
+        assert tracker.cached_detail("openexchangerates", "EUR/USD") is None
+
+    def test_reported_next_update_wins(self):
+        """time_next_update_unix should be used over the static interval."""
+        tracker = FreshnessTracker(clock=FakeClock(PUBLISHED_AT + 7200))
+        metadata = {
+            "time_last_update_unix": PUBLISHED_AT,
+            "time_next_update_unix": PUBLISHED_AT + 86400,
+        }
+
+        assert tracker.record(_detail(metadata), 3600)
+
+    def test_merge_replaces_quotes_of_the_given_pairs(self):
+        """Quotes checked elsewhere should replace only their own pairs."""
+        clock = FakeClock(PUBLISHED_AT + 600)
+        tracker = FreshnessTracker(clock=clock)
+        shard_copy = FreshnessTracker(clock=clock)
+
+        def quote(pair):
+            return RateDetail(
+                source="openexchangerates",
+                pair=pair,
+                status="success",
+                rate=1.1,
+                metadata={"timestamp": PUBLISHED_AT},
+            )
+
+        for pair in ("EUR/USD", "GBP/USD"):
+            tracker.record(quote(pair), 3600)
+        shard_copy.record(quote("USD/MAD"), 3600)
+
+        tracker.merge(shard_copy, [Pair("EUR", "USD"), Pair("USD", "MAD")])
+
+        assert tracker.fresh_pairs() == {
+            "openexchangerates": {Pair("GBP", "USD"), Pair("USD", "MAD")}
+        }
+
+    def test_ignores_failures_and_untimed_quotes(self):
+        """Quotes without a known next update, or failures, should not be kept."""
+        tracker = FreshnessTracker(clock=FakeClock(PUBLISHED_AT))
+        tracker.record(_detail({"timestamp": PUBLISHED_AT}), 3600)
+
+        assert not tracker.record(_detail({}), 3600)
+        assert not tracker.record(_detail({}, status="error"), 3600)
+        assert tracker.fresh_pairs() == {}
+
+
+class TestFreshnessInService:
+    """Tests for reusing fresh quotes and ignoring old ones."""
+
+    def test_fresh_quotes_skip_provider_requests(
+        self, mocker, mock_env_vars, mock_exchange_rate_response
+    ):
+        """A second fetch before the next update should not call the provider."""
+        published_at = mock_exchange_rate_response["timestamp"]
+        tracker = FreshnessTracker(clock=FakeClock(published_at + 60))
+        mock_request_json = mocker.patch(
+            "rates.providers.openexchangerates.request_json",
+            return_value=mock_exchange_rate_response,
+        )
+        pairs = [("EUR", "USD")]
+
+        first = fetch_rate_details_for_pairs(
+            pairs, provider_names=["openexchangerates"], freshness=tracker
+        )
+        plan = plan_rate_requests(
+            pairs, provider_names=["openexchangerates"], fresh=tracker.fresh_pairs()
+        )
+        second = fetch_rate_details_for_pairs(
+            pairs, provider_names=["openexchangerates"], plan=plan, freshness=tracker
+        )
+
+        mock_request_json.assert_called_once()
+        assert plan.requests == []
+        assert list(second["EUR/USD"]) == list(first["EUR/USD"])
+
+    def test_old_quotes_are_left_out_of_aggregation(self, mocker):
+        """Quotes older than max_quote_age_seconds should count as failed."""
+        mocker.patch("rates.service.time.time", return_value=PUBLISHED_AT + 7200)
+        details = [
+            _detail({"timestamp": PUBLISHED_AT}),
+            RateDetail(
+                source="currencyapi", pair="EUR/USD", status="success", rate=1.1
+            ),
+        ]
+
+        result = aggregate_rate_details(
+            "EUR",
+            "USD",
+            details,
+            aggregation_method="median",
+            min_successful_sources=1,
+            max_quote_age_seconds=3600,
+        )
+
+        assert result.aggregated_rate == 1.1
+        assert result.successful_sources == 1
+        assert result.failed_sources == 1
+        assert result.stale_sources == ["openexchangerates"]
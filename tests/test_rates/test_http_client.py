@@ -1,9 +1,15 @@
 """Tests for shared HTTP client helpers."""
 
+import gzip
+
 import httpx
 import pytest
 
-from rates.http_client import request_json, sanitize_error_message
+from rates import config as config_module
+from rates import http_client, http_transport
+from rates.http_cache import clear_conditional_caches
+from rates.http_client import request_json, sanitize_error_message, stream_json_members
+from rates.http_transport import accept_encoding, transfer_stats
 
 
 class TestRequestJson:
@@ -51,6 +57,195 @@ class TestRequestJson:
         mock_get.assert_called_once()
         mock_sleep.assert_not_called()
 
+    def test_gives_up_when_retry_after_exceeds_backoff_cap(self, mocker, monkeypatch):
+        """A Retry-After above HTTP_BACKOFF_MAX_SECONDS should not be waited out."""
+        monkeypatch.setenv("HTTP_MAX_RETRIES", "3")
+        monkeypatch.setenv("HTTP_BACKOFF_MAX_SECONDS", "4")
+
+        request = httpx.Request("GET", "https://example.com/latest")
+        response = httpx.Response(
+            status_code=429, request=request, headers={"Retry-After": "3600"}
+        )
+
+        mock_get = mocker.patch("rates.http_client.httpx.get", return_value=response)
+        mock_sleep = mocker.patch("rates.http_client.time.sleep")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            request_json("https://example.com/latest")
+
+        mock_get.assert_called_once()
+        mock_sleep.assert_not_called()
+
+
+class TestConditionalRequests:
+    """Tests for ETag/Last-Modified revalidation in request_json."""
+
+    URL = "https://example.com/latest"
+
+    def _responses(self, *responses):
+        request = httpx.Request("GET", self.URL)
+        return [
+            httpx.Response(request=request, **response_kwargs)
+            for response_kwargs in responses
+        ]
+
+    def test_not_modified_reuses_cached_payload(self, mocker):
+        """A 304 answer should return the payload of the validated response."""
+        mock_get = mocker.patch(
+            "rates.http_client.httpx.get",
+            side_effect=self._responses(
+                {
+                    "status_code": 200,
+                    "json": {"rates": {"MAD": 10.8}},
+                    "headers": {
+                        "ETag": '"v1"',
+                        "Last-Modified": "Mon, 19 Oct 2026 00:00:00 GMT",
+                    },
+                },
+                {"status_code": 304},
+            ),
+        )
+        decode = mocker.spy(http_client, "decode_json")
+
+        first = request_json(self.URL, params={"base": "EUR"})
+        second = request_json(self.URL, params={"base": "EUR"})
+
+        assert second is first
+        assert decode.call_count == 1
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"] == {
+            "Accept-Encoding": accept_encoding(),
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 19 Oct 2026 00:00:00 GMT",
+        }
+
+    def test_responses_without_validators_are_not_cached(self, mocker):
+        """Requests should stay unconditional when the server sends no validators."""
+        mock_get = mocker.patch(
+            "rates.http_client.httpx.get",
+            side_effect=self._responses(
+                {"status_code": 200, "json": {"ok": 1}},
+                {"status_code": 200, "json": {"ok": 2}},
+            ),
+        )
+
+        request_json(self.URL)
+
+        assert request_json(self.URL) == {"ok": 2}
+        assert "If-None-Match" not in mock_get.call_args_list[1].kwargs["headers"]
+
+    def test_disabled_by_setting(self, mocker, monkeypatch):
+        """HTTP_CONDITIONAL_REQUESTS=false should never send validators."""
+        monkeypatch.setenv("HTTP_CONDITIONAL_REQUESTS", "false")
+        mock_get = mocker.patch(
+            "rates.http_client.httpx.get",
+            side_effect=self._responses(
+                {"status_code": 200, "json": {"ok": 1}, "headers": {"ETag": '"v1"'}},
+                {"status_code": 200, "json": {"ok": 1}, "headers": {"ETag": '"v1"'}},
+            ),
+        )
+
+        request_json(self.URL)
+        request_json(self.URL)
+
+        assert "If-None-Match" not in mock_get.call_args_list[1].kwargs["headers"]
+
+    def test_disk_cache_revalidates_across_processes(
+        self, mocker, monkeypatch, tmp_path
+    ):
+        """With HTTP_CACHE_DIR, a fresh cache should reuse the stored body on 304."""
+        monkeypatch.setenv("HTTP_CACHE_DIR", str(tmp_path))
+        mock_get = mocker.patch(
+            "rates.http_client.httpx.get",
+            side_effect=self._responses(
+                {
+                    "status_code": 200,
+                    "json": {"rates": {"MAD": 10.8}},
+                    "headers": {"ETag": '"v1"'},
+                },
+                {"status_code": 304},
+            ),
+        )
+
+        request_json(self.URL, headers={"apikey": "secret"})
+        clear_conditional_caches()
+        payload = request_json(self.URL, headers={"apikey": "secret"})
+
+        assert payload == {"rates": {"MAD": 10.8}}
+        assert mock_get.call_args_list[1].kwargs["headers"] == {
+            "apikey": "secret",
+            "Accept-Encoding": accept_encoding(),
+            "If-None-Match": '"v1"',
+        }
+        assert not any("secret" in path.name for path in tmp_path.iterdir())
+
+
+class TestTransport:
+    """Tests for compression negotiation, HTTP/2 and transfer accounting."""
+
+    URL = "https://example.com/latest"
+
+    def test_accept_encoding_lists_installed_decoders(self, mocker):
+        """Optional codings should only be offered when their decoder is installed."""
+        mocker.patch.object(
+            http_transport,
+            "_module_available",
+            side_effect=lambda name: name == "zstandard",
+        )
+        accept_encoding.cache_clear()
+
+        try:
+            assert accept_encoding() == "zstd, gzip, deflate"
+            assert accept_encoding() == "zstd, gzip, deflate"
+            assert accept_encoding(compression=False) == "identity"
+            assert http_transport._module_available.call_count == 3
+        finally:
+            accept_encoding.cache_clear()
+
+    def test_records_bytes_on_wire(self, mocker):
+        """Each response should add its compressed and decoded sizes."""
+        transfer_stats.reset()
+        body = b'{"rates": {"MAD": 10.8}}'
+        response = httpx.Response(
+            status_code=200,
+            request=httpx.Request("GET", self.URL),
+            content=gzip.compress(body),
+            headers={"Content-Encoding": "gzip"},
+        )
+        response.read()
+        mocker.patch("rates.http_client.httpx.get", return_value=response)
+
+        assert request_json(self.URL) == {"rates": {"MAD": 10.8}}
+
+        [record] = transfer_stats.records()
+        assert record.host == "example.com"
+        assert record.content_encoding == "gzip"
+        assert record.bytes_decoded == len(body)
+        assert transfer_stats.totals().requests == 1
+
+    def test_http2_uses_shared_client(self, mocker, monkeypatch):
+        """HTTP2_ENABLED should send requests through the shared client."""
+        mocker.patch.object(config_module.importlib.util, "find_spec")
+        monkeypatch.setenv("HTTP2_ENABLED", "true")
+        shared_client = mocker.patch("rates.http_client.get_shared_client")
+        shared_client.return_value.get.return_value = httpx.Response(
+            status_code=200, request=httpx.Request("GET", self.URL), json={"ok": True}
+        )
+        mock_get = mocker.patch("rates.http_client.httpx.get")
+
+        assert request_json(self.URL) == {"ok": True}
+        mock_get.assert_not_called()
+
+    def test_http2_requires_h2(self, mocker, monkeypatch):
+        """Enabling HTTP/2 without the h2 package should fail fast."""
+        mocker.patch.object(
+            config_module.importlib.util, "find_spec", return_value=None
+        )
+        monkeypatch.setenv("HTTP2_ENABLED", "true")
+
+        with pytest.raises(ValueError, match="h2"):
+            request_json(self.URL)
+
 
 class TestSanitizeErrorMessage:
     """Tests for secret redaction in error messages."""
@@ -70,3 +265,63 @@ class TestSanitizeErrorMessage:
         assert "myappid" not in sanitized_message
         assert "myaccess" not in sanitized_message
         assert "<redacted>" in sanitized_message
+
+    def test_redacts_header_keys_in_any_case(self):
+        """Subscription key headers should be redacted whatever their spelling."""
+        raw_message = "headers {'ocp-apim-subscription-key': 'secret'}"
+
+        assert sanitize_error_message(raw_message) == (
+            "headers {'ocp-apim-subscription-key': '<redacted>'}"
+        )
+
+    def test_messages_without_secrets_are_returned_as_is(self):
+        """The fast path should not copy messages that cannot hold secrets."""
+        raw_message = "Server error '503 Service Unavailable' for url 'https://a.b/c'"
+
+        assert sanitize_error_message(raw_message) is raw_message
+
+
+class TestStreamJsonMembers:
+    """Tests for stream_json_members."""
+
+    def test_returns_requested_members_from_stream(self, mocker):
+        """Only requested members should be returned from the streamed body."""
+        request = httpx.Request("GET", "https://example.com/eur.json")
+        response = httpx.Response(
+            status_code=200,
+            request=request,
+            content=b'{"date": "2026-03-21", "eur": {"mad": 10.75, "usd": 1.08}}',
+        )
+        mock_stream = mocker.patch("rates.http_client.httpx.stream")
+        mock_stream.return_value.__enter__.return_value = response
+
+        members = stream_json_members(
+            "https://example.com/eur.json", [("eur", "mad")], timeout_seconds=5
+        )
+
+        assert members == {"eur": {"mad": 10.75}}
+        mock_stream.assert_called_once_with(
+            "GET",
+            "https://example.com/eur.json",
+            params=None,
+            headers={"Accept-Encoding": accept_encoding()},
+            timeout=5,
+        )
+
+    def test_retries_transient_status(self, mocker, monkeypatch):
+        """Transient HTTP status should be retried like request_json."""
+        monkeypatch.setenv("HTTP_MAX_RETRIES", "1")
+        monkeypatch.setenv("HTTP_BACKOFF_BASE_SECONDS", "0")
+
+        request = httpx.Request("GET", "https://example.com/eur.json")
+        responses = [
+            httpx.Response(status_code=503, request=request),
+            httpx.Response(status_code=200, request=request, content=b'{"eur": {}}'),
+        ]
+        mock_stream = mocker.patch("rates.http_client.httpx.stream")
+        mock_stream.return_value.__enter__.side_effect = responses
+
+        members = stream_json_members("https://example.com/eur.json", [("eur", "mad")])
+
+        assert members == {"eur": {}}
+        assert mock_stream.call_count == 2
@@ -0,0 +1,77 @@
+"""Tests for pluggable JSON decoding backends."""
+
+import typing as t
+
+import pytest
+
+from rates import json_decoding
+from rates.json_decoding import decode_json, get_json_backend, set_json_backend
+
+
+class Payload(t.TypedDict, total=False):
+    """Schema used by decoding tests."""
+
+    rates: t.Dict[str, float]
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    """Restore automatic backend selection after each test."""
+    yield
+    set_json_backend("auto")
+
+
+class TestDecodeJson:
+    """Tests for decode_json and backend selection."""
+
+    def test_json_backend_decodes_payload(self):
+        """The standard library backend should always be available."""
+        set_json_backend("json")
+
+        assert decode_json(b'{"rates": {"MAD": 10.8}}', Payload) == {
+            "rates": {"MAD": 10.8}
+        }
+        assert get_json_backend() == "json"
+
+    def test_auto_falls_back_to_json_without_optional_backends(self, mocker):
+        """Auto selection should use json when no fast backend is installed."""
+        mocker.patch.object(json_decoding, "_import_optional", return_value=None)
+
+        assert set_json_backend("auto") == "json"
+
+    def test_auto_prefers_installed_backend(self, mocker):
+        """Auto selection should pick the first installed fast backend."""
+        fake_orjson = mocker.MagicMock()
+        fake_orjson.loads.return_value = {"ok": True}
+        mocker.patch.object(
+            json_decoding,
+            "_import_optional",
+            side_effect=lambda name: fake_orjson if name == "orjson" else None,
+        )
+
+        assert set_json_backend("auto") == "orjson"
+        assert decode_json(b'{"ok": true}') == {"ok": True}
+
+    def test_msgspec_backend_uses_schema(self, mocker):
+        """Typed backends should receive the provider schema."""
+        fake_msgspec = mocker.MagicMock()
+        mocker.patch.object(
+            json_decoding, "_import_optional", return_value=fake_msgspec
+        )
+        set_json_backend("msgspec")
+
+        decode_json(b"{}", Payload)
+
+        fake_msgspec.json.decode.assert_called_once_with(b"{}", type=Payload)
+
+    def test_raises_when_requested_backend_is_missing(self, mocker):
+        """Explicitly requesting a missing backend should fail validation."""
+        mocker.patch.object(json_decoding, "_import_optional", return_value=None)
+
+        with pytest.raises(ValueError, match="not installed"):
+            set_json_backend("msgspec")
+
+    def test_raises_for_unknown_backend(self):
+        """Unknown backend names should fail validation."""
+        with pytest.raises(ValueError, match="JSON_DECODER must be one of"):
+            set_json_backend("simdjson")
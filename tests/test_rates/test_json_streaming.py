@@ -0,0 +1,101 @@
+"""Tests for incremental JSON member extraction."""
+
+import json
+
+import pytest
+
+from rates.json_streaming import JsonMemberExtractor, extract_json_members
+
+CURRENCY_TABLE = json.dumps(
+    {
+        "date": "2026-03-21",
+        "eur": {"aed": 3.97, "mad": 10.7511, "usd": 1.08, "zar": 19.9},
+    }
+)
+
+
+def _chunks(text, size):
+    return [text[index : index + size] for index in range(0, len(text), size)]
+
+
+class TestExtractJsonMembers:
+    """Tests for extract_json_members."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+    def test_extracts_members_across_chunk_boundaries(self, chunk_size):
+        """Values split between chunks should be reassembled."""
+        members = extract_json_members(
+            _chunks(CURRENCY_TABLE, chunk_size),
+            [("eur", "mad"), ("eur", "usd"), ("date",)],
+        )
+
+        assert members == {
+            "date": "2026-03-21",
+            "eur": {"mad": 10.7511, "usd": 1.08},
+        }
+
+    def test_stops_reading_once_all_paths_are_found(self):
+        """Chunks after the last requested value should not be consumed."""
+        consumed = []
+
+        def chunks():
+            for chunk in _chunks(CURRENCY_TABLE, 8):
+                consumed.append(chunk)
+                yield chunk
+
+        members = extract_json_members(chunks(), [("eur", "aed")])
+
+        assert members == {"eur": {"aed": 3.97}}
+        assert "".join(consumed) != CURRENCY_TABLE
+
+    def test_missing_member_is_omitted(self):
+        """Paths absent from the document should be left out of the result."""
+        members = extract_json_members(
+            [CURRENCY_TABLE], [("eur", "mad"), ("eur", "xxx"), ("gbp", "mad")]
+        )
+
+        assert members == {"eur": {"mad": 10.7511}}
+
+    def test_skips_nested_containers_and_escaped_strings(self):
+        """Unrelated arrays, objects and escaped quotes should not confuse the scan."""
+        document = json.dumps(
+            {
+                "disclaimer": 'Rates "as is" {not json} [x]',
+                "meta": {"sources": [{"rates": {"MAD": 0}}, [1, 2]]},
+                "rates": {"MAD": 10.8, "EUR": 0.92, "flag": True, "note": None},
+            }
+        )
+
+        members = extract_json_members(
+            _chunks(document, 5),
+            [("rates", "MAD"), ("rates", "flag"), ("rates", "note"), ("meta", "x")],
+        )
+
+        assert members == {
+            "meta": {},
+            "rates": {"MAD": 10.8, "flag": True, "note": None},
+        }
+
+    def test_number_at_end_of_chunk_waits_for_more_input(self):
+        """A number cut by a chunk boundary should not be read early."""
+        members = extract_json_members(
+            ['{"rates": {"MAD": 10.', "75}}"], [("rates", "MAD")]
+        )
+
+        assert members == {"rates": {"MAD": 10.75}}
+
+    def test_keeps_empty_parent_objects(self):
+        """Parents of requested paths should be present even without the key."""
+        members = extract_json_members(['{"eur": {"usd": 1.08}}'], [("eur", "mad")])
+
+        assert members == {"eur": {}}
+
+    def test_raises_for_truncated_document(self):
+        """Input ending inside the document should raise ValueError."""
+        with pytest.raises(ValueError, match="ended before"):
+            extract_json_members(['{"eur": {"aed": 3.97'], [("eur", "mad")])
+
+    def test_requires_non_empty_paths(self):
+        """Extraction needs at least one path below the document root."""
+        with pytest.raises(ValueError, match="non-empty JSON path"):
+            JsonMemberExtractor([])
@@ -0,0 +1,98 @@
+"""Tests for rate detail models."""
+
+import pytest
+
+from rates.currencies import Pair
+from rates.models import RateDetail, RateDetailBatch, RateStatus
+
+
+def _details():
+    return [
+        RateDetail(
+            source="openexchangerates", pair="EUR/MAD", status="success", rate=10.8
+        ),
+        RateDetail(
+            source="bank_al_maghrib",
+            pair="EUR/MAD",
+            status="error",
+            error="timeout",
+            metadata={"endpoint": "CoursBBE"},
+        ),
+        RateDetail(source="currencyapi", pair="EUR/MAD", status="success", rate=10.7),
+        RateDetail(
+            source="openexchangerates", pair="USD/MAD", status="error", error="timeout"
+        ),
+    ]
+
+
+class TestRateDetailBatch:
+    """Tests for RateDetailBatch."""
+
+    def test_round_trips_details(self):
+        """Rows should be rebuilt as equal RateDetail objects on demand."""
+        details = _details()
+
+        batch = RateDetailBatch(details)
+
+        assert len(batch) == 4
+        assert list(batch) == details
+        assert batch[-1] == details[-1]
+        assert batch[1].metadata == {"endpoint": "CoursBBE"}
+
+    def test_interns_repeated_strings(self):
+        """Repeated sources, pairs and errors should share one table entry."""
+        batch = RateDetailBatch(_details())
+
+        assert list(batch.source_ids) == [0, 1, 2, 0]
+        assert list(batch.pair_ids) == [Pair("EUR", "MAD").id] * 3 + [
+            Pair("USD", "MAD").id
+        ]
+        assert batch.error_ids[1] == batch.error_ids[3]
+        assert batch.error_ids[0] == -1
+
+    def test_successful_rates_reads_columns(self):
+        """Successful rates should come from the status and rate columns."""
+        batch = RateDetailBatch(_details())
+
+        assert batch.successful_rates() == [10.8, 10.7]
+        assert RateDetailBatch().successful_rates() == []
+
+    def test_rows_yield_tuples_without_metadata(self):
+        """rows() should expose column values as plain tuples."""
+        batch = RateDetailBatch(_details()[:2])
+
+        assert list(batch.rows()) == [
+            ("openexchangerates", "EUR/MAD", "success", 10.8, None),
+            ("bank_al_maghrib", "EUR/MAD", "error", None, "timeout"),
+        ]
+
+    def test_select_keeps_metadata_of_selected_rows(self):
+        """Selecting rows should renumber metadata for the new batch."""
+        batch = RateDetailBatch(_details())
+
+        selected = batch.select([1, 3])
+
+        assert [detail.source for detail in selected] == [
+            "bank_al_maghrib",
+            "openexchangerates",
+        ]
+        assert selected[0].metadata == {"endpoint": "CoursBBE"}
+        assert selected[1].metadata == {}
+        assert batch[1:3] == _details()[1:3]
+
+    def test_rows_use_interned_pairs_and_status_enum(self):
+        """Rebuilt rows should carry interned pairs and RateStatus members."""
+        detail = RateDetailBatch(_details())[0]
+
+        assert detail.pair is Pair("EUR", "MAD")
+        assert detail.status is RateStatus.SUCCESS
+
+    def test_rejects_unknown_status(self):
+        """Statuses outside RateStatus should fail validation."""
+        with pytest.raises(ValueError, match="Unsupported rate status"):
+            RateDetailBatch().append_row("a", "EUR/MAD", "pending")
+
+    def test_raises_for_out_of_range_index(self):
+        """Indexing past the end should raise IndexError."""
+        with pytest.raises(IndexError):
+            RateDetailBatch(_details())[4]
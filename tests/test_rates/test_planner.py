@@ -0,0 +1,136 @@
+"""Tests for the provider request planner."""
+
+import pytest
+
+from rates.planner import plan_requests
+from rates.providers.base import (
+    REQUEST_SCOPE_BASE,
+    REQUEST_SCOPE_CURRENCY,
+    REQUEST_SCOPE_GLOBAL,
+    REQUEST_SCOPE_PAIR,
+    ProviderCapabilities,
+)
+
+PROVIDERS = {
+    "bank_al_maghrib": ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_CURRENCY,
+        supports_batch=True,
+        anchor_currency="MAD",
+    ),
+    "exchangerate_api": ProviderCapabilities(request_scope=REQUEST_SCOPE_PAIR),
+    "fawazahmed0_exchange_api": ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_BASE, supports_batch=True
+    ),
+    "openexchangerates": ProviderCapabilities(
+        request_scope=REQUEST_SCOPE_GLOBAL, supports_batch=True
+    ),
+}
+
+PAIRS = [("EUR", "MAD"), ("USD", "MAD"), ("EUR", "USD")]
+
+
+class TestPlanRequests:
+    """Tests for plan_requests function."""
+
+    def test_all_mode_shares_requests_between_pairs(self):
+        """Every provider should be used, with shared requests counted once."""
+        plan = plan_requests(PAIRS, PROVIDERS, min_successful_sources=1)
+
+        requests = {(request.provider, request.key) for request in plan.requests}
+        assert plan.assignments["EUR/MAD"] == list(PROVIDERS)
+        assert requests == {
+            ("bank_al_maghrib", "EUR"),
+            ("bank_al_maghrib", "USD"),
+            ("exchangerate_api", "EUR/MAD"),
+            ("exchangerate_api", "USD/MAD"),
+            ("exchangerate_api", "EUR/USD"),
+            ("fawazahmed0_exchange_api", "EUR"),
+            ("fawazahmed0_exchange_api", "USD"),
+            ("openexchangerates", "*"),
+        }
+
+    def test_minimal_mode_prefers_already_planned_requests(self):
+        """Minimal mode should reuse full-table requests across pairs."""
+        plan = plan_requests(
+            PAIRS,
+            PROVIDERS,
+            min_successful_sources=1,
+            mode="minimal",
+            costs={"bank_al_maghrib": 0.5},
+        )
+
+        assert plan.assignments == {
+            "EUR/MAD": ["bank_al_maghrib"],
+            "USD/MAD": ["bank_al_maghrib"],
+            "EUR/USD": ["bank_al_maghrib"],
+        }
+        assert len(plan.requests) == 2
+
+    def test_minimal_mode_prefers_one_covering_request(self):
+        """A full-table request should beat cheaper per-pair requests in total."""
+        plan = plan_requests(
+            PAIRS,
+            PROVIDERS,
+            min_successful_sources=1,
+            mode="minimal",
+            costs={
+                "bank_al_maghrib": 2,
+                "fawazahmed0_exchange_api": 2,
+                "openexchangerates": 1.5,
+            },
+        )
+
+        assert plan.assignments == {
+            "EUR/MAD": ["openexchangerates"],
+            "USD/MAD": ["openexchangerates"],
+            "EUR/USD": ["openexchangerates"],
+        }
+        assert plan.total_cost == 1.5
+
+    def test_minimal_mode_picks_cheapest_sources(self):
+        """The cheapest providers should be picked to reach the minimum."""
+        plan = plan_requests(
+            [("EUR", "MAD")],
+            PROVIDERS,
+            min_successful_sources=2,
+            mode="minimal",
+            costs={"exchangerate_api": 5, "openexchangerates": 3},
+        )
+
+        assert plan.assignments["EUR/MAD"] == [
+            "bank_al_maghrib",
+            "fawazahmed0_exchange_api",
+        ]
+        assert "not needed" in plan.skipped["EUR/MAD"]["openexchangerates"]
+
+    def test_quota_limits_requests(self):
+        """Providers over quota should be skipped and reported."""
+        plan = plan_requests(
+            PAIRS,
+            {"exchangerate_api": PROVIDERS["exchangerate_api"]},
+            min_successful_sources=1,
+            quotas={"exchangerate_api": 2},
+        )
+
+        assert plan.assignments["EUR/USD"] == []
+        assert plan.unsatisfied_pairs == ["EUR/USD"]
+        assert "quota" in plan.explain()
+
+    def test_fresh_pairs_are_served_from_cache(self):
+        """Fresh cached pairs should not need any request."""
+        plan = plan_requests(
+            [("EUR", "MAD")],
+            {"openexchangerates": PROVIDERS["openexchangerates"]},
+            min_successful_sources=1,
+            mode="minimal",
+            fresh={"openexchangerates": {"EUR/MAD"}},
+        )
+
+        assert plan.requests == []
+        assert plan.cached == {"EUR/MAD": ["openexchangerates"]}
+        assert plan.unsatisfied_pairs == []
+
+    def test_rejects_unknown_mode(self):
+        """Unknown plan modes should fail validation."""
+        with pytest.raises(ValueError, match="Unsupported plan mode"):
+            plan_requests(PAIRS, PROVIDERS, min_successful_sources=1, mode="cheap")
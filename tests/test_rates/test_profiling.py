@@ -0,0 +1,92 @@
+"""Tests for opt-in stage profiling."""
+
+import json
+import threading
+
+import pytest
+
+from rates.profiling import Profiler, profile_run, profile_stage
+
+
+class TestProfiler:
+    """Tests for Profiler."""
+
+    def test_stage_records_calls_and_times(self):
+        """Each stage call should add to the stage's totals."""
+        profiler = Profiler(trace_memory=False)
+
+        for _ in range(2):
+            with profiler.stage("fetch_rate:openexchangerates"):
+                sum(range(1000))
+
+        stats = profiler.stats["fetch_rate:openexchangerates"]
+        assert stats.calls == 2
+        assert stats.wall_seconds >= stats.cpu_seconds >= 0
+        assert stats.allocated_bytes == 0
+
+    def test_peak_is_measured_per_stage(self):
+        """A stage should not report a peak reached before it started."""
+        profiler = Profiler(trace_memory=True)
+        with profiler:
+            with profiler.stage("fetch_rate:large"):
+                large = bytearray(1_000_000)
+                del large
+
+            with profiler.stage("fetch_rate:small"):
+                small = bytearray(1_000)
+                del small
+
+        assert profiler.stats["fetch_rate:large"].peak_bytes >= 1_000_000
+        assert 1_000 <= profiler.stats["fetch_rate:small"].peak_bytes < 1_000_000
+
+    def test_samples_only_threads_inside_a_stage(self):
+        """Stacks should be collapsed under the stage name of their thread."""
+        profiler = Profiler(trace_memory=False)
+        entered = threading.Event()
+        release = threading.Event()
+
+        def fetch():
+            with profiler.stage("fetch_rate:slow"):
+                entered.set()
+                release.wait()
+
+        worker = threading.Thread(target=fetch)
+        worker.start()
+        entered.wait()
+        profiler.sample()
+        release.set()
+        worker.join()
+
+        [(stack, count)] = profiler.stacks.items()
+        assert stack.startswith("fetch_rate:slow;")
+        assert "test_profiling.TestProfiler." in stack
+        assert count == 1
+
+
+class TestProfileRun:
+    """Tests for profile_run and profile_stage."""
+
+    def test_stage_is_a_no_op_outside_a_run(self):
+        """Unprofiled calls should share one no-op context manager."""
+        assert profile_stage("aggregate_rates") is profile_stage("fetch_rate:x")
+
+    def test_writes_collapsed_stacks_and_stage_totals(self, tmp_path):
+        """A profiled run should leave flamegraph input and per-stage totals."""
+        with profile_run(
+            str(tmp_path), label="run", interval_seconds=0.001
+        ) as profiler:
+            with profile_stage("aggregate_rates"):
+                [str(number) for number in range(1000)]
+
+            with pytest.raises(ValueError, match="already in progress"):
+                with profile_run(str(tmp_path)):
+                    pass
+
+        stages = json.loads((tmp_path / "run.stages.json").read_text())
+        assert stages["aggregate_rates"]["calls"] == 1
+        assert stages["aggregate_rates"]["peak_bytes"] > 0
+        assert (tmp_path / "run.collapsed").exists()
+        assert profiler.output_paths == (
+            str(tmp_path / "run.collapsed"),
+            str(tmp_path / "run.stages.json"),
+        )
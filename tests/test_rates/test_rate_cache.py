@@ -0,0 +1,237 @@
+"""Tests for the stale-while-revalidate rate cache."""
+
+from concurrent.futures import Executor, Future
+
+import pytest
+
+from rates.models import AggregatedRateResult
+from rates.rate_cache import HotPairRefresher, RateCache, RateCacheBusyError
+
+
+class FakeClock:
+    """Clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ManualExecutor(Executor):
+    """Executor that queues tasks until ``run_pending`` is called."""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        self.pending.append((future, fn, args, kwargs))
+        return future
+
+    def run_pending(self):
+        pending, self.pending = self.pending, []
+        for future, fn, args, kwargs in pending:
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as error:
+                future.set_exception(error)
+
+
+def _result(rate):
+    return AggregatedRateResult(
+        pair="EUR/MAD",
+        aggregation_method="median",
+        aggregated_rate=rate,
+        details=[],
+        successful_sources=1,
+        failed_sources=0,
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def executor():
+    return ManualExecutor()
+
+
+@pytest.fixture
+def loader(mocker):
+    return mocker.Mock(side_effect=lambda base, quote: _result(10.8))
+
+
+@pytest.fixture
+def cache(loader, executor, clock):
+    return RateCache(loader, executor, ttl_seconds=60, stale_seconds=300, clock=clock)
+
+
+def _load(cache, executor):
+    future = cache.get("EUR", "MAD")
+    executor.run_pending()
+    return future.result()
+
+
+class TestRateCache:
+    """Tests for RateCache."""
+
+    def test_fresh_entry_is_served_without_loading(self, cache, executor, loader):
+        """A rate within its TTL should be returned without another fetch."""
+        first = _load(cache, executor)
+        second = cache.get("EUR", "MAD")
+
+        assert first.result.aggregated_rate == 10.8
+        assert second.done()
+        assert second.result().stale is False
+        assert loader.call_count == 1
+
+    def test_concurrent_misses_share_one_load(self, cache, executor, loader):
+        """Callers missing the same pair should wait on the same load."""
+        first = cache.get("EUR", "MAD")
+        second = cache.get("EUR", "MAD")
+        executor.run_pending()
+
+        assert first is second
+        assert first.result().result.aggregated_rate == 10.8
+        assert loader.call_count == 1
+
+    def test_stale_entry_is_served_while_refreshing(
+        self, cache, executor, loader, clock
+    ):
+        """A stale rate should be returned at once and refreshed in the background."""
+        _load(cache, executor)
+        clock.now += 90
+
+        stale = cache.get("EUR", "MAD")
+        cache.get("EUR", "MAD")
+
+        assert stale.done()
+        assert stale.result().stale is True
+        assert stale.result().age_seconds == 90
+        assert len(executor.pending) == 1
+
+        executor.run_pending()
+        assert cache.peek("EUR", "MAD").age_seconds == 0
+        assert loader.call_count == 2
+
+    def test_expired_entry_is_reloaded_before_returning(self, cache, executor, clock):
+        """A rate past the stale window should not be served."""
+        _load(cache, executor)
+        clock.now += 400
+
+        future = cache.get("EUR", "MAD")
+
+        assert not future.done()
+        executor.run_pending()
+        assert future.result().age_seconds == 0
+        assert future.result().stale is False
+
+    def test_failed_refresh_keeps_stale_entry(self, cache, executor, loader, clock):
+        """A refresh failure should keep serving the previous rate."""
+        _load(cache, executor)
+        loader.side_effect = ValueError("provider down")
+        clock.now += 90
+
+        cache.get("EUR", "MAD")
+        executor.run_pending()
+        served = cache.get("EUR", "MAD")
+
+        assert served.result().result.aggregated_rate == 10.8
+        assert served.result().stale is True
+        assert len(executor.pending) == 1
+
+    def test_failed_first_load_is_not_cached(self, cache, executor, loader):
+        """A failed load should raise and be retried by the next caller."""
+        loader.side_effect = [ValueError("provider down"), _result(10.9)]
+
+        with pytest.raises(ValueError, match="provider down"):
+            _load(cache, executor)
+
+        assert _load(cache, executor).result.aggregated_rate == 10.9
+
+    def test_rejects_negative_windows(self, loader, executor):
+        """Negative TTL or stale windows should be rejected."""
+        with pytest.raises(ValueError, match="cannot be negative"):
+            RateCache(loader, executor, ttl_seconds=-1)
+
+    def test_background_refreshes_are_capped(self, loader, executor, clock):
+        """Stale entries beyond the refresh cap should be served without a refresh."""
+        cache = RateCache(
+            loader, executor, ttl_seconds=60, clock=clock, max_concurrent_refreshes=1
+        )
+        for quote in ("MAD", "USD"):
+            cache.get("EUR", quote)
+        executor.run_pending()
+        clock.now += 90
+
+        served = [cache.get("EUR", quote) for quote in ("MAD", "USD")]
+
+        assert all(future.result().stale for future in served)
+        assert len(executor.pending) == 1
+
+    def test_misses_past_the_load_cap_are_rejected(self, loader, executor, clock):
+        """A miss should raise once ``max_concurrent_loads`` loads are in flight."""
+        cache = RateCache(loader, executor, clock=clock, max_concurrent_loads=1)
+        first = cache.get("EUR", "MAD")
+
+        assert cache.get("EUR", "MAD") is first
+        with pytest.raises(RateCacheBusyError):
+            cache.get("EUR", "USD")
+
+        executor.run_pending()
+        assert cache.get("EUR", "USD") is not None
+
+    def test_expired_entries_are_evicted(self, cache, executor, clock):
+        """Entries past the stale window should be dropped from memory."""
+        _load(cache, executor)
+        clock.now += 200
+        cache.get("EUR", "USD")
+        executor.run_pending()
+        clock.now += 200
+
+        assert cache.evict_expired() == ["EUR/MAD"]
+        assert cache.pairs() == ["EUR/USD"]
+
+
+class TestHotPairRefresh:
+    """Tests for refreshing frequently requested pairs before they expire."""
+
+    def test_hot_pair_is_refreshed_before_ttl(self, cache, executor, clock):
+        """Pairs requested often should be reloaded within the lead time."""
+        for _ in range(3):
+            _load(cache, executor)
+        cache.get("EUR", "USD")
+        executor.run_pending()
+        clock.now += 55
+
+        refreshed = cache.refresh_hot(min_hits=2, lead_seconds=10)
+
+        assert refreshed == ["EUR/MAD"]
+        executor.run_pending()
+        assert cache.peek("EUR", "MAD").age_seconds == 0
+        assert cache.peek("EUR", "USD").age_seconds == 55
+
+    def test_fresh_or_cold_pairs_are_not_refreshed(self, cache, executor, clock):
+        """Refreshes should wait for the lead window and cool down without lookups."""
+        for _ in range(3):
+            _load(cache, executor)
+
+        assert cache.refresh_hot(min_hits=2, lead_seconds=10) == []
+
+        clock.now += 55
+
+        assert cache.refresh_hot(min_hits=2, lead_seconds=10) == []
+        assert executor.pending == []
+
+    def test_refresher_thread_runs_refresh_hot(self, mocker):
+        """HotPairRefresher should call refresh_hot until stopped."""
+        cache = mocker.Mock()
+
+        with HotPairRefresher(cache, interval_seconds=0.01, min_hits=3) as refresher:
+            while not cache.refresh_hot.called:
+                pass
+
+        cache.refresh_hot.assert_called_with(3, refresher.lead_seconds)
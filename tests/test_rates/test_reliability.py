@@ -0,0 +1,140 @@
+"""Tests for provider reliability scoring."""
+
+from rates.models import RateDetail
+from rates.reliability import ProviderReliability, ReliabilityTracker
+from rates.service import aggregate_rate_details, fetch_and_aggregate_rate
+
+
+def _details(rates):
+    return [
+        (
+            RateDetail(source=source, pair="EUR/MAD", status="success", rate=rate)
+            if rate is not None
+            else RateDetail(
+                source=source, pair="EUR/MAD", status="error", error="timeout"
+            )
+        )
+        for source, rate in rates.items()
+    ]
+
+
+def _observe(tracker, rates, times=1, latencies=None):
+    for _ in range(times):
+        tracker.observe({"EUR/MAD": _details(rates)}, latencies)
+
+
+class TestProviderReliability:
+    """Tests for turning rolling averages into weights."""
+
+    def test_new_providers_have_full_weight(self):
+        """Providers below min_samples should not be penalized yet."""
+        assert ProviderReliability(samples=2, error_rate=1.0).weight(5) == 1.0
+
+    def test_weight_drops_with_deviation_errors_and_latency(self):
+        """Each component should lower the weight."""
+        perfect = ProviderReliability(samples=5).weight(5)
+
+        assert perfect == 1.0
+        assert ProviderReliability(samples=5, deviation=0.005).weight(5) == 0.5
+        assert ProviderReliability(samples=5, error_rate=0.5).weight(5) == 0.5
+        assert ProviderReliability(samples=5, latency_seconds=10).weight(5) == 0.5
+        assert ProviderReliability(samples=5, error_rate=1.0).weight(5) == 0.01
+
+
+class TestReliabilityTracker:
+    """Tests for ReliabilityTracker."""
+
+    def test_scores_deviation_from_consensus(self):
+        """An outlier provider should end up with a lower weight than the others."""
+        tracker = ReliabilityTracker(min_samples=1)
+
+        _observe(tracker, {"a": 10.0, "b": 10.0, "c": 11.0}, times=3)
+
+        assert tracker.weight("a") == 1.0
+        assert tracker.score("c").deviation == 0.1
+        assert tracker.weight("c") < 0.1
+
+    def test_scores_errors_and_latency(self):
+        """Failed details and slow requests should be tracked per provider."""
+        tracker = ReliabilityTracker(min_samples=1, alpha=0.5)
+
+        _observe(tracker, {"a": 10.0, "b": None}, latencies={"a": 0.5, "b": 4.0})
+        _observe(tracker, {"a": 10.0, "b": 10.0}, latencies={"a": 0.5, "b": 2.0})
+
+        score = tracker.score("b")
+        assert score.samples == 2
+        assert score.error_rate == 0.5
+        assert score.latency_seconds == 3.0
+
+    def test_select_providers_skips_poor_ones_but_keeps_minimum(self):
+        """Poor providers should be skipped while enough providers remain."""
+        clock_now = [1000.0]
+        tracker = ReliabilityTracker(
+            min_samples=1, min_weight=0.2, retry_seconds=60, clock=lambda: clock_now[0]
+        )
+        _observe(tracker, {"a": 10.0, "b": None, "c": None})
+
+        assert tracker.select_providers(["a", "b", "c"], 1) == ["a"]
+        assert tracker.select_providers(["a", "b", "c"], 2) == ["a", "c"]
+
+        clock_now[0] += 60
+        assert tracker.select_providers(["a", "b", "c"], 1) == ["a", "b", "c"]
+
+    def test_scores_persist_between_runs(self, tmp_path):
+        """Scores saved to the state file should be loaded by a new tracker."""
+        state_path = str(tmp_path / "state" / "reliability.json")
+        tracker = ReliabilityTracker(state_path)
+        _observe(tracker, {"a": 10.0, "b": None})
+        tracker.save()
+
+        reloaded = ReliabilityTracker(state_path)
+
+        assert reloaded.score("b") == tracker.score("b")
+
+    def test_unreadable_state_file_is_ignored(self, tmp_path):
+        """A corrupt state file should start from empty scores."""
+        state_path = tmp_path / "reliability.json"
+        state_path.write_text("{not json")
+
+        tracker = ReliabilityTracker(str(state_path))
+
+        assert tracker.score("a").samples == 0
+        assert tracker.load_error is not None
+
+
+class TestWeightedAggregation:
+    """Tests for weighted aggregation in the service layer."""
+
+    def test_aggregate_rate_details_uses_weights(self):
+        """Provider weights should steer weighted_median."""
+        result = aggregate_rate_details(
+            "EUR",
+            "MAD",
+            _details({"a": 10.0, "b": 10.1, "c": 12.0}),
+            aggregation_method="weighted_median",
+            min_successful_sources=1,
+            weights={"a": 0.1, "b": 0.1},
+        )
+
+        assert result.aggregated_rate == 12.0
+        assert result.successful_sources == 3
+
+    def test_fetch_and_aggregate_skips_poor_providers(
+        self, mocker, monkeypatch, mock_env_vars, mock_exchange_rate_response
+    ):
+        """Providers with a poor score should not be requested."""
+        monkeypatch.setenv("RATE_SOURCES", "openexchangerates,currencyapi")
+        monkeypatch.setenv("RELIABILITY_MIN_SAMPLES", "1")
+        mocker.patch(
+            "rates.providers.openexchangerates.request_json",
+            return_value=mock_exchange_rate_response,
+        )
+        mock_currencyapi = mocker.patch(
+            "rates.providers.currencyapi.request_json", side_effect=ValueError("down")
+        )
+
+        fetch_and_aggregate_rate("EUR", "USD")
+        result = fetch_and_aggregate_rate("EUR", "USD")
+
+        assert mock_currencyapi.call_count == 1
+        assert [detail.source for detail in result.details] == ["openexchangerates"]
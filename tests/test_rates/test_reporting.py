@@ -0,0 +1,124 @@
+"""Tests for streaming rate reports."""
+
+import io
+import json
+import threading
+
+import pytest
+
+from rates.currencies import Pair
+from rates.models import AggregatedRateResult, RateDetail, RateDetailBatch
+from rates.reporting import RateReporter, format_detail_lines
+
+
+def _details():
+    pair = Pair("EUR", "USD")
+    return [
+        RateDetail(source="openexchangerates", pair=pair, status="success", rate=1.1),
+        RateDetail(source="currencyapi", pair=pair, status="error", error="timeout"),
+    ]
+
+
+def _result():
+    return AggregatedRateResult(
+        pair=Pair("EUR", "USD"),
+        aggregation_method="median",
+        aggregated_rate=1.1,
+        details=RateDetailBatch(_details()),
+        successful_sources=1,
+        failed_sources=1,
+    )
+
+
+class TestFormatDetailLines:
+    """Tests for format_detail_lines."""
+
+    def test_lists_and_batches_format_alike(self):
+        """Lists of details and columnar batches should give the same lines."""
+        lines = list(format_detail_lines(_details()))
+
+        assert lines == [
+            "- [openexchangerates] EUR/USD=1.1000",
+            "- [currencyapi] error: timeout",
+        ]
+        assert list(format_detail_lines(RateDetailBatch(_details()))) == lines
+
+
+class TestRateReporter:
+    """Tests for RateReporter."""
+
+    def test_ndjson_writes_one_record_per_line(self):
+        """Details should precede the result record, one JSON object per line."""
+        stream = io.StringIO()
+
+        RateReporter(stream, "ndjson").write_result(_result(), 1.0, True)
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [record["type"] for record in records] == ["detail", "detail", "result"]
+        assert records[1] == {
+            "type": "detail",
+            "pair": "EUR/USD",
+            "source": "currencyapi",
+            "status": "error",
+            "rate": None,
+            "error": "timeout",
+        }
+        assert records[2]["triggered"] is True
+        assert records[2]["threshold"] == 1.0
+
+    def test_csv_header_is_written_once(self, tmp_path):
+        """Appending to an existing report should not repeat the header."""
+        report_path = tmp_path / "report.csv"
+        for _ in range(2):
+            with open(report_path, "a", encoding="utf-8", newline="") as stream:
+                RateReporter(stream, "csv").write_error(
+                    Pair("EUR", "USD"), ValueError("No successful rates")
+                )
+
+        lines = report_path.read_text(encoding="utf-8").splitlines()
+        assert lines[0].startswith("type,pair,source")
+        assert lines[1:] == ["error,EUR/USD,,,,No successful rates,,,,,"] * 2
+
+    def test_text_summarizes_results(self):
+        """The text format should keep detail lines and summarize the result."""
+        stream = io.StringIO()
+
+        RateReporter(stream, "text").write_result(_result(), 1.2, False)
+
+        assert stream.getvalue().splitlines()[-1] == (
+            "EUR/USD median rate 1.1000 is below threshold 1.2000 "
+            "(1 successful, 1 failed source(s))"
+        )
+
+    def test_rule_records_are_not_interleaved(self):
+        """Another thread's record should wait until a rule's records are written."""
+        stream = io.StringIO()
+        reporter = RateReporter(stream, "ndjson")
+        other = threading.Thread(
+            target=reporter.write_error,
+            args=(Pair("USD", "MAD"), ValueError("No successful rates")),
+        )
+
+        def details():
+            first, second = _details()
+            yield first
+            # Between two records of this rule: the other thread must wait.
+            other.start()
+            other.join(timeout=0.2)
+            yield second
+
+        reporter.write_error(Pair("EUR", "USD"), ValueError("Too few"), details())
+        other.join()
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert [(record["type"], record["pair"]) for record in records] == [
+            ("detail", "EUR/USD"),
+            ("detail", "EUR/USD"),
+            ("error", "EUR/USD"),
+            ("error", "USD/MAD"),
+        ]
+
+    def test_rejects_unknown_format(self):
+        """Unknown formats should fail fast."""
+        with pytest.raises(ValueError, match="Unsupported report format"):
+            RateReporter(io.StringIO(), "xml")
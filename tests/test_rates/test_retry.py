@@ -0,0 +1,147 @@
+"""Tests for retry policies and the retry budget."""
+
+import httpx
+import pytest
+
+from rates.http_client import request_json
+from rates.retry import (
+    RetryBudget,
+    RetryBudgetExhaustedError,
+    RetryPolicy,
+    classify_error,
+)
+
+URL = "https://example.com/latest"
+
+
+def _status_error(status_code):
+    request = httpx.Request("GET", URL)
+    response = httpx.Response(status_code=status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+class TestClassifyError:
+    """Tests for grouping failures into retry error classes."""
+
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (_status_error(429), "rate_limited"),
+            (_status_error(503), "server"),
+            (_status_error(404), None),
+            (httpx.ReadTimeout("timed out"), "timeout"),
+            (httpx.ConnectError("refused"), "network"),
+            (ValueError("bad payload"), None),
+        ],
+    )
+    def test_classifies_errors(self, error, expected):
+        """Each failure should map to its error class, or None if permanent."""
+        assert classify_error(error) == expected
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    def test_decorrelated_jitter_stays_within_bounds(self):
+        """Delays should grow from the base delay without exceeding the cap."""
+        policy = RetryPolicy(backoff_base_seconds=0.5, backoff_max_seconds=4)
+        delay = policy.backoff_base_seconds
+
+        for _ in range(50):
+            next_delay = policy.next_delay_seconds(delay)
+            assert 0.5 <= next_delay <= min(4, max(0.5, delay * 3))
+            delay = next_delay
+
+    def test_only_listed_error_classes_are_retried(self):
+        """Error classes outside retry_on should fail immediately."""
+        policy = RetryPolicy(max_retries=2, retry_on=frozenset({"server"}))
+
+        assert policy.should_retry(0, "server")
+        assert not policy.should_retry(0, "timeout")
+        assert not policy.should_retry(2, "server")
+
+
+class TestRetryBudget:
+    """Tests for RetryBudget."""
+
+    def test_limits_retries_to_ratio_of_requests(self):
+        """Retries beyond the ratio should be refused until the window moves on."""
+        now = [0.0]
+        budget = RetryBudget(
+            ratio=0.1, window_seconds=10, min_retries=0, clock=lambda: now[0]
+        )
+        for _ in range(20):
+            budget.record_request()
+
+        assert budget.try_acquire_retry()
+        assert budget.try_acquire_retry()
+        assert not budget.try_acquire_retry()
+
+        now[0] = 11.0
+        budget.record_request()
+        assert not budget.try_acquire_retry()
+
+    def test_min_retries_are_always_allowed(self):
+        """A quiet process should still get min_retries per window."""
+        budget = RetryBudget(ratio=0.1, min_retries=1)
+        budget.record_request()
+
+        assert budget.try_acquire_retry()
+        assert not budget.try_acquire_retry()
+
+
+class TestRequestJsonRetries:
+    """Tests for retry settings applied by request_json."""
+
+    def _responses(self, *status_codes):
+        request = httpx.Request("GET", URL)
+        return [
+            httpx.Response(status_code=status_code, request=request, json={})
+            for status_code in status_codes
+        ]
+
+    def test_provider_max_retries_override(self, mocker, monkeypatch):
+        """HTTP_PROVIDER_MAX_RETRIES should override retries for one provider."""
+        monkeypatch.setenv("HTTP_MAX_RETRIES", "3")
+        monkeypatch.setenv("HTTP_PROVIDER_MAX_RETRIES", "bank_al_maghrib=0")
+        mock_get = mocker.patch(
+            "rates.http_client.httpx.get", side_effect=self._responses(503, 200)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            request_json(URL, provider="bank_al_maghrib")
+
+        mock_get.assert_called_once()
+
+    def test_exhausted_budget_stops_retries(self, mocker, monkeypatch):
+        """No retry should be attempted once the shared budget is spent."""
+        monkeypatch.setenv("HTTP_RETRY_BUDGET_MIN_RETRIES", "0")
+        mocker.patch("rates.http_client.time.sleep")
+        mock_get = mocker.patch(
+            "rates.http_client.httpx.get", side_effect=self._responses(503, 200)
+        )
+
+        with pytest.raises(RetryBudgetExhaustedError, match="budget exhausted") as info:
+            request_json(URL)
+
+        assert isinstance(info.value.__cause__, httpx.HTTPStatusError)
+        mock_get.assert_called_once()
+
+    def test_error_classes_can_be_excluded(self, mocker, monkeypatch):
+        """Error classes missing from HTTP_RETRY_ON should not be retried."""
+        monkeypatch.setenv("HTTP_RETRY_ON", "server,timeout")
+        mock_get = mocker.patch(
+            "rates.http_client.httpx.get", side_effect=self._responses(429, 200)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            request_json(URL)
+
+        mock_get.assert_called_once()
+
+    def test_rejects_unknown_error_class(self, monkeypatch):
+        """Unknown error classes should be reported as configuration errors."""
+        monkeypatch.setenv("HTTP_RETRY_ON", "server,teapot")
+
+        with pytest.raises(ValueError, match="HTTP_RETRY_ON"):
+            request_json(URL)
@@ -1,11 +1,22 @@
 """Tests for rates service orchestration."""
 
+import time
+from concurrent.futures import Future
+
 import pytest
 
-from rates.models import RateDetail
+from rates.config import get_config
+from rates.models import RateDetail, RateDetailBatch, RateStatus
+from rates.providers.exchangerate_api import ExchangeRateApiProvider
+from rates.providers.openexchangerates import OpenExchangeRatesProvider
+from rates.reliability import ReliabilityTracker
 from rates.service import (
+    AVAILABLE_PROVIDERS,
     aggregate_rate_details,
+    fetch_rate_details_for_pairs,
     get_enabled_provider_names,
+    get_provider_quotas,
+    stream_rate_details_for_pairs,
     validate_min_successful_sources,
 )
 
@@ -85,6 +96,28 @@ class TestAggregateRateDetails:
         assert result.successful_sources == 2
         assert result.failed_sources == 1
 
+    def test_aggregates_batch_without_materializing_rows(self):
+        """A RateDetailBatch should be aggregated column-wise and kept as details."""
+        batch = RateDetailBatch(
+            [
+                RateDetail(source="a", pair="EUR/MAD", status="success", rate=0.1000),
+                RateDetail(source="b", pair="EUR/MAD", status="error", error="timeout"),
+                RateDetail(source="c", pair="EUR/MAD", status="success", rate=0.1020),
+            ]
+        )
+
+        result = aggregate_rate_details(
+            base_currency="EUR",
+            quote_currency="MAD",
+            details=batch,
+            aggregation_method="median",
+            min_successful_sources=2,
+        )
+
+        assert result.aggregated_rate == 0.1010
+        assert result.details is batch
+        assert result.failed_sources == 1
+
     def test_raises_when_not_enough_successful_sources(self):
         """Aggregation should fail when success count is below minimum."""
         details = [
@@ -102,3 +135,229 @@ class TestAggregateRateDetails:
                 aggregation_method="median",
                 min_successful_sources=1,
             )
+
+
+class TestAvailableProviders:
+    """Tests for lazily loaded provider factories."""
+
+    def test_factories_build_provider_instances(self):
+        """Every registered factory should import and build its provider."""
+        for provider_name, factory in AVAILABLE_PROVIDERS.items():
+            provider = factory()
+
+            assert provider.source_name == provider_name
+
+
+class TestGetProviderQuotas:
+    """Tests for provider quota parsing."""
+
+    def test_parses_quotas(self, monkeypatch):
+        """Quota entries should be parsed into integers per provider."""
+        monkeypatch.setenv("PROVIDER_QUOTAS", "openexchangerates=10, BANK_AL_MAGHRIB=2")
+
+        assert get_provider_quotas() == {
+            "openexchangerates": 10,
+            "bank_al_maghrib": 2,
+        }
+
+    def test_raises_for_malformed_entry(self, monkeypatch):
+        """Entries without a value should fail validation."""
+        monkeypatch.setenv("PROVIDER_QUOTAS", "openexchangerates")
+
+        with pytest.raises(ValueError, match="provider=value"):
+            get_provider_quotas()
+
+
+class TestFetchRateDetailsForPairs:
+    """Tests for multi-pair fetching."""
+
+    def test_full_table_provider_is_called_once_for_all_pairs(
+        self, mocker, mock_env_vars, mock_exchange_rate_response
+    ):
+        """One OpenExchangeRates request should serve every pair."""
+        mock_request_json = mocker.patch(
+            "rates.providers.openexchangerates.request_json",
+            return_value=mock_exchange_rate_response,
+        )
+
+        details_by_pair = fetch_rate_details_for_pairs(
+            [("EUR", "USD"), ("GBP", "USD")],
+            provider_names=["openexchangerates"],
+        )
+
+        mock_request_json.assert_called_once()
+        assert isinstance(details_by_pair["EUR/USD"], RateDetailBatch)
+        assert details_by_pair["EUR/USD"][0].rate == 1.0 / 0.92
+        assert details_by_pair["GBP/USD"][0].rate == 1.0 / 0.79
+
+
+class TestStreamRateDetailsForPairs:
+    """Tests for streaming multi-pair fetching."""
+
+    def test_yields_each_requested_pair_once(
+        self, mocker, mock_env_vars, mock_exchange_rate_response
+    ):
+        """Every pair should be yielded with its provider details."""
+        mocker.patch(
+            "rates.providers.openexchangerates.request_json",
+            return_value=mock_exchange_rate_response,
+        )
+
+        streamed = list(
+            stream_rate_details_for_pairs(
+                [("EUR", "USD"), ("GBP", "USD")],
+                provider_names=["openexchangerates"],
+            )
+        )
+
+        assert sorted(pair for pair, _ in streamed) == ["EUR/USD", "GBP/USD"]
+        assert all(
+            [detail.source for detail in details] == ["openexchangerates"]
+            for _, details in streamed
+        )
+
+    def test_closing_early_stops_blocked_workers(
+        self, mocker, mock_env_vars, mock_exchange_rate_response
+    ):
+        """A consumer that stops reading should not leave workers blocked."""
+        mocker.patch(
+            "rates.providers.openexchangerates.request_json",
+            return_value=mock_exchange_rate_response,
+        )
+        stream = stream_rate_details_for_pairs(
+            [("EUR", "USD"), ("GBP", "USD"), ("USD", "EUR")],
+            provider_names=["openexchangerates"],
+            queue_size=1,
+        )
+
+        pair, _ = next(stream)
+        stream.close()
+
+        assert pair == "EUR/USD"
+
+    def test_requests_share_one_worker_pool(
+        self, mocker, mock_env_vars, mock_exchange_rate_response
+    ):
+        """Repeated fetches should reuse the configured pool."""
+        mocker.patch(
+            "rates.providers.openexchangerates.request_json",
+            return_value=mock_exchange_rate_response,
+        )
+        pool = get_config().workers.pool()
+
+        for _ in range(2):
+            fetch_rate_details_for_pairs(
+                [("EUR", "USD")], provider_names=["openexchangerates"]
+            )
+
+        assert get_config().workers.pool() is pool
+        assert pool.stats().completed == 2
+
+    def test_base_scoped_providers_run_one_pool_task_per_base(
+        self, mocker, mock_env_vars, monkeypatch
+    ):
+        """Per-base tables should be fetched as separate shared-pool tasks."""
+        monkeypatch.setenv("STREAMING_JSON_EXTRACTION", "false")
+        mocker.patch(
+            "rates.providers.fawazahmed0_exchange_api.request_json",
+            side_effect=lambda url, **kwargs: {
+                "eur": {"usd": 1.08, "gbp": 0.85},
+                "gbp": {"usd": 1.27},
+            },
+        )
+        pool = get_config().workers.pool()
+
+        details_by_pair = fetch_rate_details_for_pairs(
+            [("EUR", "USD"), ("GBP", "USD"), ("EUR", "GBP")],
+            provider_names=["fawazahmed0_exchange_api"],
+        )
+
+        assert [details[0].rate for details in details_by_pair.values()] == [
+            1.08,
+            1.27,
+            0.85,
+        ]
+        assert pool.stats().completed == 2
+
+    def test_pairs_missing_from_a_batch_are_errors(self, mocker, mock_env_vars):
+        """A batch answer shorter than the request should not drop pairs."""
+        mocker.patch.object(
+            OpenExchangeRatesProvider,
+            "fetch_rates",
+            return_value=[
+                RateDetail(
+                    source="openexchangerates",
+                    pair="EUR/USD",
+                    status=RateStatus.SUCCESS,
+                    rate=1.08,
+                )
+            ],
+        )
+
+        details_by_pair = fetch_rate_details_for_pairs(
+            [("EUR", "USD"), ("GBP", "USD")], provider_names=["openexchangerates"]
+        )
+
+        assert details_by_pair["EUR/USD"][0].rate == 1.08
+        assert details_by_pair["GBP/USD"][0].status == RateStatus.ERROR
+        assert details_by_pair["GBP/USD"][0].error == (
+            "Provider returned no rate for this pair"
+        )
+
+    def test_provider_failures_become_errors(self, mocker, mock_env_vars):
+        """A provider raising mid-batch should still answer every pair."""
+        mocker.patch.object(
+            OpenExchangeRatesProvider, "fetch_rates", side_effect=RuntimeError("boom")
+        )
+
+        details_by_pair = fetch_rate_details_for_pairs(
+            [("EUR", "USD"), ("GBP", "USD")], provider_names=["openexchangerates"]
+        )
+
+        assert [details[0].error for details in details_by_pair.values()] == [
+            "Unhandled provider failure: boom",
+            "Unhandled provider failure: boom",
+        ]
+
+    def test_latency_is_measured_per_request(self, mocker, mock_env_vars):
+        """A per-pair provider's latency should not grow with the pair count."""
+
+        def fetch_rate(provider, base_currency, quote_currency):
+            time.sleep(0.02)
+            return RateDetail(
+                source="exchangerate_api",
+                pair=f"{base_currency}/{quote_currency}",
+                status=RateStatus.SUCCESS,
+                rate=1.1,
+            )
+
+        mocker.patch.object(ExchangeRateApiProvider, "fetch_rate", fetch_rate)
+        observe = mocker.spy(ReliabilityTracker, "observe")
+
+        fetch_rate_details_for_pairs(
+            [("EUR", "USD"), ("GBP", "USD"), ("USD", "EUR"), ("USD", "GBP")],
+            provider_names=["exchangerate_api"],
+        )
+
+        latency = observe.call_args.args[2]["exchangerate_api"]
+        assert 0.02 <= latency < 0.06
+
+    def test_cancelled_requests_do_not_hang(self, mocker, mock_env_vars):
+        """Pairs of a request the pool cancelled should come back as errors."""
+
+        def cancelled(*args):
+            future = Future()
+            future.cancel()
+            return future
+
+        pool = get_config().workers.pool()
+        mocker.patch.object(pool, "submit", side_effect=cancelled)
+
+        details_by_pair = fetch_rate_details_for_pairs(
+            [("EUR", "USD"), ("GBP", "USD")], provider_names=["openexchangerates"]
+        )
+
+        assert [details[0].error for details in details_by_pair.values()] == [
+            "Provider request was cancelled",
+            "Provider request was cancelled",
+        ]
@@ -0,0 +1,99 @@
+"""Tests for the shared fetch worker pool."""
+
+import threading
+import time
+from concurrent.futures import wait
+
+import pytest
+
+from rates.worker_pool import FetchWorkerPool, get_worker_pool
+
+
+class TestFetchWorkerPool:
+    """Tests for FetchWorkerPool."""
+
+    def test_provider_limit_caps_concurrent_tasks(self):
+        """Tasks over a provider's limit should wait without blocking others."""
+        pool = FetchWorkerPool(max_workers=4, provider_limits={"slow": 1})
+        lock = threading.Lock()
+        running = {"slow": 0, "fast": 0}
+        peak = {"slow": 0, "fast": 0}
+
+        def fetch(provider_name):
+            with lock:
+                running[provider_name] += 1
+                peak[provider_name] = max(peak[provider_name], running[provider_name])
+            time.sleep(0.02)
+            with lock:
+                running[provider_name] -= 1
+            return provider_name
+
+        futures = [pool.submit("slow", fetch, "slow") for _ in range(3)]
+        futures += [pool.submit("fast", fetch, "fast") for _ in range(3)]
+        results = [future.result(timeout=5) for future in futures]
+        pool.shutdown()
+
+        assert results == ["slow"] * 3 + ["fast"] * 3
+        assert peak["slow"] == 1
+        assert peak["fast"] > 1
+        assert pool.stats().completed == 6
+
+    def test_stats_report_queue_depth(self):
+        """Tasks waiting for a provider slot should count as queued."""
+        pool = FetchWorkerPool(max_workers=2, provider_limits={"slow": 1})
+        release = threading.Event()
+
+        first = pool.submit("slow", release.wait)
+        second = pool.submit("slow", release.wait)
+        while pool.stats().running == 0:
+            time.sleep(0.001)
+
+        stats = pool.stats()
+        release.set()
+        first.result(timeout=5)
+        second.result(timeout=5)
+        pool.shutdown()
+
+        assert (stats.queued, stats.running) == (1, 1)
+
+    def test_shutdown_cancels_waiting_tasks(self):
+        """Queued tasks should be cancelled and submissions rejected."""
+        pool = FetchWorkerPool(max_workers=1, provider_limits={"slow": 1})
+        release = threading.Event()
+
+        running = pool.submit("slow", release.wait)
+        waiting = pool.submit("slow", release.wait)
+        threading.Timer(0.02, release.set).start()
+        pool.shutdown(cancel_futures=True)
+
+        assert running.result() is True
+        assert waiting.cancelled()
+        assert wait([waiting], timeout=1).done == {waiting}
+        with pytest.raises(RuntimeError, match="after shutdown"):
+            pool.submit("slow", release.wait)
+
+    def test_shutdown_cancels_tasks_waiting_for_a_worker(self):
+        """Tasks the executor never started should not stay pending."""
+        pool = FetchWorkerPool(max_workers=1)
+        release = threading.Event()
+
+        running = pool.submit("first", release.wait)
+        waiting = pool.submit("second", release.wait)
+        threading.Timer(0.02, release.set).start()
+        pool.shutdown(cancel_futures=True)
+
+        assert running.result() is True
+        assert wait([waiting], timeout=1).done == {waiting}
+        assert waiting.cancelled()
+        assert pool.stats().queued == 0
+
+
+class TestGetWorkerPool:
+    """Tests for the process-wide pool."""
+
+    def test_pool_is_reused_until_settings_change(self):
+        """The same settings should share one pool across calls."""
+        pool = get_worker_pool(2, provider_limits={"openexchangerates": 1})
+
+        assert get_worker_pool(2, provider_limits={"openexchangerates": 1}) is pool
+        assert get_worker_pool(3) is not pool
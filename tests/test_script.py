@@ -1,9 +1,50 @@
 """Tests for the main script module."""
 
+import json
+from concurrent.futures import Future
+
 import pytest
 
-from rates.models import AggregatedRateResult, RateDetail
-from script import check_and_notify, prepare_inputs
+from rates.changes import RateChangeTracker
+from rates.models import AggregatedRateResult, RateDetail, RateDetailBatch
+from rates.reliability import ReliabilityTracker
+from rates.service import aggregate_rate_details
+from script import (
+    WatchRule,
+    _partition_rules_by_base,
+    check_and_notify,
+    prepare_inputs,
+    prepare_watchlist,
+)
+
+
+class InlineExecutor:
+    """Executor stand-in running submitted work in the calling process."""
+
+    def __init__(self, max_workers):
+        self.max_workers = max_workers
+        self.submitted = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def _stream(details_by_pair):
+    """Return a stand-in for stream_rate_details_for_pairs yielding these details."""
+
+    def stream(*args, **kwargs):
+        return iter(details_by_pair.items())
+
+    return stream
 
 
 class TestPrepareInputs:
@@ -32,10 +73,36 @@ class TestPrepareInputs:
             prepare_inputs()
 
 
+class TestPrepareWatchlist:
+    """Tests for prepare_watchlist function."""
+
+    def test_falls_back_to_single_pair_settings(self, monkeypatch, mock_env_vars):
+        """Without WATCHLIST the single pair settings should be used."""
+        monkeypatch.delenv("WATCHLIST", raising=False)
+
+        assert prepare_watchlist() == [WatchRule("EUR", "USD", 0.9)]
+
+    def test_parses_multiple_rules(self, monkeypatch, mock_env_vars):
+        """WATCHLIST entries should be parsed and normalized."""
+        monkeypatch.setenv("WATCHLIST", "eur/mad:10.3, USD/MAD:9.5")
+
+        assert prepare_watchlist() == [
+            WatchRule("EUR", "MAD", 10.3),
+            WatchRule("USD", "MAD", 9.5),
+        ]
+
+    def test_raises_for_malformed_rule(self, monkeypatch, mock_env_vars):
+        """Entries without a threshold should fail validation."""
+        monkeypatch.setenv("WATCHLIST", "EUR/MAD")
+
+        with pytest.raises(ValueError, match="BASE/QUOTE:THRESHOLD"):
+            prepare_watchlist()
+
+
 class TestCheckAndNotify:
     """Tests for check_and_notify function."""
 
-    def test_notifies_when_threshold_met(self, mocker, mock_env_vars):
+    def test_notifies_when_threshold_met(self, mocker, monkeypatch, mock_env_vars):
         """Test notification sent when aggregated rate >= threshold."""
         details = [
             RateDetail(
@@ -52,13 +119,11 @@ class TestCheckAndNotify:
             ),
         ]
 
-        mocker.patch("script.get_aggregation_method", return_value="median")
+        monkeypatch.setenv("RATE_SOURCES", "openexchangerates,bank_al_maghrib")
         mocker.patch(
-            "script.get_enabled_provider_names",
-            return_value=["openexchangerates", "bank_al_maghrib"],
+            "script.stream_rate_details_for_pairs",
+            side_effect=_stream({"EUR/USD": details}),
         )
-        mocker.patch("script.get_min_successful_sources", return_value=1)
-        mocker.patch("script.fetch_rate_details", return_value=details)
 
         mocker.patch(
             "script.aggregate_rate_details",
@@ -82,6 +147,38 @@ class TestCheckAndNotify:
         assert "openexchangerates" in call_args[0][1]
         assert "bank_al_maghrib" in call_args[0][1]
 
+    def test_formats_batch_details(self, mocker, monkeypatch, mock_env_vars):
+        """Columnar batches should be aggregated and formatted row by row."""
+        details = RateDetailBatch(
+            [
+                RateDetail(
+                    source="openexchangerates",
+                    pair="EUR/USD",
+                    status="success",
+                    rate=0.95,
+                ),
+                RateDetail(
+                    source="bank_al_maghrib",
+                    pair="EUR/USD",
+                    status="error",
+                    error="timeout",
+                ),
+            ]
+        )
+
+        monkeypatch.setenv("RATE_SOURCES", "openexchangerates,bank_al_maghrib")
+        mocker.patch(
+            "script.stream_rate_details_for_pairs",
+            side_effect=_stream({"EUR/USD": details}),
+        )
+        mock_notify = mocker.patch("script.notify")
+
+        check_and_notify()
+
+        message = mock_notify.call_args[0][1]
+        assert "- [openexchangerates] EUR/USD=0.9500" in message
+        assert "- [bank_al_maghrib] error: timeout" in message
+
     def test_no_notification_when_below_threshold(self, mocker, mock_env_vars):
         """Test no notification when aggregated rate is below threshold."""
         details = [
@@ -93,12 +190,10 @@ class TestCheckAndNotify:
             )
         ]
 
-        mocker.patch("script.get_aggregation_method", return_value="median")
         mocker.patch(
-            "script.get_enabled_provider_names", return_value=["openexchangerates"]
+            "script.stream_rate_details_for_pairs",
+            side_effect=_stream({"EUR/USD": details}),
         )
-        mocker.patch("script.get_min_successful_sources", return_value=1)
-        mocker.patch("script.fetch_rate_details", return_value=details)
         mocker.patch(
             "script.aggregate_rate_details",
             return_value=AggregatedRateResult(
@@ -121,6 +216,60 @@ class TestCheckAndNotify:
             "The current EUR/USD exchange rate is 0.8000, which is below the threshold rate 0.9000."
         )
 
+    def test_prints_stale_quotes_left_out(self, mocker, monkeypatch, mock_env_vars):
+        """Quotes dropped for their age should be reported by the script."""
+        monkeypatch.setenv("RATE_MAX_QUOTE_AGE_SECONDS", "3600")
+        details = [
+            RateDetail(
+                source="openexchangerates",
+                pair="EUR/USD",
+                status="success",
+                rate=0.80,
+                metadata={"timestamp": 1_000},
+            ),
+            RateDetail(
+                source="currencyapi", pair="EUR/USD", status="success", rate=0.82
+            ),
+        ]
+
+        mocker.patch(
+            "script.stream_rate_details_for_pairs",
+            side_effect=_stream({"EUR/USD": details}),
+        )
+        mocker.patch("script.notify")
+        mock_print = mocker.patch("builtins.print")
+
+        check_and_notify()
+
+        mock_print.assert_any_call(
+            "[Freshness] Ignored openexchangerates EUR/USD quote older than 3600s"
+        )
+
+    def test_prints_skipped_unreliable_providers(
+        self, mocker, monkeypatch, mock_env_vars
+    ):
+        """Providers left out for poor reliability should be reported by the script."""
+        monkeypatch.setenv("RATE_SOURCES", "openexchangerates,currencyapi")
+        details = [
+            RateDetail(
+                source="openexchangerates", pair="EUR/USD", status="success", rate=0.8
+            )
+        ]
+        mocker.patch(
+            "script.select_reliable_providers", return_value=["openexchangerates"]
+        )
+        mock_stream = mocker.patch(
+            "script.stream_rate_details_for_pairs",
+            side_effect=_stream({"EUR/USD": details}),
+        )
+        mocker.patch("script.notify")
+        mock_print = mocker.patch("builtins.print")
+
+        check_and_notify()
+
+        mock_print.assert_any_call("[Reliability] Skipping currencyapi (weight 1.00)")
+        assert mock_stream.call_args.kwargs["provider_names"] == ["openexchangerates"]
+
     def test_notifies_when_aggregation_fails_and_config_enabled(
         self, mocker, monkeypatch, mock_env_vars
     ):
@@ -136,13 +285,11 @@ class TestCheckAndNotify:
 
         monkeypatch.setenv("NOTIFY_ON_AGGREGATION_FAILURE", "true")
 
-        mocker.patch("script.get_aggregation_method", return_value="median")
+        mocker.patch("script.validate_min_successful_sources", return_value=None)
         mocker.patch(
-            "script.get_enabled_provider_names", return_value=["openexchangerates"]
+            "script.stream_rate_details_for_pairs",
+            side_effect=_stream({"EUR/USD": details}),
         )
-        mocker.patch("script.get_min_successful_sources", return_value=1)
-        mocker.patch("script.validate_min_successful_sources", return_value=None)
-        mocker.patch("script.fetch_rate_details", return_value=details)
         mocker.patch(
             "script.aggregate_rate_details",
             side_effect=ValueError("Not enough successful sources"),
@@ -156,3 +303,256 @@ class TestCheckAndNotify:
         subject, message = mock_notify.call_args[0]
         assert "Aggregation failed" in subject
         assert "Not enough successful sources" in message
+
+    def test_sends_one_digest_for_multiple_alerts(
+        self, mocker, monkeypatch, mock_env_vars
+    ):
+        """Several triggered rules should produce a single notification."""
+        monkeypatch.setenv("WATCHLIST", "EUR/USD:0.9,GBP/USD:1.1")
+
+        mocker.patch(
+            "script.stream_rate_details_for_pairs",
+            side_effect=_stream({"EUR/USD": [], "GBP/USD": []}),
+        )
+        mocker.patch(
+            "script.aggregate_rate_details",
+            side_effect=[
+                AggregatedRateResult(
+                    pair="EUR/USD",
+                    aggregation_method="median",
+                    aggregated_rate=0.95,
+                    details=[],
+                    successful_sources=1,
+                    failed_sources=0,
+                ),
+                AggregatedRateResult(
+                    pair="GBP/USD",
+                    aggregation_method="median",
+                    aggregated_rate=1.25,
+                    details=[],
+                    successful_sources=1,
+                    failed_sources=0,
+                ),
+            ],
+        )
+        mock_notify = mocker.patch("script.notify")
+
+        check_and_notify()
+
+        mock_notify.assert_called_once()
+        subject, message = mock_notify.call_args[0]
+        assert subject == "2 exchange rate alerts"
+        assert "EUR/USD" in message
+        assert "GBP/USD" in message
+
+    def test_change_tracker_skips_unchanged_pairs(
+        self, mocker, monkeypatch, mock_env_vars
+    ):
+        """Only pairs with changed details should be re-aggregated."""
+        monkeypatch.setenv("WATCHLIST", "EUR/USD:2,GBP/USD:2")
+        eur_details = [
+            RateDetail(
+                source="openexchangerates", pair="EUR/USD", status="success", rate=1.1
+            )
+        ]
+        gbp_details = [
+            RateDetail(
+                source="openexchangerates", pair="GBP/USD", status="success", rate=1.3
+            )
+        ]
+        changed_gbp_details = [
+            RateDetail(
+                source="openexchangerates", pair="GBP/USD", status="success", rate=1.4
+            )
+        ]
+
+        mocker.patch(
+            "script.stream_rate_details_for_pairs",
+            side_effect=[
+                iter({"EUR/USD": eur_details, "GBP/USD": gbp_details}.items()),
+                iter({"EUR/USD": eur_details, "GBP/USD": changed_gbp_details}.items()),
+            ],
+        )
+        mock_aggregate = mocker.patch(
+            "script.aggregate_rate_details", wraps=aggregate_rate_details
+        )
+        mocker.patch("script.notify")
+        tracker = RateChangeTracker()
+
+        check_and_notify(change_tracker=tracker)
+        check_and_notify(change_tracker=tracker)
+
+        aggregated_pairs = [
+            call.kwargs["base_currency"] for call in mock_aggregate.call_args_list
+        ]
+        assert aggregated_pairs == ["EUR", "GBP", "GBP"]
+
+    def test_change_tracker_tracks_each_rule(self, mocker, monkeypatch, mock_env_vars):
+        """Rules sharing a pair should each be skipped once nothing changed."""
+        monkeypatch.setenv("WATCHLIST", "EUR/USD:2,EUR/USD:3")
+        details = [
+            RateDetail(
+                source="openexchangerates", pair="EUR/USD", status="success", rate=1.1
+            )
+        ]
+
+        mocker.patch(
+            "script.stream_rate_details_for_pairs",
+            side_effect=[iter({"EUR/USD": details}.items()) for _ in range(3)],
+        )
+        mock_aggregate = mocker.patch(
+            "script.aggregate_rate_details", wraps=aggregate_rate_details
+        )
+        mocker.patch("script.notify")
+        tracker = RateChangeTracker()
+
+        for _ in range(3):
+            check_and_notify(change_tracker=tracker)
+
+        assert mock_aggregate.call_count == 2
+
+    def test_writes_machine_readable_report(
+        self, mocker, monkeypatch, tmp_path, mock_env_vars
+    ):
+        """OUTPUT_FORMAT=ndjson should append one record per detail and rule."""
+        report_path = tmp_path / "report.ndjson"
+        monkeypatch.setenv("OUTPUT_FORMAT", "ndjson")
+        monkeypatch.setenv("OUTPUT_PATH", str(report_path))
+        details = [
+            RateDetail(
+                source="openexchangerates", pair="EUR/USD", status="success", rate=0.95
+            )
+        ]
+
+        mocker.patch(
+            "script.stream_rate_details_for_pairs",
+            side_effect=_stream({"EUR/USD": details}),
+        )
+        mocker.patch("script.notify")
+
+        check_and_notify()
+
+        records = [
+            json.loads(line)
+            for line in report_path.read_text(encoding="utf-8").splitlines()
+        ]
+        assert [record["type"] for record in records] == ["detail", "result"]
+        assert records[1]["pair"] == "EUR/USD"
+        assert records[1]["triggered"] is True
+
+    def test_writes_text_report_to_output_path(
+        self, mocker, monkeypatch, tmp_path, mock_env_vars
+    ):
+        """OUTPUT_PATH should also receive text records."""
+        report_path = tmp_path / "report.txt"
+        monkeypatch.setenv("OUTPUT_PATH", str(report_path))
+        details = [
+            RateDetail(
+                source="openexchangerates", pair="EUR/USD", status="success", rate=0.95
+            )
+        ]
+
+        mocker.patch(
+            "script.stream_rate_details_for_pairs",
+            side_effect=_stream({"EUR/USD": details}),
+        )
+        mocker.patch("script.notify")
+
+        check_and_notify()
+
+        assert report_path.read_text(encoding="utf-8").splitlines() == [
+            "- [openexchangerates] EUR/USD=0.9500",
+            "EUR/USD median rate 0.9500 is at or above threshold 0.9000 "
+            "(1 successful, 0 failed source(s))",
+        ]
+
+    def test_rejects_invalid_pipeline_settings(self, monkeypatch, mock_env_vars):
+        """Pipeline stages need at least one worker and queue slot."""
+        monkeypatch.setenv("PIPELINE_EVALUATE_WORKERS", "0")
+
+        with pytest.raises(ValueError, match="PIPELINE_EVALUATE_WORKERS"):
+            check_and_notify()
+
+    def test_dry_run_prints_plan_without_fetching(
+        self, mocker, monkeypatch, mock_env_vars
+    ):
+        """Dry-run mode should explain the plan and skip fetching."""
+        monkeypatch.setenv("RATE_PLAN_DRY_RUN", "true")
+
+        mock_fetch = mocker.patch("script.stream_rate_details_for_pairs")
+        mock_notify = mocker.patch("script.notify")
+        mock_print = mocker.patch("builtins.print")
+
+        check_and_notify()
+
+        mock_fetch.assert_not_called()
+        mock_notify.assert_not_called()
+        assert "HTTP requests: 1" in mock_print.call_args[0][0]
+
+
+class TestShardedCheck:
+    """Tests for multi-process sharded checks."""
+
+    def test_partition_keeps_base_currencies_together(self):
+        """Rules sharing a base should land in the same shard."""
+        rules = [
+            WatchRule("EUR", "MAD", 1.0),
+            WatchRule("USD", "MAD", 1.0),
+            WatchRule("EUR", "USD", 1.0),
+            WatchRule("GBP", "MAD", 1.0),
+        ]
+
+        shards = _partition_rules_by_base(rules, 2)
+
+        assert len(shards) == 2
+        assert [rule.base_currency for rule in shards[0]] == ["EUR", "EUR"]
+        assert {rule.base_currency for rule in shards[1]} == {"USD", "GBP"}
+        assert _partition_rules_by_base(rules, 8) == [
+            [rules[0], rules[2]],
+            [rules[1]],
+            [rules[3]],
+        ]
+
+    def test_merges_shard_alerts_into_one_notification(
+        self, mocker, monkeypatch, mock_env_vars
+    ):
+        """Alerts from every shard should be sent in a single digest."""
+        monkeypatch.setenv("WATCHLIST", "EUR/USD:0.9,GBP/USD:1.2")
+        monkeypatch.setenv("SHARD_WORKERS", "2")
+
+        def fetch(pairs, provider_names, plan, freshness, observer):
+            observer({}, {"openexchangerates": 0.5})
+            return {
+                f"{base}/{quote}": [
+                    RateDetail(
+                        source="openexchangerates",
+                        pair=f"{base}/{quote}",
+                        status="success",
+                        rate=1.3,
+                    )
+                ]
+                for base, quote in pairs
+            }
+
+        executors = []
+
+        def make_executor(max_workers, mp_context):
+            assert mp_context.get_start_method() == "spawn"
+            executors.append(InlineExecutor(max_workers))
+            return executors[-1]
+
+        mocker.patch("script.ProcessPoolExecutor", side_effect=make_executor)
+        mock_fetch = mocker.patch(
+            "script.fetch_rate_details_for_pairs", side_effect=fetch
+        )
+        mock_notify = mocker.patch("script.notify")
+        observe = mocker.spy(ReliabilityTracker, "observe")
+
+        check_and_notify()
+
+        assert observe.call_count == 2
+        assert executors[0].max_workers == 2
+        assert executors[0].submitted == 2
+        assert mock_fetch.call_count == 2
+        mock_notify.assert_called_once()
+        assert mock_notify.call_args[0][0] == "2 exchange rate alerts"
@@ -0,0 +1,47 @@
+"""Tests for the startup timing report."""
+
+import sys
+
+from startup_timing import ImportTimer
+
+
+class TestImportTimer:
+    """Tests for ImportTimer."""
+
+    def test_records_newly_imported_modules(self, tmp_path, monkeypatch):
+        """Modules imported inside the timer should appear in the report."""
+        (tmp_path / "timed_parent_module.py").write_text("import timed_child_module\n")
+        (tmp_path / "timed_child_module.py").write_text("VALUE = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, "timed_parent_module", raising=False)
+        monkeypatch.delitem(sys.modules, "timed_child_module", raising=False)
+
+        with ImportTimer() as timer:
+            import timed_parent_module  # noqa: F401
+
+        timings = {timing.module: timing for timing in timer.timings}
+        assert "timed_parent_module" in timings
+        assert "timed_child_module" in timings
+        assert (
+            timings["timed_parent_module"].cumulative_seconds
+            >= timings["timed_child_module"].cumulative_seconds
+        )
+        assert "timed_parent_module" in timer.format_report()
+
+    def test_restores_builtin_import(self):
+        """The original import function should be restored on exit."""
+        import builtins
+
+        original_import = builtins.__import__
+
+        with ImportTimer():
+            pass
+
+        assert builtins.__import__ is original_import
+
+    def test_ignores_already_imported_modules(self):
+        """Modules already in sys.modules should not be reported."""
+        with ImportTimer() as timer:
+            import json  # noqa: F401
+
+        assert timer.timings == []